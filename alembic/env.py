@@ -1,4 +1,5 @@
 import asyncio
+import re
 from logging.config import fileConfig
 
 from alembic import context
@@ -19,6 +20,23 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Full-text search objects created by raw DDL (src/lib/search.py), not
+# mapped on the models: keep autogenerate from dropping them
+SEARCH_OBJECTS = {"search_vector", "idx_courses_search_vector"}
+
+
+# Monthly partitions of `messages` (src/lib/partitions.py), created at
+# runtime on PostgreSQL
+PARTITION_RE = re.compile(r"messages_(p\d{6}|default)")
+
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    if type_ == "table" and (
+        name.startswith("courses_fts") or PARTITION_RE.fullmatch(name)
+    ):
+        return False
+    return name not in SEARCH_OBJECTS
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
@@ -27,6 +45,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -35,7 +54,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -0,0 +1,45 @@
+"""keyset pagination indexes
+
+Composite (filter column, id) indexes so cursor pages are a single index
+range scan. Each replaces the single-column index it extends. On PostgreSQL
+the indexes are built CONCURRENTLY so listings keep working meanwhile.
+
+Revision ID: d4192ebba466
+Revises: 01e79a09e6e3
+Create Date: 2026-10-18 15:14:18.051564
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4192ebba466'
+down_revision: Union[str, None] = '01e79a09e6e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (new index, table, columns, replaced single-column index)
+INDEXES = [
+    ('idx_courses_category_id', 'courses', ['category', 'id'], 'ix_courses_category'),
+    ('idx_courses_level_id', 'courses', ['level', 'id'], None),
+    ('idx_conversations_user_id', 'conversations', ['user_id', 'id'], 'ix_conversations_user_id'),
+    ('idx_messages_conversation_id', 'messages', ['conversation_id', 'id'], 'ix_messages_conversation_id'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, replaced in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+            if replaced:
+                op.drop_index(replaced, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, replaced in reversed(INDEXES):
+            if replaced:
+                op.create_index(replaced, table, columns[:1], unique=False, postgresql_concurrently=True)
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
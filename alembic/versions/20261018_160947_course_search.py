@@ -0,0 +1,45 @@
+"""course search
+
+Revision ID: b6ce58376235
+Revises: cc2cd2445c7a
+Create Date: 2026-10-18 16:09:47.746777
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from src.lib.search import POSTGRES_COURSE_SEARCH_DDL, SQLITE_COURSE_SEARCH_DDL
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6ce58376235'
+down_revision: Union[str, None] = 'cc2cd2445c7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        # The generated column is computed for existing rows on ADD COLUMN
+        for statement in POSTGRES_COURSE_SEARCH_DDL:
+            op.execute(statement)
+    elif dialect == "sqlite":
+        for statement in SQLITE_COURSE_SEARCH_DDL:
+            op.execute(statement)
+        op.execute(
+            "INSERT INTO courses_fts (rowid, title, description, category) "
+            "SELECT id, fold(title), fold(description), fold(category) FROM courses"
+        )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.drop_index('idx_courses_search_vector', table_name='courses')
+        op.drop_column('courses', 'search_vector')
+        op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
+    elif dialect == "sqlite":
+        for trigger in ("insert", "update", "delete"):
+            op.execute(f"DROP TRIGGER IF EXISTS courses_fts_{trigger}")
+        op.execute("DROP TABLE IF EXISTS courses_fts")
@@ -0,0 +1,82 @@
+"""message partitions and archive
+
+Revision ID: 1d25a5d018aa
+Revises: b6ce58376235
+Create Date: 2026-10-18 16:27:06.587706
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.core.config import settings
+from src.lib.partitions import partition_messages
+
+# revision identifiers, used by Alembic.
+revision: str = '1d25a5d018aa'
+down_revision: Union[str, None] = 'b6ce58376235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Plain (unpartitioned) messages table, as before this revision
+POSTGRES_UNPARTITIONED_MESSAGES_DDL = (
+    "ALTER TABLE messages RENAME TO messages_partitioned",
+    "ALTER TABLE messages_partitioned "
+    "RENAME CONSTRAINT messages_pkey TO messages_partitioned_pkey",
+    "DROP INDEX idx_messages_conversation_id",
+    "DROP INDEX idx_messages_conversation_created",
+    "ALTER SEQUENCE messages_id_seq OWNED BY NONE",
+    """
+    CREATE TABLE messages (
+        id INTEGER NOT NULL DEFAULT nextval('messages_id_seq') PRIMARY KEY,
+        conversation_id INTEGER NOT NULL CONSTRAINT messages_conversation_id_fkey
+            REFERENCES conversations (id) ON DELETE CASCADE,
+        role VARCHAR(20) NOT NULL,
+        content TEXT NOT NULL,
+        tokens_used INTEGER,
+        created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+    )
+    """,
+    "ALTER SEQUENCE messages_id_seq OWNED BY messages.id",
+    "INSERT INTO messages SELECT id, conversation_id, role, content, tokens_used, "
+    "created_at FROM messages_partitioned",
+    "DROP TABLE messages_partitioned",
+    "CREATE INDEX idx_messages_conversation_id ON messages (conversation_id, id)",
+    "CREATE INDEX ix_messages_id ON messages (id)",
+)
+
+
+def upgrade() -> None:
+    op.add_column('conversations', sa.Column('archived_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute(
+        "UPDATE messages SET created_at = coalesce("
+        "(SELECT created_at FROM conversations "
+        "WHERE conversations.id = messages.conversation_id), CURRENT_TIMESTAMP) "
+        "WHERE created_at IS NULL"
+    )
+
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        # Rebuilds the table: NOT NULL created_at, new indexes, partitions
+        partition_messages(bind, settings.MESSAGE_PARTITIONS_AHEAD_MONTHS)
+        return
+    with op.batch_alter_table('messages') as batch_op:
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), nullable=False, existing_server_default=sa.text('(CURRENT_TIMESTAMP)'))
+        batch_op.drop_index('ix_messages_id')
+        batch_op.create_index('idx_messages_conversation_created', ['conversation_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    # Conversations still archived keep their messages in the archive files:
+    # rehydrate them first if they should survive the downgrade
+    if op.get_bind().dialect.name == "postgresql":
+        for statement in POSTGRES_UNPARTITIONED_MESSAGES_DDL:
+            op.execute(statement)
+    else:
+        with op.batch_alter_table('messages') as batch_op:
+            batch_op.drop_index('idx_messages_conversation_created')
+            batch_op.create_index('ix_messages_id', ['id'], unique=False)
+            batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True), nullable=True, existing_server_default=sa.text('(CURRENT_TIMESTAMP)'))
+    op.drop_column('conversations', 'archived_at')
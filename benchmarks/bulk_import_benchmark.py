@@ -0,0 +1,153 @@
+"""
+Bulk lesson import vs. per-row repository creates.
+
+Builds the same course tree (lessons → quiz → questions → 4 answers) twice:
+once through `repo.create(...)` per row, the way one-HTTP-call-per-object
+clients do, and once through `LessonImportRepository` batched inserts.
+Reports wall time and SQL statements executed as JSON.
+
+Usage:
+    python -m benchmarks.bulk_import_benchmark --lessons 50 --questions 10
+    python -m benchmarks.bulk_import_benchmark --database-url postgresql+asyncpg://...
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fakeredis import FakeAsyncRedis
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+import src.lib.cache
+from src.core.database import Base, build_engine
+from src.repositories.auth.auth_repository import AuthRepository
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.lessons.lesson_import_repository import LessonImportRepository
+from src.repositories.lessons.lesson_repository import LessonRepository
+from src.repositories.quizzes.quiz_repository import (
+    AnswerRepository,
+    QuestionRepository,
+    QuizRepository,
+)
+from src.schemas.lesson import LessonImport
+
+
+def build_tree(lessons: int, questions: int) -> list[LessonImport]:
+    return [
+        LessonImport.model_validate(
+            {
+                "title": f"Lesson {i}",
+                "content": "Lorem ipsum " * 50,
+                "order": i,
+                "quiz": {
+                    "title": f"Quiz {i}",
+                    "questions": [
+                        {
+                            "content": f"Question {q}",
+                            "order": q,
+                            "answers": [
+                                {
+                                    "content": f"Answer {a}",
+                                    "is_correct": a == 1,
+                                    "order": a,
+                                }
+                                for a in range(1, 5)
+                            ],
+                        }
+                        for q in range(1, questions + 1)
+                    ],
+                },
+            }
+        )
+        for i in range(1, lessons + 1)
+    ]
+
+
+async def import_per_row(db: AsyncSession, course_id: int, tree: list[LessonImport]):
+    lessons, quizzes = LessonRepository(db), QuizRepository(db)
+    questions, answers = QuestionRepository(db), AnswerRepository(db)
+    for item in tree:
+        lesson = await lessons.create(
+            {**item.model_dump(exclude={"quiz"}), "course_id": course_id}
+        )
+        quiz = await quizzes.create(
+            {**item.quiz.model_dump(exclude={"questions"}), "lesson_id": lesson.id}
+        )
+        for q in item.quiz.questions:
+            question = await questions.create(
+                {**q.model_dump(exclude={"answers"}), "quiz_id": quiz.id}
+            )
+            for a in q.answers:
+                await answers.create({**a.model_dump(), "question_id": question.id})
+
+
+async def import_bulk(db: AsyncSession, course_id: int, tree: list[LessonImport]):
+    repository = LessonImportRepository(db)
+    for start in range(0, len(tree), 100):
+        await repository.insert_batch(course_id, tree[start : start + 100])
+    await repository.commit(course_id)
+
+
+async def run(database_url: str, lessons: int, questions: int) -> dict:
+    src.lib.cache.redis_client = FakeAsyncRedis()
+    engine = build_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements = 0
+
+    def count(*args):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    tree = build_tree(lessons, questions)
+    results = {}
+
+    async with session_factory() as db:
+        user = await AuthRepository(db).create(
+            {"email": "bench@example.com", "password": "x", "name": "Bench"}
+        )
+        for name, importer in (("per_row", import_per_row), ("bulk", import_bulk)):
+            course = await CourseRepository(db).create(
+                {"title": name, "creator_id": user.id}
+            )
+            statements = 0
+            started = time.perf_counter()
+            await importer(db, course.id, tree)
+            results[name] = {
+                "seconds": round(time.perf_counter() - started, 4),
+                "statements": statements,
+            }
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+    rows = lessons * (2 + questions * 5)
+    return {
+        "database": engine.url.get_backend_name(),
+        "lessons": lessons,
+        "questions_per_quiz": questions,
+        "rows": rows,
+        **results,
+        "speedup": round(results["per_row"]["seconds"] / results["bulk"]["seconds"], 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--lessons", type=int, default=50)
+    parser.add_argument("--questions", type=int, default=10)
+    args = parser.parse_args()
+    report = asyncio.run(run(args.database_url, args.lessons, args.questions))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Fake Anthropic Messages API for load tests.
+
+Answers `POST /v1/messages` like the real API, both as one JSON body and as
+a server-sent event stream (`"stream": true`), so `ClaudeClient.generate`
+and `ClaudeClient.stream` run unchanged. Latency is shaped, not computed:
+the first token comes after `--ttft-ms`, then `--tokens` tokens follow at
+`--tokens-per-second`; `--jitter` scales every delay by a random factor in
+[1 - jitter, 1 + jitter]. `--error-rate` answers that share of requests with
+529 overloaded, to exercise retries and the provider fallback.
+
+`GET /stats` returns the requests served, for checking that load actually
+reached the provider (and was not answered from the semantic cache).
+
+Point the API at it with ANTHROPIC_BASE_URL (any ANTHROPIC_API_KEY works).
+
+Usage:
+    python -m benchmarks.fake_llm --port 8100
+    python -m benchmarks.fake_llm --ttft-ms 800 --tokens 300 --tokens-per-second 60
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+WORDS = (
+    "Đệ quy là kỹ thuật một hàm tự gọi chính nó để giải bài toán nhỏ hơn "
+    "cho đến khi gặp trường hợp cơ sở"
+).split()
+
+
+@dataclass
+class LatencyProfile:
+    ttft_ms: float = 300.0
+    tokens: int = 120
+    tokens_per_second: float = 80.0
+    jitter: float = 0.1
+    error_rate: float = 0.0
+
+    def delay(self, seconds: float) -> float:
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    @property
+    def ttft(self) -> float:
+        return self.delay(self.ttft_ms / 1000)
+
+    @property
+    def inter_token(self) -> float:
+        return self.delay(1 / self.tokens_per_second)
+
+
+def create_app(profile: LatencyProfile) -> Starlette:
+    stats: Counter[str] = Counter()
+    ids = itertools.count(1)
+
+    def message(model: str, input_tokens: int, text: str, output_tokens: int) -> dict:
+        return {
+            "id": f"msg_fake_{next(ids)}",
+            "type": "message",
+            "role": "assistant",
+            "model": model,
+            "content": [{"type": "text", "text": text}] if text else [],
+            "stop_reason": "end_turn" if text else None,
+            "stop_sequence": None,
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+        }
+
+    def sse(event: str, data: dict) -> bytes:
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+    async def events(
+        model: str, input_tokens: int, tokens: int
+    ) -> AsyncIterator[bytes]:
+        yield sse(
+            "message_start",
+            {"type": "message_start", "message": message(model, input_tokens, "", 1)},
+        )
+        yield sse(
+            "content_block_start",
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+        )
+        await asyncio.sleep(profile.ttft)
+        for i in range(tokens):
+            if i:
+                await asyncio.sleep(profile.inter_token)
+            yield sse(
+                "content_block_delta",
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {
+                        "type": "text_delta",
+                        "text": WORDS[i % len(WORDS)] + " ",
+                    },
+                },
+            )
+        yield sse("content_block_stop", {"type": "content_block_stop", "index": 0})
+        yield sse(
+            "message_delta",
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": tokens},
+            },
+        )
+        yield sse("message_stop", {"type": "message_stop"})
+        stats["completed"] += 1
+
+    async def messages(request: Request) -> Response:
+        body = await request.json()
+        stats["requests"] += 1
+        if random.random() < profile.error_rate:
+            stats["overloaded"] += 1
+            return JSONResponse(
+                {
+                    "type": "error",
+                    "error": {"type": "overloaded_error", "message": "Overloaded"},
+                },
+                status_code=529,
+            )
+
+        model = body.get("model", "fake")
+        tokens = min(profile.tokens, body.get("max_tokens") or profile.tokens)
+        # Rough count, ~4 characters per token like the real tokenizer
+        input_tokens = max(1, len(json.dumps(body, ensure_ascii=False)) // 4)
+        if body.get("stream"):
+            stats["streamed"] += 1
+            return StreamingResponse(
+                events(model, input_tokens, tokens), media_type="text/event-stream"
+            )
+
+        await asyncio.sleep(
+            profile.ttft + sum(profile.inter_token for _ in range(tokens - 1))
+        )
+        stats["completed"] += 1
+        text = " ".join(WORDS[i % len(WORDS)] for i in range(tokens))
+        return JSONResponse(message(model, input_tokens, text, tokens))
+
+    async def get_stats(request: Request) -> Response:
+        return JSONResponse(dict(stats))
+
+    return Starlette(
+        routes=[
+            Route("/v1/messages", messages, methods=["POST"]),
+            Route("/stats", get_stats, methods=["GET"]),
+        ]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--ttft-ms", type=float, default=LatencyProfile.ttft_ms)
+    parser.add_argument("--tokens", type=int, default=LatencyProfile.tokens)
+    parser.add_argument(
+        "--tokens-per-second", type=float, default=LatencyProfile.tokens_per_second
+    )
+    parser.add_argument("--jitter", type=float, default=LatencyProfile.jitter)
+    parser.add_argument("--error-rate", type=float, default=LatencyProfile.error_rate)
+    args = parser.parse_args()
+
+    profile = LatencyProfile(
+        ttft_ms=args.ttft_ms,
+        tokens=args.tokens,
+        tokens_per_second=args.tokens_per_second,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    uvicorn.run(
+        create_app(profile), host=args.host, port=args.port, log_level="warning"
+    )
+
+
+if __name__ == "__main__":
+    main()
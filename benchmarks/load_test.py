@@ -0,0 +1,400 @@
+"""
+Load test of the core endpoints: login, course list, chat send, quiz submit.
+
+Seeds its own users, course, quiz and conversations through the
+repositories (`--database-url` must be the database the API uses; rows are
+tagged `loadtest-<run>` and left in place, so use a throwaway database),
+logs every user in once, then drives the running API one scenario at a
+time: `--concurrency` clients, each with its own user, send requests
+back to back for `--warmup` + `--duration` seconds, and only requests started
+after the warmup are recorded. Reports per scenario throughput, latency
+percentiles (p50/p95/p99) and status counts as JSON; `chat_stream` also
+reports time to the first token event.
+
+Run the API against the fake provider (`benchmarks.fake_llm`), with chat
+rate limits that do not throttle the test and the semantic cache off so
+every chat request reaches the provider:
+
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8100 ANTHROPIC_API_KEY=fake \\
+    CHAT_RATE_LIMIT_PER_HOUR=1000000 CHAT_RATE_LIMIT_PER_DAY=1000000 \\
+    SEMANTIC_CACHE_ENABLED=false uvicorn src.main:app --workers 4
+
+`--baseline` compares with an earlier report and exits with status 1 when
+a scenario's p95 grew, or its throughput fell, by more than
+`--max-regression`, or its error rate grew by more than one point.
+
+Usage:
+    python -m benchmarks.load_test --output main.json
+    python -m benchmarks.load_test --scenarios login courses --concurrency 50
+    python -m benchmarks.load_test --baseline main.json --max-regression 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.config import settings
+from src.core.database import build_engine
+from src.lib.password import hash_password
+from src.repositories.auth.auth_repository import AuthRepository
+from src.repositories.chat.conversation_repository import ConversationRepository
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.lessons.lesson_repository import LessonRepository
+from src.repositories.quizzes.quiz_repository import (
+    AnswerRepository,
+    QuestionRepository,
+    QuizRepository,
+)
+
+PASSWORD = "LoadTest-123"
+QUESTION = "Giải thích đệ quy và cho một ví dụ bằng Python (lần {n})"
+TEXT = "Đệ quy là kỹ thuật một hàm tự gọi chính nó để giải bài toán nhỏ hơn. "
+# Error rate increase tolerated by --baseline, in absolute terms
+ERROR_RATE_SLACK = 0.01
+
+
+@dataclass
+class Account:
+    email: str
+    conversation_id: int
+    token: str = ""
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class Fixture:
+    run_id: str
+    course_id: int
+    quiz_id: int
+    answers: list[dict]
+    accounts: list[Account]
+
+
+@dataclass
+class Samples:
+    latencies: list[float] = field(default_factory=list)
+    first_token: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+
+async def seed(database_url: str, users: int, questions: int) -> Fixture:
+    """Create the course, quiz (unlimited attempts) and users to drive"""
+    run_id = uuid.uuid4().hex[:8]
+    engine = build_engine(database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    # One bcrypt hash for everyone; logins still verify at full cost
+    hashed = hash_password(PASSWORD)
+
+    async with session_factory() as db:
+        auth = AuthRepository(db)
+        owner = await auth.create(
+            {
+                "email": f"loadtest-{run_id}-owner@example.com",
+                "password": hashed,
+                "name": "Load test",
+            }
+        )
+        course = await CourseRepository(db).create(
+            {
+                "title": f"Load test {run_id}",
+                "description": TEXT * 3,
+                "creator_id": owner.id,
+                "is_published": True,
+            }
+        )
+        lesson = await LessonRepository(db).create(
+            {
+                "course_id": course.id,
+                "title": "Đệ quy",
+                "content": TEXT * 20,
+                "order": 1,
+            }
+        )
+        quiz = await QuizRepository(db).create(
+            {"lesson_id": lesson.id, "title": "Đệ quy"}
+        )
+        # NULL = unlimited; on insert the column default (3) would win
+        quiz.max_attempts = None
+        await db.commit()
+        answers = []
+        for q in range(1, questions + 1):
+            question = await QuestionRepository(db).create(
+                {"quiz_id": quiz.id, "content": f"Câu {q}", "order": q}
+            )
+            for a in range(1, 5):
+                answer = await AnswerRepository(db).create(
+                    {
+                        "question_id": question.id,
+                        "content": f"Đáp án {a}",
+                        "is_correct": a == 1,
+                        "order": a,
+                    }
+                )
+                if a == 1:
+                    answers.append(
+                        {"question_id": question.id, "answer_ids": [answer.id]}
+                    )
+
+        accounts = []
+        for i in range(users):
+            user = await auth.create(
+                {
+                    "email": f"loadtest-{run_id}-{i}@example.com",
+                    "password": hashed,
+                    "name": f"Load test {i}",
+                }
+            )
+            conversation = await ConversationRepository(db).create(
+                {"user_id": user.id, "course_id": course.id}
+            )
+            accounts.append(Account(user.email, conversation.id))
+
+    await engine.dispose()
+    return Fixture(run_id, course.id, quiz.id, answers, accounts)
+
+
+# A scenario sends one request; returns the status and, for streams, the
+# seconds until the first token event
+Scenario = Callable[
+    [httpx.AsyncClient, Account, Fixture, int], Awaitable[tuple[int, float | None]]
+]
+
+
+async def login(client, account, fixture, n):
+    response = await client.post(
+        "/api/v1/auth/login", json={"email": account.email, "password": PASSWORD}
+    )
+    return response.status_code, None
+
+
+async def courses(client, account, fixture, n):
+    response = await client.get("/api/v1/courses", headers=account.headers)
+    return response.status_code, None
+
+
+async def chat(client, account, fixture, n):
+    response = await client.post(
+        f"/api/chat/conversations/{account.conversation_id}/messages",
+        json={"content": QUESTION.format(n=n)},
+        headers=account.headers,
+    )
+    return response.status_code, None
+
+
+async def chat_stream(client, account, fixture, n):
+    started = time.perf_counter()
+    first_token = None
+    async with client.stream(
+        "POST",
+        f"/api/chat/conversations/{account.conversation_id}/messages/stream",
+        json={"content": QUESTION.format(n=n)},
+        headers=account.headers,
+    ) as response:
+        async for line in response.aiter_lines():
+            if line == "event: error":
+                return 502, first_token
+            if first_token is None and line == "event: token":
+                first_token = time.perf_counter() - started
+    return response.status_code, first_token
+
+
+async def quiz(client, account, fixture, n):
+    response = await client.post(
+        f"/api/v1/quizzes/{fixture.quiz_id}/submit",
+        json={"answers": fixture.answers},
+        headers=account.headers,
+    )
+    return response.status_code, None
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "login": login,
+    "courses": courses,
+    "chat": chat,
+    "chat_stream": chat_stream,
+    "quiz": quiz,
+}
+
+
+async def authenticate(client: httpx.AsyncClient, accounts: list[Account]) -> None:
+    async def one(account: Account) -> None:
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": account.email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+        account.token = response.json()["access_token"]
+
+    await asyncio.gather(*(one(account) for account in accounts))
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    fixture: Fixture,
+    concurrency: int,
+    warmup: float,
+    duration: float,
+) -> Samples:
+    samples = Samples()
+    record_from = time.perf_counter() + warmup
+    deadline = record_from + duration
+
+    async def worker(i: int) -> None:
+        account = fixture.accounts[i % len(fixture.accounts)]
+        n = 0
+        while (started := time.perf_counter()) < deadline:
+            n += 1
+            try:
+                status, first_token = await scenario(client, account, fixture, n)
+            except httpx.HTTPError as exc:
+                status, first_token = type(exc).__name__, None
+            if started >= record_from:
+                samples.latencies.append(time.perf_counter() - started)
+                samples.statuses[status] += 1
+                if first_token is not None:
+                    samples.first_token.append(first_token)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return samples
+
+
+def percentiles(seconds: list[float]) -> dict[str, float]:
+    """p50/p95/p99, mean and max in milliseconds"""
+    if not seconds:
+        return {}
+    cuts = (
+        statistics.quantiles(seconds, n=100, method="inclusive")
+        if len(seconds) > 1
+        else seconds * 99
+    )
+    values = {
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "mean": statistics.fmean(seconds),
+        "max": max(seconds),
+    }
+    return {name: round(value * 1000, 1) for name, value in values.items()}
+
+
+def summarize(samples: Samples, duration: float) -> dict:
+    requests = len(samples.latencies)
+    ok = sum(
+        count
+        for status, count in samples.statuses.items()
+        if isinstance(status, int) and status < 400
+    )
+    summary = {
+        "requests": requests,
+        "throughput_rps": round(requests / duration, 1),
+        "error_rate": round((requests - ok) / requests, 4) if requests else 0.0,
+        "latency_ms": percentiles(samples.latencies),
+        "status": {str(status): count for status, count in samples.statuses.items()},
+    }
+    if samples.first_token:
+        summary["first_token_ms"] = percentiles(samples.first_token)
+    return summary
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Scenarios that got slower, or failed more, than `baseline`"""
+    regressions = []
+    for name, current in report["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before or not before["requests"]:
+            continue
+        p95, p95_before = current["latency_ms"].get("p95"), before["latency_ms"]["p95"]
+        if p95 is None or p95 > p95_before * (1 + max_regression):
+            regressions.append(f"{name}: p95 {p95_before} -> {p95} ms")
+        rps, rps_before = current["throughput_rps"], before["throughput_rps"]
+        if rps < rps_before * (1 - max_regression):
+            regressions.append(f"{name}: throughput {rps_before} -> {rps} req/s")
+        errors, errors_before = current["error_rate"], before["error_rate"]
+        if errors > errors_before + ERROR_RATE_SLACK:
+            regressions.append(f"{name}: error rate {errors_before} -> {errors}")
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> dict:
+    users = args.users or args.concurrency
+    fixture = await seed(args.database_url, users, args.questions)
+    limits = httpx.Limits(
+        max_connections=args.concurrency, max_keepalive_connections=args.concurrency
+    )
+    report = {
+        "base_url": args.base_url,
+        "started_at": datetime.now(UTC).isoformat(),
+        "run_id": fixture.run_id,
+        "concurrency": args.concurrency,
+        "users": users,
+        "warmup_seconds": args.warmup,
+        "duration_seconds": args.duration,
+        "scenarios": {},
+    }
+    async with httpx.AsyncClient(
+        base_url=args.base_url, timeout=args.timeout, limits=limits
+    ) as client:
+        await authenticate(client, fixture.accounts)
+        for name in args.scenarios:
+            samples = await drive(
+                client,
+                SCENARIOS[name],
+                fixture,
+                args.concurrency,
+                args.warmup,
+                args.duration,
+            )
+            report["scenarios"][name] = summarize(samples, args.duration)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=["login", "courses", "chat", "quiz"],
+    )
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--users", type=int, default=0, help="default: one per client")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--output", type=Path, help="also write the report here")
+    parser.add_argument("--baseline", type=Path, help="earlier report to compare")
+    parser.add_argument("--max-regression", type=float, default=0.15)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        report["regressions"] = compare(report, baseline, args.max_regression)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+    if report.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+"""
+pytest-benchmark micro-benchmarks of the request hot paths.
+
+Kept out of the test suite: files are `bench_*.py` and run with their own
+`pytest.ini`, so coverage options and `tests/` fixtures do not apply.
+
+Usage:
+    python -m pytest benchmarks/micro
+    python -m pytest benchmarks/micro --benchmark-json=micro.json
+    python -m pytest benchmarks/micro --benchmark-autosave
+    python -m pytest benchmarks/micro --benchmark-compare \\
+        --benchmark-compare-fail=median:15%
+"""
@@ -0,0 +1,59 @@
+"""
+Quiz grading: compiling the answer key and grading submissions.
+
+Rows mimic `QuizRepository.get_answer_key` for a 50-question quiz of
+single choice, multiple choice and fill-in-the-blank questions.
+"""
+
+from collections import namedtuple
+
+import pytest
+
+from src.schemas.quiz import AnswerSubmission
+from src.services.quizzes.quiz_grader import compile_quiz, grade_submissions
+
+KeyRow = namedtuple("KeyRow", "question_id type points answer_id content is_correct")
+TYPES = ("single_choice", "multiple_choice", "fill_blank")
+QUESTIONS = 50
+
+
+def answer_key() -> list[KeyRow]:
+    rows = []
+    for q in range(1, QUESTIONS + 1):
+        type_ = TYPES[q % 3]
+        for a in range(4):
+            correct = a == 0 or (type_ == "multiple_choice" and a == 2)
+            rows.append(KeyRow(q, type_, 1 + q % 3, q * 10 + a, f"Đáp án {a}", correct))
+    return rows
+
+
+def submission() -> list[AnswerSubmission]:
+    return [
+        (
+            AnswerSubmission(question_id=q, text_answer="ĐÁP ÁN  0")
+            if TYPES[q % 3] == "fill_blank"
+            else AnswerSubmission(question_id=q, answer_ids=[q * 10, q * 10 + 2])
+        )
+        for q in range(1, QUESTIONS + 1)
+    ]
+
+
+@pytest.fixture(scope="module")
+def compiled():
+    return compile_quiz(1, 1, answer_key())
+
+
+def bench_compile_quiz(benchmark):
+    rows = answer_key()
+    assert len(benchmark(compile_quiz, 1, 1, rows).question_ids) == QUESTIONS
+
+
+def bench_grade_one(benchmark, compiled):
+    answers = [submission()]
+    assert benchmark(grade_submissions, compiled, answers)[0].earned_points > 0
+
+
+@pytest.mark.parametrize("batch", [10, 100])
+def bench_grade_batch(benchmark, compiled, batch):
+    answers = [submission()] * batch
+    assert len(benchmark(grade_submissions, compiled, answers)) == batch
@@ -0,0 +1,72 @@
+"""
+Access tokens and password hashing.
+
+`verify_password` runs at the configured BCRYPT_ROUNDS, the cost every
+login pays; it is timed over a few rounds only.
+"""
+
+import asyncio
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+import src.lib.cache
+from src.lib.jwt import (
+    create_access_token,
+    decode_access_token,
+    token_digest,
+    verified_token_cache,
+    verify_access_token,
+)
+from src.lib.password import hash_password, verify_password
+
+PASSWORD = "Benchmark-123"
+
+
+@pytest.fixture(scope="module")
+def token() -> str:
+    return create_access_token({"sub": "42"})
+
+
+@pytest.fixture
+def loop(monkeypatch):
+    monkeypatch.setattr(src.lib.cache, "redis_client", FakeAsyncRedis())
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def bench_create_access_token(benchmark):
+    benchmark(create_access_token, {"sub": "42"})
+
+
+def bench_decode_access_token(benchmark, token):
+    assert benchmark(decode_access_token, token)["sub"] == "42"
+
+
+def bench_token_digest(benchmark, token):
+    benchmark(token_digest, token)
+
+
+def bench_verify_access_token_cached(benchmark, token, loop):
+    """Request path once the worker has seen the token"""
+    loop.run_until_complete(verify_access_token(token))
+    claims = benchmark(lambda: loop.run_until_complete(verify_access_token(token)))
+    assert claims["sub"] == "42"
+
+
+def bench_verify_access_token_uncached(benchmark, token, loop):
+    """Signature check plus the Redis revocation lookup"""
+
+    def verify():
+        verified_token_cache.clear()
+        return loop.run_until_complete(verify_access_token(token))
+
+    assert benchmark(verify)["sub"] == "42"
+
+
+def bench_verify_password(benchmark):
+    hashed = hash_password(PASSWORD)
+    assert benchmark.pedantic(
+        verify_password, args=(PASSWORD, hashed), rounds=5, warmup_rounds=1
+    )
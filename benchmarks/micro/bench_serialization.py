@@ -0,0 +1,47 @@
+"""
+Response encoding of every response schema, 100 rows per payload.
+
+Payloads come from `benchmarks.serialization_benchmark`. `orjson` is
+FastAPI's route path (validate, then ORJSONResponse), `adapter` the
+JSONAdapter used by list endpoints.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from benchmarks.serialization_benchmark import payloads
+from src.lib.responses import JSONAdapter
+
+PAYLOADS = payloads(rows=100)
+
+
+@pytest.fixture(scope="module")
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+def bench_adapter(benchmark, name):
+    type_, make = PAYLOADS[name]
+    benchmark(JSONAdapter(type_).dump_json, make())
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+def bench_orjson(benchmark, name, loop):
+    type_, make = PAYLOADS[name]
+    field = create_model_field(name="Response", type_=type_, mode="serialization")
+    value = make()
+
+    def encode() -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=value)
+        )
+        return ORJSONResponse(content).body
+
+    benchmark(encode)
@@ -0,0 +1,262 @@
+"""
+Response serialization: FastAPI's default path vs. orjson vs. JSONAdapter.
+
+For each response schema in `src/schemas`, encodes a realistic payload
+(ORM rows where the endpoint returns rows) three ways:
+
+- `default`: FastAPI's `serialize_response` through the route's response
+  field, then `JSONResponse` (json.dumps), as before;
+- `orjson`: the same validation, then `ORJSONResponse`, the app's default;
+- `adapter`: `JSONAdapter.dump_json`, used by list endpoints: validation
+  and encoding in one pass inside pydantic-core.
+
+Reports CPU microseconds per response and the speedup over `default` as
+JSON. Every path must produce the same document.
+
+Usage:
+    python -m benchmarks.serialization_benchmark
+    python -m benchmarks.serialization_benchmark --rows 500 --iterations 200
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.lib.responses import JSONAdapter
+from src.models.chat import Conversation, Message
+from src.models.course import Course
+from src.models.document import Document
+from src.models.lesson import Lesson
+from src.models.quiz import QuizAttempt
+from src.schemas.chat import ConversationResponse, MessageResponse
+from src.schemas.course import CourseListResponse, CourseSearchResponse
+from src.schemas.document import DocumentResponse
+from src.schemas.lesson import LessonResponse
+from src.schemas.progress import ProgressOverviewResponse
+from src.schemas.quiz import QuizAttemptResponse, QuizResult
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=UTC)
+TEXT = "Đệ quy là kỹ thuật một hàm tự gọi chính nó để giải bài toán nhỏ hơn. "
+
+
+def course(i: int) -> Course:
+    return Course(
+        id=i,
+        creator_id=1,
+        title=f"Khóa học Python {i}",
+        description=TEXT * 3,
+        category="programming",
+        level="beginner",
+        duration_hours=12,
+        is_published=True,
+        created_at=NOW,
+    )
+
+
+def payloads(rows: int) -> dict[str, tuple[Any, Callable[[], Any]]]:
+    """Schema name -> (response type, factory of a fresh payload)"""
+    return {
+        "CourseListResponse": (
+            CourseListResponse,
+            lambda: {
+                "items": [course(i) for i in range(rows)],
+                "total": rows * 10,
+                "page": 1,
+                "size": rows,
+                "pages": 10,
+                "next_cursor": "eyJpZCI6MTB9",
+            },
+        ),
+        "CourseSearchResponse": (
+            CourseSearchResponse,
+            lambda: {
+                "items": [
+                    {
+                        **vars(course(i)),
+                        "rank": 1.0 / (i + 1),
+                        "title_highlight": f"Khóa học <mark>Python</mark> {i}",
+                        "description_highlight": TEXT,
+                    }
+                    for i in range(rows)
+                ],
+                "total": rows,
+                "page": 1,
+                "size": rows,
+                "pages": 1,
+                "facets": {"category": {"programming": rows}, "level": {"beginner": 3}},
+            },
+        ),
+        "list[LessonResponse]": (
+            list[LessonResponse],
+            lambda: [
+                Lesson(
+                    id=i,
+                    course_id=1,
+                    title=f"Bài {i}",
+                    order=i,
+                    duration_minutes=15,
+                    created_at=NOW,
+                )
+                for i in range(rows)
+            ],
+        ),
+        "list[MessageResponse]": (
+            list[MessageResponse],
+            lambda: [
+                Message(
+                    id=i,
+                    conversation_id=1,
+                    role="assistant" if i % 2 else "user",
+                    content=TEXT * 6,
+                    created_at=NOW,
+                )
+                for i in range(rows)
+            ],
+        ),
+        "list[ConversationResponse]": (
+            list[ConversationResponse],
+            lambda: [
+                Conversation(
+                    id=i, user_id=1, course_id=1, title=f"Hỏi {i}", created_at=NOW
+                )
+                for i in range(rows)
+            ],
+        ),
+        "list[QuizAttemptResponse]": (
+            list[QuizAttemptResponse],
+            lambda: [
+                QuizAttempt(
+                    id=i,
+                    quiz_id=1,
+                    score=80,
+                    total_points=10,
+                    earned_points=8,
+                    passed=True,
+                    started_at=NOW,
+                    completed_at=NOW,
+                )
+                for i in range(rows)
+            ],
+        ),
+        "list[DocumentResponse]": (
+            list[DocumentResponse],
+            lambda: [
+                Document(
+                    id=i,
+                    course_id=1,
+                    name=f"slides-{i}.pdf",
+                    file_type="pdf",
+                    file_size=123456,
+                    created_at=NOW,
+                )
+                for i in range(rows)
+            ],
+        ),
+        "QuizResult": (
+            QuizResult,
+            lambda: {
+                "attempt_id": 1,
+                "score": 80,
+                "total_points": rows,
+                "earned_points": rows - 2,
+                "passed": True,
+                "completed_at": NOW,
+                "details": [
+                    {
+                        "question_id": i,
+                        "correct": bool(i % 3),
+                        "selected_answer_ids": [i * 4],
+                        "correct_answer_ids": [i * 4],
+                        "points_earned": 1,
+                    }
+                    for i in range(rows)
+                ],
+            },
+        ),
+        "ProgressOverviewResponse": (
+            ProgressOverviewResponse,
+            lambda: {
+                "total_courses": rows,
+                "completed_courses": 1,
+                "total_lessons": rows * 10,
+                "completed_lessons": rows,
+                "courses": [
+                    {
+                        "course_id": i,
+                        "course_title": f"Khóa học {i}",
+                        "total_lessons": 10,
+                        "completed_lessons": 1,
+                        "progress": 10,
+                        "completed": False,
+                        "last_activity_at": NOW,
+                    }
+                    for i in range(rows)
+                ],
+            },
+        ),
+    }
+
+
+def cpu_us(encode: Callable[[Any], bytes], make: Callable[[], Any], n: int) -> float:
+    values = [make() for _ in range(n)]
+    started = time.process_time()
+    for value in values:
+        encode(value)
+    return (time.process_time() - started) / n * 1_000_000
+
+
+def run(rows: int, iterations: int) -> dict:
+    loop = asyncio.new_event_loop()
+    report = {}
+    for name, (type_, make) in payloads(rows).items():
+        field = create_model_field(name="Response", type_=type_, mode="serialization")
+        adapter = JSONAdapter(type_)
+
+        def via(
+            response_class: type[JSONResponse], field: Any = field
+        ) -> Callable[[Any], bytes]:
+            def encode(value: Any) -> bytes:
+                content = loop.run_until_complete(
+                    serialize_response(field=field, response_content=value)
+                )
+                return response_class(content).body
+
+            return encode
+
+        paths = {
+            "default": via(JSONResponse),
+            "orjson": via(ORJSONResponse),
+            "adapter": adapter.dump_json,
+        }
+        documents = {json.loads(dump(make())).__repr__() for dump in paths.values()}
+        assert len(documents) == 1, f"{name}: paths disagree"
+
+        timings = {path: cpu_us(dump, make, iterations) for path, dump in paths.items()}
+        report[name] = {
+            "bytes": len(paths["adapter"](make())),
+            **{f"{path}_cpu_us": round(us, 1) for path, us in timings.items()},
+            "orjson_speedup": round(timings["default"] / timings["orjson"], 2),
+            "adapter_speedup": round(timings["default"] / timings["adapter"], 2),
+        }
+    loop.close()
+    return {"rows": rows, "iterations": iterations, "schemas": report}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main()
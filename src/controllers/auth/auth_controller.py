@@ -0,0 +1,84 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.dependencies import bearer_scheme, get_current_user
+from src.exceptions.auth import InvalidCredentialsError, UserAlreadyExistsError
+from src.models.user import User
+from src.schemas.user import (
+    TokenResponse,
+    UserCreate,
+    UserLogin,
+    UserResponse,
+    UserUpdate,
+)
+from src.services.auth.auth_service import AuthService
+
+router = APIRouter(prefix="/api/v1/auth", tags=["Auth"])
+
+
+def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
+    return AuthService(db)
+
+
+@router.post(
+    "/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED
+)
+async def register(
+    data: UserCreate,
+    service: AuthService = Depends(get_auth_service),
+) -> User:
+    """Đăng ký tài khoản"""
+    try:
+        return await service.register(data.model_dump())
+    except UserAlreadyExistsError:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST, "Email already exists"
+        ) from None
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(
+    data: UserLogin,
+    service: AuthService = Depends(get_auth_service),
+) -> dict[str, str]:
+    """Đăng nhập bằng email + password"""
+    try:
+        return await service.login(data.email, data.password)
+    except InvalidCredentialsError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from None
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    current_user: Annotated[User, Depends(get_current_user)],
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    service: AuthService = Depends(get_auth_service),
+) -> None:
+    """Đăng xuất: token hiện tại không dùng được nữa"""
+    await service.logout(current_user, credentials.credentials)
+
+
+@router.get("/profile", response_model=UserResponse)
+async def profile(
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> User:
+    """Thông tin user hiện tại"""
+    return current_user
+
+
+@router.put("/profile", response_model=UserResponse)
+async def update_profile(
+    data: UserUpdate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: AuthService = Depends(get_auth_service),
+) -> User:
+    """Cập nhật profile"""
+    return await service.update_profile(current_user, data)
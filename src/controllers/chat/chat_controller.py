@@ -0,0 +1,249 @@
+import logging
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.database import get_db
+from src.core.dependencies import check_chat_rate_limit, get_current_user
+from src.exceptions.chat import ConversationNotFoundError, CourseNotFoundError
+from src.exceptions.pagination import InvalidCursorError
+from src.lib.ai.router import LLMRouter, get_ai_router
+from src.lib.ai.semantic_cache import SemanticAnswerCache, get_semantic_cache
+from src.lib.responses import JSONAdapter
+from src.lib.write_behind import WriteBehindBuffer
+from src.models.chat import Conversation, Message
+from src.models.user import User
+from src.repositories.chat.message_repository import message_buffer
+from src.schemas.chat import (
+    ConversationCreate,
+    ConversationResponse,
+    MessageCreate,
+    MessageResponse,
+)
+from src.services.chat.chat_service import PAGE_SIZE, ChatService
+from src.services.chat.summary_service import (
+    ConversationSummaryService,
+    get_conversation_summarizer,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/chat", tags=["Chat"])
+
+MAX_PAGE_SIZE = 200
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+conversation_list_json: JSONAdapter[list[ConversationResponse]] = JSONAdapter(
+    list[ConversationResponse]
+)
+message_list_json: JSONAdapter[list[MessageResponse]] = JSONAdapter(
+    list[MessageResponse]
+)
+
+
+def get_message_buffer() -> WriteBehindBuffer[Message] | None:
+    """FastAPI dependency; None in "sync" durability mode"""
+    if settings.CHAT_MESSAGE_DURABILITY == "buffered":
+        return message_buffer
+    return None
+
+
+def get_chat_service(
+    db: AsyncSession = Depends(get_db),
+    ai_client: LLMRouter = Depends(get_ai_router),
+    answer_cache: SemanticAnswerCache | None = Depends(get_semantic_cache),
+    summarizer: ConversationSummaryService | None = Depends(
+        get_conversation_summarizer
+    ),
+    buffer: WriteBehindBuffer[Message] | None = Depends(get_message_buffer),
+) -> ChatService:
+    return ChatService(
+        db,
+        ai_client,
+        answer_cache=answer_cache,
+        summarizer=summarizer,
+        message_buffer=buffer,
+    )
+
+
+def _not_found(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+
+
+def _cursor_headers(next_cursor: str | None) -> dict[str, str]:
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+# ============ Conversations ============
+@router.get("/conversations", response_model=list[ConversationResponse])
+async def index(
+    current_user: Annotated[User, Depends(get_current_user)],
+    limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    service: ChatService = Depends(get_chat_service),
+) -> Response:
+    """
+    Danh sách conversations của user (mới nhất trước)
+
+    Query params:
+    - limit: Số item/trang
+    - cursor: Giá trị header `X-Next-Cursor` của trang trước
+    """
+    try:
+        items, next_cursor = await service.list_conversations(
+            current_user.id, limit, cursor
+        )
+    except InvalidCursorError:
+        raise _invalid_cursor() from None
+    return conversation_list_json.response(items, headers=_cursor_headers(next_cursor))
+
+
+@router.get("/conversations/{conversation_id}", response_model=ConversationResponse)
+async def show(
+    conversation_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ChatService = Depends(get_chat_service),
+) -> Conversation:
+    """Chi tiết conversation"""
+    try:
+        return await service.get_conversation(conversation_id, current_user.id)
+    except ConversationNotFoundError:
+        raise _not_found("Conversation not found") from None
+
+
+@router.post(
+    "/conversations",
+    response_model=ConversationResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create(
+    data: ConversationCreate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ChatService = Depends(get_chat_service),
+) -> Conversation:
+    """Tạo conversation mới"""
+    try:
+        return await service.create_conversation(current_user.id, data)
+    except CourseNotFoundError:
+        raise _not_found("Course not found") from None
+
+
+@router.delete(
+    "/conversations/{conversation_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+async def destroy(
+    conversation_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ChatService = Depends(get_chat_service),
+) -> None:
+    """Xóa conversation"""
+    try:
+        await service.delete_conversation(conversation_id, current_user.id)
+    except ConversationNotFoundError:
+        raise _not_found("Conversation not found") from None
+
+
+# ============ Messages ============
+@router.get(
+    "/conversations/{conversation_id}/messages",
+    response_model=list[MessageResponse],
+)
+async def list_messages(
+    conversation_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    service: ChatService = Depends(get_chat_service),
+) -> Response:
+    """
+    Danh sách tin nhắn (cũ nhất trước)
+
+    Query params:
+    - limit: Số item/trang
+    - cursor: Giá trị header `X-Next-Cursor` của trang trước
+    """
+    try:
+        items, next_cursor = await service.list_messages(
+            conversation_id, current_user.id, limit, cursor
+        )
+    except ConversationNotFoundError:
+        raise _not_found("Conversation not found") from None
+    except InvalidCursorError:
+        raise _invalid_cursor() from None
+    return message_list_json.response(items, headers=_cursor_headers(next_cursor))
+
+
+@router.post(
+    "/conversations/{conversation_id}/messages",
+    response_model=MessageResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(check_chat_rate_limit)],
+)
+async def send_message(
+    conversation_id: int,
+    data: MessageCreate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ChatService = Depends(get_chat_service),
+) -> Message:
+    """Gửi tin nhắn + AI response"""
+    try:
+        return await service.send_message(
+            conversation_id, current_user.id, data.content
+        )
+    except (ConversationNotFoundError, CourseNotFoundError):
+        raise _not_found("Conversation not found") from None
+
+
+@router.post(
+    "/conversations/{conversation_id}/messages/stream",
+    dependencies=[Depends(check_chat_rate_limit)],
+)
+async def stream_message(
+    conversation_id: int,
+    data: MessageCreate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ChatService = Depends(get_chat_service),
+) -> StreamingResponse:
+    """Gửi tin nhắn, AI response trả về dạng server-sent events.
+
+    Events: `token` ({"delta"}) per text chunk, then `done` ({"message_id"})
+    once the reply is saved, or `error` if the provider fails mid-stream.
+    """
+    try:
+        events = await service.stream_message(
+            conversation_id, current_user.id, data.content
+        )
+    except (ConversationNotFoundError, CourseNotFoundError):
+        raise _not_found("Conversation not found") from None
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event in events:
+                yield _sse(event["event"], event["data"])
+        except Exception:
+            logger.exception("AI stream failed for conversation %s", conversation_id)
+            yield _sse("error", {"detail": "AI service unavailable"})
+        finally:
+            # Also on client disconnect: releases the service's session
+            await events.aclose()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
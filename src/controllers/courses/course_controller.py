@@ -0,0 +1,191 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.dependencies import get_current_user
+from src.exceptions.courses import CourseNotFoundError, CoursePermissionError
+from src.exceptions.pagination import InvalidCursorError
+from src.lib.http_cache import catalog_cache
+from src.lib.pagination import CountMode
+from src.lib.responses import JSONAdapter
+from src.models.course import Course
+from src.models.progress import Enrollment
+from src.models.user import User
+from src.schemas.course import (
+    CourseCreate,
+    CourseListResponse,
+    CourseResponse,
+    CourseSearchResponse,
+    CourseUpdate,
+)
+from src.schemas.progress import EnrollmentResponse
+from src.services.courses.course_service import CourseService
+
+router = APIRouter(prefix="/api/v1/courses", tags=["Courses"])
+
+MAX_PAGE_SIZE = 100
+
+course_json: JSONAdapter[CourseResponse] = JSONAdapter(CourseResponse)
+course_list_json: JSONAdapter[CourseListResponse] = JSONAdapter(CourseListResponse)
+course_search_json: JSONAdapter[CourseSearchResponse] = JSONAdapter(
+    CourseSearchResponse
+)
+
+
+def get_course_service(db: AsyncSession = Depends(get_db)) -> CourseService:
+    return CourseService(db)
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(status.HTTP_404_NOT_FOUND, "Course not found")
+
+
+# ============ INDEX - List all courses ============
+@router.get("", response_model=CourseListResponse)
+async def index(
+    request: Request,
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    category: str | None = None,
+    level: str | None = None,
+    cursor: str | None = None,
+    count: CountMode | None = None,
+    service: CourseService = Depends(get_course_service),
+) -> Response:
+    """
+    Lấy danh sách khóa học với phân trang
+
+    Query params:
+    - page: Số trang (default: 1)
+    - size: Số item/trang (default: 10)
+    - category: Lọc theo danh mục
+    - level: Lọc theo cấp độ
+    - cursor: `next_cursor` của trang trước; bật cursor mode, bỏ qua `page`
+    - count: exact | estimated | none (default: exact, cursor mode: none)
+
+    Hỗ trợ ETag / If-None-Match (304)
+    """
+    try:
+        return await catalog_cache.respond(
+            request,
+            ["courses"],
+            course_list_json,
+            lambda: service.list_courses(page, size, category, level, cursor, count),
+        )
+    except InvalidCursorError:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid cursor") from None
+
+
+# ============ SEARCH - Full-text search ============
+# Declared before /{course_id} so "search" is not parsed as an id
+@router.get("/search", response_model=CourseSearchResponse)
+async def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    page: int = Query(1, ge=1),
+    size: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    category: str | None = None,
+    level: str | None = None,
+    service: CourseService = Depends(get_course_service),
+) -> Response:
+    """
+    Tìm kiếm khóa học theo tiêu đề, mô tả, danh mục
+
+    Query params:
+    - q: Từ khóa; mọi từ phải khớp, từ cuối khớp theo tiền tố, không phân biệt dấu
+    - page, size: Phân trang
+    - category, level: Lọc kết quả (không ảnh hưởng `facets`)
+    """
+    return await catalog_cache.respond(
+        request,
+        ["courses"],
+        course_search_json,
+        lambda: service.search_courses(q, page, size, category, level),
+    )
+
+
+# ============ SHOW - Get course by ID ============
+@router.get("/{course_id}", response_model=CourseResponse)
+async def show(
+    course_id: int,
+    request: Request,
+    service: CourseService = Depends(get_course_service),
+) -> Response:
+    """Lấy chi tiết khóa học theo ID (hỗ trợ ETag / If-None-Match)"""
+    try:
+        return await catalog_cache.respond(
+            request,
+            [f"course:{course_id}"],
+            course_json,
+            lambda: service.get_course(course_id),
+        )
+    except CourseNotFoundError:
+        raise _not_found() from None
+
+
+# ============ CREATE - Create new course ============
+@router.post("", response_model=CourseResponse, status_code=status.HTTP_201_CREATED)
+async def create(
+    data: CourseCreate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: CourseService = Depends(get_course_service),
+) -> Course:
+    """Tạo khóa học mới"""
+    return await service.create_course(data, creator_id=current_user.id)
+
+
+# ============ UPDATE - Update course ============
+@router.put("/{course_id}", response_model=CourseResponse)
+async def update(
+    course_id: int,
+    data: CourseUpdate,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: CourseService = Depends(get_course_service),
+) -> Course:
+    """Cập nhật khóa học (Owner)"""
+    try:
+        return await service.update_course(course_id, data, current_user.id)
+    except CourseNotFoundError:
+        raise _not_found() from None
+    except CoursePermissionError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Not authorized") from None
+
+
+# ============ DELETE - Delete course ============
+@router.delete("/{course_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def destroy(
+    course_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: CourseService = Depends(get_course_service),
+) -> None:
+    """Xóa khóa học (Owner)"""
+    try:
+        await service.delete_course(course_id, current_user.id)
+    except CourseNotFoundError:
+        raise _not_found() from None
+    except CoursePermissionError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Not authorized") from None
+
+
+# ============ ENROLL - Enroll in course ============
+@router.post(
+    "/{course_id}/enroll",
+    response_model=EnrollmentResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def enroll(
+    course_id: int,
+    response: Response,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: CourseService = Depends(get_course_service),
+) -> Enrollment:
+    """Đăng ký khóa học (gọi lại khi đã đăng ký trả 200)"""
+    try:
+        enrollment, created = await service.enroll(course_id, current_user.id)
+    except CourseNotFoundError:
+        raise _not_found() from None
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return enrollment
@@ -0,0 +1,173 @@
+import mimetypes
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.database import get_db
+from src.core.dependencies import get_current_user
+from src.exceptions.courses import CourseNotFoundError, CoursePermissionError
+from src.exceptions.documents import (
+    DocumentNotFoundError,
+    FileTooLargeError,
+    UnsupportedFileTypeError,
+)
+from src.lib.file_response import RangeFileResponse
+from src.lib.responses import JSONAdapter
+from src.models.document import Document
+from src.models.user import User
+from src.schemas.document import DocumentResponse
+from src.services.documents.document_service import DocumentService
+from src.services.documents.ingestion_service import (
+    DocumentIngestionService,
+    get_document_ingester,
+)
+
+router = APIRouter(prefix="/api/v1", tags=["Documents"])
+
+document_list_json: JSONAdapter[list[DocumentResponse]] = JSONAdapter(
+    list[DocumentResponse]
+)
+
+
+def get_document_service(
+    db: AsyncSession = Depends(get_db),
+    ingester: DocumentIngestionService | None = Depends(get_document_ingester),
+) -> DocumentService:
+    return DocumentService(db, ingester=ingester)
+
+
+def _content_length(request: Request) -> int | None:
+    value = request.headers.get("content-length")
+    if value is None:
+        return None
+    try:
+        length = int(value)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid Content-Length")
+    return length
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        f"File exceeds {settings.DOCUMENT_MAX_BYTES} bytes",
+    )
+
+
+@router.get("/courses/{course_id}/documents", response_model=list[DocumentResponse])
+async def index(
+    course_id: int,
+    service: DocumentService = Depends(get_document_service),
+) -> Response:
+    """Danh sách tài liệu của khóa học"""
+    try:
+        documents = await service.list_documents(course_id)
+    except CourseNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Course not found") from None
+    return document_list_json.response(documents)
+
+
+@router.post(
+    "/courses/{course_id}/documents",
+    response_model=DocumentResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            }
+        }
+    },
+)
+async def upload(
+    course_id: int,
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    filename: str = Query(..., min_length=1, max_length=255),
+    name: str | None = Query(None, max_length=255),
+    service: DocumentService = Depends(get_document_service),
+) -> Document:
+    """
+    Upload tài liệu (Owner)
+
+    Body: nội dung file (raw bytes), ghi xuống đĩa theo từng chunk.
+    Query params:
+    - filename: Tên file gốc, dùng để xác định loại file
+    - name: Tên hiển thị (default: filename)
+    """
+    content_length = _content_length(request)
+    if content_length is not None and content_length > settings.DOCUMENT_MAX_BYTES:
+        raise _too_large()
+
+    try:
+        return await service.upload(
+            course_id, current_user.id, filename, request.stream(), name
+        )
+    except CourseNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Course not found") from None
+    except CoursePermissionError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Not authorized") from None
+    except FileTooLargeError:
+        raise _too_large() from None
+    except UnsupportedFileTypeError:
+        raise HTTPException(
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, "File type not allowed"
+        ) from None
+
+
+# RangeFileResponse takes no status_code, so OpenAPI cannot infer the default
+@router.get(
+    "/documents/{document_id}",
+    response_class=RangeFileResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def download(
+    document_id: int,
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: DocumentService = Depends(get_document_service),
+) -> RangeFileResponse:
+    """
+    Download tài liệu (chủ khóa học hoặc học viên đã đăng ký)
+
+    Hỗ trợ Range (tải tiếp) và If-None-Match (ETag = sha256 của file).
+    """
+    try:
+        document = await service.get_readable(document_id, current_user.id)
+    except DocumentNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Document not found") from None
+    except CoursePermissionError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Not authorized") from None
+
+    filename = document.name
+    if not filename.lower().endswith(f".{document.file_type}"):
+        filename = f"{filename}.{document.file_type}"
+    return RangeFileResponse(
+        service.path_of(document),
+        size=await service.size_of(document),
+        etag=f'"{document.sha256}"',
+        media_type=mimetypes.guess_type(filename)[0],
+        filename=filename,
+        request_headers=request.headers,
+    )
+
+
+@router.delete("/documents/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def destroy(
+    document_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: DocumentService = Depends(get_document_service),
+) -> None:
+    """Xóa tài liệu (Owner)"""
+    try:
+        await service.delete_document(document_id, current_user.id)
+    except DocumentNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Document not found") from None
+    except CoursePermissionError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Not authorized") from None
@@ -1,5 +1,10 @@
+from typing import Any
+
 from fastapi import APIRouter
 
+from src.lib.ai.semantic_cache import semantic_cache
+from src.lib.password import password_hasher
+
 router = APIRouter(prefix="/api/health")
 
 
@@ -7,3 +12,15 @@ router = APIRouter(prefix="/api/health")
 def health_check():
     """Health check endpoint"""
     return {"status": "ok"}
+
+
+@router.get("/ai-cache")
+def ai_cache_stats() -> dict[str, Any]:
+    """Semantic answer cache hit/miss counters"""
+    return semantic_cache.snapshot()
+
+
+@router.get("/password-hasher")
+def password_hasher_stats() -> dict[str, Any]:
+    """bcrypt worker pool load (queue_depth > 0 means logins are waiting)"""
+    return password_hasher.snapshot()
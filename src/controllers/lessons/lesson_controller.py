@@ -0,0 +1,143 @@
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.dependencies import get_current_user
+from src.exceptions.courses import CourseNotFoundError, CoursePermissionError
+from src.exceptions.lessons import LessonImportError, LessonImportTooLargeError
+from src.lib.http_cache import catalog_cache
+from src.lib.responses import JSONAdapter
+from src.models.user import User
+from src.schemas.lesson import (
+    LessonImport,
+    LessonImportRequest,
+    LessonImportResponse,
+    LessonResponse,
+)
+from src.services.documents.ingestion_service import (
+    DocumentIngestionService,
+    get_document_ingester,
+)
+from src.services.lessons.lesson_import_service import LessonImportService
+from src.services.lessons.lesson_service import LessonService
+
+router = APIRouter(prefix="/api/v1", tags=["Lessons"])
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+lesson_list_json: JSONAdapter[list[LessonResponse]] = JSONAdapter(list[LessonResponse])
+
+
+def get_lesson_import_service(
+    db: AsyncSession = Depends(get_db),
+    ingester: DocumentIngestionService | None = Depends(get_document_ingester),
+) -> LessonImportService:
+    return LessonImportService(db, ingester=ingester)
+
+
+def get_lesson_service(db: AsyncSession = Depends(get_db)) -> LessonService:
+    return LessonService(db)
+
+
+async def _iter_ndjson(request: Request) -> AsyncIterator[LessonImport]:
+    """Parse an NDJSON body line by line as it arrives"""
+    buffer = b""
+    line_no = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield _parse_line(line, line_no)
+    if buffer.strip():
+        yield _parse_line(buffer, line_no + 1)
+
+
+def _parse_line(line: bytes, line_no: int) -> LessonImport:
+    try:
+        return LessonImport.model_validate_json(line)
+    except ValidationError as exc:
+        raise LessonImportError(
+            exc.errors(include_url=False)[0]["msg"], line_no
+        ) from None
+
+
+@router.get("/courses/{course_id}/lessons", response_model=list[LessonResponse])
+async def index(
+    course_id: int,
+    request: Request,
+    service: LessonService = Depends(get_lesson_service),
+) -> Response:
+    """Danh sách bài học của khóa học (hỗ trợ ETag / If-None-Match)"""
+    try:
+        return await catalog_cache.respond(
+            request,
+            [f"lessons:{course_id}"],
+            lesson_list_json,
+            lambda: service.list_lessons(course_id),
+        )
+    except CourseNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Course not found") from None
+
+
+@router.post(
+    "/courses/{course_id}/lessons/import",
+    response_model=LessonImportResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "application/json": {"schema": LessonImportRequest.model_json_schema()},
+                NDJSON_MEDIA_TYPE: {
+                    "schema": {"type": "string", "description": "1 lesson per line"}
+                },
+            }
+        }
+    },
+)
+async def import_lessons(
+    course_id: int,
+    request: Request,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: LessonImportService = Depends(get_lesson_import_service),
+) -> LessonImportResponse:
+    """
+    Import nhiều bài học kèm quiz/câu hỏi/đáp án (Owner)
+
+    Body: JSON `{"lessons": [...]}` hoặc NDJSON (1 bài học mỗi dòng,
+    Content-Type: application/x-ndjson) cho file lớn.
+    """
+    content_type = request.headers.get("content-type", "")
+    lessons: Iterable[LessonImport] | AsyncIterable[LessonImport]
+    if content_type.startswith(NDJSON_MEDIA_TYPE):
+        lessons = _iter_ndjson(request)
+    else:
+        try:
+            payload = LessonImportRequest.model_validate_json(await request.body())
+        except ValidationError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=exc.errors(include_url=False, include_context=False),
+            ) from None
+        lessons = payload.lessons
+
+    try:
+        return await service.import_lessons(course_id, current_user.id, lessons)
+    except CourseNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Course not found") from None
+    except CoursePermissionError:
+        raise HTTPException(status.HTTP_403_FORBIDDEN, "Not authorized") from None
+    except LessonImportTooLargeError as exc:
+        raise HTTPException(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, exc.detail
+        ) from None
+    except LessonImportError as exc:
+        raise HTTPException(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            {"line": exc.line, "msg": exc.detail},
+        ) from None
@@ -0,0 +1,12 @@
+from fastapi import APIRouter, Response
+
+from src.lib.metrics import render_metrics
+
+router = APIRouter(prefix="/api/metrics")
+
+
+@router.get("")
+def metrics() -> Response:
+    """Prometheus metrics (latency, SQL, AI tokens, cache hit rate)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,61 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.dependencies import get_current_user
+from src.exceptions.lessons import LessonNotFoundError
+from src.exceptions.progress import NotEnrolledError
+from src.models.user import User
+from src.schemas.progress import CourseProgressResponse, ProgressOverviewResponse
+from src.services.progress.progress_service import ProgressService
+
+router = APIRouter(prefix="/api/v1/progress", tags=["Progress"])
+
+
+def get_progress_service(db: AsyncSession = Depends(get_db)) -> ProgressService:
+    return ProgressService(db)
+
+
+def _not_enrolled() -> HTTPException:
+    return HTTPException(status.HTTP_404_NOT_FOUND, "Not enrolled in this course")
+
+
+@router.get("", response_model=ProgressOverviewResponse)
+async def overview(
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ProgressService = Depends(get_progress_service),
+) -> ProgressOverviewResponse:
+    """Tiến độ tổng quan"""
+    return await service.overview(current_user.id)
+
+
+@router.get("/courses/{course_id}", response_model=CourseProgressResponse)
+async def course_progress(
+    course_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ProgressService = Depends(get_progress_service),
+) -> CourseProgressResponse:
+    """Tiến độ theo khóa học"""
+    try:
+        return await service.course_progress(current_user.id, course_id)
+    except NotEnrolledError:
+        raise _not_enrolled() from None
+
+
+@router.post("/lessons/{lesson_id}/complete", response_model=CourseProgressResponse)
+async def complete_lesson(
+    lesson_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: ProgressService = Depends(get_progress_service),
+) -> CourseProgressResponse:
+    """Đánh dấu hoàn thành bài học"""
+    try:
+        return await service.complete_lesson(current_user.id, lesson_id)
+    except LessonNotFoundError:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "Lesson not found") from None
+    except NotEnrolledError:
+        raise HTTPException(
+            status.HTTP_403_FORBIDDEN, "Not enrolled in this course"
+        ) from None
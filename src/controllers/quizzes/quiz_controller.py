@@ -0,0 +1,58 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.dependencies import get_current_user
+from src.exceptions.quizzes import QuizAttemptLimitError, QuizNotFoundError
+from src.lib.responses import JSONAdapter
+from src.models.user import User
+from src.schemas.quiz import QuizAttemptResponse, QuizResult, QuizSubmit
+from src.services.quizzes.quiz_service import QuizService
+
+router = APIRouter(prefix="/api/v1/quizzes", tags=["Quizzes"])
+
+attempt_list_json: JSONAdapter[list[QuizAttemptResponse]] = JSONAdapter(
+    list[QuizAttemptResponse]
+)
+
+
+def get_quiz_service(db: AsyncSession = Depends(get_db)) -> QuizService:
+    return QuizService(db)
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(status.HTTP_404_NOT_FOUND, "Quiz not found")
+
+
+@router.post("/{quiz_id}/submit", response_model=QuizResult)
+async def submit(
+    quiz_id: int,
+    data: QuizSubmit,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: QuizService = Depends(get_quiz_service),
+) -> QuizResult:
+    """Nộp bài làm quiz"""
+    try:
+        return await service.submit(quiz_id, current_user.id, data)
+    except QuizNotFoundError:
+        raise _not_found() from None
+    except QuizAttemptLimitError:
+        raise HTTPException(
+            status.HTTP_400_BAD_REQUEST, "Maximum attempts reached"
+        ) from None
+
+
+@router.get("/{quiz_id}/attempts", response_model=list[QuizAttemptResponse])
+async def attempts(
+    quiz_id: int,
+    current_user: Annotated[User, Depends(get_current_user)],
+    service: QuizService = Depends(get_quiz_service),
+) -> Response:
+    """Lịch sử làm quiz"""
+    try:
+        attempts = await service.list_attempts(quiz_id, current_user.id)
+    except QuizNotFoundError:
+        raise _not_found() from None
+    return attempt_list_json.response(attempts)
@@ -1,12 +1,107 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import Delete, Insert, Select, Update, text
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, declarative_base
 
 from src.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG)
+
+def build_engine(url: str) -> AsyncEngine:
+    """Create an async engine with pool settings taken from `settings`"""
+    db_url = make_url(url)
+    kwargs: dict[str, Any] = {"echo": settings.DB_ECHO}
+
+    if db_url.get_backend_name() != "sqlite":
+        kwargs.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+
+    if db_url.get_driver_name() == "asyncpg":
+        # SQLAlchemy's own prepared statement LRU and asyncpg's native cache
+        db_url = db_url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+        )
+        kwargs["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "server_settings": {"application_name": settings.PROJECT_NAME},
+        }
+
+    return create_async_engine(db_url, **kwargs)
+
+
+_primary_reads: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Send every read inside the block to the primary.
+
+    For reads whose result is cached under a version that was just bumped:
+    a lagging replica could still return the data from before that write.
+    """
+    token = _primary_reads.set(True)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+def _is_plain_select(clause: Any) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+class RoutingSession(Session):
+    """Session sending plain SELECTs to a read replica.
+
+    Once the session flushes or executes a write it stays on the primary for
+    the rest of its life, so a request always reads its own writes.
+    """
+
+    def __init__(self, *args: Any, replica: AsyncEngine | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replica: Engine | None = replica.sync_engine if replica else None
+
+    def get_bind(
+        self, mapper: Any = None, clause: Any = None, **kwargs: Any
+    ) -> Engine | Connection:
+        if self._flushing or isinstance(clause, Insert | Update | Delete):
+            self.info["has_writes"] = True
+        elif (
+            self.replica is not None
+            and not self.info.get("has_writes")
+            and not _primary_reads.get()
+            and _is_plain_select(clause)
+        ):
+            return self.replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+engine = build_engine(settings.DATABASE_URL)
+read_engine = (
+    build_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
+)
 
 AsyncSessionLocal = async_sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    replica=read_engine,
+    expire_on_commit=False,
 )
 
 Base = declarative_base()
@@ -18,3 +113,35 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+async def warm_up_engine(db_engine: AsyncEngine, connections: int) -> None:
+    """Open `connections` pooled connections at once and run SELECT 1 on each.
+
+    Done in the app lifespan so the first requests find a full pool instead
+    of all opening connections (TCP + TLS + auth) at the same time.
+    """
+    opened = await asyncio.gather(
+        *(db_engine.connect().start() for _ in range(connections))
+    )
+    try:
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in opened))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in opened))
+
+
+async def warm_up_engines() -> None:
+    """Pre-fill the primary and replica pools (app startup)"""
+    connections = min(settings.DB_WARMUP_CONNECTIONS, settings.DB_POOL_SIZE)
+    if connections <= 0:
+        return
+    await warm_up_engine(engine, connections)
+    if read_engine is not None:
+        await warm_up_engine(read_engine, connections)
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection (app shutdown)"""
+    await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
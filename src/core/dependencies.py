@@ -0,0 +1,76 @@
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.core.database import get_db
+from src.lib.cache import current_user_cache
+from src.lib.jwt import verify_access_token
+from src.lib.rate_limit import chat_rate_limiter
+from src.models.user import User
+from src.repositories.auth.auth_repository import AuthRepository
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Resolve the authenticated user from the Bearer token.
+
+    Token claims and the user row are both cached in-process, so a warm
+    request does no signature check and no user query.
+    """
+    unauthorized = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    if credentials is None:
+        raise unauthorized
+
+    claims = await verify_access_token(credentials.credentials)
+    if not claims or not str(claims.get("sub", "")).isdigit():
+        raise unauthorized
+
+    user = await _load_user(db, int(claims["sub"]))
+    if user is None:
+        raise unauthorized
+    return user
+
+
+async def _load_user(db: AsyncSession, user_id: int) -> User | None:
+    """Active user by id, from `current_user_cache` when possible"""
+    cached = current_user_cache.get(user_id)
+    if cached is not None:
+        # Attach the cached state to this request's session without a SELECT
+        return await db.merge(cached, load=False)
+
+    user = await AuthRepository(db).get_by_id(user_id)
+    if user is None or not user.is_active:
+        return None
+    current_user_cache.set(user_id, _detached_copy(user))
+    return user
+
+
+def _detached_copy(user: User) -> User:
+    """Column snapshot not bound to any session, safe to share across requests"""
+    copy = User(
+        **{column.key: getattr(user, column.key) for column in User.__table__.columns}
+    )
+    make_transient_to_detached(copy)
+    return copy
+
+
+async def check_chat_rate_limit(
+    current_user: User = Depends(get_current_user),
+) -> None:
+    """Reject the request with 429 once the user's chat limits are used up"""
+    result = await chat_rate_limiter.hit(current_user.id)
+    if not result.allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded. Try again later.",
+            headers={"Retry-After": result.retry_after_header},
+        )
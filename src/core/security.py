@@ -1,28 +1,22 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
-from jose import jwt
-from passlib.context import CryptContext
+from src.lib import jwt
+from src.lib.jwt import decode_access_token
+from src.lib.password import hash_password, pwd_context, verify_password
 
-from src.core.config import settings
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+__all__ = [
+    "create_access_token",
+    "decode_access_token",
+    "get_password_hash",
+    "pwd_context",
+    "verify_password",
+]
 
 
 def create_access_token(subject: str | Any, expires_delta: timedelta = None) -> str:
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    to_encode = {"exp": expire, "sub": str(subject)}
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm="HS256")
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return jwt.create_access_token({"sub": str(subject)}, expires_delta)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return hash_password(password)
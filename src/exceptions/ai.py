@@ -0,0 +1,2 @@
+class AIUnavailableError(Exception):
+    """Every AI provider failed, timed out or has its circuit open"""
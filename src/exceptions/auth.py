@@ -0,0 +1,6 @@
+class UserAlreadyExistsError(Exception):
+    """Email is already registered"""
+
+
+class InvalidCredentialsError(Exception):
+    """Email or password is wrong"""
@@ -0,0 +1,7 @@
+from src.exceptions.courses import CourseNotFoundError
+
+__all__ = ["ConversationNotFoundError", "CourseNotFoundError"]
+
+
+class ConversationNotFoundError(Exception):
+    """Conversation does not exist or belongs to another user"""
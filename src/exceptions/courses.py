@@ -0,0 +1,6 @@
+class CourseNotFoundError(Exception):
+    """Course does not exist"""
+
+
+class CoursePermissionError(Exception):
+    """User is not allowed to modify the course"""
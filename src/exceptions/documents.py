@@ -0,0 +1,14 @@
+class DocumentNotFoundError(Exception):
+    """Document does not exist"""
+
+
+class FileTooLargeError(Exception):
+    """Upload exceeds the size limit"""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class UnsupportedFileTypeError(Exception):
+    """File extension/MIME type is not allowed for uploads"""
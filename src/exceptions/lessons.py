@@ -0,0 +1,15 @@
+class LessonImportError(Exception):
+    """Import document is invalid; nothing was written"""
+
+    def __init__(self, detail: str, line: int | None = None):
+        super().__init__(detail)
+        self.detail = detail
+        self.line = line
+
+
+class LessonImportTooLargeError(LessonImportError):
+    """Import document exceeds the lesson limit"""
+
+
+class LessonNotFoundError(Exception):
+    """Lesson does not exist"""
@@ -0,0 +1,2 @@
+class InvalidCursorError(ValueError):
+    """Pagination cursor is malformed or was not issued by this API"""
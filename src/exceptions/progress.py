@@ -0,0 +1,2 @@
+class NotEnrolledError(Exception):
+    """User is not enrolled in the course"""
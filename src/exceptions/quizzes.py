@@ -0,0 +1,6 @@
+class QuizNotFoundError(Exception):
+    """Quiz does not exist"""
+
+
+class QuizAttemptLimitError(Exception):
+    """User has used all attempts allowed for the quiz"""
@@ -0,0 +1,127 @@
+"""
+Chat history retention: keep `messages` small and its partitions in place.
+
+Each run:
+1. creates the monthly `messages` partitions for the coming
+   `MESSAGE_PARTITIONS_AHEAD_MONTHS` months (PostgreSQL);
+2. moves every conversation idle for `CHAT_ARCHIVE_AFTER_DAYS` to the
+   zstd archive (`CHAT_ARCHIVE_DIR`), one transaction per conversation;
+3. drops the monthly partitions older than the cutoff that are now empty.
+
+Archived conversations come back on their own the next time they are used.
+Safe to run while the API is up; run it daily.
+
+Usage:
+    python -m src.jobs.archive_conversations
+    python -m src.jobs.archive_conversations --after-days 365 --limit 1000
+"""
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.database import AsyncSessionLocal, dispose_engines
+from src.lib.partitions import (
+    MESSAGES,
+    add_months,
+    create_monthly_partitions,
+    drop_empty_partitions,
+    month_start,
+)
+from src.repositories.chat.conversation_repository import ConversationRepository
+from src.services.chat.archive_service import ConversationArchiveService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionReport:
+    conversations: int = 0
+    messages: int = 0
+    partitions_created: list[str] = field(default_factory=list)
+    partitions_dropped: list[str] = field(default_factory=list)
+
+
+async def archive_conversations(
+    after_days: int = settings.CHAT_ARCHIVE_AFTER_DAYS,
+    limit: int | None = None,
+    batch_size: int = settings.CHAT_ARCHIVE_BATCH_SIZE,
+    session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+) -> RetentionReport:
+    """Run one retention pass; `limit` caps the conversations archived"""
+    now = datetime.now(UTC)
+    before = now - timedelta(days=after_days)
+    report = RetentionReport()
+
+    async with session_factory() as db:
+        connection = await db.connection()
+        report.partitions_created = await connection.run_sync(
+            create_monthly_partitions,
+            MESSAGES,
+            now.date(),
+            add_months(now.date(), settings.MESSAGE_PARTITIONS_AHEAD_MONTHS),
+        )
+        await db.commit()
+
+    while limit is None or report.conversations < limit:
+        size = (
+            batch_size
+            if limit is None
+            else min(batch_size, limit - report.conversations)
+        )
+        async with session_factory() as db:
+            ids = await ConversationRepository(db).get_cold(before, size)
+        if not ids:
+            break
+        archived = 0
+        for conversation_id in ids:
+            # A session per conversation keeps the identity map small
+            async with session_factory() as db:
+                moved = await ConversationArchiveService(db).archive_conversation(
+                    conversation_id, before
+                )
+            if moved is not None:
+                archived += 1
+                report.messages += moved
+        report.conversations += archived
+        if len(ids) < size or not archived:
+            break
+
+    async with session_factory() as db:
+        connection = await db.connection()
+        report.partitions_dropped = await connection.run_sync(
+            drop_empty_partitions, MESSAGES, month_start(before.date())
+        )
+        await db.commit()
+    return report
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--after-days", type=int, default=settings.CHAT_ARCHIVE_AFTER_DAYS
+    )
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        report = await archive_conversations(args.after_days, args.limit)
+    finally:
+        await dispose_engines()
+    logger.info(
+        "Archived %s conversations (%s messages); partitions created %s, dropped %s",
+        report.conversations,
+        report.messages,
+        report.partitions_created,
+        report.partitions_dropped,
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+"""
+Recompute the denormalized progress counters.
+
+`courses.lesson_count` and `enrollments.completed_lessons` are maintained
+incrementally; this rebuilds them from `lessons` / `user_progress` after a
+manual data fix or to check for drift. Safe to run while the API is up.
+
+Usage:
+    python -m src.jobs.rebuild_progress
+    python -m src.jobs.rebuild_progress --course-id 42
+"""
+
+import argparse
+import asyncio
+import logging
+
+from src.core.database import AsyncSessionLocal, dispose_engines
+from src.repositories.progress.progress_repository import ProgressRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild_progress(course_id: int | None = None) -> int:
+    """Rebuild counters for one course or all; returns enrollments rewritten"""
+    async with AsyncSessionLocal() as db:
+        return await ProgressRepository(db).rebuild(course_id)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--course-id", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        count = await rebuild_progress(args.course_id)
+    finally:
+        await dispose_engines()
+    logger.info("Rebuilt progress for %s enrollments", count)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
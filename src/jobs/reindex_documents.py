@@ -0,0 +1,63 @@
+"""
+Rebuild the tutor retrieval chunks of lessons and documents.
+
+Uploads and lesson imports are chunked in the background as they happen;
+this re-chunks everything, e.g. after the first deploy of the
+`document_chunks` table, after lesson content was edited directly in the
+database, or when chunking parameters change. Safe to run while the API is
+up: each lesson/document is swapped in its own transaction.
+
+Usage:
+    python -m src.jobs.reindex_documents
+    python -m src.jobs.reindex_documents --course-id 42
+"""
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from src.core.database import AsyncSessionLocal, dispose_engines
+from src.models.course import Course
+from src.models.document import Document
+from src.services.documents.ingestion_service import DocumentIngestionService
+
+logger = logging.getLogger(__name__)
+
+
+async def reindex_documents(course_id: int | None = None) -> int:
+    """Re-chunk one course or all; returns chunks written"""
+    async with AsyncSessionLocal() as db:
+        courses = select(Course.id).order_by(Course.id)
+        documents = select(Document.id).order_by(Document.id)
+        if course_id is not None:
+            courses = courses.where(Course.id == course_id)
+            documents = documents.where(Document.course_id == course_id)
+        course_ids = list((await db.scalars(courses)).all())
+        document_ids = list((await db.scalars(documents)).all())
+
+    ingester = DocumentIngestionService()
+    written = 0
+    for id in course_ids:
+        written += await ingester.ingest_lessons(id, rebuild=True)
+    for id in document_ids:
+        written += await ingester.ingest_document(id)
+    return written
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--course-id", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        count = await reindex_documents(args.course_id)
+    finally:
+        await dispose_engines()
+    logger.info("Wrote %s chunks", count)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""
+Run queued background jobs (AI summaries, document ingestion, email).
+
+Consumes the queues in `JOB_QUEUE_CONCURRENCY` (or those given with
+--queue), running at most that many jobs of each queue at a time. Start as
+many worker processes as needed; SIGTERM/SIGINT lets running jobs finish.
+
+Usage:
+    python -m src.jobs.worker
+    python -m src.jobs.worker --queue ai --queue email
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import signal
+
+import redis.asyncio as redis
+
+from src.core.config import settings
+from src.core.database import dispose_engines
+from src.lib.ai.router import shutdown_ai_router, startup_ai_router
+from src.lib.jobs import RedisBackend, Worker, job_queue
+
+logger = logging.getLogger(__name__)
+
+# Modules whose import registers tasks on `job_queue`
+TASK_MODULES = (
+    "src.lib.email",
+    "src.services.chat.summary_service",
+    "src.services.documents.ingestion_service",
+)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--queue", action="append", dest="queues")
+    args = parser.parse_args()
+
+    for module in TASK_MODULES:
+        importlib.import_module(module)
+    concurrency = settings.JOB_QUEUE_CONCURRENCY
+    if args.queues:
+        concurrency = {name: concurrency.get(name, 1) for name in args.queues}
+
+    client = None
+    if settings.JOB_QUEUE_BACKEND == "redis":
+        # Own connection pool without the API's short socket timeout: BLPOP
+        # blocks for up to the poll timeout
+        client = redis.Redis.from_url(settings.REDIS_URL)
+        job_queue.backend = RedisBackend(client=client)
+
+    worker = Worker(job_queue, concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+
+    await startup_ai_router()
+    logger.info("Worker consuming %s", concurrency)
+    try:
+        await worker.run()
+    finally:
+        await shutdown_ai_router()
+        if client is not None:
+            await client.aclose()  # type: ignore[attr-defined]  # stubs predate it
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
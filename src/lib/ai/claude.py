@@ -0,0 +1,122 @@
+"""
+Claude (Anthropic) client.
+
+`ClaudeClient.from_settings()` owns a pooled `httpx.AsyncClient` so requests
+reuse warm keep-alive connections instead of paying a TLS handshake each
+time; `with_model()` shares that pool for another model. The provider router
+(`src.lib.ai.router`) holds the process-wide instances.
+
+The SDK is imported, and its client built, on first use (see `src.lib.lazy`).
+"""
+
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, Any, cast
+
+from src.core.config import settings
+from src.lib.lazy import Lazy
+from src.lib.metrics import record_llm_usage
+
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from anthropic.types import MessageParam
+
+
+class ClaudeClient:
+    """Async wrapper around the Anthropic Messages API."""
+
+    def __init__(
+        self,
+        client: "AsyncAnthropic | Lazy[AsyncAnthropic]",
+        model: str = settings.CLAUDE_MODEL,
+        max_tokens: int = settings.AI_MAX_TOKENS,
+        owns_client: bool = True,
+    ):
+        self._client = client if isinstance(client, Lazy) else Lazy.of(client)
+        self.model = model
+        self.max_tokens = max_tokens
+        # Clients from `with_model()` share the pool; only the owner closes it
+        self.owns_client = owns_client
+
+    @classmethod
+    def from_settings(cls, model: str = settings.CLAUDE_MODEL) -> "ClaudeClient":
+        """Client backed by a pooled HTTP connection, built on first use"""
+
+        def build() -> "AsyncAnthropic":
+            import httpx
+            from anthropic import AsyncAnthropic
+
+            http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.AI_TIMEOUT_SECONDS, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=settings.AI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.AI_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+            return AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY or None,
+                base_url=settings.ANTHROPIC_BASE_URL or None,
+                http_client=http_client,
+                max_retries=settings.AI_MAX_RETRIES,
+            )
+
+        return cls(Lazy(build), model=model)
+
+    @property
+    def client(self) -> "AsyncAnthropic":
+        return self._client.get()
+
+    def with_model(self, model: str) -> "ClaudeClient":
+        """Same connection pool, different model"""
+        return ClaudeClient(
+            self._client, model=model, max_tokens=self.max_tokens, owns_client=False
+        )
+
+    def preload(self) -> None:
+        """Import the SDK and build the client now (blocking)"""
+        self._client.get()
+
+    @staticmethod
+    def _request(messages: list[dict], system: str | None) -> dict[str, Any]:
+        # The SDK's typed params are TypedDicts; ours are plain dicts
+        request: dict[str, Any] = {"messages": cast("list[MessageParam]", messages)}
+        if system:
+            request["system"] = system
+        return request
+
+    async def generate(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Return the full completion for a conversation"""
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens or self.max_tokens,
+            **self._request(messages, system),
+        )
+        usage = response.usage
+        record_llm_usage(
+            "anthropic", self.model, usage.input_tokens, usage.output_tokens
+        )
+        return "".join(block.text for block in response.content if block.type == "text")
+
+    async def stream(
+        self, messages: list[dict], system: str | None = None
+    ) -> AsyncGenerator[str, None]:
+        """Yield completion text deltas as soon as the provider sends them"""
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            **self._request(messages, system),
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+            usage = (await stream.get_final_message()).usage
+            record_llm_usage(
+                "anthropic", self.model, usage.input_tokens, usage.output_tokens
+            )
+
+    async def aclose(self) -> None:
+        if self.owns_client and self._client.loaded:
+            await self.client.close()
@@ -0,0 +1,125 @@
+"""
+OpenAI client, the fallback provider behind Claude.
+
+Same interface as `ClaudeClient` (`generate` / `stream` over Anthropic-style
+`messages` plus a separate `system` prompt), so the router can swap them.
+Like it, the SDK is imported on first use.
+"""
+
+from collections.abc import AsyncGenerator
+from typing import TYPE_CHECKING, cast
+
+from src.core.config import settings
+from src.lib.lazy import Lazy
+from src.lib.metrics import record_llm_usage
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+    from openai.types import CompletionUsage
+    from openai.types.chat import ChatCompletionMessageParam
+
+
+class OpenAIClient:
+    """Async wrapper around the OpenAI Chat Completions API."""
+
+    def __init__(
+        self,
+        client: "AsyncOpenAI | Lazy[AsyncOpenAI]",
+        model: str = settings.OPENAI_MODEL,
+        max_tokens: int = settings.AI_MAX_TOKENS,
+        owns_client: bool = True,
+    ):
+        self._client = client if isinstance(client, Lazy) else Lazy.of(client)
+        self.model = model
+        self.max_tokens = max_tokens
+        # Clients from `with_model()` share the pool; only the owner closes it
+        self.owns_client = owns_client
+
+    @classmethod
+    def from_settings(cls, model: str = settings.OPENAI_MODEL) -> "OpenAIClient":
+        """Client backed by a pooled HTTP connection, built on first use"""
+
+        def build() -> "AsyncOpenAI":
+            import httpx
+            from openai import AsyncOpenAI
+
+            http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.AI_TIMEOUT_SECONDS, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=settings.AI_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.AI_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+            return AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=http_client,
+                max_retries=settings.AI_MAX_RETRIES,
+            )
+
+        return cls(Lazy(build), model=model)
+
+    @property
+    def client(self) -> "AsyncOpenAI":
+        return self._client.get()
+
+    def with_model(self, model: str) -> "OpenAIClient":
+        """Same connection pool, different model"""
+        return OpenAIClient(
+            self._client, model=model, max_tokens=self.max_tokens, owns_client=False
+        )
+
+    def preload(self) -> None:
+        """Import the SDK and build the client now (blocking)"""
+        self._client.get()
+
+    @staticmethod
+    def _messages(
+        messages: list[dict], system: str | None
+    ) -> "list[ChatCompletionMessageParam]":
+        if system:
+            messages = [{"role": "system", "content": system}, *messages]
+        return cast("list[ChatCompletionMessageParam]", messages)
+
+    async def generate(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Return the full completion for a conversation"""
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=max_tokens or self.max_tokens,
+            messages=self._messages(messages, system),
+        )
+        self._record_usage(response.usage)
+        return response.choices[0].message.content or ""
+
+    async def stream(
+        self, messages: list[dict], system: str | None = None
+    ) -> AsyncGenerator[str, None]:
+        """Yield completion text deltas as soon as the provider sends them"""
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            messages=self._messages(messages, system),
+            stream=True,
+            # Token usage arrives in a last chunk without choices
+            stream_options={"include_usage": True},
+        )
+        async with stream:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if chunk.usage is not None:
+                    self._record_usage(chunk.usage)
+
+    def _record_usage(self, usage: "CompletionUsage | None") -> None:
+        if usage is not None:
+            record_llm_usage(
+                "openai", self.model, usage.prompt_tokens, usage.completion_tokens
+            )
+
+    async def aclose(self) -> None:
+        if self.owns_client and self._client.loaded:
+            await self.client.close()
@@ -0,0 +1,83 @@
+SYSTEM_PROMPT_TEMPLATE = """\
+Bạn là một AI Tutor thông minh và thân thiện, giúp học viên học tập hiệu quả.
+
+THÔNG TIN KHÓA HỌC:
+- Tên: {course_title}
+- Mô tả: {course_description}
+- Cấp độ: {course_level}
+{lesson_outline}
+HƯỚNG DẪN:
+1. Trả lời ngắn gọn, dễ hiểu
+2. Sử dụng ví dụ thực tế
+3. Khuyến khích học viên suy nghĩ
+4. Đề xuất tài liệu bổ sung khi phù hợp
+5. Nếu câu hỏi ngoài phạm vi, hãy hướng dẫn học viên lịch sự
+
+PHONG CÁCH:
+- Thân thiện, động viên
+- Sử dụng emoji phù hợp
+- Định dạng code nếu có"""
+
+
+PASSAGES_SECTION_TEMPLATE = """
+TÀI LIỆU LIÊN QUAN (trích từ bài học và tài liệu khóa học, ưu tiên dùng khi trả lời):
+{passages}
+"""
+
+SUMMARY_SECTION_TEMPLATE = """
+TÓM TẮT CUỘC TRÒ CHUYỆN TRƯỚC ĐÓ:
+{summary}
+"""
+
+SUMMARY_SYSTEM_PROMPT = """Bạn tóm tắt cuộc trò chuyện giữa học viên và AI Tutor.
+Giữ lại: câu hỏi chính, khái niệm đã giải thích, lỗi sai của học viên, việc còn dang dở.
+Bỏ qua lời chào và chi tiết không cần thiết.
+Viết ngắn gọn bằng ngôn ngữ của cuộc trò chuyện."""
+
+SUMMARY_UPDATE_TEMPLATE = """TÓM TẮT HIỆN TẠI:
+{summary}
+
+CÁC TIN NHẮN MỚI:
+{transcript}
+
+Viết lại bản tóm tắt, gộp thêm thông tin từ các tin nhắn mới."""
+
+
+def build_summary_request(summary: str | None, messages: list[dict]) -> list[dict]:
+    """Messages asking the model to fold `messages` into `summary`"""
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+    content = SUMMARY_UPDATE_TEMPLATE.format(
+        summary=summary or "(chưa có)", transcript=transcript
+    )
+    return [{"role": "user", "content": content}]
+
+
+def build_system_prompt(
+    context: dict, summary: str | None = None, passages: list[str] | None = None
+) -> str:
+    """Render the tutor system prompt from a course context"""
+    course = context["course"]
+    lessons = context.get("lessons") or []
+    outline = ""
+    if lessons:
+        outline = "\nDANH SÁCH BÀI HỌC:\n" + "".join(
+            f"{lesson['order']}. {lesson['title']}\n" for lesson in lessons
+        )
+    prompt = SYSTEM_PROMPT_TEMPLATE.format(
+        course_title=course["title"],
+        course_description=course.get("description") or "",
+        course_level=course.get("level") or "",
+        lesson_outline=outline,
+    )
+    if passages:
+        prompt += PASSAGES_SECTION_TEMPLATE.format(passages="\n---\n".join(passages))
+    if summary:
+        prompt += SUMMARY_SECTION_TEMPLATE.format(summary=summary)
+    return prompt
+
+
+# Last resort when every provider is down and no cached answer is close enough
+FALLBACK_REPLY = (
+    "Xin lỗi, AI Tutor đang tạm thời quá tải nên chưa thể trả lời câu hỏi này. "
+    "Bạn vui lòng thử lại sau ít phút nhé! 🙏"
+)
@@ -0,0 +1,428 @@
+"""
+Route AI requests across providers and models.
+
+Each question is classified first: short, plain questions go to the cheaper
+model (Haiku / GPT-4o mini); longer ones, code, or requests for an
+explanation go to the stronger one (Sonnet / GPT-4o). The tier's providers
+are then tried in order, Claude before OpenAI:
+
+- a circuit breaker per provider skips one that keeps failing instead of
+  making every request wait out its timeout;
+- each attempt has a timeout, and all attempts share one request budget;
+- once an attempt has run past its recent p95 latency, a hedged request goes
+  to the next provider and whichever answers first wins.
+
+If nothing answers, `AIUnavailableError` is raised and the chat service
+falls back to a cached answer or a canned reply. Streams fail over (and
+hedge) only until their first token.
+
+One router, and its pooled provider clients, is shared per process; the app
+lifespan and the job worker open and close it. Provider SDKs are imported
+on first use (or by `preload()`), not at startup.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol, TypeVar
+
+from src.core.config import settings
+from src.exceptions.ai import AIUnavailableError
+from src.lib.ai.claude import ClaudeClient
+from src.lib.ai.openai_client import OpenAIClient
+from src.lib.ai.semantic_cache import HashingEmbedder
+from src.lib.ai.tokens import count_tokens
+from src.lib.metrics import record_llm_call
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SIMPLE = "simple"
+COMPLEX = "complex"
+
+# Asking for reasoning rather than a fact (matched on accent-folded text)
+_COMPLEX_RE = re.compile(
+    r"\b(tai sao|vi sao|giai thich|so sanh|phan tich|chung minh|tung buoc|"
+    r"lam sao|nhu the nao|sua loi|toi uu|thiet ke|why|how|explain|compare|"
+    r"analy[sz]e|prove|step by step|debug|optimi[sz]e|design|difference)\b"
+)
+_CODE_RE = re.compile(r"```|Traceback|^\s*(def|class|import|for|if)\b|[{};]\s*$", re.M)
+
+
+def classify(
+    messages: list[dict],
+    simple_max_tokens: int = settings.AI_SIMPLE_QUESTION_MAX_TOKENS,
+) -> str:
+    """SIMPLE for a short factual question, COMPLEX for real tutoring"""
+    question = messages[-1]["content"] if messages else ""
+    if count_tokens(question) > simple_max_tokens or _CODE_RE.search(question):
+        return COMPLEX
+    if _COMPLEX_RE.search(HashingEmbedder.normalize(question)):
+        return COMPLEX
+    return SIMPLE
+
+
+class CircuitBreaker:
+    """Opens after `failure_threshold` failures in a row.
+
+    While open, requests are refused; every `reset_timeout` seconds one probe
+    is let through, and its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = settings.AI_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = settings.AI_BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self.clock() < self.opened_at + self.reset_timeout:
+            return False
+        # Probe; re-arm so concurrent requests keep waiting
+        self.opened_at = self.clock()
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = self.clock()
+
+
+class LatencyTracker:
+    """Latencies of the last `window` successful calls"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """None until there are enough samples to trust"""
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ChatClient(Protocol):
+    model: str
+
+    async def generate(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        max_tokens: int | None = None,
+    ) -> str: ...
+
+    def stream(
+        self, messages: list[dict], system: str | None = None
+    ) -> AsyncGenerator[str, None]: ...
+
+    def preload(self) -> None: ...
+
+    async def aclose(self) -> None: ...
+
+
+@dataclass
+class Route:
+    """One provider model serving a tier"""
+
+    provider: str
+    client: ChatClient
+    # generate() duration, and stream() time to first token
+    latency: LatencyTracker = field(default_factory=LatencyTracker)
+    first_token: LatencyTracker = field(default_factory=LatencyTracker)
+
+
+class LLMRouter:
+    """`generate` / `stream` like a single client, over all providers."""
+
+    def __init__(
+        self,
+        routes: dict[str, list[Route]],
+        breakers: dict[str, CircuitBreaker] | None = None,
+        timeout: float = settings.AI_PROVIDER_TIMEOUT_SECONDS,
+        budget: float = settings.AI_REQUEST_BUDGET_SECONDS,
+        hedge: bool = settings.AI_HEDGE_ENABLED,
+        hedge_percentile: float = settings.AI_HEDGE_PERCENTILE,
+        hedge_min_delay: float = settings.AI_HEDGE_MIN_DELAY_SECONDS,
+        simple_max_tokens: int = settings.AI_SIMPLE_QUESTION_MAX_TOKENS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.routes = routes
+        self.breakers = breakers or {}
+        for tier_routes in routes.values():
+            for route in tier_routes:
+                self.breakers.setdefault(route.provider, CircuitBreaker())
+        self.timeout = timeout
+        self.budget = budget
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.simple_max_tokens = simple_max_tokens
+        self.clock = clock
+
+    @classmethod
+    def from_settings(cls) -> "LLMRouter":
+        """Claude for both tiers, plus OpenAI behind it when a key is set"""
+        claude = ClaudeClient.from_settings()
+        routes = {
+            SIMPLE: [
+                Route("anthropic", claude.with_model(settings.CLAUDE_SIMPLE_MODEL))
+            ],
+            COMPLEX: [Route("anthropic", claude)],
+        }
+        if settings.OPENAI_API_KEY:
+            openai = OpenAIClient.from_settings()
+            routes[SIMPLE].append(
+                Route("openai", openai.with_model(settings.OPENAI_SIMPLE_MODEL))
+            )
+            routes[COMPLEX].append(Route("openai", openai))
+        return cls(routes)
+
+    def routes_for(self, messages: list[dict], tier: str | None = None) -> list[Route]:
+        return self.routes[tier or classify(messages, self.simple_max_tokens)]
+
+    async def generate(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        max_tokens: int | None = None,
+        tier: str | None = None,
+    ) -> str:
+        """Full completion from the first provider to answer"""
+
+        async def call(route: Route) -> str:
+            return await route.client.generate(
+                messages, system=system, max_tokens=max_tokens
+            )
+
+        _, reply = await self._race(self.routes_for(messages, tier), call, "generate")
+        return reply
+
+    async def stream(
+        self,
+        messages: list[dict],
+        system: str | None = None,
+        tier: str | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Text deltas from the first provider to start answering.
+
+        An error after the first token is raised to the caller as is: the
+        client has already shown part of the answer.
+        """
+
+        async def open_stream(route: Route) -> tuple[AsyncGenerator[str, None], str]:
+            deltas = route.client.stream(messages, system=system)
+            try:
+                first = await anext(deltas, "")
+            except BaseException:
+                await deltas.aclose()
+                raise
+            return deltas, first
+
+        async def discard(opened: tuple[AsyncGenerator[str, None], str]) -> None:
+            await opened[0].aclose()
+
+        route, (deltas, first) = await self._race(
+            self.routes_for(messages, tier),
+            open_stream,
+            "stream",
+            discard,
+        )
+        try:
+            if first:
+                yield first
+            async for delta in deltas:
+                yield delta
+        except Exception:
+            self.breakers[route.provider].record_failure()
+            raise
+        finally:
+            await deltas.aclose()
+
+    async def _race(
+        self,
+        routes: list[Route],
+        call: Callable[[Route], Awaitable[T]],
+        mode: str,
+        discard: Callable[[T], Awaitable[Any]] | None = None,
+    ) -> tuple[Route, T]:
+        """Try `routes` in order, hedging a slow attempt with the next one.
+
+        Returns the first successful (route, result); results of attempts
+        that lose the race are passed to `discard`.
+        """
+        deadline = self.clock() + self.budget
+        waiting = list(routes)
+        running: dict[asyncio.Task, Route] = {}
+        hedged = False
+
+        def launch() -> bool:
+            while waiting:
+                route = waiting.pop(0)
+                if self.breakers[route.provider].allow():
+                    attempt = self._attempt(route, call, mode, deadline)
+                    running[asyncio.create_task(attempt)] = route
+                    return True
+                logger.info("Skipping AI provider %s: circuit open", route.provider)
+            return False
+
+        launch()
+        try:
+            while running:
+                delay = None
+                if self.hedge and not hedged and waiting and len(running) == 1:
+                    (primary,) = running.values()
+                    delay = self._hedge_delay(self._tracker(primary, mode))
+                done, _ = await asyncio.wait(
+                    running, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    hedged = True
+                    launch()
+                    continue
+
+                winner = None
+                for task in done:
+                    route = running.pop(task)
+                    if task.exception() is not None:
+                        continue
+                    if winner is None:
+                        winner = (route, task.result())
+                    elif discard is not None:
+                        await discard(task.result())
+                if winner is not None:
+                    return winner
+                if not running:
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+            results = await asyncio.gather(*running, return_exceptions=True)
+            if discard is not None:
+                for result in results:
+                    if not isinstance(result, BaseException):
+                        await discard(result)
+        raise AIUnavailableError("No AI provider answered")
+
+    async def _attempt(
+        self,
+        route: Route,
+        call: Callable[[Route], Awaitable[T]],
+        mode: str,
+        deadline: float,
+    ) -> T:
+        remaining = deadline - self.clock()
+        if remaining <= 0:
+            raise TimeoutError("AI request budget spent")
+        breaker = self.breakers[route.provider]
+        model = route.client.model
+        started = self.clock()
+        try:
+            result = await asyncio.wait_for(call(route), min(self.timeout, remaining))
+        except asyncio.CancelledError:
+            # Lost a hedged race
+            record_llm_call(route.provider, model, "cancelled", None, mode)
+            raise
+        except Exception:
+            breaker.record_failure()
+            record_llm_call(route.provider, model, "error", None, mode)
+            logger.warning(
+                "AI provider %s (%s) failed",
+                route.provider,
+                model,
+                exc_info=True,
+            )
+            raise
+        elapsed = self.clock() - started
+        self._tracker(route, mode).add(elapsed)
+        record_llm_call(route.provider, model, "success", elapsed, mode)
+        breaker.record_success()
+        return result
+
+    @staticmethod
+    def _tracker(route: Route, mode: str) -> LatencyTracker:
+        return route.first_token if mode == "stream" else route.latency
+
+    def _hedge_delay(self, tracker: LatencyTracker) -> float | None:
+        p = tracker.percentile(self.hedge_percentile)
+        return None if p is None else max(p, self.hedge_min_delay)
+
+    def reset(self) -> None:
+        """Forget breaker state and latencies"""
+        for breaker in self.breakers.values():
+            breaker.record_success()
+        for tier_routes in self.routes.values():
+            for route in tier_routes:
+                route.latency.samples.clear()
+                route.first_token.samples.clear()
+
+    async def preload(self) -> None:
+        """Import the provider SDKs in a worker thread, off the event loop.
+
+        Started in the background once the app is up, so neither startup nor
+        the first chat request pays for the imports.
+        """
+        for tier_routes in self.routes.values():
+            for route in tier_routes:
+                try:
+                    await asyncio.to_thread(route.client.preload)
+                except Exception:
+                    logger.exception("Could not preload %s client", route.provider)
+
+    async def aclose(self) -> None:
+        for tier_routes in self.routes.values():
+            for route in tier_routes:
+                await route.client.aclose()
+
+
+_ai_router: LLMRouter | None = None
+
+
+async def startup_ai_router() -> LLMRouter:
+    """Open the shared router (called from the app lifespan)"""
+    return get_ai_router()
+
+
+async def shutdown_ai_router() -> None:
+    """Close the shared router and its connection pools"""
+    global _ai_router
+    if _ai_router is not None:
+        await _ai_router.aclose()
+        _ai_router = None
+
+
+def get_ai_router() -> LLMRouter:
+    """FastAPI dependency returning the shared router.
+
+    Falls back to lazy creation when the lifespan has not run (e.g. tests
+    driving the app through an ASGI transport).
+    """
+    global _ai_router
+    if _ai_router is None:
+        _ai_router = LLMRouter.from_settings()
+    return _ai_router
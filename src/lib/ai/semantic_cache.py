@@ -0,0 +1,292 @@
+"""
+Semantic answer cache for course questions.
+
+Exact `hash(question + course_id)` keys almost never hit because students
+phrase the same question differently. Instead each course keeps a small
+in-process index: question embeddings stacked in a NumPy matrix, matched
+by cosine similarity against a threshold, with per-entry TTL and LRU
+eviction once the course reaches its capacity.
+
+Lexical embeddings score "... in Python?" and "... in Java?" higher than
+many genuine rewordings, so similarity only shortlists candidates. A hit
+is then decided on content words (question and filler words like "là gì",
+"how", "cho mình hỏi" ignored; accents, case and close typos folded):
+
+- a content word swapped for another ("Python" -> "Java") never matches;
+- words added or dropped on one side are fine while the shared words keep
+  a Jaccard overlap of at least `min_overlap`.
+
+The fallback lookup (every provider down) passes a lower threshold and
+overlap.
+"""
+
+import re
+import time
+import unicodedata
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+import numpy as np
+
+from src.core.config import settings
+from src.lib.metrics import record_cache
+
+_WORD_RE = re.compile(r"\w+")
+
+# Accent-folded question framing and function words (Vietnamese, English).
+# Programming keywords ("for", "in", "if", "not") stay content words
+_FILLER_WORDS = frozenset(
+    "a anh ban cac cach chi cho co cua de duoc em giai giup gi hoi khi la lam "
+    "minh mot nao nghia nhe nhi nhu nhung o oi sao the thi thich toi tren "
+    "trong va vao vay ve voi xin "
+    "about an are can could do does explain how i is me my of please should "
+    "tell the to what whats why would you".split()
+)
+
+# Cosine-ranked candidates checked per lookup
+_CANDIDATES = 5
+
+
+class HashingEmbedder:
+    """Embed text into a fixed-size vector via the hashing trick.
+
+    Features are accent-folded words plus character trigrams, so small
+    rewordings, typos and missing Vietnamese diacritics still land close
+    together. Needs no model download and no network call.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        text = unicodedata.normalize("NFKD", text.casefold()).replace("đ", "d")
+        return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+    def words(self, text: str) -> frozenset[str]:
+        return frozenset(_WORD_RE.findall(self.normalize(text)))
+
+    def _features(self, text: str) -> list[tuple[str, float]]:
+        features: list[tuple[str, float]] = []
+        for word in _WORD_RE.findall(self.normalize(text)):
+            features.append((word, 1.0))
+            padded = f"#{word}#"
+            features.extend((padded[i : i + 3], 0.5) for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, weight in self._features(text):
+            digest = zlib.crc32(feature.encode())
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vector[digest % self.dim] += sign * weight
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+def _content_words(words: frozenset[str]) -> frozenset[str]:
+    return words - _FILLER_WORDS or words
+
+
+def _is_typo(a: str, b: str) -> bool:
+    # Short words differ by meaning, not typos ("int" / "init")
+    return min(len(a), len(b)) >= 5 and SequenceMatcher(None, a, b).ratio() >= 0.8
+
+
+def word_overlap(cached: frozenset[str], asked: frozenset[str]) -> float:
+    """Jaccard overlap of two questions' content words, typos counted as equal.
+
+    0.0 when each side has a content word the other lacks, i.e. one was
+    swapped for another.
+    """
+    cached, asked = _content_words(cached), _content_words(asked)
+    only_cached, only_asked = set(cached - asked), set(asked - cached)
+    typos = {w for w in only_cached if any(_is_typo(w, o) for o in only_asked)}
+    only_asked = {o for o in only_asked if not any(_is_typo(w, o) for w in typos)}
+    only_cached -= typos
+    if only_cached and only_asked:
+        return 0.0
+    shared = len(cached & asked) + len(typos)
+    return shared / (shared + len(only_cached) + len(only_asked))
+
+
+class _CourseIndex:
+    """Embedding matrix + answers for one course, grown on demand."""
+
+    def __init__(self, dim: int, capacity: int):
+        self.capacity = capacity
+        self.vectors: np.ndarray = np.zeros((min(16, capacity), dim), np.float32)
+        self.expires_at: np.ndarray = np.zeros(len(self.vectors))
+        self.last_used: np.ndarray = np.zeros(len(self.vectors))
+        self.answers: list[str | None] = [None] * len(self.vectors)
+        self.words: list[frozenset[str]] = [frozenset()] * len(self.vectors)
+
+    def search(self, query: np.ndarray, now: float, threshold: float) -> list[int]:
+        """Live slots scoring at least `threshold`, best first"""
+        scores = self.vectors @ query
+        scores[self.expires_at <= now] = -np.inf
+        slots = np.flatnonzero(scores >= threshold)
+        if slots.size > _CANDIDATES:
+            slots = slots[np.argpartition(-scores[slots], _CANDIDATES)[:_CANDIDATES]]
+        return [int(slot) for slot in slots[np.argsort(-scores[slots])]]
+
+    def free_slot(self, now: float) -> tuple[int, bool]:
+        """Return a writable slot and whether a live entry was evicted."""
+        free = np.flatnonzero(self.expires_at <= now)
+        if free.size:
+            return int(free[0]), False
+        if len(self.vectors) < self.capacity:
+            self._grow()
+            return int(np.flatnonzero(self.expires_at <= now)[0]), False
+        return int(np.argmin(self.last_used)), True
+
+    def _grow(self) -> None:
+        size = len(self.vectors)
+        extra = min(size, self.capacity - size)
+        self.vectors = np.vstack(
+            [self.vectors, np.zeros((extra, self.vectors.shape[1]), np.float32)]
+        )
+        self.expires_at = np.concatenate([self.expires_at, np.zeros(extra)])
+        self.last_used = np.concatenate([self.last_used, np.zeros(extra)])
+        self.answers.extend([None] * extra)
+        self.words.extend([frozenset()] * extra)
+
+    def live_count(self, now: float) -> int:
+        return int(np.count_nonzero(self.expires_at > now))
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SemanticAnswerCache:
+    """Per-course cache of AI answers keyed by question similarity."""
+
+    def __init__(
+        self,
+        embedder: HashingEmbedder | None = None,
+        threshold: float = 0.6,
+        min_overlap: float = 0.75,
+        ttl_seconds: float = 3600,
+        max_entries_per_course: int = 500,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.embedder = embedder or HashingEmbedder()
+        self.threshold = threshold
+        self.min_overlap = min_overlap
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_course = max_entries_per_course
+        self.clock = clock
+        self.stats = CacheStats()
+        self._indexes: dict[int, _CourseIndex] = {}
+
+    @classmethod
+    def from_settings(cls) -> "SemanticAnswerCache":
+        return cls(
+            threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+            min_overlap=settings.SEMANTIC_CACHE_MIN_OVERLAP,
+            ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+            max_entries_per_course=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+        )
+
+    def get(
+        self,
+        course_id: int,
+        question: str,
+        threshold: float | None = None,
+        min_overlap: float | None = None,
+    ) -> str | None:
+        """Return a cached answer for a similar question, if any.
+
+        `threshold` and `min_overlap` override the cache's defaults for one
+        lookup (the provider-down fallback loosens both).
+        """
+        index = self._indexes.get(course_id)
+        if index is not None:
+            now = self.clock()
+            slot = self._match(
+                index,
+                question,
+                now,
+                self.threshold if threshold is None else threshold,
+                self.min_overlap if min_overlap is None else min_overlap,
+            )
+            if slot >= 0:
+                index.last_used[slot] = now
+                self.stats.hits += 1
+                record_cache("semantic_answer", "hit")
+                return index.answers[slot]
+        self.stats.misses += 1
+        record_cache("semantic_answer", "miss")
+        return None
+
+    def set(self, course_id: int, question: str, answer: str) -> None:
+        """Cache an answer, replacing a near-duplicate question if present"""
+        index = self._indexes.get(course_id)
+        if index is None:
+            index = self._indexes[course_id] = _CourseIndex(
+                self.embedder.dim, self.max_entries_per_course
+            )
+        now = self.clock()
+        slot = self._match(index, question, now, self.threshold, self.min_overlap)
+        if slot < 0:
+            slot, evicted = index.free_slot(now)
+            self.stats.evictions += evicted
+        index.vectors[slot] = self.embedder.embed(question)
+        index.answers[slot] = answer
+        index.words[slot] = self.embedder.words(question)
+        index.expires_at[slot] = now + self.ttl_seconds
+        index.last_used[slot] = now
+
+    def _match(
+        self,
+        index: _CourseIndex,
+        question: str,
+        now: float,
+        threshold: float,
+        min_overlap: float,
+    ) -> int:
+        """Best-scoring slot whose question has the same content words, or -1"""
+        words = self.embedder.words(question)
+        for slot in index.search(self.embedder.embed(question), now, threshold):
+            if word_overlap(index.words[slot], words) >= min_overlap:
+                return slot
+        return -1
+
+    def invalidate_course(self, course_id: int) -> None:
+        """Drop every cached answer of a course (e.g. after content edits)"""
+        self._indexes.pop(course_id, None)
+
+    def clear(self) -> None:
+        self._indexes.clear()
+        self.stats = CacheStats()
+
+    def snapshot(self) -> dict:
+        """Counters for monitoring"""
+        now = self.clock()
+        return {
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "evictions": self.stats.evictions,
+            "hit_rate": round(self.stats.hit_rate, 4),
+            "courses": len(self._indexes),
+            "entries": sum(index.live_count(now) for index in self._indexes.values()),
+        }
+
+
+semantic_cache = SemanticAnswerCache.from_settings()
+
+
+def get_semantic_cache() -> SemanticAnswerCache | None:
+    """FastAPI dependency; None when the cache is disabled"""
+    return semantic_cache if settings.SEMANTIC_CACHE_ENABLED else None
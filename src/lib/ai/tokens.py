@@ -0,0 +1,25 @@
+"""
+Token estimates for prompt budgeting.
+
+Exact counts would need the provider tokenizer (a network call for Claude),
+which is too slow for the request path. BPE tokenizers average roughly four
+UTF-8 bytes per token; counting bytes rather than characters keeps the
+estimate conservative for Vietnamese, whose accented letters take 2-3 bytes
+and split into more tokens than plain ASCII.
+"""
+
+import math
+
+BYTES_PER_TOKEN = 4
+# Role/turn framing the API adds around each message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def count_tokens(text: str) -> int:
+    """Estimated token count of `text`"""
+    return math.ceil(len(text.encode("utf-8")) / BYTES_PER_TOKEN)
+
+
+def message_tokens(content_tokens: int) -> int:
+    """Budget cost of a chat message with `content_tokens` of content"""
+    return content_tokens + MESSAGE_OVERHEAD_TOKENS
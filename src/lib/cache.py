@@ -0,0 +1,180 @@
+"""
+Redis cache helpers.
+
+`redis_client` is the shared async connection pool on `settings.REDIS_URL`.
+`LayeredCache` puts a small in-process TTL cache (L1) in front of Redis (L2)
+and stores values as JSON, zlib-compressed above a size threshold. Redis
+errors are logged and treated as misses so callers fall back to the database.
+Invalidation clears Redis and the local L1; other workers' L1 copies age out
+within their (short) TTL.
+"""
+
+import json
+import logging
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.lib.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+redis_client = redis.Redis.from_url(
+    settings.REDIS_URL,
+    socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+    socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+)
+
+# Payload header: first byte says how the rest is encoded
+_RAW = b"j"
+_ZLIB = b"z"
+
+
+def encode_payload(value: Any, compress_min_bytes: int = 512) -> bytes:
+    """Serialize to JSON, compressing payloads worth the CPU"""
+    data = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+    if len(data) >= compress_min_bytes:
+        return _ZLIB + zlib.compress(data, 6)
+    return _RAW + data
+
+
+def decode_payload(payload: bytes) -> Any:
+    header, body = payload[:1], payload[1:]
+    if header == _ZLIB:
+        body = zlib.decompress(body)
+    elif header != _RAW:
+        raise ValueError(f"Unknown cache payload header {header!r}")
+    return json.loads(body)
+
+
+class TTLCache:
+    """Bounded in-process LRU cache whose entries expire after `ttl` seconds.
+
+    Lookups of a named cache are counted in the `cache_requests_total` metric.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+        name: str | None = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.name = name
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any | None:
+        value = self._get(key)
+        if self.name is not None:
+            record_cache(self.name, "miss" if value is None else "hit")
+        return value
+
+    def _get(self, key: Any) -> Any | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= self.clock():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        """Store `value`; `ttl` overrides the cache-wide TTL for this entry"""
+        self._data[key] = (self.clock() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class LayeredCache:
+    """Namespaced L1 (process) + L2 (Redis) cache for JSON-able values."""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int,
+        l1: TTLCache | None = None,
+        client: redis.Redis | None = None,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.l1 = l1 or TTLCache()
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        # Resolved per call so tests can swap the module-level client
+        return self._client or redis_client
+
+    def key(self, id: Any) -> str:
+        return f"{self.namespace}:{id}"
+
+    async def get(self, id: Any) -> Any | None:
+        key = self.key(id)
+        value = self.l1.get(key)
+        if value is not None:
+            record_cache(self.namespace, "l1_hit")
+            return value
+        try:
+            payload = await self.client.get(key)
+        except RedisError:
+            logger.warning("Redis unavailable, cache miss for %s", key)
+            payload = None
+        if payload is None:
+            record_cache(self.namespace, "miss")
+            return None
+        value = decode_payload(payload)
+        self.l1.set(key, value)
+        record_cache(self.namespace, "l2_hit")
+        return value
+
+    async def set(self, id: Any, value: Any) -> None:
+        key = self.key(id)
+        self.l1.set(key, value)
+        try:
+            await self.client.set(key, encode_payload(value), ex=self.ttl)
+        except RedisError:
+            logger.warning("Redis unavailable, %s cached in-process only", key)
+
+    async def invalidate(self, id: Any) -> None:
+        key = self.key(id)
+        self.l1.delete(key)
+        try:
+            await self.client.delete(key)
+        except RedisError:
+            logger.warning("Redis unavailable, could not invalidate %s", key)
+
+
+# Active users by id for `get_current_user`. Process-local: AuthRepository
+# drops an entry on write, other workers see the change within the TTL.
+current_user_cache = TTLCache(
+    maxsize=settings.AUTH_USER_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    name="current_user",
+)
+
+course_context_cache = LayeredCache(
+    "course_context",
+    ttl=settings.COURSE_CONTEXT_CACHE_TTL_SECONDS,
+    l1=TTLCache(
+        maxsize=settings.COURSE_CONTEXT_L1_MAX_ENTRIES,
+        ttl=settings.COURSE_CONTEXT_L1_TTL_SECONDS,
+    ),
+)
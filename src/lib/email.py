@@ -0,0 +1,52 @@
+"""
+Outgoing email over SMTP.
+
+`send_email` talks to the SMTP server directly (in a worker thread, smtplib
+is blocking); request handlers should call `queue_email` instead so the
+response doesn't wait on the mail server, and failures are retried.
+"""
+
+import smtplib
+from email.message import EmailMessage
+
+import anyio
+
+from src.core.config import settings
+from src.lib.jobs import job_queue
+
+
+def _send(message: EmailMessage) -> None:
+    with smtplib.SMTP(
+        settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS
+    ) as smtp:
+        if settings.SMTP_USE_TLS:
+            smtp.starttls()
+        if settings.SMTP_USERNAME:
+            smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        smtp.send_message(message)
+
+
+async def send_email(to: str, subject: str, body: str) -> bool:
+    """Send a plain-text email now"""
+    message = EmailMessage()
+    message["From"] = settings.EMAIL_FROM
+    message["To"] = to
+    message["Subject"] = subject
+    message.set_content(body)
+    await anyio.to_thread.run_sync(_send, message)
+    return True
+
+
+async def queue_email(
+    to: str, subject: str, body: str, idempotency_key: str | None = None
+) -> str | None:
+    """Send an email from the job queue; returns the job id"""
+    return await job_queue.enqueue(
+        "email.send", to, subject, body, idempotency_key=idempotency_key
+    )
+
+
+@job_queue.task("email.send", queue="email", max_retries=5, backoff=30.0)
+async def send_email_task(to: str, subject: str, body: str) -> None:
+    # Looked up at call time so tests can patch `send_email`
+    await send_email(to, subject, body)
@@ -0,0 +1,157 @@
+"""
+File responses with HTTP Range and ETag support.
+
+`RangeFileResponse` answers `If-None-Match` with 304 and a single
+`Range: bytes=...` with 206, so a resumed download only transfers the
+missing bytes. The body is sent with the ASGI zero-copy extension
+(`sendfile`) when the server offers it, otherwise in fixed-size chunks, so
+memory per download stays constant.
+"""
+
+import os
+import re
+from urllib.parse import quote
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+CHUNK_SIZE = 64 * 1024
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Inclusive (start, end) of a single byte range.
+
+    Returns None for a header we don't serve partially (multiple ranges,
+    other units), which means "send the whole file". Raises ValueError if
+    the range can't be satisfied.
+    """
+    match = _RANGE_RE.match(header.replace(" ", ""))
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(header)
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison against an If-None-Match list"""
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+class RangeFileResponse(Response):
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        size: int,
+        etag: str,
+        media_type: str | None = None,
+        filename: str | None = None,
+        request_headers: Headers | None = None,
+    ):
+        self.path = path
+        self.size = size
+        self.media_type = media_type or "application/octet-stream"
+        self.background = None
+        self.start, self.end = 0, size - 1
+        self.status_code = 200
+        self.send_body = True
+        self.init_headers(
+            {"etag": etag, "accept-ranges": "bytes", "cache-control": "private"}
+        )
+        if filename is not None:
+            self.headers["content-disposition"] = (
+                f"attachment; filename*=utf-8''{quote(filename)}"
+            )
+        self._negotiate(request_headers or Headers(), etag)
+
+    def _negotiate(self, request_headers: Headers, etag: str) -> None:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            self.status_code = 304
+            self.send_body = False
+            return
+
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        # A stale If-Range means the client's partial copy is a different file
+        if range_header and (if_range is None or if_range.strip() == etag):
+            try:
+                byte_range = parse_range(range_header, self.size)
+            except ValueError:
+                self.status_code = 416
+                self.send_body = False
+                self.headers["content-range"] = f"bytes */{self.size}"
+                self.headers["content-length"] = "0"
+                return
+            if byte_range is not None:
+                self.start, self.end = byte_range
+                self.status_code = 206
+                self.headers["content-range"] = (
+                    f"bytes {self.start}-{self.end}/{self.size}"
+                )
+        self.headers["content-length"] = str(self.end - self.start + 1)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if not self.send_body or scope["method"].upper() == "HEAD" or self.size == 0:
+            await send({"type": "http.response.body", "body": b""})
+        elif ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+            await self._send_zerocopy(send)
+        else:
+            await self._send_chunks(send)
+
+    async def _send_zerocopy(self, send: Send) -> None:
+        with open(self.path, "rb") as file:
+            await send(
+                {
+                    "type": ZEROCOPY_EXTENSION,
+                    "file": file,
+                    "offset": self.start,
+                    "count": self.end - self.start + 1,
+                }
+            )
+
+    async def _send_chunks(self, send: Send) -> None:
+        remaining = self.end - self.start + 1
+        async with await anyio.open_file(self.path, "rb") as file:
+            await file.seek(self.start)
+            while remaining > 0:
+                chunk = await file.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+        if remaining > 0:
+            # File shrank under us; close the body so the client sees a short read
+            await send({"type": "http.response.body", "body": b""})
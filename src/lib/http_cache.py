@@ -0,0 +1,145 @@
+"""
+HTTP caching for public, read-mostly endpoints.
+
+`ResponseCache.respond` serializes an endpoint's result once and answers
+with an `ETag` (hash of the body) and `Cache-Control`; a request whose
+`If-None-Match` carries that tag gets an empty `304 Not Modified`.
+
+With the response cache enabled the serialized body and its tag are kept in
+a `LayeredCache` (process L1 + Redis) under the route, the query string and
+the current *version* of every scope the response depends on ("courses",
+"course:12", ...). Repositories bump those versions after each committed
+write, so stale entries are simply never looked up again and expire on
+their TTL. Versions are read before the data and bumped after the commit,
+and bodies that will be cached are loaded from the primary (a lagging
+replica could return data from before the bump), so an entry is never older
+than the version it is stored under. Repeat
+requests cost one Redis MGET plus an L1 hit, without touching the database.
+
+If Redis is down nothing is cached but ETags and 304s keep working.
+"""
+
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import nullcontext
+from typing import Any
+
+import redis.asyncio as redis
+from fastapi import Request, Response, status
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.core.database import primary_reads
+from src.lib import cache
+from src.lib.cache import LayeredCache, TTLCache
+from src.lib.responses import JSONAdapter
+
+logger = logging.getLogger(__name__)
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an `If-None-Match` header against `etag`"""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+class ResponseCache:
+    """ETags, conditional GET and an optional versioned response cache."""
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int = settings.HTTP_RESPONSE_CACHE_TTL_SECONDS,
+        max_age: int = settings.HTTP_CACHE_MAX_AGE_SECONDS,
+        enabled: bool = settings.HTTP_RESPONSE_CACHE_ENABLED,
+        l1: TTLCache | None = None,
+        client: redis.Redis | None = None,
+    ):
+        self.namespace = namespace
+        self.enabled = enabled
+        self.store = LayeredCache(f"{namespace}_response", ttl, l1=l1, client=client)
+        self._client = client
+        self.cache_control = (
+            f"public, max-age={max_age}" if max_age > 0 else "public, no-cache"
+        )
+
+    @property
+    def client(self) -> redis.Redis:
+        # Resolved per call so tests can swap the module-level client
+        return self._client or cache.redis_client
+
+    def _version_key(self, scope: str) -> str:
+        return f"{self.namespace}_version:{scope}"
+
+    async def versions(self, scopes: Sequence[str]) -> list[int] | None:
+        """Current version of each scope, None if Redis is unavailable"""
+        try:
+            values = await self.client.mget([self._version_key(s) for s in scopes])
+        except RedisError:
+            logger.warning("Redis unavailable, %s responses not cached", self.namespace)
+            return None
+        return [int(value or 0) for value in values]
+
+    async def invalidate(self, *scopes: str) -> None:
+        """Bump the version of `scopes` (call after the write is committed)"""
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for scope in scopes:
+                    pipe.incr(self._version_key(scope))
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Redis unavailable, could not invalidate %s", scopes)
+
+    def _key(self, request: Request, scopes: Sequence[str], versions: list[int]) -> str:
+        query = sorted(request.query_params.multi_items())
+        raw = f"{request.url.path}?{query}|{list(zip(scopes, versions, strict=True))}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    async def respond(
+        self,
+        request: Request,
+        scopes: Sequence[str],
+        adapter: JSONAdapter,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Response:
+        """Serve `load()` serialized by `adapter`, from cache when possible.
+
+        Exceptions from `load` propagate (and nothing is cached), so callers
+        map them to HTTP errors as usual.
+        """
+        key = entry = None
+        if self.enabled:
+            versions = await self.versions(scopes)
+            if versions is not None:
+                key = self._key(request, scopes, versions)
+                entry = await self.store.get(key)
+
+        if entry is None:
+            with primary_reads() if key is not None else nullcontext():
+                body = adapter.dump_json(await load())
+            entry = {"etag": make_etag(body), "body": body.decode()}
+            if key is not None:
+                await self.store.set(key, entry)
+
+        headers = {"ETag": entry["etag"], "Cache-Control": self.cache_control}
+        if etag_matches(request.headers.get("if-none-match"), entry["etag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(entry["body"], media_type="application/json", headers=headers)
+
+
+# Public course catalog: course lists / search ("courses"), course detail
+# ("course:<id>") and lesson lists ("lessons:<course_id>")
+catalog_cache = ResponseCache(
+    "catalog",
+    l1=TTLCache(
+        maxsize=settings.HTTP_RESPONSE_CACHE_L1_MAX_ENTRIES,
+        ttl=settings.HTTP_RESPONSE_CACHE_L1_TTL_SECONDS,
+    ),
+)
@@ -0,0 +1,445 @@
+"""
+Lightweight async job queue for work that shouldn't hold up a request.
+
+A request enqueues a job (task name + JSON args) and returns; a worker
+process (`python -m src.jobs.worker`) runs it, so response time no longer
+depends on LLM or SMTP tail latency.
+
+On Redis each queue is a list, plus a sorted set of jobs waiting out a retry
+backoff that a Lua script moves back to the list once due. A failing job is
+retried with exponential backoff and jitter, then parked on the queue's
+dead-letter list. An idempotency key allows one queued or running job per
+key; while the job runs the key is held on a short lease the worker keeps
+renewing, so a worker that dies mid-job frees it within minutes. Workers
+run a fixed number of jobs per queue at a time, and a backend error only
+fails the job at hand, never the worker loop. `MemoryBackend` has the same
+behaviour in-process, for tests and single-process setups.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import random
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+
+import redis.asyncio as redis
+from redis.exceptions import NoScriptError
+
+from src.core.config import settings
+from src.lib import cache
+
+logger = logging.getLogger(__name__)
+
+TaskFunc = Callable[..., Awaitable[Any]]
+
+# Dead jobs kept per queue for inspection
+DEAD_LETTER_LIMIT = 1000
+
+# KEYS[1]: delayed zset, KEYS[2]: ready list. ARGV: now, max jobs to move.
+PROMOTE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1],
+  'LIMIT', 0, tonumber(ARGV[2]))
+if #due > 0 then
+  redis.call('ZREM', KEYS[1], unpack(due))
+  redis.call('RPUSH', KEYS[2], unpack(due))
+end
+return #due
+"""
+PROMOTE_SHA = hashlib.sha1(PROMOTE_SCRIPT.encode()).hexdigest()
+
+
+@dataclass
+class Job:
+    id: str
+    task: str
+    queue: str
+    args: list[Any] = field(default_factory=list)
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    idempotency_key: str | None = None
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, data: str | bytes) -> "Job":
+        return cls(**json.loads(data))
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    func: TaskFunc
+    queue: str
+    max_retries: int
+    backoff: float
+    max_backoff: float
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter, so failed jobs don't retry in lockstep"""
+        delay = min(self.max_backoff, self.backoff * 2.0 ** (attempts - 1))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+class Backend(Protocol):
+    async def push(self, job: Job, delay: float = 0.0) -> None: ...
+
+    async def pop(self, queue: str, timeout: float) -> Job | None: ...
+
+    async def bury(self, job: Job) -> None: ...
+
+    async def claim(self, key: str, job_id: str, ttl: int) -> bool: ...
+
+    async def release(self, key: str) -> None: ...
+
+    async def refresh(self, key: str, ttl: int) -> None: ...
+
+
+class RedisBackend:
+    def __init__(
+        self,
+        prefix: str = "jobs",
+        client: redis.Redis | None = None,
+        clock: Callable[[], float] = time.time,
+        promote_batch: int = 100,
+    ):
+        self.prefix = prefix
+        self._client = client
+        self.clock = clock
+        self.promote_batch = promote_batch
+
+    @property
+    def client(self) -> redis.Redis:
+        # Resolved per call so the shared client can be swapped (tests)
+        return self._client or cache.redis_client
+
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix, *parts))
+
+    async def push(self, job: Job, delay: float = 0.0) -> None:
+        if delay > 0:
+            await self.client.zadd(
+                self._key(job.queue, "delayed"), {job.dumps(): self.clock() + delay}
+            )
+        else:
+            await self.client.rpush(self._key(job.queue), job.dumps())
+
+    async def pop(self, queue: str, timeout: float) -> Job | None:
+        """Next ready job; waits up to `timeout` seconds (0: don't wait)"""
+        await self._promote(queue)
+        if timeout > 0:
+            item = await self.client.blpop([self._key(queue)], timeout=timeout)
+            data = item[1] if item else None
+        else:
+            data = await self.client.lpop(self._key(queue))
+        return Job.loads(data) if data else None
+
+    async def bury(self, job: Job) -> None:
+        key = self._key(job.queue, "dead")
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, job.dumps())
+            pipe.ltrim(key, -DEAD_LETTER_LIMIT, -1)
+            await pipe.execute()
+
+    async def claim(self, key: str, job_id: str, ttl: int) -> bool:
+        return bool(
+            await self.client.set(self._key("key", key), job_id, nx=True, ex=ttl)
+        )
+
+    async def release(self, key: str) -> None:
+        await self.client.delete(self._key("key", key))
+
+    async def refresh(self, key: str, ttl: int) -> None:
+        await self.client.expire(self._key("key", key), ttl)
+
+    async def _promote(self, queue: str) -> None:
+        keys = [self._key(queue, "delayed"), self._key(queue)]
+        args = [self.clock(), self.promote_batch]
+        try:
+            await self.client.evalsha(PROMOTE_SHA, len(keys), *keys, *args)
+        except NoScriptError:
+            await self.client.eval(PROMOTE_SCRIPT, len(keys), *keys, *args)
+
+
+class MemoryBackend:
+    """In-process backend; jobs still round-trip through JSON like on Redis"""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self.clock = clock
+        self.ready: dict[str, deque[str]] = defaultdict(deque)
+        self.delayed: dict[str, list[tuple[float, int, str]]] = defaultdict(list)
+        self.dead: dict[str, list[Job]] = defaultdict(list)
+        self.keys: dict[str, tuple[str, float]] = {}
+        self._events: dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._seq = itertools.count()
+
+    async def push(self, job: Job, delay: float = 0.0) -> None:
+        if delay > 0:
+            entry = (self.clock() + delay, next(self._seq), job.dumps())
+            heapq.heappush(self.delayed[job.queue], entry)
+        else:
+            self.ready[job.queue].append(job.dumps())
+        self._events[job.queue].set()
+
+    async def pop(self, queue: str, timeout: float) -> Job | None:
+        deadline = self.clock() + timeout
+        while True:
+            self._promote(queue)
+            if self.ready[queue]:
+                return Job.loads(self.ready[queue].popleft())
+            wait = deadline - self.clock()
+            if wait <= 0:
+                return None
+            if self.delayed[queue]:
+                wait = min(wait, self.delayed[queue][0][0] - self.clock())
+            event = self._events[queue]
+            event.clear()
+            try:
+                await asyncio.wait_for(event.wait(), max(wait, 0.001))
+            except TimeoutError:
+                pass
+
+    async def bury(self, job: Job) -> None:
+        dead = self.dead[job.queue]
+        dead.append(job)
+        del dead[:-DEAD_LETTER_LIMIT]
+
+    async def claim(self, key: str, job_id: str, ttl: int) -> bool:
+        held = self.keys.get(key)
+        if held is not None and held[1] > self.clock():
+            return False
+        self.keys[key] = (job_id, self.clock() + ttl)
+        return True
+
+    async def release(self, key: str) -> None:
+        self.keys.pop(key, None)
+
+    async def refresh(self, key: str, ttl: int) -> None:
+        held = self.keys.get(key)
+        if held is not None:
+            self.keys[key] = (held[0], self.clock() + ttl)
+
+    def _promote(self, queue: str) -> None:
+        delayed = self.delayed[queue]
+        now = self.clock()
+        while delayed and delayed[0][0] <= now:
+            self.ready[queue].append(heapq.heappop(delayed)[2])
+
+
+class JobQueue:
+    def __init__(
+        self, backend: Backend, idempotency_ttl: int = 86400, lease_ttl: int = 300
+    ):
+        self.backend = backend
+        # A key is released when its job finishes. Safety nets: it expires
+        # after `idempotency_ttl` while the job is queued, and `lease_ttl`
+        # after the last renewal once a worker runs it (the worker died)
+        self.idempotency_ttl = idempotency_ttl
+        self.lease_ttl = lease_ttl
+        self.tasks: dict[str, Task] = {}
+
+    def task(
+        self,
+        name: str,
+        *,
+        queue: str = "default",
+        max_retries: int = 3,
+        backoff: float = 2.0,
+        max_backoff: float = 300.0,
+    ) -> Callable[[TaskFunc], TaskFunc]:
+        """Register an async function as task `name` on `queue`"""
+
+        def decorator(func: TaskFunc) -> TaskFunc:
+            self.tasks[name] = Task(
+                name, func, queue, max_retries, backoff, max_backoff
+            )
+            return func
+
+        return decorator
+
+    async def enqueue(
+        self,
+        name: str,
+        *args: Any,
+        idempotency_key: str | None = None,
+        delay: float = 0.0,
+        **kwargs: Any,
+    ) -> str | None:
+        """Queue a run of task `name`; returns the job id.
+
+        Returns None without queueing if a job with the same
+        `idempotency_key` is still queued or running.
+        """
+        task = self.tasks.get(name)
+        if task is None:
+            raise ValueError(f"Unknown task {name!r}")
+        job = Job(uuid.uuid4().hex, name, task.queue, list(args), kwargs)
+        if idempotency_key is not None:
+            job.idempotency_key = idempotency_key
+            claimed = await self.backend.claim(
+                idempotency_key, job.id, self.idempotency_ttl
+            )
+            if not claimed:
+                return None
+        await self.backend.push(job, delay)
+        return job.id
+
+
+class Worker:
+    """Run queued jobs, at most `concurrency[queue]` at a time per queue"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        concurrency: dict[str, int],
+        poll_timeout: float = 1.0,
+    ):
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_timeout = poll_timeout
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Consume until `stop()`; jobs already started are finished first"""
+        self._stopping.clear()
+        consumers = [
+            asyncio.create_task(self._consume(name))
+            for name, limit in self.concurrency.items()
+            for _ in range(limit)
+        ]
+        try:
+            await asyncio.gather(*consumers)
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+            await asyncio.gather(*consumers, return_exceptions=True)
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    async def run_until_empty(self, queues: Iterable[str] | None = None) -> int:
+        """Run ready jobs one by one until the queues are empty; returns jobs run.
+
+        Jobs waiting out a retry backoff are left alone. For tests and
+        one-off scripts.
+        """
+        names = set(queues or self.concurrency)
+        processed = 0
+        while True:
+            ran = False
+            for name in names:
+                job = await self.queue.backend.pop(name, 0)
+                if job is not None:
+                    await self.process(job)
+                    processed += 1
+                    ran = True
+            if not ran:
+                return processed
+
+    async def process(self, job: Job) -> bool:
+        """Run one job; failures are re-queued with backoff or dead-lettered"""
+        task = self.queue.tasks.get(job.task)
+        job.attempts += 1
+        try:
+            if task is None:
+                raise LookupError(f"Unknown task {job.task!r}")
+            async with self._lease(job):
+                await task.func(*job.args, **job.kwargs)
+        except Exception:
+            if task is not None and job.attempts <= task.max_retries:
+                delay = task.retry_delay(job.attempts)
+                logger.warning(
+                    "Job %s (%s) failed, retry %s in %.1fs",
+                    job.id,
+                    job.task,
+                    job.attempts,
+                    delay,
+                    exc_info=True,
+                )
+                await self._retry(job, delay)
+                return False
+            logger.exception("Job %s (%s) failed for good", job.id, job.task)
+            try:
+                await self.queue.backend.bury(job)
+            except Exception:
+                logger.exception("Dead-lettering job %s (%s) failed", job.id, job.task)
+            await self._release(job)
+            return False
+        await self._release(job)
+        return True
+
+    async def _consume(self, name: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                job = await self.queue.backend.pop(name, self.poll_timeout)
+            except Exception:
+                logger.exception("Polling queue %s failed", name)
+                await asyncio.sleep(self.poll_timeout)
+                continue
+            if job is not None:
+                await self.process(job)
+
+    async def _retry(self, job: Job, delay: float) -> None:
+        try:
+            await self.queue.backend.push(job, delay)
+        except Exception:
+            # The job is lost: free its key so the work can be queued again
+            logger.exception("Re-queueing job %s (%s) failed", job.id, job.task)
+            await self._release(job)
+            return
+        await self._hold(job, self.queue.idempotency_ttl)
+
+    @asynccontextmanager
+    async def _lease(self, job: Job) -> AsyncIterator[None]:
+        """Hold the job's key for `lease_ttl` at a time while it runs"""
+        if job.idempotency_key is None:
+            yield
+            return
+        await self._hold(job, self.queue.lease_ttl)
+        renew = asyncio.create_task(self._renew(job))
+        try:
+            yield
+        finally:
+            renew.cancel()
+            await asyncio.gather(renew, return_exceptions=True)
+
+    async def _renew(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(self.queue.lease_ttl / 3)
+            await self._hold(job, self.queue.lease_ttl)
+
+    async def _hold(self, job: Job, ttl: int) -> None:
+        if job.idempotency_key is None:
+            return
+        try:
+            await self.queue.backend.refresh(job.idempotency_key, ttl)
+        except Exception:
+            logger.exception("Renewing the key of job %s (%s) failed", job.id, job.task)
+
+    async def _release(self, job: Job) -> None:
+        if job.idempotency_key is None:
+            return
+        try:
+            await self.queue.backend.release(job.idempotency_key)
+        except Exception:
+            logger.exception(
+                "Releasing the key of job %s (%s) failed", job.id, job.task
+            )
+
+
+def _make_backend() -> Backend:
+    if settings.JOB_QUEUE_BACKEND == "memory":
+        return MemoryBackend()
+    return RedisBackend()
+
+
+job_queue = JobQueue(_make_backend())
@@ -0,0 +1,106 @@
+"""
+Access tokens (HS256 JWT).
+
+`verify_access_token` is the request-path check: verified claims are kept in
+a bounded in-process LRU keyed by the token's SHA-256 digest, so repeated
+requests with the same token skip signature verification. An entry lives
+until the token's `exp` or AUTH_TOKEN_CACHE_TTL_SECONDS, whichever is first.
+
+Logout revokes a token by digest in Redis until it expires. Revocation is
+checked whenever a worker verifies a token it has not cached, so other
+workers stop accepting it within the cache TTL.
+"""
+
+import hashlib
+import logging
+import math
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from jose import JWTError, jwt
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.lib import cache
+from src.lib.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+ALGORITHM = "HS256"
+REVOKED_PREFIX = "auth:revoked"
+
+# digest -> claims, or _REVOKED for tokens logged out in this worker
+verified_token_cache = TTLCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+    name="verified_token",
+)
+_REVOKED = False
+
+
+def create_access_token(
+    data: dict[str, Any], expires_delta: timedelta | None = None
+) -> str:
+    """Sign `data` (must contain "sub") into an access token"""
+    expire = datetime.now(UTC) + (
+        expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    return jwt.encode({**data, "exp": expire}, settings.SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_access_token(token: str) -> dict[str, Any] | None:
+    """Return the token claims, or None if the token is invalid or expired"""
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def verify_access_token(token: str) -> dict[str, Any] | None:
+    """Claims of a valid, unrevoked token (cached), else None"""
+    digest = token_digest(token)
+    claims = verified_token_cache.get(digest)
+    if claims is not None:
+        return claims or None
+
+    claims = decode_access_token(token)
+    if claims is None or await _is_revoked(digest):
+        return None
+    ttl = min(settings.AUTH_TOKEN_CACHE_TTL_SECONDS, _seconds_left(claims))
+    if ttl > 0:
+        verified_token_cache.set(digest, claims, ttl=ttl)
+    return claims
+
+
+async def revoke_access_token(token: str) -> None:
+    """Reject `token` from now on (logout)"""
+    claims = decode_access_token(token)
+    if claims is None:
+        return
+    digest = token_digest(token)
+    seconds_left = _seconds_left(claims)
+    verified_token_cache.set(digest, _REVOKED, ttl=seconds_left)
+    try:
+        await cache.redis_client.set(
+            f"{REVOKED_PREFIX}:{digest}", 1, ex=max(1, math.ceil(seconds_left))
+        )
+    except RedisError:
+        logger.warning("Redis unavailable, token revoked in this worker only")
+
+
+async def _is_revoked(digest: str) -> bool:
+    try:
+        return bool(await cache.redis_client.exists(f"{REVOKED_PREFIX}:{digest}"))
+    except RedisError:
+        logger.warning("Redis unavailable, skipping token revocation check")
+        return False
+
+
+def _seconds_left(claims: dict[str, Any]) -> float:
+    exp = claims.get("exp")
+    return exp - time.time() if isinstance(exp, int | float) else 0.0
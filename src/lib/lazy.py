@@ -0,0 +1,39 @@
+"""
+Deferred construction of heavy objects.
+
+The provider SDKs take a few hundred milliseconds to import, most of a
+cold start. Their clients are wrapped in `Lazy` so importing the app, and
+building the AI router in the lifespan, never imports them; the first call
+does, or `preload()` from a background thread right after startup.
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Generic, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class Lazy(Generic[T]):
+    """A value built by `factory` on first `get()`, once, thread-safely."""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._value: T | None = None
+        self.loaded = False
+
+    @classmethod
+    def of(cls, value: T) -> "Lazy[T]":
+        """An already-built value"""
+        lazy = cls(lambda: value)
+        lazy._value, lazy.loaded = value, True
+        return lazy
+
+    def get(self) -> T:
+        if not self.loaded:
+            with self._lock:
+                if not self.loaded:
+                    self._value = self._factory()
+                    self.loaded = True
+        return cast(T, self._value)
@@ -0,0 +1,82 @@
+"""
+Archive storage for the messages of cold conversations.
+
+Each archived conversation is one zstd-compressed JSONL file,
+`<root>/<id // 1000>/<id>.jsonl.zst`, one message per line. Chat text
+compresses several times over, and the files never need an index or a
+query: a conversation is only ever read back whole, when it is rehydrated.
+Files are written to a temp file, fsynced and renamed into place, so a
+conversation's rows are only deleted once its archive is complete on disk.
+Disk and compression work run in anyio's thread pool.
+"""
+
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import anyio
+import orjson
+import zstandard
+
+from src.core.config import settings
+
+# Columns kept per message; ids and timestamps survive the round trip
+ARCHIVED_COLUMNS = ("id", "role", "content", "tokens_used", "created_at")
+
+
+class MessageArchive:
+    def __init__(self, root: str | Path, level: int = 10):
+        self.root = Path(root)
+        self.level = level
+
+    def path_for(self, conversation_id: int) -> Path:
+        return self.root / str(conversation_id // 1000) / f"{conversation_id}.jsonl.zst"
+
+    async def write(self, conversation_id: int, rows: list[dict[str, Any]]) -> int:
+        """Store `rows` (dicts of ARCHIVED_COLUMNS); returns the file size"""
+        return await anyio.to_thread.run_sync(self._write, conversation_id, rows)
+
+    async def read(self, conversation_id: int) -> list[dict[str, Any]]:
+        """Rows of an archived conversation; FileNotFoundError if none"""
+        return await anyio.to_thread.run_sync(self._read, conversation_id)
+
+    async def delete(self, conversation_id: int) -> None:
+        await anyio.Path(self.path_for(conversation_id)).unlink(missing_ok=True)
+
+    def _write(self, conversation_id: int, rows: list[dict[str, Any]]) -> int:
+        data = b"".join(
+            orjson.dumps({column: row[column] for column in ARCHIVED_COLUMNS}) + b"\n"
+            for row in rows
+        )
+        compressed = zstandard.ZstdCompressor(level=self.level).compress(data)
+
+        path = self.path_for(conversation_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as file:
+                file.write(compressed)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return len(compressed)
+
+    def _read(self, conversation_id: int) -> list[dict[str, Any]]:
+        compressed = self.path_for(conversation_id).read_bytes()
+        data = zstandard.ZstdDecompressor().decompress(compressed)
+        rows = []
+        for line in data.splitlines():
+            row = orjson.loads(line)
+            row["created_at"] = datetime.fromisoformat(row["created_at"])
+            rows.append(row)
+        return rows
+
+
+message_archive = MessageArchive(
+    settings.CHAT_ARCHIVE_DIR, level=settings.CHAT_ARCHIVE_ZSTD_LEVEL
+)
@@ -0,0 +1,211 @@
+"""
+Prometheus metrics and request-scoped instrumentation.
+
+`MetricsMiddleware` times every HTTP request per route template, and counts
+the SQL statements it ran and the time they took (SQLAlchemy cursor events
+add into a per-request `RequestStats` held in a context variable). The AI
+router records provider latency and token usage, caches record hits and
+misses, and the chat service records tokens per message. Everything is
+served in the Prometheus text format at `/api/metrics`.
+
+With several worker processes set `PROMETHEUS_MULTIPROC_DIR` so the
+endpoint aggregates all of them.
+"""
+
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+LLM_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL statements per HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+HTTP_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL per HTTP request",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+DB_QUERY_SECONDS = Histogram(
+    "db_query_duration_seconds", "SQL statement latency", buckets=LATENCY_BUCKETS
+)
+LLM_REQUESTS = Counter(
+    "llm_requests_total", "AI provider calls", ["provider", "model", "outcome"]
+)
+LLM_LATENCY = Histogram(
+    "llm_request_duration_seconds",
+    "AI provider latency (generate: full reply, stream: first token)",
+    ["provider", "model", "mode"],
+    buckets=LLM_BUCKETS,
+)
+LLM_TOKENS = Counter(
+    "llm_tokens_total", "AI tokens billed", ["provider", "model", "direction"]
+)
+CACHE_REQUESTS = Counter("cache_requests_total", "Cache lookups", ["cache", "result"])
+CHAT_MESSAGE_TOKENS = Histogram(
+    "chat_message_tokens",
+    "Tokens per chat message",
+    ["role"],
+    buckets=(10, 25, 50, 100, 200, 400, 800, 1600, 3200),
+)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def current_request_stats() -> RequestStats | None:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, many: bool
+) -> None:
+    elapsed = time.perf_counter() - context._metrics_started
+    DB_QUERY_SECONDS.observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+def instrument_sqlalchemy() -> None:
+    """Time every SQL statement of every engine (idempotent)"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def record_cache(cache: str, result: str) -> None:
+    CACHE_REQUESTS.labels(cache, result).inc()
+
+
+def record_llm_call(
+    provider: str, model: str, outcome: str, seconds: float | None, mode: str
+) -> None:
+    LLM_REQUESTS.labels(provider, model, outcome).inc()
+    if seconds is not None:
+        LLM_LATENCY.labels(provider, model, mode).observe(seconds)
+
+
+def record_llm_usage(
+    provider: str, model: str, input_tokens: int | None, output_tokens: int | None
+) -> None:
+    if input_tokens:
+        LLM_TOKENS.labels(provider, model, "input").inc(input_tokens)
+    if output_tokens:
+        LLM_TOKENS.labels(provider, model, "output").inc(output_tokens)
+
+
+def record_message_tokens(role: str, tokens: int) -> None:
+    CHAT_MESSAGE_TOKENS.labels(role).observe(tokens)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Current metrics in the Prometheus text format, and its content type"""
+    registry: CollectorRegistry = REGISTRY
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    """Per-route latency, status and SQL usage of each HTTP request.
+
+    Routes are labelled by their path template (`/api/chat/conversations/
+    {conversation_id}`), never the raw path, to keep label cardinality
+    bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._templates: dict[Any, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            route = self._route(scope)
+            method = scope["method"]
+            HTTP_REQUESTS.labels(method, route, str(status)).inc()
+            HTTP_LATENCY.labels(method, route).observe(elapsed)
+            HTTP_DB_QUERIES.labels(route).observe(stats.queries)
+            HTTP_DB_SECONDS.labels(route).observe(stats.db_seconds)
+
+    def _route(self, scope: Scope) -> str:
+        app = scope.get("app")
+        if app is None:
+            return "unmatched"
+        # The router stores the matched endpoint in the (shared) scope
+        endpoint = scope.get("endpoint")
+        if endpoint is not None and endpoint in self._templates:
+            return self._templates[endpoint]
+        for route in app.router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                path = getattr(route, "path", "unmatched")
+                if endpoint is not None:
+                    self._templates[endpoint] = path
+                return path
+        return "unmatched"
@@ -0,0 +1,88 @@
+"""
+Keyset (cursor) pagination helpers.
+
+OFFSET pagination makes the database walk and discard every skipped row, so
+page 100 of a listing costs 100x page 1. Keyset pagination instead resumes
+after the last row seen (`WHERE id > :last_id ORDER BY id LIMIT n`), which
+is a single range scan on a (filter, id) index whatever the depth.
+
+Cursors are opaque to clients: URL-safe base64 of a small JSON object with
+the sort key of the last row.
+"""
+
+import base64
+import json
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.pagination import InvalidCursorError
+
+# How a listing reports its total: exact COUNT(*), planner estimate, or not at all
+CountMode = Literal["exact", "estimated", "none"]
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """Decode a cursor, raising InvalidCursorError on anything unexpected"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursorError(cursor) from None
+    if not isinstance(values, dict):
+        raise InvalidCursorError(cursor)
+    return values
+
+
+def cursor_id(cursor: str | None) -> int | None:
+    """Id of the last row of the previous page (None for the first page)"""
+    if cursor is None:
+        return None
+    last_id = decode_cursor(cursor).get("id")
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursorError(cursor)
+    return last_id
+
+
+def split_page(rows: Sequence[Any], limit: int) -> tuple[list[Any], str | None]:
+    """Trim a `limit + 1` fetch to `limit` rows plus the next page's cursor.
+
+    Fetching one extra row tells whether another page exists without a
+    COUNT query.
+    """
+    items = list(rows[:limit])
+    if len(rows) > limit and items:
+        return items, encode_cursor({"id": items[-1].id})
+    return items, None
+
+
+async def count_rows(db: AsyncSession, query: Select, estimate: bool = False) -> int:
+    """Count the rows `query` would return.
+
+    With `estimate=True` on PostgreSQL the planner's row estimate is used
+    (EXPLAIN, no table scan), which is close enough for a page counter once
+    the table has been analyzed. Other databases fall back to COUNT(*).
+    """
+    query = query.order_by(None).limit(None).offset(None)
+    dialect = db.get_bind().dialect
+    if estimate and dialect.name == "postgresql":
+        compiled = query.compile(
+            dialect=dialect, compile_kwargs={"literal_binds": True}
+        )
+        # Sent as is: through text(), an inlined value such as "a:b" would be
+        # parsed as a bind parameter
+        connection = await db.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    count = await db.scalar(select(func.count()).select_from(query.subquery()))
+    return count or 0
@@ -0,0 +1,200 @@
+"""
+Monthly range partitions on PostgreSQL.
+
+`messages` is partitioned by `created_at`, one partition per calendar month
+(`messages_p202610` holds October 2026) plus a DEFAULT partition that
+catches anything outside the created ranges, so an insert never fails for
+want of a partition. Queries that bound `created_at` from below only touch
+the partitions from that month on, and the archive job drops old months
+once their conversations have moved to the archive, instead of deleting
+rows out of one ever-growing table.
+
+Everything here takes a synchronous `Connection`, so the same code serves
+the migration, `create_all` and (through `run_sync`) the archive job. Other
+dialects have no partitions: the functions do nothing there.
+"""
+
+import re
+from datetime import UTC, date, datetime
+
+from sqlalchemy import Connection, text
+
+MESSAGES = "messages"
+
+# Turns a freshly created or migrated `messages` table (renamed to
+# messages_unpartitioned first) into a partitioned one. The primary key of a
+# partitioned table must include the partition key, hence (id, created_at);
+# ids still come from the original sequence.
+POSTGRES_PARTITIONED_MESSAGES_DDL = (
+    "ALTER TABLE messages RENAME TO messages_unpartitioned",
+    "ALTER TABLE messages_unpartitioned "
+    "RENAME CONSTRAINT messages_pkey TO messages_unpartitioned_pkey",
+    "DROP INDEX IF EXISTS ix_messages_id",
+    "DROP INDEX IF EXISTS idx_messages_conversation_id",
+    "DROP INDEX IF EXISTS idx_messages_conversation_created",
+    "ALTER SEQUENCE messages_id_seq OWNED BY NONE",
+    """
+    CREATE TABLE messages (
+        id INTEGER NOT NULL DEFAULT nextval('messages_id_seq'),
+        conversation_id INTEGER NOT NULL CONSTRAINT messages_conversation_id_fkey
+            REFERENCES conversations (id) ON DELETE CASCADE,
+        role VARCHAR(20) NOT NULL,
+        content TEXT NOT NULL,
+        tokens_used INTEGER,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+        PRIMARY KEY (id, created_at)
+    ) PARTITION BY RANGE (created_at)
+    """,
+    "ALTER SEQUENCE messages_id_seq OWNED BY messages.id",
+    "CREATE INDEX idx_messages_conversation_id ON messages (conversation_id, id)",
+    "CREATE INDEX idx_messages_conversation_created "
+    "ON messages (conversation_id, created_at)",
+    "CREATE TABLE messages_default PARTITION OF messages DEFAULT",
+)
+
+_PARTITION_RE = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def _is_postgres(connection: Connection) -> bool:
+    return connection.dialect.name == "postgresql"
+
+
+def _bound(month: date) -> str:
+    return datetime(month.year, month.month, 1, tzinfo=UTC).isoformat()
+
+
+def create_monthly_partitions(
+    connection: Connection, table: str, start: date, end: date
+) -> list[str]:
+    """Create the missing partitions for every month from `start` to `end`.
+
+    Postgres refuses a new partition while the DEFAULT one holds rows in its
+    range (late or clock-skewed inserts), so those rows are moved over: the
+    default is detached, the partition created and filled, then the default
+    re-attached.
+    """
+    if not _is_postgres(connection):
+        return []
+    existing = set(list_partitions(connection, table))
+    default = f"{table}_default"
+    created = []
+    month, last = month_start(start), month_start(end)
+    while month <= last:
+        name = partition_name(table, month)
+        if name not in existing:
+            lower, upper = _bound(month), _bound(add_months(month, 1))
+            in_range = f"created_at >= '{lower}' AND created_at < '{upper}'"
+            create = (
+                f"CREATE TABLE {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+            # Locked before the check so no row reaches the default after it
+            connection.execute(text(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE"))
+            if connection.scalar(
+                text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})")
+            ):
+                connection.execute(
+                    text(f"ALTER TABLE {table} DETACH PARTITION {default}")
+                )
+                connection.execute(text(create))
+                connection.execute(
+                    text(
+                        f"WITH moved AS (DELETE FROM {default} WHERE {in_range} "
+                        f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+                    )
+                )
+                connection.execute(
+                    text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+                )
+            else:
+                connection.execute(text(create))
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def list_partitions(connection: Connection, table: str) -> dict[str, date]:
+    """Monthly partitions of `table` by name, with the month each one holds"""
+    if not _is_postgres(connection):
+        return {}
+    names = connection.scalars(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    partitions = {}
+    for name in names:
+        match = _PARTITION_RE.search(name)
+        if match:
+            partitions[name] = date(int(match[1]), int(match[2]), 1)
+    return partitions
+
+
+def partition_messages(connection: Connection, months_ahead: int) -> None:
+    """Rebuild `messages` as a partitioned table, keeping its rows.
+
+    Creates a partition for every month from the oldest message to
+    `months_ahead` months from now before copying, so existing rows land in
+    monthly partitions rather than the default one.
+    """
+    if not _is_postgres(connection):
+        return
+    for statement in POSTGRES_PARTITIONED_MESSAGES_DDL:
+        connection.execute(text(statement))
+    today = datetime.now(UTC).date()
+    oldest = connection.scalar(
+        text("SELECT min(created_at) FROM messages_unpartitioned")
+    )
+    create_monthly_partitions(
+        connection,
+        MESSAGES,
+        oldest.date() if oldest else today,
+        add_months(today, months_ahead),
+    )
+    # created_at used to be nullable
+    connection.execute(
+        text(
+            "INSERT INTO messages "
+            "(id, conversation_id, role, content, tokens_used, created_at) "
+            "SELECT m.id, m.conversation_id, m.role, m.content, m.tokens_used, "
+            "coalesce(m.created_at, c.created_at, now()) "
+            "FROM messages_unpartitioned m "
+            "JOIN conversations c ON c.id = m.conversation_id"
+        )
+    )
+    connection.execute(text("DROP TABLE messages_unpartitioned"))
+
+
+def drop_empty_partitions(
+    connection: Connection, table: str, before: date
+) -> list[str]:
+    """Drop the monthly partitions that end before `before` and hold no rows"""
+    dropped = []
+    for name, month in sorted(list_partitions(connection, table).items()):
+        if add_months(month, 1) > before:
+            continue
+        # Locked before the check so a rehydration can't slip a row in
+        connection.execute(text(f"LOCK TABLE {name} IN ACCESS EXCLUSIVE MODE"))
+        if connection.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {name})")):
+            continue
+        connection.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        connection.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
@@ -0,0 +1,127 @@
+"""
+Password hashing (bcrypt via passlib).
+
+A bcrypt hash or verify takes 100-300 ms of CPU. Called from a coroutine it
+would stall every other request on the worker, so the async API runs passlib
+in a small dedicated thread pool (bcrypt releases the GIL while hashing).
+The pool size bounds how many cores logins can take; extra calls wait in the
+executor queue, whose depth is exposed by `password_hasher.snapshot()`.
+
+The sync `hash_password`/`verify_password` remain for scripts and fixtures.
+"""
+
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from passlib.context import CryptContext
+
+from src.core.config import settings
+
+T = TypeVar("T")
+
+# min == max == default: hashes made with any other cost are re-hashed on the
+# next successful login, so changing BCRYPT_ROUNDS migrates users gradually
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def needs_rehash(hashed_password: str | None) -> bool:
+    """Whether the hash was made with other settings than the current ones"""
+    if not hashed_password:
+        return False
+    return bool(pwd_context.needs_update(hashed_password))
+
+
+class PasswordHasher:
+    """Bounded thread pool running the blocking passlib calls."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker"""
+        return max(0, self.in_flight - self.max_workers)
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="password-hasher"
+            )
+        # Counters are only touched on the event loop thread, no lock needed
+        self.in_flight += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def snapshot(self) -> dict:
+        """Counters for monitoring"""
+        return {
+            "workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash off the event loop"""
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_and_rehash(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify off the event loop; also return a fresh hash if it is outdated.
+
+    Both bcrypt runs happen in one pool job so a login needing an upgrade
+    only waits for a worker once.
+    """
+    return await password_hasher.run(
+        _verify_and_rehash, plain_password, hashed_password
+    )
+
+
+def _verify_and_rehash(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if needs_rehash(hashed_password):
+        return True, hash_password(plain_password)
+    return True, None
@@ -0,0 +1,97 @@
+"""
+N+1 query guard for development and tests.
+
+Counts the statements each HTTP request runs through an ORM session,
+relationship lazy loads included, and raises `TooManyQueriesError` as soon
+as a request runs more than `max_queries` statements or the same SELECT more
+than `max_repeats` times (the signature of a loop loading one row at a time).
+Off in production; `DB_QUERY_GUARD` turns it on and the test suite does, so
+a missing loading profile fails the test that hits it.
+
+`query_budget()` applies the same limits to any block of code.
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.config import settings
+
+
+class TooManyQueriesError(RuntimeError):
+    """A request ran more statements than its query budget allows"""
+
+
+@dataclass
+class QueryBudget:
+    max_queries: int = settings.DB_QUERY_GUARD_MAX_QUERIES
+    max_repeats: int = settings.DB_QUERY_GUARD_MAX_REPEATS
+    queries: int = 0
+    selects: Counter[str] = field(default_factory=Counter)
+
+    def record(self, state: ORMExecuteState) -> None:
+        self.queries += 1
+        if self.queries > self.max_queries:
+            raise TooManyQueriesError(
+                f"More than {self.max_queries} queries in one request"
+            )
+        if not state.is_select:
+            return
+        sql = str(state.statement)
+        self.selects[sql] += 1
+        if self.selects[sql] > self.max_repeats:
+            kind = "lazy load" if state.is_relationship_load else "SELECT"
+            raise TooManyQueriesError(
+                f"Same {kind} ran more than {self.max_repeats} times in one "
+                f"request (N+1? use a loading profile): {sql[:200]}"
+            )
+
+
+_budget: ContextVar[QueryBudget | None] = ContextVar("query_budget", default=None)
+
+
+@contextmanager
+def query_budget(
+    max_queries: int = settings.DB_QUERY_GUARD_MAX_QUERIES,
+    max_repeats: int = settings.DB_QUERY_GUARD_MAX_REPEATS,
+) -> Iterator[QueryBudget]:
+    """Enforce a query budget on the ORM statements run inside the block"""
+    install_query_guard()
+    budget = QueryBudget(max_queries, max_repeats)
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def _on_orm_execute(state: ORMExecuteState) -> None:
+    budget = _budget.get()
+    if budget is not None:
+        budget.record(state)
+
+
+def install_query_guard() -> None:
+    """Count statements of every session (idempotent)"""
+    if not event.contains(Session, "do_orm_execute", _on_orm_execute):
+        event.listen(Session, "do_orm_execute", _on_orm_execute)
+
+
+class QueryGuardMiddleware:
+    """Give each HTTP request its own query budget"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with query_budget():
+            await self.app(scope, receive, send)
@@ -0,0 +1,197 @@
+"""
+Per-key rate limiting over several sliding windows at once.
+
+Each key keeps a Redis sorted set of hit timestamps. One Lua script trims it,
+counts every window and records the hit only if all windows allow it, so a
+check is a single atomic round-trip. Unlike a fixed INCR/EXPIRE counter there
+is no burst at window boundaries.
+
+If Redis is unreachable the limiter degrades to per-process token buckets
+(same limits, refilled continuously), so chat stays usable but limits are
+enforced per worker instead of globally.
+"""
+
+import hashlib
+import logging
+import math
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import redis.asyncio as redis
+from redis.exceptions import NoScriptError, RedisError
+
+from src.core.config import settings
+from src.lib import cache
+
+logger = logging.getLogger(__name__)
+
+# KEYS[1]: hit log. ARGV: now_ms, member, then (limit, window_ms) pairs.
+# Returns {1, remaining} when the hit is recorded, {0, retry_after_ms} if not.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local longest = 0
+for i = 3, #ARGV, 2 do
+  longest = math.max(longest, tonumber(ARGV[i + 1]))
+end
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - longest)
+
+local retry_after = 0
+local remaining = nil
+for i = 3, #ARGV, 2 do
+  local limit = tonumber(ARGV[i])
+  local window = tonumber(ARGV[i + 1])
+  local since = '(' .. (now - window)
+  local count = redis.call('ZCOUNT', key, since, '+inf')
+  if count >= limit then
+    -- A slot frees up when the (count - limit + 1)-th oldest hit ages out
+    local hit = redis.call('ZRANGEBYSCORE', key, since, '+inf',
+      'WITHSCORES', 'LIMIT', count - limit, 1)
+    local wait = window
+    if hit[2] then
+      wait = tonumber(hit[2]) + window - now
+    end
+    retry_after = math.max(retry_after, wait, 1)
+  elseif remaining == nil or limit - count - 1 < remaining then
+    remaining = limit - count - 1
+  end
+end
+
+if retry_after > 0 then
+  return {0, retry_after}
+end
+redis.call('ZADD', key, now, ARGV[2])
+redis.call('PEXPIRE', key, longest)
+return {1, remaining}
+"""
+SLIDING_WINDOW_SHA = hashlib.sha1(SLIDING_WINDOW_SCRIPT.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    limit: int
+    window_seconds: int
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    # Hits left in the tightest window (0 when denied)
+    remaining: int
+    # Seconds until the next hit would be allowed (0 when allowed)
+    retry_after: float
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+class TokenBucket:
+    """Continuously refilled bucket holding at most `limit` tokens."""
+
+    def __init__(self, limit: int, window_seconds: float, now: float):
+        self.capacity = limit
+        self.rate = limit / window_seconds
+        self.tokens = float(limit)
+        self.updated_at = now
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def wait_time(self) -> float:
+        """Seconds until one token is available"""
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate == 0:
+            return math.inf
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """Check and record hits for a key against all `limits` together."""
+
+    def __init__(
+        self,
+        namespace: str,
+        limits: Sequence[RateLimit],
+        client: redis.Redis | None = None,
+        clock: Callable[[], float] = time.time,
+        fallback_max_keys: int = 10000,
+    ):
+        self.namespace = namespace
+        self.limits = tuple(limits)
+        self._client = client
+        self.clock = clock
+        self.fallback_max_keys = fallback_max_keys
+        self._buckets: OrderedDict[str, list[TokenBucket]] = OrderedDict()
+
+    @property
+    def client(self) -> redis.Redis:
+        # Resolved per call so tests can swap the module-level client
+        return self._client or cache.redis_client
+
+    def key(self, id: object) -> str:
+        return f"rate_limit:{self.namespace}:{id}"
+
+    async def hit(self, id: object) -> RateLimitResult:
+        """Record one hit for `id` unless a window is full"""
+        key = self.key(id)
+        now = self.clock()
+        try:
+            allowed, value = await self._eval(key, now)
+        except RedisError:
+            logger.warning("Redis unavailable, local rate limit for %s", key)
+            return self._hit_local(key, now)
+        if allowed:
+            return RateLimitResult(True, int(value), 0.0)
+        return RateLimitResult(False, 0, int(value) / 1000)
+
+    async def _eval(self, key: str, now: float) -> list[int]:
+        args = [int(now * 1000), uuid.uuid4().hex]
+        for rate_limit in self.limits:
+            args += [rate_limit.limit, rate_limit.window_seconds * 1000]
+        try:
+            return list(await self.client.evalsha(SLIDING_WINDOW_SHA, 1, key, *args))
+        except NoScriptError:
+            # First call on this Redis (or after SCRIPT FLUSH): send the body
+            return list(await self.client.eval(SLIDING_WINDOW_SCRIPT, 1, key, *args))
+
+    def _hit_local(self, key: str, now: float) -> RateLimitResult:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = [
+                TokenBucket(rate_limit.limit, rate_limit.window_seconds, now)
+                for rate_limit in self.limits
+            ]
+            self._buckets[key] = buckets
+            if len(self._buckets) > self.fallback_max_keys:
+                self._buckets.popitem(last=False)
+        self._buckets.move_to_end(key)
+
+        for bucket in buckets:
+            bucket.refill(now)
+        wait = max(bucket.wait_time() for bucket in buckets)
+        if wait > 0:
+            return RateLimitResult(False, 0, wait)
+        for bucket in buckets:
+            bucket.tokens -= 1
+        return RateLimitResult(True, min(int(b.tokens) for b in buckets), 0.0)
+
+    def reset_local(self) -> None:
+        """Forget the fallback buckets"""
+        self._buckets.clear()
+
+
+# Messages sent to the AI tutor, per user
+chat_rate_limiter = RateLimiter(
+    "chat",
+    [
+        RateLimit(settings.CHAT_RATE_LIMIT_PER_HOUR, 3600),
+        RateLimit(settings.CHAT_RATE_LIMIT_PER_DAY, 86400),
+    ],
+)
@@ -0,0 +1,46 @@
+"""
+JSON response encoding.
+
+The app's default response class is `ORJSONResponse`: FastAPI still
+validates and converts each return value through the route's
+`response_model`, then orjson encodes the result, several times faster than
+`json.dumps`.
+
+List endpoints go further with `JSONAdapter`, a `TypeAdapter` built once at
+import that validates ORM rows (`from_attributes`) and writes JSON bytes in
+one pass inside pydantic-core, with no intermediate dicts and no second
+encoder. Routes keep their `response_model` for the OpenAPI schema.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Generic, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+class JSONAdapter(Generic[T]):
+    """Precompiled validator and JSON serializer for one response type."""
+
+    def __init__(self, type_: type[T] | Any):
+        self.adapter: TypeAdapter[T] = TypeAdapter(type_)
+
+    def dump_json(self, value: Any) -> bytes:
+        return self.adapter.dump_json(
+            self.adapter.validate_python(value, from_attributes=True)
+        )
+
+    def response(
+        self,
+        value: Any,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        return Response(
+            self.dump_json(value),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+        )
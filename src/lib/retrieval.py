@@ -0,0 +1,116 @@
+"""
+Chunking and BM25 ranking for course retrieval.
+
+Text is split into overlapping word windows; each chunk is stored with its
+term frequencies so an index can be assembled from rows without touching
+the text again. `BM25Index` is an inverted index (term -> {chunk_id: tf})
+that supports adding and removing single chunks, so a course index is kept
+up to date by applying the difference instead of rebuilding it.
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+CHUNK_WORDS = 200
+CHUNK_OVERLAP_WORDS = 40
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word terms; NFKC keeps Vietnamese diacritics comparable"""
+    return _WORD_RE.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def term_counts(text: str) -> tuple[dict[str, int], int]:
+    """(term frequencies, number of terms) of a chunk"""
+    terms = tokenize(text)
+    return dict(Counter(terms)), len(terms)
+
+
+def chunk_text(
+    text: str, size: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP_WORDS
+) -> list[str]:
+    """Split into windows of `size` words, each sharing `overlap` with the last"""
+    if not 0 <= overlap < size:
+        raise ValueError("overlap must be in [0, size)")
+    words = text.split()
+    if not words:
+        return []
+    step = size - overlap
+    chunks = []
+    for start in range(0, len(words), step):
+        chunks.append(" ".join(words[start : start + size]))
+        if start + size >= len(words):
+            break
+    return chunks
+
+
+@dataclass(frozen=True)
+class IndexedChunk:
+    id: int
+    content: str
+    length: int
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+class BM25Index:
+    """Okapi BM25 over an inverted index with incremental updates"""
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.chunks: dict[int, IndexedChunk] = {}
+        self.postings: dict[str, dict[int, int]] = {}
+        self._terms: dict[int, tuple[str, ...]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def add(self, chunk: IndexedChunk, terms: dict[str, int]) -> None:
+        if chunk.id in self.chunks:
+            self.remove(chunk.id)
+        self.chunks[chunk.id] = chunk
+        self._terms[chunk.id] = tuple(terms)
+        self._total_length += chunk.length
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[chunk.id] = tf
+
+    def remove(self, chunk_id: int) -> None:
+        chunk = self.chunks.pop(chunk_id, None)
+        if chunk is None:
+            return
+        self._total_length -= chunk.length
+        for term in self._terms.pop(chunk_id):
+            posting = self.postings[term]
+            del posting[chunk_id]
+            if not posting:
+                del self.postings[term]
+
+    def search(self, query: str, k: int) -> list[tuple[float, IndexedChunk]]:
+        """Top `k` chunks for `query`, best first; chunks sharing no term are skipped"""
+        n = len(self.chunks)
+        if n == 0 or k <= 0:
+            return []
+        avg_length = self._total_length / n or 1.0
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for chunk_id, tf in posting.items():
+                norm = self.k1 * (
+                    1 - self.b + self.b * self.chunks[chunk_id].length / avg_length
+                )
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (
+                    self.k1 + 1
+                ) / (tf + norm)
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [(score, self.chunks[chunk_id]) for chunk_id, score in best]
@@ -0,0 +1,157 @@
+"""
+Full-text search helpers shared by the PostgreSQL and SQLite backends.
+
+PostgreSQL indexes courses through a generated `search_vector` tsvector
+column (GIN index); SQLite, used by the tests, through an FTS5 table kept in
+step by triggers. Both index accent-folded text, so "de quy" finds
+"Đệ quy", and both receive the same parsed terms from `parse_terms`: every
+word must match, the last one as a prefix (search-as-you-type).
+
+Highlighting happens here, in Python, on the page being returned only,
+which keeps it identical across backends and avoids running ts_headline
+over every match.
+"""
+
+import html
+import re
+import sqlite3
+import unicodedata
+from typing import Any, overload
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+MAX_TERMS = 8
+SNIPPET_CHARS = 160
+
+# Letters and digits only: keeps tsquery / FTS5 syntax out of user input
+_TERM_RE = re.compile(r"[^\W_]+")
+
+
+@overload
+def fold(text: str) -> str: ...
+
+
+@overload
+def fold(text: None) -> None: ...
+
+
+def fold(text: str | None) -> str | None:
+    """Lowercase and strip Vietnamese diacritics ("Đệ Quy" -> "de quy")"""
+    if text is None:
+        return None
+    text = unicodedata.normalize("NFKD", text.casefold()).replace("đ", "d")
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def parse_terms(query: str) -> list[str]:
+    """Folded search terms of a user query, at most MAX_TERMS"""
+    return _TERM_RE.findall(fold(query))[:MAX_TERMS]
+
+
+def to_tsquery(terms: list[str]) -> str:
+    """Terms as a PostgreSQL tsquery: all required, last one as a prefix"""
+    return " & ".join([*terms[:-1], f"{terms[-1]}:*"])
+
+
+def to_fts5_query(terms: list[str]) -> str:
+    """Terms as an FTS5 MATCH expression with the same semantics"""
+    return " ".join([*(f'"{t}"' for t in terms[:-1]), f'"{terms[-1]}"*'])
+
+
+def _matches(word: str, terms: list[str]) -> bool:
+    folded = fold(word)
+    return folded in terms[:-1] or folded.startswith(terms[-1])
+
+
+def highlight(text: str | None, terms: list[str], snippet: bool = False) -> str | None:
+    """HTML-escape `text` and wrap the words matching `terms` in <mark>.
+
+    With `snippet` only a window of about SNIPPET_CHARS around the first
+    match is kept.
+    """
+    if not text or not terms:
+        return html.escape(text) if text else text
+    words = [m for m in _TERM_RE.finditer(text) if _matches(m.group(), terms)]
+
+    start, end = 0, len(text)
+    if snippet and len(text) > SNIPPET_CHARS:
+        first = words[0].start() if words else 0
+        start = max(0, first - SNIPPET_CHARS // 4)
+        end = min(len(text), start + SNIPPET_CHARS)
+        # Don't cut words in half
+        while start > 0 and text[start - 1].isalnum():
+            start -= 1
+        while end < len(text) and text[end].isalnum():
+            end += 1
+
+    parts, pos = [], start
+    for word in words:
+        if word.start() < start or word.end() > end:
+            continue
+        parts.append(html.escape(text[pos : word.start()]))
+        parts.append(f"<mark>{html.escape(word.group())}</mark>")
+        pos = word.end()
+    parts.append(html.escape(text[pos:end]))
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return prefix + "".join(parts) + suffix
+
+
+# SQLite has no unaccent(); register `fold` on every SQLite connection so
+# the FTS triggers index the same folded text PostgreSQL does
+@event.listens_for(Engine, "connect")
+def _register_sqlite_functions(dbapi_connection: Any, connection_record: Any) -> None:
+    if isinstance(dbapi_connection, sqlite3.Connection) or (
+        type(dbapi_connection).__module__.endswith("aiosqlite")
+    ):
+        dbapi_connection.create_function("fold", 1, fold, deterministic=True)
+
+
+# ============ Course search DDL ============
+# f_unaccent: unaccent() is only STABLE, generated columns need IMMUTABLE
+POSTGRES_COURSE_SEARCH_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+    AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+    """,
+    """
+    ALTER TABLE courses ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', f_unaccent(coalesce(title, ''))), 'A')
+        || setweight(
+            to_tsvector('simple', f_unaccent(coalesce(description, ''))), 'B'
+        )
+        || setweight(to_tsvector('simple', f_unaccent(coalesce(category, ''))), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX idx_courses_search_vector ON courses USING GIN (search_vector)",
+)
+
+SQLITE_COURSE_SEARCH_DDL = (
+    """
+    CREATE VIRTUAL TABLE courses_fts USING fts5(
+        title, description, category, tokenize = 'unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER courses_fts_insert AFTER INSERT ON courses BEGIN
+        INSERT INTO courses_fts (rowid, title, description, category)
+        VALUES (new.id, fold(new.title), fold(new.description), fold(new.category));
+    END
+    """,
+    """
+    CREATE TRIGGER courses_fts_update AFTER UPDATE OF title, description, category
+    ON courses BEGIN
+        UPDATE courses_fts SET title = fold(new.title),
+            description = fold(new.description), category = fold(new.category)
+        WHERE rowid = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER courses_fts_delete AFTER DELETE ON courses BEGIN
+        DELETE FROM courses_fts WHERE rowid = old.id;
+    END
+    """,
+)
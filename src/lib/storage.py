@@ -0,0 +1,73 @@
+"""
+Content-addressed file storage for uploaded documents.
+
+Uploads are streamed to a temp file chunk by chunk while being hashed, then
+moved to `<root>/<sha[:2]>/<sha>`. Memory use per upload is one chunk no
+matter the file size, and identical files are stored once. Writes go through
+anyio's thread pool so disk I/O never blocks the event loop.
+"""
+
+import hashlib
+import os
+import uuid
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import anyio
+
+from src.core.config import settings
+from src.exceptions.documents import FileTooLargeError
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    sha256: str
+    size: int
+    path: Path
+
+
+class FileStorage:
+    def __init__(self, root: str | Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def path_for(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256
+
+    async def save(self, chunks: AsyncIterable[bytes]) -> StoredFile:
+        """Stream `chunks` to disk; raises FileTooLargeError past `max_bytes`"""
+        tmp_dir = self.root / "tmp"
+        await anyio.Path(tmp_dir).mkdir(parents=True, exist_ok=True)
+        tmp_path = tmp_dir / uuid.uuid4().hex
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with await anyio.open_file(tmp_path, "wb") as file:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise FileTooLargeError(self.max_bytes)
+                    digest.update(chunk)
+                    await file.write(chunk)
+
+            sha256 = digest.hexdigest()
+            path = self.path_for(sha256)
+            await anyio.Path(path.parent).mkdir(parents=True, exist_ok=True)
+            # Same content already stored: the rename just replaces it
+            await anyio.to_thread.run_sync(os.replace, tmp_path, path)
+        except BaseException:
+            await anyio.Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return StoredFile(sha256, size, path)
+
+    async def size(self, path: Path) -> int:
+        return (await anyio.Path(path).stat()).st_size
+
+    async def delete(self, sha256: str) -> None:
+        await anyio.Path(self.path_for(sha256)).unlink(missing_ok=True)
+
+
+document_storage = FileStorage(
+    settings.DOCUMENT_STORAGE_DIR, max_bytes=settings.DOCUMENT_MAX_BYTES
+)
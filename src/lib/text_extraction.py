@@ -0,0 +1,39 @@
+"""
+Plain-text extraction from uploaded course documents.
+
+PDF goes through pypdf, DOCX is read straight from its `word/document.xml`.
+Legacy .doc and images have no text layer we can read without OCR and yield
+an empty string. Extraction is blocking; callers run it in a worker thread.
+"""
+
+import zipfile
+from pathlib import Path
+from xml.etree import ElementTree
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def extract_text(path: str | Path, file_type: str | None) -> str:
+    if file_type == "pdf":
+        return _extract_pdf(path)
+    if file_type == "docx":
+        return _extract_docx(path)
+    return ""
+
+
+def _extract_pdf(path: str | Path) -> str:
+    # Imported here: pypdf is slow to import and only the ingestion job needs it
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _extract_docx(path: str | Path) -> str:
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = (
+        "".join(node.text or "" for node in paragraph.iter(f"{_W_NS}t"))
+        for paragraph in root.iter(f"{_W_NS}p")
+    )
+    return "\n".join(text for text in paragraphs if text)
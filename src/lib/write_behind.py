@@ -0,0 +1,157 @@
+"""
+Write-behind buffering of inserts.
+
+`WriteBehindBuffer.add` queues a row in process and returns at once; a
+background task writes everything queued every `flush_interval` seconds as
+one multi-row INSERT (executemany) and a single commit, across all groups
+(e.g. conversations). A buffer reaching `max_rows` is flushed by the caller
+that fills it, so memory stays bounded and a database outage surfaces as
+errors instead of an ever-growing queue.
+
+Rows stay readable through `pending()` until their flush has committed, so
+readers merge them with what they load from the database. Rows must carry
+their primary key already (see `MessageRepository.next_id`).
+
+The trade-off is durability: rows still queued when the process dies are
+lost, up to `flush_interval` worth. The lifespan flushes on shutdown.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.inspection import inspect
+
+from src.core.database import AsyncSessionLocal, Base
+
+logger = logging.getLogger(__name__)
+
+ModelType = TypeVar("ModelType", bound=Base)
+
+
+class WriteBehindBuffer(Generic[ModelType]):
+    """Batches inserts of `model` rows, grouped by the `group_by` column."""
+
+    def __init__(
+        self,
+        model: type[ModelType],
+        group_by: str,
+        max_rows: int = 500,
+        flush_interval: float = 0.5,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ):
+        self.model = model
+        self.group_by = group_by
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.session_factory = session_factory
+        self._columns = [column.key for column in inspect(model).columns]
+        self._queued: dict[Any, list[ModelType]] = defaultdict(list)
+        self._flushing: dict[Any, list[ModelType]] = {}
+        self._size = 0
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        # Highest id handed out by `reserve_id`
+        self.last_id = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def reserve_id(self, floor: int) -> int:
+        """Next id above both `floor` and every id reserved so far.
+
+        For databases without sequences; only safe within one process.
+        """
+        self.last_id = max(self.last_id, floor) + 1
+        return self.last_id
+
+    async def add(self, instance: ModelType) -> None:
+        """Queue `instance` for insert; flushes first if the buffer is full"""
+        if self._size >= self.max_rows:
+            await self.flush()
+        self._queued[getattr(instance, self.group_by)].append(instance)
+        self._size += 1
+
+    def pending(self, group: Any) -> list[ModelType]:
+        """Rows of `group` not yet committed, oldest first"""
+        return [*self._flushing.get(group, ()), *self._queued.get(group, ())]
+
+    def discard(self, group: Any) -> None:
+        """Drop the queued rows of `group` (e.g. it was deleted)"""
+        self._size -= len(self._queued.pop(group, ()))
+
+    async def flush(self) -> int:
+        """Write every queued row; returns rows written.
+
+        A batch that breaks a constraint is retried row by row and the
+        offending rows dropped. Any other error puts the rows back in the
+        queue and is raised.
+        """
+        async with self._flush_lock:
+            if not self._size:
+                return 0
+            self._flushing, self._queued = self._queued, defaultdict(list)
+            rows = [self._row(i) for group in self._flushing.values() for i in group]
+            try:
+                try:
+                    await self._insert(rows)
+                    written = len(rows)
+                except IntegrityError:
+                    written = await self._insert_each(rows)
+            except BaseException:
+                for group, instances in self._flushing.items():
+                    self._queued[group][:0] = instances
+                raise
+            finally:
+                self._flushing = {}
+            self._size -= len(rows)
+            return written
+
+    async def start(self) -> None:
+        """Flush every `flush_interval` seconds in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and flush what is left"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception(
+                    "Flushing %s %s rows failed", self._size, self.model.__name__
+                )
+
+    def _row(self, instance: ModelType) -> dict[str, Any]:
+        return {column: getattr(instance, column) for column in self._columns}
+
+    async def _insert(self, rows: Iterable[dict[str, Any]]) -> None:
+        rows = sorted(rows, key=lambda row: row["id"])
+        async with self.session_factory() as db:
+            await db.execute(insert(self.model), rows)
+            await db.commit()
+
+    async def _insert_each(self, rows: list[dict[str, Any]]) -> int:
+        written = 0
+        for row in rows:
+            try:
+                await self._insert([row])
+                written += 1
+            except IntegrityError:
+                logger.warning(
+                    "Dropped buffered %s %s", self.model.__name__, row.get("id")
+                )
+        return written
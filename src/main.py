@@ -1,13 +1,86 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from redis.exceptions import RedisError
 
-from src.controllers import health_controller
+from src.controllers import health_controller, metrics_controller
+from src.controllers.auth import auth_controller
+from src.controllers.chat import chat_controller
+from src.controllers.courses import course_controller
+from src.controllers.documents import document_controller
+from src.controllers.lessons import lesson_controller
+from src.controllers.progress import progress_controller
+from src.controllers.quizzes import quiz_controller
 from src.core.config import settings
+from src.core.database import dispose_engines, warm_up_engines
+from src.lib.ai.router import shutdown_ai_router, startup_ai_router
+from src.lib.cache import redis_client
+from src.lib.jobs import Worker, job_queue
+from src.lib.metrics import MetricsMiddleware, instrument_sqlalchemy
+from src.lib.password import password_hasher
+from src.lib.query_guard import QueryGuardMiddleware, install_query_guard
+from src.repositories.chat.message_repository import message_buffer
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up() -> None:
+    """Open database and Redis connections before taking traffic.
+
+    Failures are logged, not fatal: the pools connect lazily anyway.
+    """
+    try:
+        await warm_up_engines()
+    except Exception:
+        logger.exception("Database warm-up failed")
+    try:
+        await redis_client.ping()
+    except RedisError as exc:
+        logger.warning("Redis unavailable at startup: %s", exc)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await warm_up()
+    # Shared, pooled clients live for the whole worker process
+    ai_router = await startup_ai_router()
+    # Provider SDKs are imported in the background once we are serving
+    preload = asyncio.create_task(ai_router.preload())
+    if settings.CHAT_MESSAGE_DURABILITY == "buffered":
+        await message_buffer.start()
+    worker = None
+    if settings.JOB_QUEUE_BACKEND == "memory":
+        # No separate worker process: run queued jobs in this one
+        worker = Worker(job_queue, settings.JOB_QUEUE_CONCURRENCY)
+        worker_task = asyncio.create_task(worker.run())
+    yield
+    await preload
+    # Before the engines are disposed: buffered messages need the database
+    try:
+        await message_buffer.stop()
+    except Exception:
+        logger.exception("Could not flush %s buffered messages", len(message_buffer))
+    if worker is not None:
+        worker.stop()
+        await worker_task
+    await shutdown_ai_router()
+    await redis_client.aclose()  # type: ignore[attr-defined]  # stubs predate it
+    await dispose_engines()
+    password_hasher.shutdown()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
+    # orjson for every route; list routes encode through JSONAdapter
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -19,8 +92,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.DB_QUERY_GUARD:
+    install_query_guard()
+    app.add_middleware(QueryGuardMiddleware)
+
+if settings.METRICS_ENABLED:
+    # Added last so it wraps CORS too and times the whole request
+    instrument_sqlalchemy()
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers (Controllers)
 app.include_router(health_controller.router, tags=["Health"])
+app.include_router(metrics_controller.router, tags=["Health"])
+app.include_router(auth_controller.router)
+app.include_router(chat_controller.router)
+app.include_router(course_controller.router)
+app.include_router(document_controller.router)
+app.include_router(lesson_controller.router)
+app.include_router(progress_controller.router)
+app.include_router(quiz_controller.router)
 
 
 @app.get("/")
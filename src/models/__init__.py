@@ -1,3 +1,25 @@
 from src.core.database import Base
+from src.models.chat import Conversation, Message
+from src.models.course import Course
+from src.models.document import Document, DocumentChunk
+from src.models.lesson import Lesson
+from src.models.progress import Enrollment, UserProgress
+from src.models.quiz import Answer, Question, Quiz, QuizAttempt
+from src.models.user import User
 
-__all__ = ["Base"]
+__all__ = [
+    "Answer",
+    "Base",
+    "Conversation",
+    "Course",
+    "Document",
+    "DocumentChunk",
+    "Enrollment",
+    "Lesson",
+    "Message",
+    "Question",
+    "Quiz",
+    "QuizAttempt",
+    "User",
+    "UserProgress",
+]
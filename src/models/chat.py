@@ -0,0 +1,116 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    Connection,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    event,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from src.core.config import settings
+from src.core.database import Base
+from src.lib.partitions import partition_messages
+
+if TYPE_CHECKING:
+    from src.models.course import Course
+    from src.models.user import User
+
+
+class Conversation(Base):
+    __tablename__ = "conversations"
+    __table_args__ = (Index("idx_conversations_user_id", "user_id", "id"),)
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False
+    )
+    course_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("courses.id"), nullable=False, index=True
+    )
+
+    # Columns
+    title: Mapped[str | None] = mapped_column(String(255))
+    # Rolling summary of every message up to summary_until_id (inclusive)
+    summary: Mapped[str | None] = mapped_column(Text)
+    summary_until_id: Mapped[int | None] = mapped_column(Integer)
+
+    # Timestamps
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
+    # Messages moved to the archive (src/lib/message_archive.py)
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+    # Relationships
+    user: Mapped["User"] = relationship("User", back_populates="conversations")
+    course: Mapped["Course"] = relationship("Course", back_populates="conversations")
+    messages: Mapped[list["Message"]] = relationship(
+        "Message",
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        # messages.conversation_id is ON DELETE CASCADE: deleting a conversation
+        # (or a course's conversations) does not load its messages first
+        passive_deletes=True,
+        order_by="Message.id",
+    )
+
+    def __repr__(self) -> str:
+        return f"<Conversation {self.id}>"
+
+
+class Message(Base):
+    __tablename__ = "messages"
+    # Partitioned by month on PostgreSQL (src/lib/partitions.py), where the
+    # primary key is (id, created_at)
+    __table_args__ = (
+        Index("idx_messages_conversation_id", "conversation_id", "id"),
+        Index("idx_messages_conversation_created", "conversation_id", "created_at"),
+    )
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Foreign Keys
+    conversation_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # Columns
+    role: Mapped[str] = mapped_column(String(20), nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    # Estimated tokens of `content`, counted once on insert
+    tokens_used: Mapped[int | None] = mapped_column(Integer)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    # Relationships
+    conversation: Mapped["Conversation"] = relationship(
+        "Conversation", back_populates="messages"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Message {self.role}:{self.id}>"
+
+
+@event.listens_for(Message.__table__, "after_create")
+def _partition_messages(target: Table, connection: Connection, **kw: Any) -> None:
+    partition_messages(connection, settings.MESSAGE_PARTITIONS_AHEAD_MONTHS)
@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from src.core.database import Base
+from src.lib.search import POSTGRES_COURSE_SEARCH_DDL, SQLITE_COURSE_SEARCH_DDL
+
+if TYPE_CHECKING:
+    from src.models.chat import Conversation
+    from src.models.document import Document
+    from src.models.lesson import Lesson
+    from src.models.user import User
+
+
+class Course(Base):
+    __tablename__ = "courses"
+    # Keyset pagination: filter column + id, so `WHERE category = ? AND id > ?`
+    # is a single index range scan
+    __table_args__ = (
+        Index("idx_courses_category_id", "category", "id"),
+        Index("idx_courses_level_id", "level", "id"),
+    )
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    creator_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=False, index=True
+    )
+
+    # Columns
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    thumbnail: Mapped[str | None] = mapped_column(String(500))
+    category: Mapped[str | None] = mapped_column(String(100))
+    level: Mapped[str | None] = mapped_column(String(50), default="beginner")
+    duration_hours: Mapped[int | None] = mapped_column(Integer, default=0)
+    is_published: Mapped[bool | None] = mapped_column(
+        Boolean, default=False, index=True
+    )
+    # Denormalized lesson count, kept in step by LessonRepository / lesson import
+    lesson_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
+
+    # Relationships
+    creator: Mapped["User"] = relationship("User", back_populates="courses")
+    lessons: Mapped[list["Lesson"]] = relationship(
+        "Lesson",
+        back_populates="course",
+        cascade="all, delete-orphan",
+        order_by="Lesson.order",
+    )
+    conversations: Mapped[list["Conversation"]] = relationship(
+        "Conversation", back_populates="course", cascade="all, delete-orphan"
+    )
+    documents: Mapped[list["Document"]] = relationship(
+        "Document", back_populates="course", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Course {self.title}>"
+
+
+# Full-text search index (see src/lib/search.py). Not mapped: only the
+# search repository reads it, and only through raw column / table names
+for _statement in POSTGRES_COURSE_SEARCH_DDL:
+    event.listen(
+        Course.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+for _statement in SQLITE_COURSE_SEARCH_DDL:
+    event.listen(
+        Course.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Course.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS courses_fts").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,86 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from src.core.database import Base
+
+if TYPE_CHECKING:
+    from src.models.course import Course
+
+
+class Document(Base):
+    __tablename__ = "documents"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    course_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Columns
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Relative to DOCUMENT_STORAGE_DIR; files are content-addressed, so
+    # documents with the same bytes share one file
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_type: Mapped[str | None] = mapped_column(String(50))
+    file_size: Mapped[int | None] = mapped_column(Integer)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+
+    # Timestamps
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    # Relationships
+    course: Mapped["Course"] = relationship("Course", back_populates="documents")
+
+    def __repr__(self) -> str:
+        return f"<Document {self.name}>"
+
+
+class DocumentChunk(Base):
+    """Overlapping text window of a lesson or document, for tutor retrieval.
+
+    `terms` holds the chunk's term frequencies so the in-process BM25 index
+    is (re)built from these rows without re-tokenizing; see
+    src/services/documents/retrieval_service.py.
+    """
+
+    __tablename__ = "document_chunks"
+    # Index-only scan for the per-course (count, max id) index signature
+    __table_args__ = (Index("idx_document_chunks_course_id", "course_id", "id"),)
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Foreign Keys
+    course_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
+    )
+    # Exactly one of lesson_id / document_id is set
+    lesson_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("lessons.id", ondelete="CASCADE"), index=True
+    )
+    document_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("documents.id", ondelete="CASCADE"), index=True
+    )
+
+    # Columns
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    terms: Mapped[Any] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False
+    )
+    length: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<DocumentChunk {self.course_id}:{self.id}>"
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from src.core.database import Base
+
+if TYPE_CHECKING:
+    from src.models.course import Course
+    from src.models.quiz import Quiz
+
+
+class Lesson(Base):
+    __tablename__ = "lessons"
+    __table_args__ = (Index("idx_lessons_order", "course_id", "order"),)
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    course_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("courses.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Columns
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    content: Mapped[str | None] = mapped_column(Text)
+    video_url: Mapped[str | None] = mapped_column(String(500))
+    order: Mapped[int] = mapped_column(Integer, nullable=False)
+    duration_minutes: Mapped[int | None] = mapped_column(Integer, default=0)
+
+    # Timestamps
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
+
+    # Relationships
+    course: Mapped["Course"] = relationship("Course", back_populates="lessons")
+    quizzes: Mapped[list["Quiz"]] = relationship(
+        "Quiz", back_populates="lesson", cascade="all, delete-orphan"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Lesson {self.title}>"
@@ -0,0 +1,167 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from src.core.database import Base
+
+if TYPE_CHECKING:
+    from src.models.lesson import Lesson
+
+
+class Quiz(Base):
+    __tablename__ = "quizzes"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    lesson_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("lessons.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Columns
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    time_limit: Mapped[int | None] = mapped_column(Integer, default=30)
+    passing_score: Mapped[int | None] = mapped_column(Integer, default=60)
+    max_attempts: Mapped[int | None] = mapped_column(Integer, default=3)
+    # Bumped on every question/answer write; keys the compiled answer key cache
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+
+    # Timestamps
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    # Relationships
+    lesson: Mapped["Lesson"] = relationship("Lesson", back_populates="quizzes")
+    questions: Mapped[list["Question"]] = relationship(
+        "Question",
+        back_populates="quiz",
+        cascade="all, delete-orphan",
+        order_by="Question.order",
+    )
+
+    def __repr__(self) -> str:
+        return f"<Quiz {self.title}>"
+
+
+class Question(Base):
+    __tablename__ = "questions"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    quiz_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("quizzes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Columns
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    type: Mapped[str | None] = mapped_column(String(50), default="single_choice")
+    points: Mapped[int | None] = mapped_column(Integer, default=1)
+    order: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    # Relationships
+    quiz: Mapped["Quiz"] = relationship("Quiz", back_populates="questions")
+    answers: Mapped[list["Answer"]] = relationship(
+        "Answer",
+        back_populates="question",
+        cascade="all, delete-orphan",
+        order_by="Answer.order",
+    )
+
+    def __repr__(self) -> str:
+        return f"<Question {self.id}>"
+
+
+class Answer(Base):
+    __tablename__ = "answers"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    question_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Columns
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    is_correct: Mapped[bool | None] = mapped_column(Boolean, default=False)
+    order: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Relationships
+    question: Mapped["Question"] = relationship("Question", back_populates="answers")
+
+    def __repr__(self) -> str:
+        return f"<Answer {self.id}>"
+
+
+class QuizAttempt(Base):
+    __tablename__ = "quiz_attempts"
+    __table_args__ = (Index("idx_quiz_attempts_user_quiz", "user_id", "quiz_id"),)
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    quiz_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("quizzes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Columns
+    score: Mapped[int] = mapped_column(Integer, nullable=False)
+    earned_points: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_points: Mapped[int] = mapped_column(Integer, nullable=False)
+    passed: Mapped[bool | None] = mapped_column(Boolean, default=False)
+    answers: Mapped[Any | None] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql")
+    )
+
+    # Timestamps
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return f"<QuizAttempt {self.id}>"
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from src.core.database import Base
+
+if TYPE_CHECKING:
+    from src.models.chat import Conversation
+    from src.models.course import Course
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+
+    # Columns
+    email: Mapped[str] = mapped_column(
+        String(255), unique=True, nullable=False, index=True
+    )
+    password: Mapped[str] = mapped_column(String(255), nullable=False)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    avatar: Mapped[str | None] = mapped_column(String(500))
+    is_active: Mapped[bool | None] = mapped_column(Boolean, default=True)
+
+    # Timestamps
+    created_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), onupdate=func.now()
+    )
+
+    # Relationships
+    courses: Mapped[list["Course"]] = relationship("Course", back_populates="creator")
+    conversations: Mapped[list["Conversation"]] = relationship(
+        "Conversation", back_populates="user"
+    )
+
+    def __repr__(self) -> str:
+        return f"<User {self.email}>"
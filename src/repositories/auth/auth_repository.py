@@ -0,0 +1,19 @@
+from sqlalchemy import select
+
+from src.lib.cache import current_user_cache
+from src.models.user import User
+from src.repositories.base_repository import BaseRepository
+
+
+class AuthRepository(BaseRepository[User]):
+    model = User
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Find a user by email"""
+        query = select(User).where(User.email == email)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def _after_write(self, instance: User) -> None:
+        # Deactivation, profile edits and deletes reach get_current_user at once
+        current_user_cache.delete(instance.id)
@@ -0,0 +1,100 @@
+from typing import Any, ClassVar, Generic, Literal, TypeVar
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.core.database import Base
+
+ModelType = TypeVar("ModelType", bound=Base)
+WriteAction = Literal["create", "update", "delete"]
+
+
+class BaseRepository(Generic[ModelType]):
+    """Generic CRUD data access shared by the model repositories."""
+
+    model: type[ModelType]
+    # Named eager-loading trees, so a caller loads exactly the relationships
+    # it reads: lazy loads would cost a query per row (and raise under
+    # asyncio outside the session's greenlet)
+    load_profiles: ClassVar[dict[str, tuple[ExecutableOption, ...]]] = {}
+    # Profile loaded by `delete`: ORM cascades walk these relationships
+    delete_profile: ClassVar[str | None] = None
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _with_profile(self, query: Select, profile: str | None) -> Select:
+        if profile is None:
+            return query
+        try:
+            options = self.load_profiles[profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown loading profile {profile!r} for {self.model.__name__}"
+            ) from None
+        return query.options(*options)
+
+    async def get_by_id(self, id: int, profile: str | None = None) -> ModelType | None:
+        """Find a row by primary key, eager-loading `profile`"""
+        query = select(self.model).where(self.model.id == id)
+        result = await self.db.execute(self._with_profile(query, profile))
+        return result.scalar_one_or_none()
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, profile: str | None = None
+    ) -> list[ModelType]:
+        """List rows ordered by primary key, eager-loading `profile`"""
+        query = select(self.model).order_by(self.model.id).offset(skip).limit(limit)
+        result = await self.db.execute(self._with_profile(query, profile))
+        return list(result.scalars().all())
+
+    async def count(self) -> int:
+        """Count all rows"""
+        count = await self.db.scalar(select(func.count()).select_from(self.model))
+        return count or 0
+
+    async def create(self, data: dict[str, Any]) -> ModelType:
+        """Insert a new row"""
+        instance: ModelType = self.model(**data)
+        self.db.add(instance)
+        await self._before_commit(instance, "create")
+        await self.db.commit()
+        await self.db.refresh(instance)
+        await self._after_write(instance)
+        return instance
+
+    async def update(self, id: int, data: dict[str, Any]) -> ModelType | None:
+        """Update the given columns of a row"""
+        instance = await self.get_by_id(id)
+        if instance is None:
+            return None
+        for key, value in data.items():
+            if value is not None:
+                setattr(instance, key, value)
+        await self._before_commit(instance, "update")
+        await self.db.commit()
+        await self.db.refresh(instance)
+        await self._after_write(instance)
+        return instance
+
+    async def delete(self, id: int) -> bool:
+        """Delete a row, returning whether it existed"""
+        instance = await self.get_by_id(id, self.delete_profile)
+        if instance is None:
+            return False
+        await self._before_commit(instance, "delete")
+        await self.db.delete(instance)
+        await self.db.commit()
+        await self._after_write(instance)
+        return True
+
+    async def _before_commit(self, instance: ModelType, action: WriteAction) -> None:
+        """Hook run inside a create/update/delete transaction (denormalized counters).
+
+        For deletes it runs before the row is deleted, so related rows that
+        the database would cascade away are still visible.
+        """
+
+    async def _after_write(self, instance: ModelType) -> None:
+        """Hook run after a committed create/update/delete (cache invalidation)"""
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+from sqlalchemy import Select, exists, func, select, update
+
+from src.models.chat import Conversation, Message
+from src.repositories.base_repository import BaseRepository
+
+
+class ConversationRepository(BaseRepository[Conversation]):
+    model = Conversation
+
+    async def get_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        before_id: int | None = None,
+    ) -> list[Conversation]:
+        """List a user's conversations, newest first.
+
+        `before_id` resumes after the last conversation of the previous page.
+        """
+        query = (
+            select(Conversation)
+            .where(Conversation.user_id == user_id)
+            .order_by(Conversation.id.desc())
+            .limit(limit)
+        )
+        if before_id is not None:
+            query = query.where(Conversation.id < before_id)
+        else:
+            query = query.offset(skip)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_cold(self, before: datetime, limit: int) -> list[int]:
+        """Ids of unarchived conversations with no message since `before`"""
+        query = self._cold(before).order_by(Conversation.id).limit(limit)
+        return list((await self.db.scalars(query)).all())
+
+    async def is_cold(self, conversation_id: int, before: datetime) -> bool:
+        query = self._cold(before).where(Conversation.id == conversation_id)
+        return await self.db.scalar(query) is not None
+
+    def _cold(self, before: datetime) -> Select[tuple[int]]:
+        # The NOT EXISTS only reads messages newer than `before`, i.e. the
+        # recent partitions
+        recent = exists().where(
+            Message.conversation_id == Conversation.id, Message.created_at >= before
+        )
+        return select(Conversation.id).where(
+            Conversation.archived_at.is_(None),
+            Conversation.created_at < before,
+            ~recent,
+        )
+
+    async def lock(self, conversation_id: int) -> Conversation | None:
+        """Load a conversation with its row locked until the transaction ends.
+
+        Also blocks inserts of new messages into it (their foreign key check
+        locks the row too) on PostgreSQL.
+        """
+        query = (
+            select(Conversation)
+            .where(Conversation.id == conversation_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return (await self.db.execute(query)).scalar_one_or_none()
+
+    async def set_archived(self, conversation_id: int, archived: bool) -> bool:
+        """Flip the archived flag in the caller's transaction.
+
+        Only matches a conversation in the opposite state, so of two
+        concurrent rehydrations exactly one gets True.
+        """
+        column = Conversation.archived_at
+        result = await self.db.execute(
+            update(Conversation)
+            .where(
+                Conversation.id == conversation_id,
+                column.is_(None) if archived else column.is_not(None),
+            )
+            .values(archived_at=func.now() if archived else None)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Select, delete, func, insert, select, text
+
+from src.core.config import settings
+from src.lib.write_behind import WriteBehindBuffer
+from src.models.chat import Conversation, Message
+from src.repositories.base_repository import BaseRepository
+
+# Slack under a conversation's start for the created_at lower bound (clock
+# skew, SQLite's second-resolution timestamps)
+HISTORY_SLACK = timedelta(days=1)
+
+
+def history_start(conversation: Conversation) -> datetime | None:
+    """Lower bound on `created_at` for the messages of `conversation`.
+
+    No message predates its conversation, so the bound never drops a row,
+    but it lets PostgreSQL skip every monthly partition before it: reading
+    a recent chat costs the same however much older history the table holds.
+    """
+    if conversation.created_at is None:
+        return None
+    return conversation.created_at - HISTORY_SLACK
+
+
+# Messages saved in "buffered" durability mode wait here for their flush;
+# the read methods below merge them in
+message_buffer = WriteBehindBuffer(
+    Message,
+    "conversation_id",
+    max_rows=settings.CHAT_WRITE_BUFFER_MAX_ROWS,
+    flush_interval=settings.CHAT_WRITE_BUFFER_FLUSH_SECONDS,
+)
+
+
+def _merge(rows: list[Message], pending: list[Message]) -> list[Message]:
+    if not pending:
+        return rows
+    by_id = {message.id: message for message in pending}
+    # A row flushed since the query ran is in both: keep the loaded one
+    by_id.update((message.id, message) for message in rows)
+    return sorted(by_id.values(), key=lambda message: message.id)
+
+
+class MessageRepository(BaseRepository[Message]):
+    model = Message
+
+    async def next_id(self) -> int:
+        """Reserve the id of a message inserted later (write-behind)"""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return int(await self.db.scalar(text("SELECT nextval('messages_id_seq')")))
+        stored = await self.db.scalar(select(func.max(Message.id)))
+        return message_buffer.reserve_id(stored or 0)
+
+    async def get_by_conversation(
+        self,
+        conversation_id: int,
+        skip: int = 0,
+        limit: int | None = 100,
+        after_id: int | None = None,
+        since: datetime | None = None,
+    ) -> list[Message]:
+        """List messages of a conversation in chronological order.
+
+        `after_id` resumes after the last message of the previous page;
+        `since` (see `history_start`) bounds the partitions scanned.
+        """
+        query = self._of_conversation(conversation_id, since).order_by(Message.id)
+        if after_id is not None:
+            query = query.where(Message.id > after_id)
+        else:
+            query = query.offset(skip)
+        result = await self.db.execute(query.limit(limit))
+        messages = _merge(
+            list(result.scalars().all()), self._pending(conversation_id, after_id)
+        )
+        return messages if limit is None else messages[:limit]
+
+    async def get_recent(
+        self,
+        conversation_id: int,
+        limit: int = 10,
+        after_id: int | None = None,
+        since: datetime | None = None,
+    ) -> list[Message]:
+        """Last `limit` messages after `after_id`, in chronological order"""
+        query = (
+            self._of_conversation(conversation_id, since)
+            .order_by(Message.id.desc())
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(Message.id > after_id)
+        result = await self.db.execute(query)
+        messages = _merge(
+            list(reversed(result.scalars().all())),
+            self._pending(conversation_id, after_id),
+        )
+        return messages[-limit:]
+
+    async def delete_by_conversation(self, conversation_id: int) -> int:
+        """Delete every message of a conversation in the caller's transaction"""
+        result = await self.db.execute(
+            delete(Message)
+            .where(Message.conversation_id == conversation_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def insert_many(
+        self, conversation_id: int, rows: list[dict[str, Any]]
+    ) -> None:
+        """Insert messages with their original ids, in the caller's transaction"""
+        if rows:
+            await self.db.execute(
+                insert(Message),
+                [{**row, "conversation_id": conversation_id} for row in rows],
+            )
+
+    def _pending(self, conversation_id: int, after_id: int | None) -> list[Message]:
+        return [
+            message
+            for message in message_buffer.pending(conversation_id)
+            if after_id is None or message.id > after_id
+        ]
+
+    def _of_conversation(
+        self, conversation_id: int, since: datetime | None
+    ) -> Select[tuple[Message]]:
+        query = select(Message).where(Message.conversation_id == conversation_id)
+        if since is not None:
+            query = query.where(Message.created_at >= since)
+        return query
@@ -0,0 +1,167 @@
+from typing import Any
+
+from sqlalchemy import (
+    ColumnClause,
+    ColumnElement,
+    Select,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+)
+from sqlalchemy.orm import selectinload
+
+from src.lib.ai.semantic_cache import semantic_cache
+from src.lib.cache import course_context_cache
+from src.lib.http_cache import catalog_cache
+from src.lib.pagination import count_rows
+from src.lib.search import to_fts5_query, to_tsquery
+from src.models.course import Course
+from src.models.lesson import Lesson
+from src.models.quiz import Question, Quiz
+from src.repositories.base_repository import BaseRepository
+
+# Lessons -> quizzes -> questions -> answers, one SELECT per level
+_CONTENT = (
+    selectinload(Course.lessons)
+    .selectinload(Lesson.quizzes)
+    .selectinload(Quiz.questions)
+    .selectinload(Question.answers),
+    selectinload(Course.documents),
+)
+
+# Full-text index objects created by raw DDL (src/lib/search.py)
+_SEARCH_VECTOR: ColumnClause[Any] = literal_column("courses.search_vector")
+_FTS = table("courses_fts", column("rowid"))
+_FTS_TABLE: ColumnClause[Any] = literal_column("courses_fts")
+# Title matches outweigh description matches outweigh category matches
+_FTS_WEIGHTS = (10.0, 4.0, 2.0)
+
+
+class CourseRepository(BaseRepository[Course]):
+    model = Course
+    load_profiles = {
+        "lessons": (selectinload(Course.lessons),),
+        "content": _CONTENT,
+        # Everything a delete cascades to (conversations take their messages
+        # with them in the database)
+        "delete": (*_CONTENT, selectinload(Course.conversations)),
+    }
+    delete_profile = "delete"
+
+    async def get_by_creator(self, creator_id: int) -> list[Course]:
+        """List courses created by a user"""
+        query = (
+            select(Course).where(Course.creator_id == creator_id).order_by(Course.id)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    def _filtered(
+        self, category: str | None, level: str | None, query: Select | None = None
+    ) -> Select:
+        query = select(Course) if query is None else query
+        if category:
+            query = query.where(Course.category == category)
+        if level:
+            query = query.where(Course.level == level)
+        return query
+
+    async def filter(
+        self,
+        category: str | None = None,
+        level: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: int | None = None,
+    ) -> list[Course]:
+        """List courses matching the given category/level.
+
+        With `after_id` the listing resumes after that course (keyset
+        pagination) and `skip` is ignored.
+        """
+        query = self._filtered(category, level).order_by(Course.id).limit(limit)
+        if after_id is not None:
+            query = query.where(Course.id > after_id)
+        else:
+            query = query.offset(skip)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def count_filtered(
+        self,
+        category: str | None = None,
+        level: str | None = None,
+        estimate: bool = False,
+    ) -> int:
+        """Count courses matching the filters (planner estimate if `estimate`)"""
+        return await count_rows(self.db, self._filtered(category, level), estimate)
+
+    # ============ Full-text search ============
+    def _search(
+        self, terms: list[str], *columns: Any
+    ) -> tuple[Select, ColumnElement[float]]:
+        """SELECT `columns` of the courses matching every term, and their rank.
+
+        PostgreSQL matches the GIN-indexed `search_vector`, SQLite the FTS5
+        `courses_fts` table; higher ranks are better on both.
+        """
+        query = select(*columns).select_from(Course)
+        if self.db.get_bind().dialect.name == "postgresql":
+            tsquery = func.to_tsquery(
+                literal_column("'simple'::regconfig"), to_tsquery(terms)
+            )
+            query = query.where(_SEARCH_VECTOR.op("@@")(tsquery))
+            return query, func.ts_rank(_SEARCH_VECTOR, tsquery)
+        query = query.join(_FTS, _FTS.c.rowid == Course.id).where(
+            _FTS_TABLE.op("MATCH")(to_fts5_query(terms))
+        )
+        # bm25() is lower-is-better
+        return query, -func.bm25(_FTS_TABLE, *_FTS_WEIGHTS)
+
+    async def search(
+        self,
+        terms: list[str],
+        category: str | None = None,
+        level: str | None = None,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> list[tuple[Course, float]]:
+        """Courses matching every term, best first, with their rank"""
+        query, rank = self._search(terms, Course)
+        query = self._filtered(category, level, query)
+        query = (
+            query.add_columns(rank.label("rank"))
+            .order_by(rank.desc(), Course.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result.tuples())
+
+    async def count_search(
+        self, terms: list[str], category: str | None = None, level: str | None = None
+    ) -> int:
+        query, _ = self._search(terms, Course.id)
+        query = self._filtered(category, level, query)
+        return await count_rows(self.db, query)
+
+    async def search_facets(self, terms: list[str]) -> dict[str, dict[str, int]]:
+        """Match counts per category and per level (filters not applied)"""
+        facets: dict[str, dict[str, int]] = {}
+        for name, attr in (("category", Course.category), ("level", Course.level)):
+            query, _ = self._search(terms, attr, func.count())
+            result = await self.db.execute(
+                query.where(attr.is_not(None)).group_by(attr).order_by(attr)
+            )
+            facets[name] = dict(result.tuples().all())
+        return facets
+
+    async def _after_write(self, instance: Course) -> None:
+        await course_context_cache.invalidate(instance.id)
+        semantic_cache.invalidate_course(instance.id)
+        # Lesson lists too: a deleted course's lessons go with it
+        await catalog_cache.invalidate(
+            "courses", f"course:{instance.id}", f"lessons:{instance.id}"
+        )
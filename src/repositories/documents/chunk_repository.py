@@ -0,0 +1,110 @@
+from collections.abc import Collection
+
+from sqlalchemy import Row, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.retrieval import term_counts
+from src.models.document import DocumentChunk
+from src.models.lesson import Lesson
+from src.repositories.base_repository import BaseRepository
+
+# Rows fetched per IN (...) query when loading chunks into an index
+FETCH_BATCH_SIZE = 500
+
+
+class ChunkRepository(BaseRepository[DocumentChunk]):
+    model = DocumentChunk
+
+    async def signature(self, course_id: int) -> tuple[int, int]:
+        """(chunk count, max chunk id) of a course.
+
+        Inserts raise the max id and deletes lower the count, so the pair
+        changes on every write and tells a cached index it is stale.
+        """
+        query = select(
+            func.count(), func.coalesce(func.max(DocumentChunk.id), 0)
+        ).where(DocumentChunk.course_id == course_id)
+        count, max_id = (await self.db.execute(query)).one()
+        return count, max_id
+
+    async def get_ids(self, course_id: int) -> set[int]:
+        query = select(DocumentChunk.id).where(DocumentChunk.course_id == course_id)
+        return set((await self.db.scalars(query)).all())
+
+    async def get_rows(self, ids: Collection[int]) -> list[Row]:
+        """Columns an index needs for the given chunks; no ORM objects are built"""
+        ids = sorted(ids)
+        rows: list[Row] = []
+        for start in range(0, len(ids), FETCH_BATCH_SIZE):
+            query = select(
+                DocumentChunk.id,
+                DocumentChunk.content,
+                DocumentChunk.terms,
+                DocumentChunk.length,
+                DocumentChunk.lesson_id,
+                DocumentChunk.document_id,
+            ).where(DocumentChunk.id.in_(ids[start : start + FETCH_BATCH_SIZE]))
+            rows.extend((await self.db.execute(query)).all())
+        return rows
+
+    async def get_lessons_to_index(
+        self, course_id: int, include_indexed: bool = False
+    ) -> list[Lesson]:
+        """Lessons of a course with content (by default only those without chunks)"""
+        query = select(Lesson).where(
+            Lesson.course_id == course_id, Lesson.content.is_not(None)
+        )
+        if not include_indexed:
+            chunked = select(DocumentChunk.lesson_id).where(
+                DocumentChunk.course_id == course_id,
+                DocumentChunk.lesson_id.is_not(None),
+            )
+            query = query.where(Lesson.id.not_in(chunked))
+        query = query.order_by(Lesson.order, Lesson.id)
+        return list((await self.db.scalars(query)).all())
+
+    async def replace_source(
+        self,
+        course_id: int,
+        chunks: list[str],
+        *,
+        lesson_id: int | None = None,
+        document_id: int | None = None,
+    ) -> int:
+        """Swap the chunks of one lesson or document in a single transaction"""
+        await drop_source_chunks(self.db, lesson_id=lesson_id, document_id=document_id)
+        rows = []
+        for position, content in enumerate(chunks):
+            terms, length = term_counts(content)
+            rows.append(
+                {
+                    "course_id": course_id,
+                    "lesson_id": lesson_id,
+                    "document_id": document_id,
+                    "position": position,
+                    "content": content,
+                    "terms": terms,
+                    "length": length,
+                }
+            )
+        if rows:
+            await self.db.execute(insert(DocumentChunk), rows)
+        await self.db.commit()
+        return len(rows)
+
+
+async def drop_source_chunks(
+    db: AsyncSession, *, lesson_id: int | None = None, document_id: int | None = None
+) -> None:
+    """Delete the chunks of a lesson or document (no commit).
+
+    Called before the source row itself is deleted, so the index signature
+    changes even where the database doesn't enforce the FK cascade.
+    """
+    if (lesson_id is None) == (document_id is None):
+        raise ValueError("Pass exactly one of lesson_id / document_id")
+    if lesson_id is not None:
+        condition = DocumentChunk.lesson_id == lesson_id
+    else:
+        condition = DocumentChunk.document_id == document_id
+    await db.execute(delete(DocumentChunk).where(condition))
@@ -0,0 +1,28 @@
+from sqlalchemy import func, select
+
+from src.models.document import Document
+from src.repositories.base_repository import BaseRepository, WriteAction
+from src.repositories.documents.chunk_repository import drop_source_chunks
+
+
+class DocumentRepository(BaseRepository[Document]):
+    model = Document
+
+    async def get_by_course(self, course_id: int) -> list[Document]:
+        """List documents of a course, newest first"""
+        query = (
+            select(Document)
+            .where(Document.course_id == course_id)
+            .order_by(Document.id.desc())
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def count_by_sha(self, sha256: str) -> int:
+        """Number of documents stored in the file with this hash"""
+        query = select(func.count()).where(Document.sha256 == sha256)
+        return await self.db.scalar(query) or 0
+
+    async def _before_commit(self, instance: Document, action: WriteAction) -> None:
+        if action == "delete":
+            await drop_source_chunks(self.db, document_id=instance.id)
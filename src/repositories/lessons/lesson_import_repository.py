@@ -0,0 +1,98 @@
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.ai.semantic_cache import semantic_cache
+from src.lib.cache import course_context_cache
+from src.lib.http_cache import catalog_cache
+from src.models.lesson import Lesson
+from src.models.quiz import Answer, Question, Quiz
+from src.repositories.progress.progress_repository import shift_lesson_count
+from src.schemas.lesson import LessonImport
+
+
+class LessonImportRepository:
+    """Writes whole lesson → quiz → question → answer trees.
+
+    Each level is one batched `INSERT ... RETURNING id` (executemany with
+    SQLAlchemy's insertmanyvalues), so a batch costs four statements instead
+    of one round-trip per row. Nothing is committed until `commit()`, which
+    lets the caller spread a large import over many batches in one
+    transaction.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def insert_batch(
+        self, course_id: int, lessons: list[LessonImport]
+    ) -> dict[str, int]:
+        lesson_ids = await self._insert_returning_ids(
+            Lesson,
+            [
+                {**lesson.model_dump(exclude={"quiz"}), "course_id": course_id}
+                for lesson in lessons
+            ],
+        )
+
+        await shift_lesson_count(self.db, course_id, len(lesson_ids))
+
+        quizzes = [
+            (lesson_id, lesson.quiz)
+            for lesson_id, lesson in zip(lesson_ids, lessons, strict=True)
+            if lesson.quiz is not None
+        ]
+        quiz_ids = await self._insert_returning_ids(
+            Quiz,
+            [
+                {**quiz.model_dump(exclude={"questions"}), "lesson_id": lesson_id}
+                for lesson_id, quiz in quizzes
+            ],
+        )
+
+        questions = [
+            (quiz_id, question)
+            for quiz_id, (_, quiz) in zip(quiz_ids, quizzes, strict=True)
+            for question in quiz.questions
+        ]
+        question_ids = await self._insert_returning_ids(
+            Question,
+            [
+                {**question.model_dump(exclude={"answers"}), "quiz_id": quiz_id}
+                for quiz_id, question in questions
+            ],
+        )
+
+        answers = [
+            {**answer.model_dump(), "question_id": question_id}
+            for question_id, (_, question) in zip(question_ids, questions, strict=True)
+            for answer in question.answers
+        ]
+        if answers:
+            await self.db.execute(insert(Answer), answers)
+
+        return {
+            "lessons": len(lesson_ids),
+            "quizzes": len(quiz_ids),
+            "questions": len(question_ids),
+            "answers": len(answers),
+        }
+
+    async def commit(self, course_id: int) -> None:
+        await self.db.commit()
+        await course_context_cache.invalidate(course_id)
+        semantic_cache.invalidate_course(course_id)
+        await catalog_cache.invalidate(f"lessons:{course_id}")
+
+    async def rollback(self) -> None:
+        await self.db.rollback()
+
+    async def _insert_returning_ids(
+        self, model: Any, rows: list[dict[str, Any]]
+    ) -> list[int]:
+        if not rows:
+            return []
+        statement = insert(model).returning(model.id, sort_by_parameter_order=True)
+        result = await self.db.execute(statement, rows)
+        return list(result.scalars().all())
@@ -0,0 +1,58 @@
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import InstanceState, selectinload
+
+from src.lib.ai.semantic_cache import semantic_cache
+from src.lib.cache import course_context_cache
+from src.lib.http_cache import catalog_cache
+from src.models.lesson import Lesson
+from src.models.quiz import Question, Quiz
+from src.repositories.base_repository import BaseRepository, WriteAction
+from src.repositories.documents.chunk_repository import drop_source_chunks
+from src.repositories.progress.progress_repository import (
+    drop_lesson_completions,
+    shift_lesson_count,
+)
+
+# Columns the retrieval chunks are built from
+_INDEXED = ("title", "content")
+
+
+class LessonRepository(BaseRepository[Lesson]):
+    model = Lesson
+    load_profiles = {
+        "quizzes": (
+            selectinload(Lesson.quizzes)
+            .selectinload(Quiz.questions)
+            .selectinload(Question.answers),
+        ),
+    }
+    delete_profile = "quizzes"
+
+    async def get_by_course(self, course_id: int) -> list[Lesson]:
+        """List lessons of a course in display order"""
+        query = (
+            select(Lesson)
+            .where(Lesson.course_id == course_id)
+            .order_by(Lesson.order, Lesson.id)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def _before_commit(self, instance: Lesson, action: WriteAction) -> None:
+        if action == "create":
+            await shift_lesson_count(self.db, instance.course_id, 1)
+        elif action == "update":
+            # Old chunks would keep matching the old text; the next ingestion
+            # run re-chunks lessons that have none
+            state: InstanceState[Lesson] = inspect(instance)
+            if any(state.attrs[key].history.has_changes() for key in _INDEXED):
+                await drop_source_chunks(self.db, lesson_id=instance.id)
+        else:
+            await drop_lesson_completions(self.db, instance)
+            await drop_source_chunks(self.db, lesson_id=instance.id)
+            await shift_lesson_count(self.db, instance.course_id, -1)
+
+    async def _after_write(self, instance: Lesson) -> None:
+        await course_context_cache.invalidate(instance.course_id)
+        semantic_cache.invalidate_course(instance.course_id)
+        await catalog_cache.invalidate(f"lessons:{instance.course_id}")
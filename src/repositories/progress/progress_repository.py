@@ -0,0 +1,159 @@
+from typing import Any
+
+from sqlalchemy import Row, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.course import Course
+from src.models.lesson import Lesson
+from src.models.progress import Enrollment, UserProgress
+from src.repositories.base_repository import BaseRepository
+
+
+class ProgressRepository(BaseRepository[Enrollment]):
+    """Enrollments and lesson completions.
+
+    Each enrollment carries `completed_lessons` and each course
+    `lesson_count`, both updated in the transaction that changes them, so
+    progress reads never aggregate `user_progress`.
+    """
+
+    model = Enrollment
+
+    async def get_enrollment(self, user_id: int, course_id: int) -> Enrollment | None:
+        query = select(Enrollment).where(
+            Enrollment.user_id == user_id, Enrollment.course_id == course_id
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def enroll(self, user_id: int, course_id: int) -> bool:
+        """Enroll a user; False if already enrolled"""
+        created = await _insert_ignore(
+            self.db,
+            Enrollment,
+            {"user_id": user_id, "course_id": course_id},
+            ["user_id", "course_id"],
+        )
+        await self.db.commit()
+        return created
+
+    async def get_summaries(
+        self, user_id: int, course_id: int | None = None
+    ) -> list[Row]:
+        """(Enrollment, course title, lesson count) rows of a user, one query"""
+        query = (
+            select(Enrollment, Course.title, Course.lesson_count)
+            .join(Course, Course.id == Enrollment.course_id)
+            .where(Enrollment.user_id == user_id)
+            .order_by(Enrollment.id)
+            # Counters are bumped with bulk UPDATEs; don't trust identity-map copies
+            .execution_options(populate_existing=True)
+        )
+        if course_id is not None:
+            query = query.where(Enrollment.course_id == course_id)
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def mark_completed(self, user_id: int, lesson: Lesson) -> bool:
+        """Record a completed lesson; False if it was already completed"""
+        created = await _insert_ignore(
+            self.db,
+            UserProgress,
+            {"user_id": user_id, "lesson_id": lesson.id},
+            ["user_id", "lesson_id"],
+        )
+        values: dict[str, Any] = {"last_activity_at": func.now()}
+        if created:
+            values["completed_lessons"] = Enrollment.completed_lessons + 1
+        await self.db.execute(
+            update(Enrollment)
+            .where(
+                Enrollment.user_id == user_id,
+                Enrollment.course_id == lesson.course_id,
+            )
+            .values(**values)
+        )
+        await self.db.commit()
+        return created
+
+    async def rebuild(self, course_id: int | None = None) -> int:
+        """Recompute the counters from lessons/user_progress (backfill, repair).
+
+        Returns the number of enrollments rewritten.
+        """
+        lesson_count = (
+            select(func.count(Lesson.id))
+            .where(Lesson.course_id == Course.id)
+            .scalar_subquery()
+        )
+        completed = (
+            select(func.count(UserProgress.id))
+            .join(Lesson, Lesson.id == UserProgress.lesson_id)
+            .where(
+                UserProgress.user_id == Enrollment.user_id,
+                Lesson.course_id == Enrollment.course_id,
+                UserProgress.completed.is_(True),
+            )
+            .scalar_subquery()
+        )
+        courses = update(Course).values(lesson_count=lesson_count)
+        enrollments = update(Enrollment).values(completed_lessons=completed)
+        if course_id is not None:
+            courses = courses.where(Course.id == course_id)
+            enrollments = enrollments.where(Enrollment.course_id == course_id)
+
+        await self.db.execute(courses.execution_options(synchronize_session=False))
+        result = await self.db.execute(
+            enrollments.execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return result.rowcount
+
+
+async def shift_lesson_count(db: AsyncSession, course_id: int, delta: int) -> None:
+    """Adjust `courses.lesson_count` in the caller's transaction"""
+    await db.execute(
+        update(Course)
+        .where(Course.id == course_id)
+        .values(lesson_count=Course.lesson_count + delta)
+    )
+
+
+async def drop_lesson_completions(db: AsyncSession, lesson: Lesson) -> None:
+    """Take a lesson about to be deleted out of its learners' counters"""
+    completed_by = select(UserProgress.user_id).where(
+        UserProgress.lesson_id == lesson.id, UserProgress.completed.is_(True)
+    )
+    await db.execute(
+        update(Enrollment)
+        .where(
+            Enrollment.course_id == lesson.course_id,
+            Enrollment.user_id.in_(completed_by),
+        )
+        .values(completed_lessons=Enrollment.completed_lessons - 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _insert_ignore(
+    db: AsyncSession,
+    model: type[Enrollment | UserProgress],
+    values: dict[str, Any],
+    conflict: list[str],
+) -> bool:
+    """INSERT ... ON CONFLICT DO NOTHING; True if a row was inserted"""
+    # Both supported backends spell it the same way
+    dialect_insert = (
+        postgresql.insert
+        if db.get_bind().dialect.name == "postgresql"
+        else sqlite.insert
+    )
+    query = (
+        dialect_insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=conflict)
+        .returning(model.id)
+    )
+    result = await db.execute(query)
+    return result.scalar_one_or_none() is not None
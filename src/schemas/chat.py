@@ -0,0 +1,42 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# ============ Conversation ============
+class ConversationCreate(BaseModel):
+    """Schema để tạo conversation mới"""
+
+    course_id: int
+    title: str | None = Field(None, max_length=255)
+
+
+class ConversationResponse(BaseModel):
+    """Schema response cho 1 conversation"""
+
+    id: int
+    user_id: int
+    course_id: int
+    title: str | None = None
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ============ Message ============
+class MessageCreate(BaseModel):
+    """Schema để gửi tin nhắn"""
+
+    content: str = Field(..., min_length=1, max_length=4000)
+
+
+class MessageResponse(BaseModel):
+    """Schema response cho 1 tin nhắn"""
+
+    id: int
+    conversation_id: int
+    role: str
+    content: str
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
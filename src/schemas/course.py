@@ -0,0 +1,91 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+CourseLevel = Literal["beginner", "intermediate", "advanced"]
+
+
+# ============ Course ============
+class CourseCreate(BaseModel):
+    """Schema để tạo khóa học mới"""
+
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str | None = None
+    thumbnail: str | None = Field(None, max_length=500)
+    category: str | None = Field(None, max_length=100)
+    level: CourseLevel = "beginner"
+    duration_hours: int = Field(0, ge=0)
+    is_published: bool = False
+
+
+class CourseUpdate(BaseModel):
+    """Schema cập nhật khóa học, chỉ các trường được gửi lên"""
+
+    title: str | None = Field(None, min_length=1, max_length=255)
+    description: str | None = None
+    thumbnail: str | None = Field(None, max_length=500)
+    category: str | None = Field(None, max_length=100)
+    level: CourseLevel | None = None
+    duration_hours: int | None = Field(None, ge=0)
+    is_published: bool | None = None
+
+
+class CourseResponse(BaseModel):
+    """Schema response cho 1 khóa học"""
+
+    id: int
+    creator_id: int
+    title: str
+    description: str | None = None
+    thumbnail: str | None = None
+    category: str | None = None
+    level: str | None = None
+    duration_hours: int | None = None
+    is_published: bool | None = None
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CourseListResponse(BaseModel):
+    """Danh sách khóa học.
+
+    Offset mode (`page`) trả `total` chính xác; cursor mode (`cursor`) bỏ
+    `page`/`pages` và chỉ trả `total` khi được yêu cầu. `next_cursor` có
+    trong cả 2 mode, null ở trang cuối.
+    """
+
+    items: list[CourseResponse]
+    total: int | None = None
+    page: int | None = None
+    size: int
+    pages: int | None = None
+    next_cursor: str | None = None
+
+
+# ============ Search ============
+class CourseSearchHit(CourseResponse):
+    """Một kết quả tìm kiếm: khóa học kèm điểm và đoạn highlight.
+
+    `*_highlight` là HTML đã escape, từ khớp nằm trong `<mark>`.
+    """
+
+    rank: float
+    title_highlight: str
+    description_highlight: str | None = None
+
+
+class CourseSearchResponse(BaseModel):
+    """Kết quả tìm kiếm, xếp theo độ liên quan.
+
+    `facets` đếm số kết quả theo `category` và `level`, không áp dụng bộ
+    lọc, để client hiển thị các lựa chọn lọc.
+    """
+
+    items: list[CourseSearchHit]
+    total: int
+    page: int
+    size: int
+    pages: int
+    facets: dict[str, dict[str, int]]
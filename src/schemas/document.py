@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DocumentResponse(BaseModel):
+    """Schema response cho tài liệu"""
+
+    id: int
+    course_id: int
+    name: str
+    file_type: str | None = None
+    file_size: int | None = None
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+QuestionType = Literal["single_choice", "multiple_choice", "true_false", "fill_blank"]
+
+
+# ============ Lesson ============
+class LessonResponse(BaseModel):
+    """Bài học trong danh sách của khóa học (không kèm nội dung)"""
+
+    id: int
+    course_id: int
+    title: str
+    video_url: str | None = None
+    order: int
+    duration_minutes: int | None = None
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ============ Bulk Import Schemas ============
+class AnswerImport(BaseModel):
+    content: str = Field(..., min_length=1)
+    is_correct: bool = False
+    order: int = Field(..., ge=0)
+
+
+class QuestionImport(BaseModel):
+    content: str = Field(..., min_length=1)
+    type: QuestionType = "single_choice"
+    points: int = Field(1, ge=0)
+    order: int = Field(..., ge=0)
+    answers: list[AnswerImport] = Field(default_factory=list, max_length=20)
+
+
+class QuizImport(BaseModel):
+    title: str = Field(..., min_length=1, max_length=255)
+    description: str | None = None
+    time_limit: int = Field(30, ge=1)
+    passing_score: int = Field(60, ge=0, le=100)
+    max_attempts: int = Field(3, ge=1)
+    questions: list[QuestionImport] = Field(default_factory=list, max_length=200)
+
+
+class LessonImport(BaseModel):
+    """1 bài học kèm quiz (nếu có) trong tài liệu import"""
+
+    title: str = Field(..., min_length=1, max_length=255)
+    content: str | None = None
+    video_url: str | None = Field(None, max_length=500)
+    order: int = Field(..., ge=0)
+    duration_minutes: int = Field(0, ge=0)
+    quiz: QuizImport | None = None
+
+
+class LessonImportRequest(BaseModel):
+    """Schema import toàn bộ cây bài học của 1 khóa học"""
+
+    lessons: list[LessonImport] = Field(..., min_length=1)
+
+
+class LessonImportResponse(BaseModel):
+    """Số bản ghi đã tạo theo từng bảng"""
+
+    course_id: int
+    lessons: int = 0
+    quizzes: int = 0
+    questions: int = 0
+    answers: int = 0
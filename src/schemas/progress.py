@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class EnrollmentResponse(BaseModel):
+    """Schema response khi đăng ký khóa học"""
+
+    id: int
+    course_id: int
+    enrolled_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CourseProgressResponse(BaseModel):
+    """Tiến độ của user trong 1 khóa học"""
+
+    course_id: int
+    course_title: str
+    total_lessons: int
+    completed_lessons: int
+    progress: int
+    completed: bool
+    last_activity_at: datetime | None = None
+
+
+class ProgressOverviewResponse(BaseModel):
+    """Tiến độ tổng quan trên các khóa học đã đăng ký"""
+
+    total_courses: int
+    completed_courses: int
+    total_lessons: int
+    completed_lessons: int
+    courses: list[CourseProgressResponse]
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# ============ Submit ============
+class AnswerSubmission(BaseModel):
+    """Câu trả lời cho 1 câu hỏi"""
+
+    question_id: int
+    answer_ids: list[int] = Field(default_factory=list, max_length=64)
+    text_answer: str | None = Field(None, max_length=1000)
+
+
+class QuizSubmit(BaseModel):
+    """Schema nộp bài quiz"""
+
+    answers: list[AnswerSubmission] = Field(default_factory=list, max_length=200)
+
+
+# ============ Result ============
+class QuestionResult(BaseModel):
+    question_id: int
+    correct: bool
+    selected_answer_ids: list[int]
+    correct_answer_ids: list[int]
+    points_earned: int
+
+
+class QuizResult(BaseModel):
+    """Kết quả chấm 1 lần làm quiz"""
+
+    attempt_id: int
+    score: int
+    total_points: int
+    earned_points: int
+    passed: bool
+    completed_at: datetime | None = None
+    details: list[QuestionResult]
+
+
+class QuizAttemptResponse(BaseModel):
+    """Schema response cho lịch sử làm quiz"""
+
+    id: int
+    quiz_id: int
+    score: int
+    total_points: int
+    earned_points: int
+    passed: bool
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
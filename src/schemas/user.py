@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+
+# ============ Auth ============
+class UserCreate(BaseModel):
+    """Schema đăng ký tài khoản"""
+
+    email: EmailStr
+    password: str = Field(..., min_length=8, max_length=72)
+    name: str = Field(..., min_length=1, max_length=100)
+
+
+class UserLogin(BaseModel):
+    """Schema đăng nhập"""
+
+    email: EmailStr
+    password: str = Field(..., max_length=72)
+
+
+class TokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+
+
+# ============ Profile ============
+class UserUpdate(BaseModel):
+    """Schema cập nhật profile"""
+
+    name: str | None = Field(None, min_length=1, max_length=100)
+    avatar: str | None = Field(None, max_length=500)
+
+
+class UserResponse(BaseModel):
+    """Schema response cho user, không bao giờ chứa password"""
+
+    id: int
+    email: str
+    name: str
+    avatar: str | None = None
+    created_at: datetime | None = None
+
+    model_config = ConfigDict(from_attributes=True)
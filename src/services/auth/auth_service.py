@@ -0,0 +1,68 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.auth import InvalidCredentialsError, UserAlreadyExistsError
+from src.lib import jwt, password
+from src.lib.cache import current_user_cache
+from src.models.user import User
+from src.repositories.auth.auth_repository import AuthRepository
+from src.schemas.user import UserUpdate
+
+_dummy_hash: str | None = None
+
+
+class AuthService:
+    def __init__(self, db: AsyncSession, repository: AuthRepository | None = None):
+        self.repository = repository or AuthRepository(db)
+
+    async def register(self, data: dict[str, Any]) -> User:
+        """Đăng ký tài khoản mới"""
+        if await self.repository.get_by_email(data["email"]):
+            raise UserAlreadyExistsError(data["email"])
+        hashed = await password.hash_password_async(data["password"])
+        return await self.repository.create({**data, "password": hashed})
+
+    async def login(self, email: str, plain_password: str) -> dict[str, str]:
+        """Đăng nhập, trả access token.
+
+        A hash made with outdated bcrypt settings is replaced on success.
+        """
+        user = await self.repository.get_by_email(email)
+        if user is None:
+            # Same bcrypt cost as a real check, so timing doesn't reveal emails
+            await password.verify_and_rehash(plain_password, await _get_dummy_hash())
+            raise InvalidCredentialsError(email)
+
+        valid, new_hash = await password.verify_and_rehash(
+            plain_password, user.password
+        )
+        if not valid or not user.is_active:
+            raise InvalidCredentialsError(email)
+        if new_hash:
+            await self.repository.update(user.id, {"password": new_hash})
+
+        token = jwt.create_access_token({"sub": str(user.id)})
+        return {"access_token": token, "token_type": "bearer"}
+
+    async def logout(self, user: User, token: str) -> None:
+        """Thu hồi token và bỏ user khỏi cache"""
+        await jwt.revoke_access_token(token)
+        current_user_cache.delete(user.id)
+
+    async def update_profile(self, user: User, data: UserUpdate) -> User:
+        """Cập nhật profile"""
+        updated = await self.repository.update(
+            user.id, data.model_dump(exclude_unset=True)
+        )
+        if updated is None:
+            # Deleted since the token was checked
+            raise InvalidCredentialsError(user.email)
+        return updated
+
+
+async def _get_dummy_hash() -> str:
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = await password.hash_password_async("dummy-password")
+    return _dummy_hash
@@ -0,0 +1,91 @@
+import logging
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.message_archive import ARCHIVED_COLUMNS, MessageArchive, message_archive
+from src.models.chat import Conversation
+from src.repositories.chat.conversation_repository import ConversationRepository
+from src.repositories.chat.message_repository import MessageRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationArchiveService:
+    """Move the messages of cold conversations to the archive and back.
+
+    `archive` runs from the retention job (`src.jobs.archive_conversations`);
+    `rehydrate` runs on demand, when a user comes back to an archived
+    conversation, and restores the messages with their original ids and
+    timestamps.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        conversation_repository: ConversationRepository | None = None,
+        message_repository: MessageRepository | None = None,
+        archive: MessageArchive = message_archive,
+    ):
+        self.db = db
+        self.conversation_repository = conversation_repository or (
+            ConversationRepository(db)
+        )
+        self.message_repository = message_repository or MessageRepository(db)
+        self.archive = archive
+
+    async def archive_conversation(
+        self, conversation_id: int, before: datetime
+    ) -> int | None:
+        """Archive a conversation idle since `before`; returns messages moved.
+
+        None if it is gone or no longer idle: the conversation is locked and
+        re-checked first, so a message sent since it was picked keeps it
+        hot. Its rows are deleted only once the archive file is on disk.
+        """
+        conversation = await self.conversation_repository.lock(conversation_id)
+        if conversation is None or not await self.conversation_repository.is_cold(
+            conversation_id, before
+        ):
+            await self.db.rollback()
+            return None
+        try:
+            messages = await self.message_repository.get_by_conversation(
+                conversation_id, limit=None
+            )
+            rows = [
+                {column: getattr(message, column) for column in ARCHIVED_COLUMNS}
+                for message in messages
+            ]
+            await self.archive.write(conversation_id, rows)
+            await self.message_repository.delete_by_conversation(conversation_id)
+            await self.conversation_repository.set_archived(conversation_id, True)
+            await self.db.commit()
+        except BaseException:
+            await self.db.rollback()
+            raise
+        return len(rows)
+
+    async def rehydrate(self, conversation: Conversation) -> int:
+        """Restore an archived conversation's messages; returns messages restored"""
+        if conversation.archived_at is None:
+            return 0
+        restored = 0
+        # Of concurrent requests only one restores; the others wait on its
+        # row lock and then see the messages
+        if await self.conversation_repository.set_archived(conversation.id, False):
+            try:
+                rows = await self.archive.read(conversation.id)
+            except FileNotFoundError:
+                logger.error("Archive of conversation %s is missing", conversation.id)
+                rows = []
+            await self.message_repository.insert_many(conversation.id, rows)
+            await self.db.commit()
+            await self.archive.delete(conversation.id)
+            restored = len(rows)
+        await self.db.refresh(conversation, ["archived_at"])
+        return restored
+
+    async def discard(self, conversation_id: int) -> None:
+        """Drop the archive of a deleted conversation"""
+        await self.archive.delete(conversation_id)
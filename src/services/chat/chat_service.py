@@ -0,0 +1,266 @@
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.exceptions.ai import AIUnavailableError
+from src.exceptions.chat import ConversationNotFoundError, CourseNotFoundError
+from src.lib.ai.prompts import FALLBACK_REPLY
+from src.lib.ai.router import LLMRouter
+from src.lib.ai.semantic_cache import SemanticAnswerCache
+from src.lib.ai.tokens import count_tokens
+from src.lib.metrics import record_message_tokens
+from src.lib.pagination import cursor_id, split_page
+from src.lib.write_behind import WriteBehindBuffer
+from src.models.chat import Conversation, Message
+from src.repositories.chat.conversation_repository import ConversationRepository
+from src.repositories.chat.message_repository import MessageRepository, history_start
+from src.repositories.courses.course_repository import CourseRepository
+from src.schemas.chat import ConversationCreate
+from src.services.chat.archive_service import ConversationArchiveService
+from src.services.chat.context_builder import ChatContextBuilder, ChatPrompt
+from src.services.chat.summary_service import ConversationSummaryService
+from src.services.courses.course_context_service import CourseContextService
+from src.services.documents.retrieval_service import CourseRetriever
+
+PAGE_SIZE = 100
+
+
+class ChatService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        ai_client: LLMRouter,
+        conversation_repository: ConversationRepository | None = None,
+        message_repository: MessageRepository | None = None,
+        course_repository: CourseRepository | None = None,
+        answer_cache: SemanticAnswerCache | None = None,
+        context_service: CourseContextService | None = None,
+        summarizer: ConversationSummaryService | None = None,
+        retriever: CourseRetriever | None = None,
+        archive_service: ConversationArchiveService | None = None,
+        message_buffer: WriteBehindBuffer[Message] | None = None,
+    ):
+        self.db = db
+        self.ai_client = ai_client
+        self.answer_cache = answer_cache
+        self.conversation_repository = conversation_repository or (
+            ConversationRepository(db)
+        )
+        self.message_repository = message_repository or MessageRepository(db)
+        self.course_repository = course_repository or CourseRepository(db)
+        self.context_service = context_service or CourseContextService(
+            db, course_repository=self.course_repository
+        )
+        self.context_builder = ChatContextBuilder(
+            self.message_repository,
+            self.context_service,
+            retriever or CourseRetriever(db),
+        )
+        self.summarizer = summarizer
+        # Set in "buffered" durability mode: messages are inserted in batches
+        self.message_buffer = message_buffer
+        self.archive_service = archive_service or ConversationArchiveService(
+            db,
+            conversation_repository=self.conversation_repository,
+            message_repository=self.message_repository,
+        )
+
+    # ============ Conversations ============
+    async def create_conversation(
+        self, user_id: int, data: ConversationCreate
+    ) -> Conversation:
+        """Tạo conversation mới cho 1 khóa học"""
+        course = await self.course_repository.get_by_id(data.course_id)
+        if course is None:
+            raise CourseNotFoundError(data.course_id)
+        return await self.conversation_repository.create(
+            {**data.model_dump(), "user_id": user_id}
+        )
+
+    async def get_conversation(
+        self, conversation_id: int, user_id: int
+    ) -> Conversation:
+        """Lấy conversation của user, raise nếu không tồn tại"""
+        conversation = await self.conversation_repository.get_by_id(conversation_id)
+        if conversation is None or conversation.user_id != user_id:
+            raise ConversationNotFoundError(conversation_id)
+        return conversation
+
+    async def list_conversations(
+        self, user_id: int, limit: int = PAGE_SIZE, cursor: str | None = None
+    ) -> tuple[list[Conversation], str | None]:
+        """Conversations mới nhất trước, phân trang bằng cursor"""
+        rows = await self.conversation_repository.get_by_user(
+            user_id, limit=limit + 1, before_id=cursor_id(cursor)
+        )
+        return split_page(rows, limit)
+
+    async def delete_conversation(self, conversation_id: int, user_id: int) -> None:
+        conversation = await self.get_conversation(conversation_id, user_id)
+        archived = conversation.archived_at is not None
+        if self.message_buffer is not None:
+            self.message_buffer.discard(conversation_id)
+        await self.conversation_repository.delete(conversation_id)
+        if archived:
+            await self.archive_service.discard(conversation_id)
+
+    async def _get_active_conversation(
+        self, conversation_id: int, user_id: int
+    ) -> Conversation:
+        """Conversation của user, khôi phục tin nhắn nếu đã được lưu trữ"""
+        conversation = await self.get_conversation(conversation_id, user_id)
+        await self.archive_service.rehydrate(conversation)
+        return conversation
+
+    # ============ Messages ============
+    async def list_messages(
+        self,
+        conversation_id: int,
+        user_id: int,
+        limit: int = PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[Message], str | None]:
+        """Tin nhắn theo thứ tự thời gian, phân trang bằng cursor"""
+        after_id = cursor_id(cursor)
+        conversation = await self._get_active_conversation(conversation_id, user_id)
+        rows = await self.message_repository.get_by_conversation(
+            conversation_id,
+            limit=limit + 1,
+            after_id=after_id,
+            since=history_start(conversation),
+        )
+        return split_page(rows, limit)
+
+    async def send_message(
+        self, conversation_id: int, user_id: int, content: str
+    ) -> Message:
+        """Gửi tin nhắn và chờ AI trả lời đầy đủ"""
+        conversation = await self._get_active_conversation(conversation_id, user_id)
+        prompt = await self.context_builder.build(conversation, content)
+        await self._save_message(conversation.id, "user", content)
+
+        reply = self._cached_answer(conversation, prompt.messages)
+        if reply is None:
+            try:
+                reply = await self.ai_client.generate(
+                    prompt.messages, system=prompt.system
+                )
+            except AIUnavailableError:
+                reply = self._fallback_answer(conversation, prompt.messages)
+            else:
+                self._cache_answer(conversation, prompt.messages, reply)
+        message = await self._save_message(conversation.id, "assistant", reply)
+        await self._maybe_summarize(conversation, prompt)
+        return message
+
+    async def stream_message(
+        self, conversation_id: int, user_id: int, content: str
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Gửi tin nhắn và trả về iterator các sự kiện stream của AI.
+
+        Validation and prompt building happen before this returns, so errors
+        still surface as normal HTTP responses; the assistant message is
+        persisted once, after the provider stream completes.
+        """
+        conversation = await self._get_active_conversation(conversation_id, user_id)
+        prompt = await self.context_builder.build(conversation, content)
+        await self._save_message(conversation.id, "user", content)
+        return self._stream_reply(conversation, prompt)
+
+    async def _stream_reply(
+        self, conversation: Conversation, prompt: ChatPrompt
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        # Runs after the request's `get_db` dependency has exited, so the
+        # session is closed here or its connection never returns to the pool
+        try:
+            reply = self._cached_answer(conversation, prompt.messages)
+            if reply is not None:
+                yield {"event": "token", "data": {"delta": reply}}
+            else:
+                chunks: list[str] = []
+                try:
+                    async for delta in self.ai_client.stream(
+                        prompt.messages, system=prompt.system
+                    ):
+                        chunks.append(delta)
+                        yield {"event": "token", "data": {"delta": delta}}
+                except AIUnavailableError:
+                    # Raised before any token was sent
+                    reply = self._fallback_answer(conversation, prompt.messages)
+                    yield {"event": "token", "data": {"delta": reply}}
+                else:
+                    reply = "".join(chunks)
+                    self._cache_answer(conversation, prompt.messages, reply)
+
+            message = await self._save_message(conversation.id, "assistant", reply)
+            await self._maybe_summarize(conversation, prompt)
+            yield {"event": "done", "data": {"message_id": message.id}}
+        finally:
+            await self.db.close()
+
+    # ============ Helpers ============
+    async def _maybe_summarize(
+        self, conversation: Conversation, prompt: ChatPrompt
+    ) -> None:
+        if prompt.needs_summary and self.summarizer is not None:
+            await self.summarizer.schedule(conversation.id)
+
+    def _cached_answer(
+        self, conversation: Conversation, messages: list[dict]
+    ) -> str | None:
+        # Only standalone questions are cacheable: a follow-up depends on the
+        # conversation so far, not just on its wording.
+        if self.answer_cache is None or not self._is_standalone(conversation, messages):
+            return None
+        return self.answer_cache.get(conversation.course_id, messages[-1]["content"])
+
+    def _cache_answer(
+        self, conversation: Conversation, messages: list[dict], reply: str
+    ) -> None:
+        if self.answer_cache is None or not reply:
+            return
+        if not self._is_standalone(conversation, messages):
+            return
+        self.answer_cache.set(conversation.course_id, messages[-1]["content"], reply)
+
+    def _fallback_answer(self, conversation: Conversation, messages: list[dict]) -> str:
+        # Every provider is down: a looser cache match beats no answer, even
+        # for a follow-up question
+        if self.answer_cache is not None:
+            cached = self.answer_cache.get(
+                conversation.course_id,
+                messages[-1]["content"],
+                threshold=settings.AI_FALLBACK_CACHE_THRESHOLD,
+                min_overlap=settings.AI_FALLBACK_CACHE_MIN_OVERLAP,
+            )
+            if cached is not None:
+                return cached
+        return FALLBACK_REPLY
+
+    @staticmethod
+    def _is_standalone(conversation: Conversation, messages: list[dict]) -> bool:
+        return len(messages) == 1 and not conversation.summary
+
+    async def _save_message(
+        self, conversation_id: int, role: str, content: str
+    ) -> Message:
+        tokens = count_tokens(content)
+        record_message_tokens(role, tokens)
+        data = {
+            "conversation_id": conversation_id,
+            "role": role,
+            "content": content,
+            "tokens_used": tokens,
+        }
+        if self.message_buffer is None:
+            return await self.message_repository.create(data)
+        message = Message(
+            id=await self.message_repository.next_id(),
+            created_at=datetime.now(UTC),
+            **data,
+        )
+        await self.message_buffer.add(message)
+        return message
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+
+from src.core.config import settings
+from src.exceptions.chat import CourseNotFoundError
+from src.lib.ai.prompts import build_system_prompt
+from src.lib.ai.tokens import count_tokens, message_tokens
+from src.models.chat import Conversation
+from src.repositories.chat.message_repository import MessageRepository, history_start
+from src.services.courses.course_context_service import CourseContextService
+from src.services.documents.retrieval_service import CourseRetriever
+
+RECENT_MESSAGES_LIMIT = 10
+
+
+@dataclass
+class ChatPrompt:
+    system: str
+    messages: list[dict]
+    # History no longer fits raw: fold the older part into the summary
+    needs_summary: bool = False
+
+
+class ChatContextBuilder:
+    """Assemble a prompt that fits a fixed token budget.
+
+    The prompt is the course system prompt, the lesson/document chunks most
+    relevant to the question (up to `retrieval_budget` tokens), the
+    conversation's rolling summary (everything up to `summary_until_id`),
+    then as many of the most recent unsummarized messages as the budget
+    allows. Token counts come from `Message.tokens_used`, so history is
+    never re-tokenized. Prompt size stays flat however long the
+    conversation or the course material grows.
+    """
+
+    def __init__(
+        self,
+        message_repository: MessageRepository,
+        context_service: CourseContextService,
+        retriever: CourseRetriever | None = None,
+        token_budget: int = settings.CHAT_CONTEXT_TOKEN_BUDGET,
+        retrieval_budget: int = settings.RETRIEVAL_TOKEN_BUDGET,
+    ):
+        self.message_repository = message_repository
+        self.context_service = context_service
+        self.retriever = retriever
+        self.token_budget = token_budget
+        self.retrieval_budget = retrieval_budget
+
+    async def build(self, conversation: Conversation, content: str) -> ChatPrompt:
+        context = await self.context_service.get(conversation.course_id)
+        if context is None:
+            raise CourseNotFoundError(conversation.course_id)
+        passages = await self._retrieve(conversation.course_id, content)
+        system = build_system_prompt(context, conversation.summary, passages)
+
+        remaining = (
+            self.token_budget
+            - count_tokens(system)
+            - message_tokens(count_tokens(content))
+        )
+        recent = await self.message_repository.get_recent(
+            conversation.id,
+            limit=RECENT_MESSAGES_LIMIT + 1,
+            after_id=conversation.summary_until_id,
+            since=history_start(conversation),
+        )
+        needs_summary = len(recent) > RECENT_MESSAGES_LIMIT
+
+        history: list[dict] = []
+        for message in reversed(recent[-RECENT_MESSAGES_LIMIT:]):
+            if message.role not in ("user", "assistant"):
+                continue
+            tokens = message.tokens_used
+            if tokens is None:
+                tokens = count_tokens(message.content)
+            cost = message_tokens(tokens)
+            if cost > remaining:
+                needs_summary = True
+                break
+            remaining -= cost
+            history.append({"role": message.role, "content": message.content})
+        history.reverse()
+
+        # The provider expects the conversation to open with a user turn
+        while history and history[0]["role"] != "user":
+            history.pop(0)
+
+        history.append({"role": "user", "content": content})
+        return ChatPrompt(system, history, needs_summary)
+
+    async def _retrieve(self, course_id: int, content: str) -> list[str]:
+        if self.retriever is None:
+            return []
+        passages: list[str] = []
+        remaining = self.retrieval_budget
+        for chunk in await self.retriever.search(course_id, content):
+            cost = count_tokens(chunk.content)
+            if cost > remaining:
+                break
+            remaining -= cost
+            passages.append(chunk.content)
+        return passages
@@ -0,0 +1,106 @@
+import logging
+
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.database import AsyncSessionLocal
+from src.lib.ai.prompts import SUMMARY_SYSTEM_PROMPT, build_summary_request
+from src.lib.ai.router import SIMPLE, LLMRouter, get_ai_router
+from src.lib.jobs import JobQueue, job_queue
+from src.repositories.chat.conversation_repository import ConversationRepository
+from src.repositories.chat.message_repository import MessageRepository, history_start
+
+logger = logging.getLogger(__name__)
+
+# Messages folded per summary call; a longer backlog is caught up next turn
+SUMMARY_BATCH_MESSAGES = 50
+
+
+class ConversationSummaryService:
+    """Keep a rolling summary per conversation, updated in the background.
+
+    Each run folds the unsummarized messages, except the newest
+    `keep_messages`, into `Conversation.summary` with one short AI call and
+    advances `summary_until_id`. Runs go through the job queue (task
+    `chat.summarize`) and use their own DB session.
+    """
+
+    def __init__(
+        self,
+        ai_client: LLMRouter | None = None,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        keep_messages: int = settings.CHAT_SUMMARY_KEEP_MESSAGES,
+        max_tokens: int = settings.CHAT_SUMMARY_MAX_TOKENS,
+        queue: JobQueue = job_queue,
+    ):
+        self._ai_client = ai_client
+        self.session_factory = session_factory
+        self.keep_messages = keep_messages
+        self.max_tokens = max_tokens
+        self.queue = queue
+
+    @property
+    def ai_client(self) -> LLMRouter:
+        return self._ai_client or get_ai_router()
+
+    async def schedule(self, conversation_id: int) -> None:
+        """Queue a summary run; no-op if one is already queued or running"""
+        try:
+            await self.queue.enqueue(
+                "chat.summarize",
+                conversation_id,
+                idempotency_key=f"chat.summarize:{conversation_id}",
+            )
+        except RedisError:
+            # The next long turn asks again
+            logger.warning("Could not queue summary for %s", conversation_id)
+
+    async def summarize(self, conversation_id: int) -> bool:
+        """Fold older messages into the summary; False if nothing to fold"""
+        async with self.session_factory() as db:
+            conversation_repository = ConversationRepository(db)
+            conversation = await conversation_repository.get_by_id(conversation_id)
+            if conversation is None:
+                return False
+
+            pending = await MessageRepository(db).get_by_conversation(
+                conversation_id,
+                limit=SUMMARY_BATCH_MESSAGES + self.keep_messages,
+                after_id=conversation.summary_until_id,
+                since=history_start(conversation),
+            )
+            to_fold = pending[: max(0, len(pending) - self.keep_messages)]
+            if not to_fold:
+                return False
+
+            summary = await self.ai_client.generate(
+                build_summary_request(
+                    conversation.summary,
+                    [{"role": m.role, "content": m.content} for m in to_fold],
+                ),
+                system=SUMMARY_SYSTEM_PROMPT,
+                max_tokens=self.max_tokens,
+                # Condensing a transcript doesn't need the stronger model
+                tier=SIMPLE,
+            )
+            if not summary.strip():
+                return False
+            await conversation_repository.update(
+                conversation_id,
+                {"summary": summary, "summary_until_id": to_fold[-1].id},
+            )
+            return True
+
+
+conversation_summarizer = ConversationSummaryService()
+
+
+def get_conversation_summarizer() -> ConversationSummaryService | None:
+    """FastAPI dependency; None when summarization is disabled"""
+    return conversation_summarizer if settings.CHAT_SUMMARY_ENABLED else None
+
+
+@job_queue.task("chat.summarize", queue="ai")
+async def summarize_conversation_task(conversation_id: int) -> None:
+    await conversation_summarizer.summarize(conversation_id)
@@ -0,0 +1,53 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.cache import LayeredCache, course_context_cache
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.lessons.lesson_repository import LessonRepository
+
+
+class CourseContextService:
+    """Course-level AI tutor context (course info + lesson outline), cached.
+
+    Cached under `course_context:{course_id}`; CourseRepository and
+    LessonRepository invalidate the entry whenever they write.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: LayeredCache = course_context_cache,
+        course_repository: CourseRepository | None = None,
+        lesson_repository: LessonRepository | None = None,
+    ):
+        self.cache = cache
+        self.course_repository = course_repository or CourseRepository(db)
+        self.lesson_repository = lesson_repository or LessonRepository(db)
+
+    async def get(self, course_id: int) -> dict[str, Any] | None:
+        """Lấy context của khóa học, None nếu khóa học không tồn tại"""
+        context: dict[str, Any] | None = await self.cache.get(course_id)
+        if context is not None:
+            return context
+
+        course = await self.course_repository.get_by_id(course_id)
+        if course is None:
+            return None
+        lessons = await self.lesson_repository.get_by_course(course_id)
+
+        context = {
+            "course": {
+                "id": course.id,
+                "title": course.title,
+                "description": course.description,
+                "level": course.level,
+                "category": course.category,
+            },
+            "lessons": [
+                {"id": lesson.id, "title": lesson.title, "order": lesson.order}
+                for lesson in lessons
+            ],
+        }
+        await self.cache.set(course_id, context)
+        return context
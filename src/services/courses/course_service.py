@@ -0,0 +1,158 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.courses import CourseNotFoundError, CoursePermissionError
+from src.lib.pagination import CountMode, cursor_id, split_page
+from src.lib.search import highlight, parse_terms
+from src.models.course import Course
+from src.models.progress import Enrollment
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.progress.progress_repository import ProgressRepository
+from src.schemas.course import CourseCreate, CourseResponse, CourseUpdate
+
+
+class CourseService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository: CourseRepository | None = None,
+        progress_repository: ProgressRepository | None = None,
+    ):
+        self.repository = repository or CourseRepository(db)
+        self.progress_repository = progress_repository or ProgressRepository(db)
+
+    async def list_courses(
+        self,
+        page: int = 1,
+        size: int = 10,
+        category: str | None = None,
+        level: str | None = None,
+        cursor: str | None = None,
+        count: CountMode | None = None,
+    ) -> dict[str, Any]:
+        """Lấy danh sách khóa học, phân trang theo page hoặc cursor.
+
+        Cursor mode costs the same on every page and skips the COUNT unless
+        `count` asks for one; offset mode keeps the exact total by default.
+        """
+        after_id = cursor_id(cursor)
+        if count is None:
+            count = "none" if cursor is not None else "exact"
+
+        rows = await self.repository.filter(
+            category=category,
+            level=level,
+            skip=(page - 1) * size,
+            limit=size + 1,
+            after_id=after_id,
+        )
+        items, next_cursor = split_page(rows, size)
+
+        total = None
+        if count != "none":
+            total = await self.repository.count_filtered(
+                category, level, estimate=count == "estimated"
+            )
+
+        if cursor is not None:
+            return {
+                "items": items,
+                "total": total,
+                "size": size,
+                "next_cursor": next_cursor,
+            }
+        return {
+            "items": items,
+            "total": total,
+            "page": page,
+            "size": size,
+            "pages": (total + size - 1) // size if total is not None else None,
+            "next_cursor": next_cursor,
+        }
+
+    async def search_courses(
+        self,
+        q: str,
+        page: int = 1,
+        size: int = 10,
+        category: str | None = None,
+        level: str | None = None,
+    ) -> dict[str, Any]:
+        """Tìm khóa học theo từ khóa (không dấu cũng được), kèm highlight và facets"""
+        terms = parse_terms(q)
+        items: list[dict[str, Any]]
+        facets: dict[str, dict[str, int]]
+        if not terms:
+            items, total, facets = [], 0, {"category": {}, "level": {}}
+        else:
+            rows = await self.repository.search(
+                terms, category, level, skip=(page - 1) * size, limit=size
+            )
+            total = await self.repository.count_search(terms, category, level)
+            facets = await self.repository.search_facets(terms)
+            items = [
+                {
+                    **CourseResponse.model_validate(course).model_dump(),
+                    "rank": rank,
+                    "title_highlight": highlight(course.title, terms),
+                    "description_highlight": highlight(
+                        course.description, terms, snippet=True
+                    ),
+                }
+                for course, rank in rows
+            ]
+        return {
+            "items": items,
+            "total": total,
+            "page": page,
+            "size": size,
+            "pages": (total + size - 1) // size,
+            "facets": facets,
+        }
+
+    async def get_course(self, course_id: int) -> Course:
+        """Lấy khóa học theo ID, raise nếu không tồn tại"""
+        course = await self.repository.get_by_id(course_id)
+        if course is None:
+            raise CourseNotFoundError(course_id)
+        return course
+
+    async def create_course(self, data: CourseCreate, creator_id: int) -> Course:
+        """Tạo khóa học mới"""
+        return await self.repository.create(
+            {**data.model_dump(), "creator_id": creator_id}
+        )
+
+    async def update_course(
+        self, course_id: int, data: CourseUpdate, user_id: int
+    ) -> Course:
+        """Cập nhật khóa học (Owner)"""
+        await self._get_owned(course_id, user_id)
+        course = await self.repository.update(
+            course_id, data.model_dump(exclude_unset=True)
+        )
+        if course is None:
+            raise CourseNotFoundError(course_id)
+        return course
+
+    async def delete_course(self, course_id: int, user_id: int) -> None:
+        """Xóa khóa học (Owner)"""
+        await self._get_owned(course_id, user_id)
+        await self.repository.delete(course_id)
+
+    async def enroll(self, course_id: int, user_id: int) -> tuple[Enrollment, bool]:
+        """Đăng ký khóa học; trả (enrollment, có phải mới tạo)"""
+        await self.get_course(course_id)
+        created = await self.progress_repository.enroll(user_id, course_id)
+        enrollment = await self.progress_repository.get_enrollment(user_id, course_id)
+        if enrollment is None:
+            # The course was deleted in between, cascading to the enrollment
+            raise CourseNotFoundError(course_id)
+        return enrollment, created
+
+    async def _get_owned(self, course_id: int, user_id: int) -> Course:
+        course = await self.get_course(course_id)
+        if course.creator_id != user_id:
+            raise CoursePermissionError(course_id)
+        return course
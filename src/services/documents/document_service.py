@@ -0,0 +1,157 @@
+from collections.abc import AsyncIterable, AsyncIterator
+from pathlib import Path, PurePath
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.courses import CourseNotFoundError, CoursePermissionError
+from src.exceptions.documents import DocumentNotFoundError, UnsupportedFileTypeError
+from src.lib.storage import FileStorage, document_storage
+from src.models.course import Course
+from src.models.document import Document
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.documents.document_repository import DocumentRepository
+from src.repositories.progress.progress_repository import ProgressRepository
+from src.services.documents.ingestion_service import DocumentIngestionService
+
+# Allowed extensions and the leading bytes their content must start with
+FILE_SIGNATURES: dict[str, tuple[bytes, ...]] = {
+    "pdf": (b"%PDF-",),
+    "doc": (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",),
+    "docx": (b"PK\x03\x04",),
+    "jpg": (b"\xff\xd8\xff",),
+    "jpeg": (b"\xff\xd8\xff",),
+    "png": (b"\x89PNG\r\n\x1a\n",),
+    "gif": (b"GIF87a", b"GIF89a"),
+}
+SNIFF_BYTES = 8
+
+
+class DocumentService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository: DocumentRepository | None = None,
+        course_repository: CourseRepository | None = None,
+        progress_repository: ProgressRepository | None = None,
+        storage: FileStorage | None = None,
+        ingester: DocumentIngestionService | None = None,
+    ):
+        self.repository = repository or DocumentRepository(db)
+        self.course_repository = course_repository or CourseRepository(db)
+        self.progress_repository = progress_repository or ProgressRepository(db)
+        self.storage = storage or document_storage
+        self.ingester = ingester
+
+    async def list_documents(self, course_id: int) -> list[Document]:
+        """Danh sách tài liệu của khóa học"""
+        await self._get_course(course_id)
+        return await self.repository.get_by_course(course_id)
+
+    async def get_document(self, document_id: int) -> Document:
+        document = await self.repository.get_by_id(document_id)
+        if document is None:
+            raise DocumentNotFoundError(document_id)
+        return document
+
+    async def get_readable(self, document_id: int, user_id: int) -> Document:
+        """Tài liệu user được tải: chủ khóa học hoặc học viên đã đăng ký"""
+        document = await self.get_document(document_id)
+        course = await self._get_course(document.course_id)
+        if course.creator_id != user_id and (
+            await self.progress_repository.get_enrollment(user_id, course.id) is None
+        ):
+            raise CoursePermissionError(course.id)
+        return document
+
+    def path_of(self, document: Document) -> Path:
+        return self.storage.root / document.file_path
+
+    async def size_of(self, document: Document) -> int:
+        if document.file_size is not None:
+            return document.file_size
+        return await self.storage.size(self.path_of(document))
+
+    async def upload(
+        self,
+        course_id: int,
+        user_id: int,
+        filename: str,
+        chunks: AsyncIterable[bytes],
+        name: str | None = None,
+    ) -> Document:
+        """Upload tài liệu (Owner).
+
+        The body is hashed and written to disk as it arrives; the content
+        must start with the signature of its extension. Text is chunked for
+        the tutor in the background afterwards.
+        """
+        course = await self._get_course(course_id)
+        if course.creator_id != user_id:
+            raise CoursePermissionError(course_id)
+        extension = PurePath(filename).suffix.lower().lstrip(".")
+        signatures = FILE_SIGNATURES.get(extension)
+        if signatures is None:
+            raise UnsupportedFileTypeError(extension)
+
+        stored = await self.storage.save(_check_signature(chunks, signatures))
+        try:
+            document = await self.repository.create(
+                {
+                    "course_id": course_id,
+                    "name": name or filename,
+                    "file_path": str(stored.path.relative_to(self.storage.root)),
+                    "file_type": extension,
+                    "file_size": stored.size,
+                    "sha256": stored.sha256,
+                }
+            )
+        except Exception:
+            await self._release(stored.sha256)
+            raise
+        if self.ingester is not None:
+            await self.ingester.schedule_document(document.id)
+        return document
+
+    async def delete_document(self, document_id: int, user_id: int) -> None:
+        """Xóa tài liệu (Owner); file chỉ bị xóa khi không còn tài liệu nào dùng"""
+        document = await self.get_document(document_id)
+        course = await self._get_course(document.course_id)
+        if course.creator_id != user_id:
+            raise CoursePermissionError(course.id)
+        await self.repository.delete(document_id)
+        await self._release(document.sha256)
+
+    async def _release(self, sha256: str) -> None:
+        if await self.repository.count_by_sha(sha256) == 0:
+            await self.storage.delete(sha256)
+
+    async def _get_course(self, course_id: int) -> Course:
+        course = await self.course_repository.get_by_id(course_id)
+        if course is None:
+            raise CourseNotFoundError(course_id)
+        return course
+
+
+async def _check_signature(
+    chunks: AsyncIterable[bytes], signatures: tuple[bytes, ...]
+) -> AsyncIterator[bytes]:
+    """Pass `chunks` through, rejecting the upload if its first bytes don't match"""
+    head = b""
+    checked = False
+    async for chunk in chunks:
+        if not checked:
+            head += chunk
+            if len(head) < SNIFF_BYTES:
+                continue
+            _match(head, signatures)
+            checked = True
+            chunk = head
+        yield chunk
+    if not checked:
+        _match(head, signatures)
+        yield head
+
+
+def _match(head: bytes, signatures: tuple[bytes, ...]) -> None:
+    if not head.startswith(signatures):
+        raise UnsupportedFileTypeError("content does not match the file extension")
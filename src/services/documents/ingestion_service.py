@@ -0,0 +1,107 @@
+import logging
+
+import anyio
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.database import AsyncSessionLocal
+from src.lib.jobs import JobQueue, job_queue
+from src.lib.retrieval import chunk_text
+from src.lib.storage import FileStorage, document_storage
+from src.lib.text_extraction import extract_text
+from src.repositories.documents.chunk_repository import ChunkRepository
+from src.repositories.documents.document_repository import DocumentRepository
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentIngestionService:
+    """Split lessons and uploaded documents into retrieval chunks.
+
+    Queued after an upload or lesson import (tasks `documents.ingest` and
+    `documents.ingest_lessons`): extracts the text (in a worker thread),
+    chunks it and replaces that source's rows in `document_chunks`. Only the
+    changed source is rewritten; CourseRetriever picks the difference up on
+    its next lookup. Runs use their own DB session.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        storage: FileStorage | None = None,
+        queue: JobQueue = job_queue,
+    ):
+        self.session_factory = session_factory
+        self._storage = storage
+        self.queue = queue
+
+    @property
+    def storage(self) -> FileStorage:
+        return self._storage or document_storage
+
+    async def schedule_document(self, document_id: int) -> None:
+        """Queue chunking of a document"""
+        await self._enqueue("documents.ingest", document_id)
+
+    async def schedule_lessons(self, course_id: int) -> None:
+        """Queue chunking of a course's not-yet-indexed lessons"""
+        await self._enqueue("documents.ingest_lessons", course_id)
+
+    async def _enqueue(self, task: str, source_id: int) -> None:
+        try:
+            await self.queue.enqueue(
+                task, source_id, idempotency_key=f"{task}:{source_id}"
+            )
+        except RedisError:
+            # Left for `python -m src.jobs.reindex_documents`
+            logger.warning("Could not queue %s for %s", task, source_id)
+
+    async def ingest_document(self, document_id: int) -> int:
+        """(Re)chunk one document; returns the number of chunks written"""
+        async with self.session_factory() as db:
+            document = await DocumentRepository(db).get_by_id(document_id)
+            if document is None:
+                return 0
+            text = await anyio.to_thread.run_sync(
+                extract_text,
+                self.storage.root / document.file_path,
+                document.file_type,
+            )
+            return await ChunkRepository(db).replace_source(
+                document.course_id,
+                chunk_text(f"{document.name}\n{text}"),
+                document_id=document.id,
+            )
+
+    async def ingest_lessons(self, course_id: int, rebuild: bool = False) -> int:
+        """Chunk lessons of a course that have no chunks yet (all if `rebuild`)"""
+        async with self.session_factory() as db:
+            repository = ChunkRepository(db)
+            written = 0
+            lessons = await repository.get_lessons_to_index(course_id, rebuild)
+            for lesson in lessons:
+                written += await repository.replace_source(
+                    course_id,
+                    chunk_text(f"{lesson.title}\n{lesson.content}"),
+                    lesson_id=lesson.id,
+                )
+            return written
+
+
+document_ingester = DocumentIngestionService()
+
+
+def get_document_ingester() -> DocumentIngestionService | None:
+    """FastAPI dependency; None when ingestion is disabled"""
+    return document_ingester if settings.DOCUMENT_INGESTION_ENABLED else None
+
+
+@job_queue.task("documents.ingest", queue="documents")
+async def ingest_document_task(document_id: int) -> None:
+    await document_ingester.ingest_document(document_id)
+
+
+@job_queue.task("documents.ingest_lessons", queue="documents")
+async def ingest_lessons_task(course_id: int) -> None:
+    await document_ingester.ingest_lessons(course_id)
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.lib.cache import TTLCache
+from src.lib.retrieval import BM25Index, IndexedChunk
+from src.repositories.documents.chunk_repository import ChunkRepository
+
+
+@dataclass
+class _CourseIndex:
+    signature: tuple[int, int]
+    index: BM25Index
+
+
+# course_id -> BM25 index of its chunks, refreshed by diff when stale
+retrieval_index_cache = TTLCache(
+    maxsize=settings.RETRIEVAL_INDEX_MAX_COURSES, ttl=3600, name="retrieval_index"
+)
+
+
+class CourseRetriever:
+    """Top-k lesson/document chunks of a course for a question.
+
+    Each worker keeps a BM25 index per course in memory. A lookup costs one
+    aggregate query (the chunk signature); when chunks were added or
+    deleted since, only the changed rows are loaded and applied to the
+    index instead of rebuilding it.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        chunk_repository: ChunkRepository | None = None,
+        cache: TTLCache = retrieval_index_cache,
+    ):
+        self.chunk_repository = chunk_repository or ChunkRepository(db)
+        self.cache = cache
+
+    async def search(
+        self, course_id: int, query: str, k: int = settings.RETRIEVAL_TOP_K
+    ) -> list[IndexedChunk]:
+        index = await self.get_index(course_id)
+        return [chunk for _, chunk in index.search(query, k)]
+
+    async def get_index(self, course_id: int) -> BM25Index:
+        signature = await self.chunk_repository.signature(course_id)
+        cached: _CourseIndex | None = self.cache.get(course_id)
+        if cached is not None and cached.signature == signature:
+            return cached.index
+
+        index = cached.index if cached is not None else BM25Index()
+        if signature[0] == 0:
+            index = BM25Index()
+        else:
+            ids = await self.chunk_repository.get_ids(course_id)
+            for chunk_id in index.chunks.keys() - ids:
+                index.remove(chunk_id)
+            for row in await self.chunk_repository.get_rows(ids - index.chunks.keys()):
+                index.add(
+                    IndexedChunk(
+                        id=row.id,
+                        content=row.content,
+                        length=row.length,
+                        meta={
+                            "lesson_id": row.lesson_id,
+                            "document_id": row.document_id,
+                        },
+                    ),
+                    row.terms,
+                )
+        self.cache.set(course_id, _CourseIndex(signature, index))
+        return index
@@ -0,0 +1,85 @@
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.courses import CourseNotFoundError, CoursePermissionError
+from src.exceptions.lessons import LessonImportTooLargeError
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.lessons.lesson_import_repository import LessonImportRepository
+from src.schemas.lesson import LessonImport, LessonImportResponse
+from src.services.documents.ingestion_service import DocumentIngestionService
+
+IMPORT_BATCH_SIZE = 100
+MAX_IMPORT_LESSONS = 2000
+
+
+class LessonImportService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        import_repository: LessonImportRepository | None = None,
+        course_repository: CourseRepository | None = None,
+        ingester: DocumentIngestionService | None = None,
+    ):
+        self.import_repository = import_repository or LessonImportRepository(db)
+        self.course_repository = course_repository or CourseRepository(db)
+        self.ingester = ingester
+
+    async def import_lessons(
+        self,
+        course_id: int,
+        user_id: int,
+        lessons: Iterable[LessonImport] | AsyncIterable[LessonImport],
+    ) -> LessonImportResponse:
+        """Import cây bài học/quiz trong 1 transaction, ghi theo từng batch.
+
+        `lessons` may be an async iterable (NDJSON upload) so large imports
+        are validated and written batch by batch without buffering the whole
+        document. Any error rolls the whole import back.
+        """
+        course = await self.course_repository.get_by_id(course_id)
+        if course is None:
+            raise CourseNotFoundError(course_id)
+        if course.creator_id != user_id:
+            raise CoursePermissionError(course_id)
+
+        result = LessonImportResponse(course_id=course_id)
+        batch: list[LessonImport] = []
+        try:
+            async for lesson in _aiter(lessons):
+                batch.append(lesson)
+                if result.lessons + len(batch) > MAX_IMPORT_LESSONS:
+                    raise LessonImportTooLargeError(
+                        f"At most {MAX_IMPORT_LESSONS} lessons per import"
+                    )
+                if len(batch) == IMPORT_BATCH_SIZE:
+                    await self._write(course_id, batch, result)
+                    batch = []
+            if batch:
+                await self._write(course_id, batch, result)
+        except Exception:
+            await self.import_repository.rollback()
+            raise
+
+        await self.import_repository.commit(course_id)
+        if self.ingester is not None:
+            await self.ingester.schedule_lessons(course_id)
+        return result
+
+    async def _write(
+        self, course_id: int, batch: list[LessonImport], result: LessonImportResponse
+    ) -> None:
+        counts = await self.import_repository.insert_batch(course_id, batch)
+        for table, count in counts.items():
+            setattr(result, table, getattr(result, table) + count)
+
+
+async def _aiter(
+    items: Iterable[LessonImport] | AsyncIterable[LessonImport],
+) -> AsyncIterator[LessonImport]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
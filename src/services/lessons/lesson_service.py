@@ -0,0 +1,46 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.courses import CourseNotFoundError, CoursePermissionError
+from src.exceptions.lessons import LessonNotFoundError
+from src.models.lesson import Lesson
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.lessons.lesson_repository import LessonRepository
+from src.services.documents.ingestion_service import DocumentIngestionService
+
+
+class LessonService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository: LessonRepository | None = None,
+        course_repository: CourseRepository | None = None,
+        ingester: DocumentIngestionService | None = None,
+    ):
+        self.repository = repository or LessonRepository(db)
+        self.course_repository = course_repository or CourseRepository(db)
+        self.ingester = ingester
+
+    async def list_lessons(self, course_id: int) -> list[Lesson]:
+        """Danh sách bài học của khóa học theo thứ tự hiển thị"""
+        if await self.course_repository.get_by_id(course_id) is None:
+            raise CourseNotFoundError(course_id)
+        return await self.repository.get_by_course(course_id)
+
+    async def update_lesson(
+        self, lesson_id: int, user_id: int, data: dict[str, Any]
+    ) -> Lesson:
+        """Cập nhật bài học (Owner); nội dung mới được chia chunk lại ở nền"""
+        lesson = await self.repository.get_by_id(lesson_id)
+        if lesson is None:
+            raise LessonNotFoundError(lesson_id)
+        course = await self.course_repository.get_by_id(lesson.course_id)
+        if course is None or course.creator_id != user_id:
+            raise CoursePermissionError(lesson.course_id)
+        updated = await self.repository.update(lesson_id, data)
+        if updated is None:
+            raise LessonNotFoundError(lesson_id)
+        if self.ingester is not None and data.keys() & {"title", "content"}:
+            await self.ingester.schedule_lessons(updated.course_id)
+        return updated
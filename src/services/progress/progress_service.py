@@ -0,0 +1,70 @@
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.lessons import LessonNotFoundError
+from src.exceptions.progress import NotEnrolledError
+from src.repositories.lessons.lesson_repository import LessonRepository
+from src.repositories.progress.progress_repository import ProgressRepository
+from src.schemas.progress import CourseProgressResponse, ProgressOverviewResponse
+
+
+class ProgressService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        repository: ProgressRepository | None = None,
+        lesson_repository: LessonRepository | None = None,
+    ):
+        self.repository = repository or ProgressRepository(db)
+        self.lesson_repository = lesson_repository or LessonRepository(db)
+
+    async def overview(self, user_id: int) -> ProgressOverviewResponse:
+        """Tiến độ tổng quan của user"""
+        courses = [
+            _course_progress(row)
+            for row in await self.repository.get_summaries(user_id)
+        ]
+        return ProgressOverviewResponse(
+            total_courses=len(courses),
+            completed_courses=sum(c.completed for c in courses),
+            total_lessons=sum(c.total_lessons for c in courses),
+            completed_lessons=sum(c.completed_lessons for c in courses),
+            courses=courses,
+        )
+
+    async def course_progress(
+        self, user_id: int, course_id: int
+    ) -> CourseProgressResponse:
+        """Tiến độ của user trong 1 khóa học"""
+        rows = await self.repository.get_summaries(user_id, course_id)
+        if not rows:
+            raise NotEnrolledError(course_id)
+        return _course_progress(rows[0])
+
+    async def complete_lesson(
+        self, user_id: int, lesson_id: int
+    ) -> CourseProgressResponse:
+        """Đánh dấu hoàn thành bài học (gọi lại nhiều lần không đếm trùng)"""
+        lesson = await self.lesson_repository.get_by_id(lesson_id)
+        if lesson is None:
+            raise LessonNotFoundError(lesson_id)
+        if await self.repository.get_enrollment(user_id, lesson.course_id) is None:
+            raise NotEnrolledError(lesson.course_id)
+
+        await self.repository.mark_completed(user_id, lesson)
+        return await self.course_progress(user_id, lesson.course_id)
+
+
+def _course_progress(row: Row) -> CourseProgressResponse:
+    enrollment, title, total = row
+    # Bounded so a counter drifting ahead of a lesson delete never shows >100%
+    completed = min(enrollment.completed_lessons, total)
+    return CourseProgressResponse(
+        course_id=enrollment.course_id,
+        course_title=title,
+        total_lessons=total,
+        completed_lessons=completed,
+        progress=completed * 100 // total if total else 0,
+        completed=total > 0 and completed == total,
+        last_activity_at=enrollment.last_activity_at,
+    )
@@ -0,0 +1,154 @@
+"""
+Quiz grading on a compiled answer key.
+
+A quiz is compiled once per version into flat arrays: each choice question's
+correct answers become one bitmask, fill_blank answers a set of normalized
+strings, points a weight vector. A submission is then a row of selected-answer
+masks, so grading one submission or a whole class is a handful of numpy ops
+with no per-question queries.
+"""
+
+import unicodedata
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy.engine import Row
+
+from src.lib.cache import TTLCache
+from src.schemas.quiz import AnswerSubmission
+
+TEXT_TYPES = frozenset({"fill_blank"})
+# Bit 63 marks a selected answer that belongs to another question (or none),
+# so it can never equal a key mask
+MAX_CHOICES = 63
+_FOREIGN_BIT = 1 << MAX_CHOICES
+
+# Compiled keys by (quiz_id, version); a question/answer write bumps the version
+compiled_quiz_cache = TTLCache(maxsize=1024, ttl=3600, name="compiled_quiz")
+
+
+def normalize_text(text: str) -> str:
+    """Form used to compare fill_blank answers: NFKC, casefolded, single spaces"""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+@dataclass(frozen=True)
+class CompiledQuiz:
+    quiz_id: int
+    version: int
+    question_ids: np.ndarray  # int64 (Q,)
+    points: np.ndarray  # int64 (Q,)
+    correct_masks: np.ndarray  # uint64 (Q,), 0 for fill_blank
+    is_text: np.ndarray  # bool (Q,)
+    positions: dict[int, int]  # question_id -> index
+    answer_bits: dict[int, tuple[int, int]]  # answer_id -> (index, bit)
+    accepted_text: dict[int, frozenset[str]]  # index -> normalized answers
+    correct_answer_ids: tuple[tuple[int, ...], ...]
+
+    @property
+    def total_points(self) -> int:
+        return int(self.points.sum())
+
+
+@dataclass(frozen=True)
+class GradedSubmission:
+    correct: np.ndarray  # bool (Q,)
+    earned_points: int
+    total_points: int
+
+    @property
+    def score(self) -> int:
+        """Percentage, rounded down"""
+        if self.total_points == 0:
+            return 0
+        return self.earned_points * 100 // self.total_points
+
+
+def compile_quiz(quiz_id: int, version: int, rows: Sequence[Row]) -> CompiledQuiz:
+    """Build the answer key from `QuizRepository.get_answer_key` rows"""
+    positions: dict[int, int] = {}
+    points: list[int] = []
+    types: list[str] = []
+    masks: list[int] = []
+    answer_bits: dict[int, tuple[int, int]] = {}
+    accepted: dict[int, set[str]] = {}
+    correct_ids: list[list[int]] = []
+    choice_counts: list[int] = []
+
+    for row in rows:
+        index = positions.get(row.question_id)
+        if index is None:
+            index = positions[row.question_id] = len(points)
+            points.append(row.points or 0)
+            types.append(row.type)
+            masks.append(0)
+            correct_ids.append([])
+            choice_counts.append(0)
+        if row.answer_id is None:
+            continue
+
+        bit = choice_counts[index]
+        if bit >= MAX_CHOICES:
+            raise ValueError(
+                f"Question {row.question_id} has more than {MAX_CHOICES} answers"
+            )
+        choice_counts[index] += 1
+        answer_bits[row.answer_id] = (index, bit)
+        if not row.is_correct:
+            continue
+        correct_ids[index].append(row.answer_id)
+        if row.type in TEXT_TYPES:
+            accepted.setdefault(index, set()).add(normalize_text(row.content))
+        else:
+            masks[index] |= 1 << bit
+
+    is_text = np.array([t in TEXT_TYPES for t in types], dtype=bool)
+    return CompiledQuiz(
+        quiz_id=quiz_id,
+        version=version,
+        question_ids=np.array(list(positions), dtype=np.int64),
+        points=np.array(points, dtype=np.int64),
+        correct_masks=np.array(masks, dtype=np.uint64),
+        is_text=is_text,
+        positions=positions,
+        answer_bits=answer_bits,
+        accepted_text={i: frozenset(texts) for i, texts in accepted.items()},
+        correct_answer_ids=tuple(tuple(ids) for ids in correct_ids),
+    )
+
+
+def grade_submissions(
+    compiled: CompiledQuiz, submissions: Sequence[Sequence[AnswerSubmission]]
+) -> list[GradedSubmission]:
+    """Grade a batch of submissions of the same quiz.
+
+    Choice questions are all-or-nothing: the selection must equal the key.
+    fill_blank matches any correct answer after normalization. Answers to
+    questions not in the quiz are ignored.
+    """
+    n, q = len(submissions), len(compiled.positions)
+    selected = np.zeros((n, q), dtype=np.uint64)
+    text_ok = np.zeros((n, q), dtype=bool)
+
+    for row, answers in enumerate(submissions):
+        for answer in answers:
+            index = compiled.positions.get(answer.question_id)
+            if index is None:
+                continue
+            if compiled.is_text[index]:
+                text = normalize_text(answer.text_answer or "")
+                text_ok[row, index] = text in compiled.accepted_text.get(index, ())
+                continue
+            mask = 0
+            for answer_id in answer.answer_ids:
+                owner, bit = compiled.answer_bits.get(answer_id, (None, 0))
+                mask |= (1 << bit) if owner == index else _FOREIGN_BIT
+            selected[row, index] = mask
+
+    # A choice question without a correct answer can't be earned
+    choice_ok = (selected == compiled.correct_masks) & (compiled.correct_masks != 0)
+    correct = np.where(compiled.is_text, text_ok, choice_ok)
+    earned = correct.astype(np.int64) @ compiled.points
+    total = compiled.total_points
+    return [GradedSubmission(correct[i], int(earned[i]), total) for i in range(n)]
@@ -0,0 +1,91 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.exceptions.quizzes import QuizAttemptLimitError, QuizNotFoundError
+from src.models.quiz import Quiz, QuizAttempt
+from src.repositories.quizzes.quiz_repository import (
+    QuizAttemptRepository,
+    QuizRepository,
+)
+from src.schemas.quiz import QuestionResult, QuizResult, QuizSubmit
+from src.services.quizzes.quiz_grader import (
+    CompiledQuiz,
+    compile_quiz,
+    compiled_quiz_cache,
+    grade_submissions,
+)
+
+
+class QuizService:
+    def __init__(
+        self,
+        db: AsyncSession,
+        quiz_repository: QuizRepository | None = None,
+        attempt_repository: QuizAttemptRepository | None = None,
+    ):
+        self.quiz_repository = quiz_repository or QuizRepository(db)
+        self.attempt_repository = attempt_repository or QuizAttemptRepository(db)
+
+    async def submit(self, quiz_id: int, user_id: int, data: QuizSubmit) -> QuizResult:
+        """Chấm bài và lưu lần làm quiz"""
+        quiz = await self._get_quiz(quiz_id)
+        if quiz.max_attempts is not None:
+            used = await self.attempt_repository.count_by_user(quiz_id, user_id)
+            if used >= quiz.max_attempts:
+                raise QuizAttemptLimitError(quiz_id)
+
+        compiled = await self.get_answer_key(quiz)
+        graded = grade_submissions(compiled, [data.answers])[0]
+        passed = graded.score >= (quiz.passing_score or 0)
+        attempt = await self.attempt_repository.create(
+            {
+                "user_id": user_id,
+                "quiz_id": quiz_id,
+                "score": graded.score,
+                "earned_points": graded.earned_points,
+                "total_points": graded.total_points,
+                "passed": passed,
+                "answers": data.model_dump(),
+            }
+        )
+
+        selections = {a.question_id: a.answer_ids for a in data.answers}
+        details = [
+            QuestionResult(
+                question_id=int(question_id),
+                correct=bool(graded.correct[i]),
+                selected_answer_ids=selections.get(int(question_id), []),
+                correct_answer_ids=list(compiled.correct_answer_ids[i]),
+                points_earned=int(compiled.points[i]) if graded.correct[i] else 0,
+            )
+            for i, question_id in enumerate(compiled.question_ids)
+        ]
+        return QuizResult(
+            attempt_id=attempt.id,
+            score=graded.score,
+            total_points=graded.total_points,
+            earned_points=graded.earned_points,
+            passed=passed,
+            completed_at=attempt.completed_at,
+            details=details,
+        )
+
+    async def list_attempts(self, quiz_id: int, user_id: int) -> list[QuizAttempt]:
+        """Lịch sử làm quiz của user"""
+        await self._get_quiz(quiz_id)
+        return await self.attempt_repository.get_by_user(quiz_id, user_id)
+
+    async def get_answer_key(self, quiz: Quiz) -> CompiledQuiz:
+        """Compiled key for the quiz's current version, built on first use"""
+        key = (quiz.id, quiz.version)
+        compiled = compiled_quiz_cache.get(key)
+        if compiled is None:
+            rows = await self.quiz_repository.get_answer_key(quiz.id)
+            compiled = compile_quiz(quiz.id, quiz.version, rows)
+            compiled_quiz_cache.set(key, compiled)
+        return compiled
+
+    async def _get_quiz(self, quiz_id: int) -> Quiz:
+        quiz = await self.quiz_repository.get_by_id(quiz_id)
+        if quiz is None:
+            raise QuizNotFoundError(quiz_id)
+        return quiz
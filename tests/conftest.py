@@ -10,19 +10,26 @@ Libraries used:
 - freezegun: Mock datetime
 - factory-boy: Test factories
 - respx: Mock HTTP requests
+- fakeredis: In-memory Redis
 """
 import asyncio
+import os
+from contextlib import contextmanager
 from typing import AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
 from faker import Faker
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from freezegun import api as freezegun
 
-from src.main import app
-from src.core.database import Base, get_db
+# Fail any request that lazy-loads row by row (set before the app is built)
+os.environ.setdefault("DB_QUERY_GUARD", "true")
+
+from src.core.database import Base, get_db  # noqa: E402
+from src.main import app  # noqa: E402
 
 # Initialize Faker
 fake = Faker()
@@ -283,6 +290,35 @@ def mock_email_service(mocker):
     return mock
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def fake_redis(mocker):
+    """Back the shared Redis client with fakeredis and reset in-process caches."""
+    from fakeredis import FakeAsyncRedis
+
+    from src.lib.cache import course_context_cache, current_user_cache
+    from src.lib.http_cache import catalog_cache
+    from src.lib.jwt import verified_token_cache
+    from src.services.documents.retrieval_service import retrieval_index_cache
+    from src.services.quizzes.quiz_grader import compiled_quiz_cache
+
+    local_caches = [
+        course_context_cache.l1,
+        catalog_cache.store.l1,
+        current_user_cache,
+        verified_token_cache,
+        compiled_quiz_cache,
+        retrieval_index_cache,
+    ]
+    redis = FakeAsyncRedis()
+    mocker.patch("src.lib.cache.redis_client", redis)
+    for local_cache in local_caches:
+        local_cache.clear()
+    yield redis
+    for local_cache in local_caches:
+        local_cache.clear()
+    await redis.aclose()
+
+
 @pytest.fixture
 def mock_redis(mocker):
     """Mock Redis cache."""
@@ -302,3 +338,58 @@ def frozen_time(faker: Faker):
     frozen_date = faker.date_time()
     with freeze_time(frozen_date) as frozen:
         yield frozen
+
+
+@pytest.fixture(autouse=True)
+def job_backend(mocker):
+    """Queue background jobs in memory; run them with `run_jobs`."""
+    from src.lib.jobs import MemoryBackend, job_queue
+
+    backend = MemoryBackend()
+    mocker.patch.object(job_queue, "backend", backend)
+    return backend
+
+
+@pytest.fixture
+def run_jobs():
+    """Run the queued jobs until every queue is empty; returns jobs run."""
+    from src.lib.jobs import Worker, job_queue
+
+    async def run() -> int:
+        queues = {task.queue: 1 for task in job_queue.tasks.values()}
+        return await Worker(job_queue, queues).run_until_empty()
+
+    return run
+
+
+@pytest.fixture
+def sql_statements():
+    """Record the SQL sent to the test database inside a `with` block.
+
+    Usage: `with sql_statements() as statements: ...`
+    """
+
+    @contextmanager
+    def record_statements() -> Generator[list[str], None, None]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    return record_statements
+
+
+@pytest.fixture(autouse=True)
+def document_ingester(mocker):
+    """Run document ingestion jobs on the test database."""
+    from src.services.documents.ingestion_service import DocumentIngestionService
+
+    ingester = DocumentIngestionService(session_factory=TestSessionLocal)
+    mocker.patch("src.services.documents.ingestion_service.document_ingester", ingester)
+    return ingester
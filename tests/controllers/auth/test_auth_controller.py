@@ -155,3 +155,48 @@ class TestAuthController:
 
         assert response.status_code == 200
         assert response.json()["name"] == update_data["name"]
+
+    async def test_logout_revokes_token(
+        self,
+        auth_client: AsyncClient,
+        profile_url: str,
+    ):
+        """Test the token is rejected after logout."""
+        await auth_client.get(profile_url)
+
+        response = await auth_client.post("/api/v1/auth/logout")
+
+        assert response.status_code == 204
+        assert (await auth_client.get(profile_url)).status_code == 401
+
+    async def test_deactivated_user_rejected(
+        self,
+        auth_client: AsyncClient,
+        test_user: dict,
+        db_session,
+        profile_url: str,
+    ):
+        """Test deactivation takes effect even with the user cached."""
+        from src.repositories.auth.auth_repository import AuthRepository
+
+        assert (await auth_client.get(profile_url)).status_code == 200
+        await AuthRepository(db_session).update(test_user["id"], {"is_active": False})
+
+        response = await auth_client.get(profile_url)
+
+        assert response.status_code == 401
+
+    async def test_cached_user_skips_user_query(
+        self,
+        auth_client: AsyncClient,
+        profile_url: str,
+        sql_statements,
+    ):
+        """Test a warm request does not load the user again."""
+        await auth_client.get(profile_url)
+
+        with sql_statements() as statements:
+            response = await auth_client.get(profile_url)
+
+        assert response.status_code == 200
+        assert statements == []
@@ -0,0 +1,127 @@
+"""
+Pytest fixtures for chat controller tests.
+"""
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.security import create_access_token, get_password_hash
+
+
+@pytest.fixture(autouse=True)
+def clear_semantic_cache():
+    """Keep cached AI answers from leaking between tests."""
+    from src.lib.ai.semantic_cache import semantic_cache
+
+    semantic_cache.clear()
+    yield
+    semantic_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_ai_router():
+    """Keep provider failures in one test from opening circuits in the next."""
+    from src.lib.ai.router import get_ai_router
+
+    get_ai_router().reset()
+
+
+@pytest_asyncio.fixture(scope="function")
+async def chat_user(db_session: AsyncSession, user_data: dict):
+    """User owning the conversations under test."""
+    from src.repositories.auth.auth_repository import AuthRepository
+
+    return await AuthRepository(db_session).create(
+        {
+            "email": user_data["email"],
+            "password": get_password_hash(user_data["password"]),
+            "name": user_data["name"],
+        }
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def chat_client(client: AsyncClient, chat_user):
+    """HTTP client authenticated as `chat_user`."""
+    client.headers["Authorization"] = f"Bearer {create_access_token(chat_user.id)}"
+    yield client
+
+
+@pytest_asyncio.fixture(scope="function")
+async def conversation(db_session: AsyncSession, chat_user, course_data: dict):
+    """Conversation on a fresh course owned by `chat_user`."""
+    from src.repositories.chat.conversation_repository import ConversationRepository
+    from src.repositories.courses.course_repository import CourseRepository
+
+    course = await CourseRepository(db_session).create(
+        {**course_data, "creator_id": chat_user.id}
+    )
+    return await ConversationRepository(db_session).create(
+        {
+            "user_id": chat_user.id,
+            "course_id": course.id,
+            "title": "Python basics",
+        }
+    )
+
+
+@pytest.fixture
+def mock_ai_stream(mocker):
+    """Mock streaming AI response yielding a few text deltas."""
+    chunks = ["Python ", "là một ", "ngôn ngữ."]
+
+    async def fake_stream(self, messages, system=None):
+        for chunk in chunks:
+            yield chunk
+
+    mocker.patch("src.lib.ai.claude.ClaudeClient.stream", fake_stream)
+    return chunks
+
+
+@pytest_asyncio.fixture(scope="function")
+async def buffered_messages(db_session: AsyncSession, monkeypatch):
+    """Save messages through the write-behind buffer, flushed by hand."""
+    from src.core.config import settings
+    from src.repositories.chat.message_repository import message_buffer
+    from tests.conftest import TestSessionLocal
+
+    monkeypatch.setattr(settings, "CHAT_MESSAGE_DURABILITY", "buffered")
+    monkeypatch.setattr(message_buffer, "session_factory", TestSessionLocal)
+    monkeypatch.setattr(message_buffer, "last_id", 0)
+    yield message_buffer
+    await message_buffer.stop()
+
+
+@pytest.fixture
+def pool_checkouts(client: AsyncClient, monkeypatch):
+    """Serve requests through the real `get_db` and count pool traffic.
+
+    The shared override session never goes back to the pool, which would
+    hide a connection the endpoint forgets to release.
+    """
+    from collections import Counter
+
+    from sqlalchemy import event
+
+    from src.core.database import get_db
+    from src.main import app
+    from tests.conftest import TestSessionLocal, test_engine
+
+    app.dependency_overrides.pop(get_db)
+    monkeypatch.setattr("src.core.database.AsyncSessionLocal", TestSessionLocal)
+    counts: Counter[str] = Counter()
+
+    def on_checkout(*args):
+        counts["checkout"] += 1
+
+    def on_checkin(*args):
+        counts["checkin"] += 1
+
+    pool = test_engine.sync_engine.pool
+    event.listen(pool, "checkout", on_checkout)
+    event.listen(pool, "checkin", on_checkin)
+    yield counts
+    event.remove(pool, "checkout", on_checkout)
+    event.remove(pool, "checkin", on_checkin)
@@ -0,0 +1,406 @@
+"""
+Tests for ChatController.
+
+Covers conversation CRUD, the blocking send endpoint and the SSE
+streaming variant.
+"""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.ai.tokens import count_tokens
+from src.repositories.chat.message_repository import MessageRepository
+
+
+def parse_sse(body: str) -> list[tuple[str, dict]]:
+    """Split an SSE body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.api
+class TestChatController:
+    """Tests for chat endpoints."""
+
+    # ============== CONVERSATIONS ==============
+
+    async def test_create_conversation(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+    ):
+        """Test creating a conversation for an existing course."""
+        response = await chat_client.post(
+            "/api/chat/conversations",
+            json={"course_id": conversation.course_id, "title": "Loops"},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["course_id"] == conversation.course_id
+
+    async def test_create_conversation_course_not_found(
+        self,
+        chat_client: AsyncClient,
+    ):
+        """Test creating a conversation for a missing course."""
+        response = await chat_client.post(
+            "/api/chat/conversations", json={"course_id": 99999}
+        )
+
+        assert response.status_code == 404
+
+    async def test_list_conversations_unauthenticated(
+        self,
+        client: AsyncClient,
+    ):
+        """Test listing conversations without auth fails."""
+        response = await client.get("/api/chat/conversations")
+
+        assert response.status_code == 401
+
+    # ============== MESSAGES ==============
+
+    async def test_send_message(
+        self,
+        db_session: AsyncSession,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_response,
+    ):
+        """Test sending a message returns the saved AI reply."""
+        response = await chat_client.post(
+            f"/api/chat/conversations/{conversation.id}/messages",
+            json={"content": "Python là gì?"},
+        )
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["role"] == "assistant"
+        assert data["content"] == mock_ai_response.return_value
+        saved = await MessageRepository(db_session).get_by_id(data["id"])
+        assert saved.tokens_used == count_tokens(mock_ai_response.return_value)
+
+    async def test_send_message_conversation_not_found(
+        self,
+        chat_client: AsyncClient,
+        mock_ai_response,
+    ):
+        """Test sending to a missing conversation."""
+        response = await chat_client.post(
+            "/api/chat/conversations/99999/messages", json={"content": "Hi"}
+        )
+
+        assert response.status_code == 404
+        mock_ai_response.assert_not_called()
+
+    async def test_send_message_rate_limited(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_response,
+        mocker,
+    ):
+        """Test exceeding the chat limit returns 429 with Retry-After."""
+        from src.lib.rate_limit import RateLimit, chat_rate_limiter
+
+        mocker.patch.object(chat_rate_limiter, "limits", (RateLimit(1, 3600),))
+        url = f"/api/chat/conversations/{conversation.id}/messages"
+
+        first = await chat_client.post(url, json={"content": "Hi"})
+        second = await chat_client.post(f"{url}/stream", json={"content": "Hi"})
+
+        assert first.status_code == 201
+        assert second.status_code == 429
+        assert 0 < int(second.headers["Retry-After"]) <= 3600
+        mock_ai_response.assert_called_once()
+
+    async def test_send_message_reuses_cached_answer(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_response,
+        db_session,
+        chat_user,
+    ):
+        """Test a reworded first question in the same course skips the AI call."""
+        from src.repositories.chat.conversation_repository import (
+            ConversationRepository,
+        )
+
+        other = await ConversationRepository(db_session).create(
+            {"user_id": chat_user.id, "course_id": conversation.course_id}
+        )
+        await chat_client.post(
+            f"/api/chat/conversations/{conversation.id}/messages",
+            json={"content": "Python là gì?"},
+        )
+        response = await chat_client.post(
+            f"/api/chat/conversations/{other.id}/messages",
+            json={"content": "python la gi"},
+        )
+
+        assert response.json()["content"] == mock_ai_response.return_value
+        mock_ai_response.assert_called_once()
+
+    async def test_send_message_providers_down(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_response,
+    ):
+        """Test a canned reply is returned when no AI provider answers."""
+        from src.lib.ai.prompts import FALLBACK_REPLY
+
+        mock_ai_response.side_effect = RuntimeError("provider down")
+
+        response = await chat_client.post(
+            f"/api/chat/conversations/{conversation.id}/messages",
+            json={"content": "Python là gì?"},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["content"] == FALLBACK_REPLY
+
+    async def test_send_message_providers_down_uses_cache(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_response,
+    ):
+        """Test a follow-up falls back to a cached answer when providers fail."""
+        url = f"/api/chat/conversations/{conversation.id}/messages"
+        await chat_client.post(url, json={"content": "Python là gì?"})
+        mock_ai_response.side_effect = RuntimeError("provider down")
+
+        response = await chat_client.post(url, json={"content": "python la gi vay"})
+
+        assert response.json()["content"] == mock_ai_response.return_value
+
+    async def test_list_messages_cursor_pagination(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        db_session,
+    ):
+        """Test walking a history with X-Next-Cursor returns every message once."""
+        from src.repositories.chat.message_repository import MessageRepository
+
+        repo = MessageRepository(db_session)
+        for i in range(7):
+            await repo.create(
+                {"conversation_id": conversation.id, "role": "user", "content": f"{i}"}
+            )
+
+        url = f"/api/chat/conversations/{conversation.id}/messages"
+        contents, params = [], {"limit": 3}
+        while True:
+            response = await chat_client.get(url, params=params)
+            assert response.status_code == 200
+            contents += [m["content"] for m in response.json()]
+            next_cursor = response.headers.get("X-Next-Cursor")
+            if next_cursor is None:
+                break
+            params = {"limit": 3, "cursor": next_cursor}
+
+        assert contents == [str(i) for i in range(7)]
+
+    async def test_list_conversations_cursor_pagination(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        db_session,
+        chat_user,
+    ):
+        """Test conversations page newest first and stop on the last page."""
+        from src.repositories.chat.conversation_repository import (
+            ConversationRepository,
+        )
+
+        newer = await ConversationRepository(db_session).create(
+            {"user_id": chat_user.id, "course_id": conversation.course_id}
+        )
+
+        first = await chat_client.get("/api/chat/conversations", params={"limit": 1})
+        second = await chat_client.get(
+            "/api/chat/conversations",
+            params={"limit": 1, "cursor": first.headers["X-Next-Cursor"]},
+        )
+
+        assert [c["id"] for c in first.json()] == [newer.id]
+        assert [c["id"] for c in second.json()] == [conversation.id]
+        assert "X-Next-Cursor" not in second.headers
+
+    async def test_list_messages_invalid_cursor(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+    ):
+        """Test a garbage cursor is rejected."""
+        response = await chat_client.get(
+            f"/api/chat/conversations/{conversation.id}/messages",
+            params={"cursor": "not-a-cursor"},
+        )
+
+        assert response.status_code == 400
+
+    # ============== STREAMING ==============
+
+    async def test_stream_message(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_stream: list[str],
+    ):
+        """Test streaming sends token events then a done event."""
+        response = await chat_client.post(
+            f"/api/chat/conversations/{conversation.id}/messages/stream",
+            json={"content": "Python là gì?"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        deltas = [data["delta"] for event, data in events if event == "token"]
+        assert deltas == mock_ai_stream
+        assert events[-1][0] == "done"
+
+    async def test_stream_message_saved_once_after_stream(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_stream: list[str],
+    ):
+        """Test the full reply is persisted as a single assistant message."""
+        await chat_client.post(
+            f"/api/chat/conversations/{conversation.id}/messages/stream",
+            json={"content": "Python là gì?"},
+        )
+
+        response = await chat_client.get(
+            f"/api/chat/conversations/{conversation.id}/messages"
+        )
+        messages = response.json()
+        assert [m["role"] for m in messages] == ["user", "assistant"]
+        assert messages[1]["content"] == "".join(mock_ai_stream)
+
+    async def test_stream_message_returns_connection(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_stream: list[str],
+        pool_checkouts,
+    ):
+        """Test the reply saved after the response started releases its session."""
+        response = await chat_client.post(
+            f"/api/chat/conversations/{conversation.id}/messages/stream",
+            json={"content": "Python là gì?"},
+        )
+
+        assert parse_sse(response.text)[-1][0] == "done"
+        assert pool_checkouts["checkout"] > 0
+        assert pool_checkouts["checkin"] == pool_checkouts["checkout"]
+
+    async def test_stream_message_provider_error(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mocker,
+    ):
+        """Test a provider failure mid-stream ends with an error event."""
+
+        async def failing_stream(self, messages, system=None):
+            yield "partial"
+            raise RuntimeError("provider down")
+
+        mocker.patch("src.lib.ai.claude.ClaudeClient.stream", failing_stream)
+
+        response = await chat_client.post(
+            f"/api/chat/conversations/{conversation.id}/messages/stream",
+            json={"content": "Hi"},
+        )
+
+        events = parse_sse(response.text)
+        assert events[-1][0] == "error"
+
+    async def test_stream_message_conversation_not_found(
+        self,
+        chat_client: AsyncClient,
+        mock_ai_stream: list[str],
+    ):
+        """Test streaming to a missing conversation returns 404 before streaming."""
+        response = await chat_client.post(
+            "/api/chat/conversations/99999/messages/stream", json={"content": "Hi"}
+        )
+
+        assert response.status_code == 404
+
+    # ============== BUFFERED MESSAGES ==============
+
+    async def test_send_message_buffered(
+        self,
+        db_session: AsyncSession,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_response,
+        buffered_messages,
+    ):
+        """Test buffered messages are listed before and after their flush."""
+        url = f"/api/chat/conversations/{conversation.id}/messages"
+        response = await chat_client.post(url, json={"content": "Python là gì?"})
+
+        assert response.status_code == 201
+        reply = response.json()
+        repository = MessageRepository(db_session)
+        assert await repository.count() == 0
+        listed = (await chat_client.get(url)).json()
+        assert [m["role"] for m in listed] == ["user", "assistant"]
+        assert listed[1]["id"] == reply["id"]
+
+        assert await buffered_messages.flush() == 2
+        assert await repository.count() == 2
+        flushed = (await chat_client.get(url)).json()
+        assert [(m["id"], m["content"]) for m in flushed] == [
+            (m["id"], m["content"]) for m in listed
+        ]
+
+    async def test_stream_message_buffered(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_stream: list[str],
+        buffered_messages,
+    ):
+        """Test a streamed reply's message_id matches the buffered message."""
+        url = f"/api/chat/conversations/{conversation.id}/messages"
+        response = await chat_client.post(
+            f"{url}/stream", json={"content": "Python là gì?"}
+        )
+
+        done = parse_sse(response.text)[-1][1]
+        messages = (await chat_client.get(url)).json()
+        assert messages[-1]["id"] == done["message_id"]
+        assert messages[-1]["content"] == "".join(mock_ai_stream)
+
+    async def test_delete_conversation_drops_buffered_messages(
+        self,
+        chat_client: AsyncClient,
+        conversation,
+        mock_ai_response,
+        buffered_messages,
+    ):
+        """Test deleting a conversation discards its unflushed messages."""
+        url = f"/api/chat/conversations/{conversation.id}"
+        await chat_client.post(f"{url}/messages", json={"content": "Hi"})
+
+        response = await chat_client.delete(url)
+
+        assert response.status_code == 204
+        assert len(buffered_messages) == 0
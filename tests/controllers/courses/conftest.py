@@ -0,0 +1,59 @@
+"""
+Pytest fixtures for course controller tests.
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest_asyncio.fixture(scope="function")
+async def many_courses(db_session: AsyncSession, user_data: dict) -> list:
+    """Twelve courses alternating between two categories, in id order."""
+    from src.models.course import Course
+    from src.repositories.auth.auth_repository import AuthRepository
+
+    creator = await AuthRepository(db_session).create(
+        {**user_data, "password": "not-a-real-hash"}
+    )
+    courses = [
+        Course(
+            title=f"Course {i}",
+            category="programming" if i % 2 else "design",
+            level="beginner",
+            creator_id=creator.id,
+        )
+        for i in range(12)
+    ]
+    db_session.add_all(courses)
+    await db_session.commit()
+    return courses
+
+
+@pytest_asyncio.fixture(scope="function")
+async def searchable_courses(db_session: AsyncSession, user_data: dict) -> list:
+    """Vietnamese courses for full-text search, indexed by the FTS triggers."""
+    from src.models.course import Course
+    from src.repositories.auth.auth_repository import AuthRepository
+
+    creator = await AuthRepository(db_session).create(
+        {**user_data, "password": "not-a-real-hash"}
+    )
+    rows = [
+        ("Đệ quy trong Python", "Hàm gọi chính nó.", "programming", "intermediate"),
+        ("Python cơ bản", "Biến, vòng lặp và đệ quy.", "programming", "beginner"),
+        ("Thiết kế giao diện", "Màu sắc & bố cục <web>.", "design", "beginner"),
+        ("Cấu trúc dữ liệu", "Danh sách, cây, đồ thị.", "programming", "advanced"),
+    ]
+    courses = [
+        Course(
+            title=title,
+            description=description,
+            category=category,
+            level=level,
+            creator_id=creator.id,
+        )
+        for title, description, category, level in rows
+    ]
+    db_session.add_all(courses)
+    await db_session.commit()
+    return courses
@@ -3,6 +3,7 @@ Tests for CourseController.
 
 Tests CRUD operations for courses with ownership-based access control.
 """
+
 import pytest
 from httpx import AsyncClient
 
@@ -156,6 +157,25 @@ class TestCourseController:
 
         assert response.status_code == 204
 
+    async def test_delete_course_with_conversation(
+        self,
+        auth_client: AsyncClient,
+        conversation_data: dict,
+    ):
+        """Test deleting a course also deletes its conversations."""
+        created = await auth_client.post(
+            "/api/chat/conversations", json=conversation_data
+        )
+        conversation_id = created.json()["id"]
+
+        response = await auth_client.delete(
+            f"/api/v1/courses/{conversation_data['course_id']}"
+        )
+
+        assert response.status_code == 204
+        response = await auth_client.get(f"/api/chat/conversations/{conversation_id}")
+        assert response.status_code == 404
+
     async def test_delete_course_not_owner(
         self,
         client: AsyncClient,
@@ -174,3 +194,206 @@ class TestCourseController:
         response = await auth_client.delete("/api/v1/courses/99999")
 
         assert response.status_code == 404
+
+    # ============== CURSOR PAGINATION ==============
+
+    async def test_list_courses_cursor_walks_every_course_once(
+        self,
+        client: AsyncClient,
+        many_courses: list,
+    ):
+        """Test following next_cursor returns each course exactly once."""
+        ids, params = [], {"size": 5, "category": "programming"}
+        while True:
+            data = (await client.get("/api/v1/courses", params=params)).json()
+            ids += [item["id"] for item in data["items"]]
+            if data["next_cursor"] is None:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        expected = [c.id for c in many_courses if c.category == "programming"]
+        assert ids == expected
+
+    async def test_list_courses_cursor_mode_is_single_keyset_query(
+        self,
+        client: AsyncClient,
+        many_courses: list,
+        sql_statements,
+    ):
+        """Test a cursor page is one keyset query and skips the COUNT."""
+        first = (await client.get("/api/v1/courses", params={"size": 5})).json()
+
+        with sql_statements() as statements:
+            response = await client.get(
+                "/api/v1/courses",
+                params={"size": 5, "cursor": first["next_cursor"]},
+            )
+
+        data = response.json()
+        assert data["items"][0]["id"] == first["items"][-1]["id"] + 1
+        assert data["total"] is None
+        assert data["page"] is None
+        assert len(statements) == 1
+        assert "COURSES.ID > ?" in statements[0].upper()
+
+    async def test_list_courses_cursor_with_count(
+        self,
+        client: AsyncClient,
+        many_courses: list,
+    ):
+        """Test cursor mode reports a total when asked for one."""
+        first = (await client.get("/api/v1/courses", params={"size": 5})).json()
+        response = await client.get(
+            "/api/v1/courses",
+            params={"size": 5, "cursor": first["next_cursor"], "count": "estimated"},
+        )
+
+        assert first["total"] == len(many_courses)
+        assert response.json()["total"] == len(many_courses)
+
+    async def test_list_courses_invalid_cursor(
+        self,
+        client: AsyncClient,
+    ):
+        """Test a malformed cursor is rejected."""
+        response = await client.get("/api/v1/courses?cursor=%%%")
+
+        assert response.status_code == 400
+
+    # ============== SEARCH ==============
+
+    async def test_search_courses_ranks_title_matches_first(
+        self,
+        client: AsyncClient,
+        searchable_courses: list,
+    ):
+        """Test unaccented terms match, title hits rank above description hits."""
+        response = await client.get("/api/v1/courses/search", params={"q": "de quy"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [
+            searchable_courses[0].id,
+            searchable_courses[1].id,
+        ]
+        assert data["total"] == 2
+        assert data["items"][0]["rank"] > data["items"][1]["rank"]
+        assert data["items"][0]["title_highlight"] == (
+            "<mark>Đệ</mark> <mark>quy</mark> trong Python"
+        )
+        assert data["facets"] == {
+            "category": {"programming": 2},
+            "level": {"beginner": 1, "intermediate": 1},
+        }
+
+    async def test_search_courses_prefix_and_filters(
+        self,
+        client: AsyncClient,
+        searchable_courses: list,
+    ):
+        """Test the last term matches as a prefix and filters narrow the hits."""
+        response = await client.get(
+            "/api/v1/courses/search", params={"q": "pyth", "level": "beginner"}
+        )
+
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [searchable_courses[1].id]
+        assert data["facets"]["level"] == {"beginner": 1, "intermediate": 1}
+
+    async def test_search_courses_escapes_highlights(
+        self,
+        client: AsyncClient,
+        searchable_courses: list,
+    ):
+        """Test highlights are HTML-escaped around the <mark> tags."""
+        response = await client.get("/api/v1/courses/search", params={"q": "bố cục"})
+
+        item = response.json()["items"][0]
+        assert item["description_highlight"] == (
+            "Màu sắc &amp; <mark>bố</mark> <mark>cục</mark> &lt;web&gt;."
+        )
+
+    async def test_search_courses_follows_updates(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+    ):
+        """Test an updated title is searchable and the old one is not."""
+        await auth_client.put(
+            f"/api/v1/courses/{test_course['id']}", json={"title": "Giải thuật"}
+        )
+
+        new = await auth_client.get("/api/v1/courses/search", params={"q": "giai"})
+        old = await auth_client.get(
+            "/api/v1/courses/search", params={"q": test_course["title"]}
+        )
+
+        assert [item["id"] for item in new.json()["items"]] == [test_course["id"]]
+        assert old.json()["total"] == 0
+
+    async def test_search_courses_no_terms(
+        self,
+        client: AsyncClient,
+    ):
+        """Test a query without letters or digits returns nothing."""
+        response = await client.get("/api/v1/courses/search", params={"q": '*&"'})
+
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+
+    # ============== HTTP CACHING ==============
+
+    async def test_get_course_not_modified(
+        self,
+        client: AsyncClient,
+        test_course: dict,
+    ):
+        """Test a matching If-None-Match gets an empty 304 with the same ETag."""
+        url = f"/api/v1/courses/{test_course['id']}"
+        first = await client.get(url)
+
+        response = await client.get(
+            url, headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert first.headers["Cache-Control"].startswith("public")
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == first.headers["ETag"]
+
+    async def test_list_courses_served_from_cache(
+        self,
+        client: AsyncClient,
+        many_courses: list,
+        sql_statements,
+    ):
+        """Test a repeated listing runs no SQL at all."""
+        first = await client.get("/api/v1/courses", params={"size": 5})
+
+        with sql_statements() as statements:
+            second = await client.get("/api/v1/courses", params={"size": 5})
+
+        assert statements == []
+        assert second.json() == first.json()
+
+    async def test_course_update_invalidates_cache(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+    ):
+        """Test detail and list responses change after an update."""
+        url = f"/api/v1/courses/{test_course['id']}"
+        detail = await auth_client.get(url)
+        listing = await auth_client.get("/api/v1/courses")
+
+        await auth_client.put(url, json={"title": "Tiêu đề mới"})
+
+        new_detail = await auth_client.get(
+            url, headers={"If-None-Match": detail.headers["ETag"]}
+        )
+        new_listing = await auth_client.get(
+            "/api/v1/courses", headers={"If-None-Match": listing.headers["ETag"]}
+        )
+        assert new_detail.status_code == 200
+        assert new_detail.json()["title"] == "Tiêu đề mới"
+        assert new_listing.json()["items"][0]["title"] == "Tiêu đề mới"
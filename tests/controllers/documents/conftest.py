@@ -0,0 +1,21 @@
+"""
+Pytest fixtures for document controller tests.
+"""
+
+import pytest
+
+PDF_BYTES = b"%PDF-1.7\n" + bytes(range(256)) * 40
+
+
+@pytest.fixture(autouse=True)
+def document_root(tmp_path, monkeypatch):
+    """Store uploads under a per-test directory."""
+    from src.lib.storage import document_storage
+
+    monkeypatch.setattr(document_storage, "root", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def pdf_bytes() -> bytes:
+    return PDF_BYTES
@@ -0,0 +1,327 @@
+"""
+Tests for DocumentController.
+
+Uploads are streamed to content-addressed files; downloads honour ETag and
+Range so resumed transfers only send the missing bytes.
+"""
+
+import io
+import zipfile
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def make_docx(*paragraphs: str) -> bytes:
+    ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{ns}"><w:body>{body}</w:body></w:document>',
+        )
+    return buffer.getvalue()
+
+
+async def _upload(
+    client: AsyncClient, course_id: int, content: bytes, filename="notes.pdf"
+):
+    return await client.post(
+        f"/api/v1/courses/{course_id}/documents",
+        params={"filename": filename},
+        content=content,
+        headers={"Content-Type": "application/octet-stream"},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.api
+class TestDocumentController:
+    """Tests for document endpoints."""
+
+    async def test_upload_and_list(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+        document_root,
+    ):
+        """Test an upload is stored under its sha256 and listed."""
+        response = await _upload(auth_client, test_course["id"], pdf_bytes)
+
+        assert response.status_code == 201
+        data = response.json()
+        assert data["name"] == "notes.pdf"
+        assert data["file_type"] == "pdf"
+        assert data["file_size"] == len(pdf_bytes)
+        stored = [p for p in document_root.rglob("*") if p.is_file()]
+        assert len(stored) == 1
+        assert stored[0].read_bytes() == pdf_bytes
+
+        listed = await auth_client.get(f"/api/v1/courses/{test_course['id']}/documents")
+        assert [d["id"] for d in listed.json()] == [data["id"]]
+
+    async def test_upload_is_chunked_for_retrieval(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        db_session: AsyncSession,
+        run_jobs,
+    ):
+        """Test an uploaded document's text ends up in document_chunks."""
+        from src.models.document import DocumentChunk
+
+        content = make_docx("Đệ quy", "Hàm đệ quy gọi lại chính nó.")
+        response = await _upload(auth_client, test_course["id"], content, "de-quy.docx")
+        assert await run_jobs() == 1
+
+        chunks = (await db_session.scalars(select(DocumentChunk))).all()
+        assert response.status_code == 201
+        assert [chunk.document_id for chunk in chunks] == [response.json()["id"]]
+        assert "Hàm đệ quy gọi lại chính nó." in chunks[0].content
+
+        await auth_client.delete(f"/api/v1/documents/{response.json()['id']}")
+        assert not (await db_session.scalars(select(DocumentChunk))).all()
+
+    async def test_upload_same_content_stored_once(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+        document_root,
+    ):
+        """Test identical uploads share one file."""
+        await _upload(auth_client, test_course["id"], pdf_bytes)
+        await _upload(auth_client, test_course["id"], pdf_bytes, "copy.pdf")
+
+        stored = [p for p in document_root.rglob("*") if p.is_file()]
+        assert len(stored) == 1
+
+    async def test_upload_too_large(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        monkeypatch,
+        document_root,
+    ):
+        """Test a body over the limit is rejected and nothing is kept."""
+        from src.lib.storage import document_storage
+
+        monkeypatch.setattr(document_storage, "max_bytes", 1024)
+
+        async def body():
+            yield b"%PDF-1.7\n"
+            for _ in range(4):
+                yield b"x" * 512
+
+        response = await auth_client.post(
+            f"/api/v1/courses/{test_course['id']}/documents",
+            params={"filename": "big.pdf"},
+            content=body(),
+        )
+
+        assert response.status_code == 413
+        assert not [p for p in document_root.rglob("*") if p.is_file()]
+
+    @pytest.mark.parametrize(
+        "filename,content",
+        [("script.sh", b"#!/bin/sh\n"), ("fake.pdf", b"MZ\x90\x00not a pdf")],
+    )
+    async def test_upload_unsupported_type(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        filename: str,
+        content: bytes,
+    ):
+        """Test disallowed extensions and mismatched content are rejected."""
+        response = await _upload(auth_client, test_course["id"], content, filename)
+
+        assert response.status_code == 415
+
+    async def test_upload_not_owner(
+        self,
+        client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+        db_session: AsyncSession,
+    ):
+        """Test only the course owner can upload."""
+        from src.core.security import create_access_token
+        from src.repositories.auth.auth_repository import AuthRepository
+
+        other = await AuthRepository(db_session).create(
+            {"email": "other@example.com", "password": "x", "name": "Other"}
+        )
+        client.headers["Authorization"] = f"Bearer {create_access_token(other.id)}"
+
+        response = await _upload(client, test_course["id"], pdf_bytes)
+
+        assert response.status_code == 403
+
+    async def test_upload_malformed_content_length(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+    ):
+        """Test a non-numeric Content-Length is a client error."""
+        response = await auth_client.post(
+            f"/api/v1/courses/{test_course['id']}/documents",
+            params={"filename": "notes.pdf"},
+            content=pdf_bytes,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Length": "lots",
+            },
+        )
+
+        assert response.status_code == 400
+
+    async def test_download_with_etag(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+    ):
+        """Test full download, then 304 for a matching If-None-Match."""
+        document = (await _upload(auth_client, test_course["id"], pdf_bytes)).json()
+        url = f"/api/v1/documents/{document['id']}"
+
+        response = await auth_client.get(url)
+
+        assert response.status_code == 200
+        assert response.content == pdf_bytes
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.headers["accept-ranges"] == "bytes"
+        etag = response.headers["etag"]
+
+        cached = await auth_client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    @pytest.mark.parametrize(
+        "range_header,start,end",
+        [
+            ("bytes=100-199", 100, 199),
+            ("bytes=5000-", 5000, None),
+            ("bytes=-10", -10, None),
+        ],
+    )
+    async def test_download_range(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+        range_header: str,
+        start: int,
+        end: int | None,
+    ):
+        """Test a Range request returns only the requested bytes."""
+        document = (await _upload(auth_client, test_course["id"], pdf_bytes)).json()
+
+        response = await auth_client.get(
+            f"/api/v1/documents/{document['id']}", headers={"Range": range_header}
+        )
+
+        expected = pdf_bytes[start : end + 1 if end is not None else None]
+        assert response.status_code == 206
+        assert response.content == expected
+        first = start % len(pdf_bytes)
+        assert response.headers["content-range"] == (
+            f"bytes {first}-{first + len(expected) - 1}/{len(pdf_bytes)}"
+        )
+
+    async def test_download_range_not_satisfiable(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+    ):
+        """Test a range past the end returns 416."""
+        document = (await _upload(auth_client, test_course["id"], pdf_bytes)).json()
+
+        response = await auth_client.get(
+            f"/api/v1/documents/{document['id']}",
+            headers={"Range": f"bytes={len(pdf_bytes)}-"},
+        )
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(pdf_bytes)}"
+
+    async def test_download_stale_if_range_sends_whole_file(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+    ):
+        """Test a Range with an outdated If-Range gets the full file."""
+        document = (await _upload(auth_client, test_course["id"], pdf_bytes)).json()
+
+        response = await auth_client.get(
+            f"/api/v1/documents/{document['id']}",
+            headers={"Range": "bytes=0-9", "If-Range": '"stale"'},
+        )
+
+        assert response.status_code == 200
+        assert response.content == pdf_bytes
+
+    async def test_download_requires_enrollment(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+        db_session: AsyncSession,
+    ):
+        """Test only the owner and enrolled students can download."""
+        from src.core.security import create_access_token
+        from src.repositories.auth.auth_repository import AuthRepository
+
+        document = (await _upload(auth_client, test_course["id"], pdf_bytes)).json()
+        other = await AuthRepository(db_session).create(
+            {"email": "other@example.com", "password": "x", "name": "Other"}
+        )
+        auth_client.headers["Authorization"] = f"Bearer {create_access_token(other.id)}"
+        url = f"/api/v1/documents/{document['id']}"
+
+        assert (await auth_client.get(url)).status_code == 403
+        await auth_client.post(f"/api/v1/courses/{test_course['id']}/enroll")
+        response = await auth_client.get(url)
+        assert response.status_code == 200
+        assert response.content == pdf_bytes
+
+    async def test_download_not_found(self, auth_client: AsyncClient):
+        """Test downloading a missing document."""
+        response = await auth_client.get("/api/v1/documents/99999")
+
+        assert response.status_code == 404
+
+    async def test_download_documented_in_openapi(self, client: AsyncClient):
+        """Test the OpenAPI schema builds with the range-aware download."""
+        response = await client.get("/api/openapi.json")
+
+        assert response.status_code == 200
+        download = response.json()["paths"]["/api/v1/documents/{document_id}"]
+        assert "200" in download["get"]["responses"]
+
+    async def test_delete_keeps_shared_file(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        pdf_bytes: bytes,
+        document_root,
+    ):
+        """Test the file is removed only with its last document."""
+        first = (await _upload(auth_client, test_course["id"], pdf_bytes)).json()
+        second = (await _upload(auth_client, test_course["id"], pdf_bytes)).json()
+
+        response = await auth_client.delete(f"/api/v1/documents/{first['id']}")
+        assert response.status_code == 204
+        assert [p for p in document_root.rglob("*") if p.is_file()]
+
+        await auth_client.delete(f"/api/v1/documents/{second['id']}")
+        assert not [p for p in document_root.rglob("*") if p.is_file()]
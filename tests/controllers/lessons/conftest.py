@@ -0,0 +1,36 @@
+"""
+Pytest fixtures for lesson controller tests.
+"""
+
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.security import create_access_token
+
+
+@pytest_asyncio.fixture(scope="function")
+async def owner(db_session: AsyncSession, user_data: dict):
+    """User owning `owner_course`."""
+    from src.repositories.auth.auth_repository import AuthRepository
+
+    return await AuthRepository(db_session).create(
+        {**user_data, "password": "not-a-real-hash"}
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def owner_client(client: AsyncClient, owner):
+    """HTTP client authenticated as the course owner."""
+    client.headers["Authorization"] = f"Bearer {create_access_token(owner.id)}"
+    yield client
+
+
+@pytest_asyncio.fixture(scope="function")
+async def owner_course(db_session: AsyncSession, owner, course_data: dict):
+    """Course created by `owner`."""
+    from src.repositories.courses.course_repository import CourseRepository
+
+    return await CourseRepository(db_session).create(
+        {**course_data, "creator_id": owner.id}
+    )
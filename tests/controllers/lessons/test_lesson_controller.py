@@ -0,0 +1,244 @@
+"""
+Tests for LessonController.
+
+Covers the cached lesson list, and for bulk import JSON and NDJSON bodies,
+ownership checks, rollback on bad input and the batched statement count.
+"""
+
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.lesson import Lesson
+from src.models.quiz import Answer, Question, Quiz
+
+
+def build_lesson(order: int, questions: int = 2) -> dict:
+    return {
+        "title": f"Bài {order}",
+        "content": "Nội dung",
+        "order": order,
+        "quiz": {
+            "title": f"Quiz {order}",
+            "questions": [
+                {
+                    "content": f"Câu hỏi {q}",
+                    "type": "single_choice",
+                    "points": 1,
+                    "order": q,
+                    "answers": [
+                        {"content": f"Đáp án {a}", "is_correct": a == 1, "order": a}
+                        for a in range(1, 5)
+                    ],
+                }
+                for q in range(1, questions + 1)
+            ],
+        },
+    }
+
+
+async def count_rows(db_session: AsyncSession, model) -> int:
+    return await db_session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.api
+class TestLessonImport:
+    """Tests for POST /api/v1/courses/{id}/lessons/import."""
+
+    async def test_import_json(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+        db_session: AsyncSession,
+    ):
+        """Test importing a JSON document creates the whole tree."""
+        body = {"lessons": [build_lesson(i) for i in range(1, 4)]}
+
+        response = await owner_client.post(
+            f"/api/v1/courses/{owner_course.id}/lessons/import", json=body
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {
+            "course_id": owner_course.id,
+            "lessons": 3,
+            "quizzes": 3,
+            "questions": 6,
+            "answers": 24,
+        }
+        assert await count_rows(db_session, Answer) == 24
+
+    async def test_import_links_children_to_parents(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+        db_session: AsyncSession,
+    ):
+        """Test RETURNING ids map each child to the right parent."""
+        body = {"lessons": [build_lesson(1, questions=1), build_lesson(2, questions=3)]}
+
+        await owner_client.post(
+            f"/api/v1/courses/{owner_course.id}/lessons/import", json=body
+        )
+
+        rows = await db_session.execute(
+            select(Lesson.order, func.count(Question.id))
+            .join(Quiz, Quiz.lesson_id == Lesson.id)
+            .join(Question, Question.quiz_id == Quiz.id)
+            .group_by(Lesson.order)
+            .order_by(Lesson.order)
+        )
+        assert rows.all() == [(1, 1), (2, 3)]
+
+    async def test_import_ndjson(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+    ):
+        """Test importing one lesson per NDJSON line."""
+        body = "\n".join(json.dumps(build_lesson(i)) for i in range(1, 6))
+
+        response = await owner_client.post(
+            f"/api/v1/courses/{owner_course.id}/lessons/import",
+            content=body,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["lessons"] == 5
+
+    async def test_import_ndjson_invalid_line_rolls_back(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+        db_session: AsyncSession,
+    ):
+        """Test a bad line fails the import with its line number."""
+        lines = [json.dumps(build_lesson(1)), json.dumps({"order": 2})]
+
+        response = await owner_client.post(
+            f"/api/v1/courses/{owner_course.id}/lessons/import",
+            content="\n".join(lines),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"]["line"] == 2
+        assert await count_rows(db_session, Lesson) == 0
+
+    async def test_import_invalid_json(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+    ):
+        """Test schema validation of JSON bodies."""
+        response = await owner_client.post(
+            f"/api/v1/courses/{owner_course.id}/lessons/import", json={"lessons": []}
+        )
+
+        assert response.status_code == 422
+
+    async def test_import_not_owner(
+        self,
+        client: AsyncClient,
+        owner_course,
+        db_session: AsyncSession,
+    ):
+        """Test only the course creator can import."""
+        from src.core.security import create_access_token
+        from src.repositories.auth.auth_repository import AuthRepository
+
+        other = await AuthRepository(db_session).create(
+            {"email": "other@example.com", "password": "x", "name": "Other"}
+        )
+        client.headers["Authorization"] = f"Bearer {create_access_token(other.id)}"
+
+        response = await client.post(
+            f"/api/v1/courses/{owner_course.id}/lessons/import",
+            json={"lessons": [build_lesson(1)]},
+        )
+
+        assert response.status_code == 403
+
+    async def test_import_course_not_found(self, owner_client: AsyncClient):
+        """Test importing into a missing course."""
+        response = await owner_client.post(
+            "/api/v1/courses/99999/lessons/import", json={"lessons": [build_lesson(1)]}
+        )
+
+        assert response.status_code == 404
+
+    async def test_import_uses_batched_inserts(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+        sql_statements,
+    ):
+        """Test rows are written in batches, not one statement per row.
+
+        PostgreSQL batches every level's INSERT ... RETURNING; SQLite has no
+        implicit insert sentinel, so SQLAlchemy sends ordered RETURNING
+        inserts per row there and only the answer executemany is batched.
+        """
+        with sql_statements() as statements:
+            await owner_client.post(
+                f"/api/v1/courses/{owner_course.id}/lessons/import",
+                json={"lessons": [build_lesson(i) for i in range(1, 21)]},
+            )
+
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        answer_inserts = [s for s in inserts if s.startswith("INSERT INTO answers")]
+        assert len(answer_inserts) == 1
+        assert len(inserts) < 20 + 20 + 40 + 160
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.api
+class TestLessonList:
+    """Tests for GET /api/v1/courses/{id}/lessons."""
+
+    async def test_list_lessons_in_order(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+    ):
+        """Test lessons are listed in display order, without their content."""
+        body = {"lessons": [build_lesson(2), build_lesson(1)]}
+        await owner_client.post(
+            f"/api/v1/courses/{owner_course.id}/lessons/import", json=body
+        )
+
+        response = await owner_client.get(f"/api/v1/courses/{owner_course.id}/lessons")
+
+        assert response.status_code == 200
+        assert [lesson["title"] for lesson in response.json()] == ["Bài 1", "Bài 2"]
+        assert "content" not in response.json()[0]
+
+    async def test_list_lessons_revalidates_after_import(
+        self,
+        owner_client: AsyncClient,
+        owner_course,
+    ):
+        """Test the ETag holds until an import changes the lesson list."""
+        url = f"/api/v1/courses/{owner_course.id}/lessons"
+        etag = (await owner_client.get(url)).headers["ETag"]
+
+        unchanged = await owner_client.get(url, headers={"If-None-Match": etag})
+        await owner_client.post(f"{url}/import", json={"lessons": [build_lesson(1)]})
+        changed = await owner_client.get(url, headers={"If-None-Match": etag})
+
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert len(changed.json()) == 1
+
+    async def test_list_lessons_course_not_found(self, client: AsyncClient):
+        """Test listing lessons of a missing course."""
+        response = await client.get("/api/v1/courses/99999/lessons")
+
+        assert response.status_code == 404
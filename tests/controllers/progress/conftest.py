@@ -0,0 +1,20 @@
+"""
+Pytest fixtures for progress controller tests.
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest_asyncio.fixture(scope="function")
+async def course_lessons(db_session: AsyncSession, test_course: dict) -> list:
+    """Four lessons of `test_course`, created through the repository."""
+    from src.repositories.lessons.lesson_repository import LessonRepository
+
+    repo = LessonRepository(db_session)
+    return [
+        await repo.create(
+            {"course_id": test_course["id"], "title": f"Bài {i}", "order": i}
+        )
+        for i in range(1, 5)
+    ]
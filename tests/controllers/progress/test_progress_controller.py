@@ -0,0 +1,141 @@
+"""
+Tests for ProgressController and course enrollment.
+
+Progress is read from denormalized counters; these tests check the counters
+follow completions and lesson create/delete.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.api
+class TestProgressController:
+    """Tests for progress endpoints."""
+
+    async def test_enroll(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+    ):
+        """Test enrolling returns 201, enrolling again 200."""
+        url = f"/api/v1/courses/{test_course['id']}/enroll"
+
+        first = await auth_client.post(url)
+        second = await auth_client.post(url)
+
+        assert first.status_code == 201
+        assert second.status_code == 200
+        assert first.json()["id"] == second.json()["id"]
+
+    async def test_enroll_course_not_found(
+        self,
+        auth_client: AsyncClient,
+    ):
+        """Test enrolling in a missing course."""
+        response = await auth_client.post("/api/v1/courses/99999/enroll")
+
+        assert response.status_code == 404
+
+    async def test_complete_lesson_counts_once(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        course_lessons: list,
+    ):
+        """Test completing the same lesson twice counts it once."""
+        await auth_client.post(f"/api/v1/courses/{test_course['id']}/enroll")
+        url = f"/api/v1/progress/lessons/{course_lessons[0].id}/complete"
+
+        await auth_client.post(url)
+        response = await auth_client.post(url)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["completed_lessons"], data["total_lessons"]) == (1, 4)
+        assert data["progress"] == 25
+        assert data["last_activity_at"] is not None
+
+    async def test_complete_lesson_not_enrolled(
+        self,
+        auth_client: AsyncClient,
+        course_lessons: list,
+    ):
+        """Test completing a lesson of a course the user is not enrolled in."""
+        response = await auth_client.post(
+            f"/api/v1/progress/lessons/{course_lessons[0].id}/complete"
+        )
+
+        assert response.status_code == 403
+
+    async def test_complete_lesson_not_found(
+        self,
+        auth_client: AsyncClient,
+    ):
+        """Test completing a missing lesson."""
+        response = await auth_client.post("/api/v1/progress/lessons/99999/complete")
+
+        assert response.status_code == 404
+
+    async def test_course_progress_not_enrolled(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+    ):
+        """Test course progress without an enrollment."""
+        response = await auth_client.get(
+            f"/api/v1/progress/courses/{test_course['id']}"
+        )
+
+        assert response.status_code == 404
+
+    async def test_lesson_create_and_delete_update_counters(
+        self,
+        db_session: AsyncSession,
+        auth_client: AsyncClient,
+        test_course: dict,
+        course_lessons: list,
+    ):
+        """Test adding and deleting lessons keeps totals and completions right."""
+        from src.repositories.lessons.lesson_repository import LessonRepository
+
+        await auth_client.post(f"/api/v1/courses/{test_course['id']}/enroll")
+        for lesson in course_lessons[:2]:
+            await auth_client.post(f"/api/v1/progress/lessons/{lesson.id}/complete")
+        repo = LessonRepository(db_session)
+
+        await repo.create(
+            {"course_id": test_course["id"], "title": "Bài 5", "order": 5}
+        )
+        await repo.delete(course_lessons[0].id)
+
+        response = await auth_client.get(
+            f"/api/v1/progress/courses/{test_course['id']}"
+        )
+        data = response.json()
+        assert (data["completed_lessons"], data["total_lessons"]) == (1, 4)
+
+    async def test_overview_single_query(
+        self,
+        auth_client: AsyncClient,
+        test_course: dict,
+        course_lessons: list,
+        sql_statements,
+    ):
+        """Test the dashboard totals come from one read, with no aggregation."""
+        await auth_client.post(f"/api/v1/courses/{test_course['id']}/enroll")
+        for lesson in course_lessons:
+            await auth_client.post(f"/api/v1/progress/lessons/{lesson.id}/complete")
+        await auth_client.get("/api/v1/progress")
+
+        with sql_statements() as statements:
+            response = await auth_client.get("/api/v1/progress")
+
+        data = response.json()
+        assert (data["total_courses"], data["completed_courses"]) == (1, 1)
+        assert data["courses"][0]["progress"] == 100
+        assert len(statements) == 1
+        assert "USER_PROGRESS" not in statements[0].upper()
@@ -0,0 +1,61 @@
+"""
+Pytest fixtures for quiz controller tests.
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest_asyncio.fixture(scope="function")
+async def quiz(db_session: AsyncSession, test_lesson: dict):
+    """Quiz with one question of each type.
+
+    Correct answers: single "Ngôn ngữ lập trình" (2 pts), multiple "int" +
+    "list" (3 pts), true_false "Đúng" (1 pt), fill_blank "print" (4 pts).
+    """
+    from src.repositories.quizzes.quiz_repository import (
+        AnswerRepository,
+        QuestionRepository,
+        QuizRepository,
+    )
+
+    quiz = await QuizRepository(db_session).create(
+        {
+            "lesson_id": test_lesson["id"],
+            "title": "Quiz: Biến và kiểu dữ liệu",
+            "passing_score": 60,
+            "max_attempts": 2,
+        }
+    )
+    questions = QuestionRepository(db_session)
+    answers = AnswerRepository(db_session)
+    spec = [
+        ("single_choice", 2, [("Ngôn ngữ lập trình", True), ("Hệ điều hành", False)]),
+        ("multiple_choice", 3, [("int", True), ("array", False), ("list", True)]),
+        ("true_false", 1, [("Đúng", True), ("Sai", False)]),
+        ("fill_blank", 4, [("print", True)]),
+    ]
+    ids = {}
+    for order, (type_, points, options) in enumerate(spec, start=1):
+        question = await questions.create(
+            {
+                "quiz_id": quiz.id,
+                "content": f"Câu {order}",
+                "type": type_,
+                "points": points,
+                "order": order,
+            }
+        )
+        ids[type_] = (question.id, [])
+        for answer_order, (content, is_correct) in enumerate(options, start=1):
+            answer = await answers.create(
+                {
+                    "question_id": question.id,
+                    "content": content,
+                    "is_correct": is_correct,
+                    "order": answer_order,
+                }
+            )
+            ids[type_][1].append(answer.id)
+    await db_session.refresh(quiz)
+    return {"id": quiz.id, "questions": ids}
@@ -0,0 +1,175 @@
+"""
+Tests for QuizController.
+
+Covers grading on submit, the attempt limit and attempt history.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def all_correct(quiz: dict) -> dict:
+    q = quiz["questions"]
+    return {
+        "answers": [
+            {
+                "question_id": q["single_choice"][0],
+                "answer_ids": [q["single_choice"][1][0]],
+            },
+            {
+                "question_id": q["multiple_choice"][0],
+                "answer_ids": [q["multiple_choice"][1][2], q["multiple_choice"][1][0]],
+            },
+            {"question_id": q["true_false"][0], "answer_ids": [q["true_false"][1][0]]},
+            {"question_id": q["fill_blank"][0], "text_answer": "  PRINT "},
+        ]
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+@pytest.mark.api
+class TestQuizController:
+    """Tests for quiz endpoints."""
+
+    async def test_submit_all_correct(
+        self,
+        auth_client: AsyncClient,
+        quiz: dict,
+    ):
+        """Test a fully correct submission scores 100."""
+        response = await auth_client.post(
+            f"/api/v1/quizzes/{quiz['id']}/submit", json=all_correct(quiz)
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["score"], data["earned_points"], data["total_points"]) == (
+            100,
+            10,
+            10,
+        )
+        assert data["passed"] is True
+        assert all(d["correct"] for d in data["details"])
+
+    async def test_submit_partial(
+        self,
+        auth_client: AsyncClient,
+        quiz: dict,
+    ):
+        """Test partial multiple choice and a wrong fill_blank earn nothing."""
+        q = quiz["questions"]
+        payload = all_correct(quiz)
+        payload["answers"][1]["answer_ids"] = [q["multiple_choice"][1][0]]
+        payload["answers"][3]["text_answer"] = "echo"
+
+        response = await auth_client.post(
+            f"/api/v1/quizzes/{quiz['id']}/submit", json=payload
+        )
+
+        data = response.json()
+        assert data["earned_points"] == 3
+        assert data["score"] == 30
+        assert data["passed"] is False
+        details = {d["question_id"]: d for d in data["details"]}
+        multiple = details[q["multiple_choice"][0]]
+        assert multiple["correct"] is False
+        assert multiple["points_earned"] == 0
+        assert sorted(multiple["correct_answer_ids"]) == sorted(
+            [q["multiple_choice"][1][0], q["multiple_choice"][1][2]]
+        )
+
+    async def test_submit_answer_of_other_question_is_wrong(
+        self,
+        auth_client: AsyncClient,
+        quiz: dict,
+    ):
+        """Test an answer id from another question never counts as correct."""
+        q = quiz["questions"]
+        payload = all_correct(quiz)
+        payload["answers"][0]["answer_ids"].append(q["true_false"][1][0])
+
+        response = await auth_client.post(
+            f"/api/v1/quizzes/{quiz['id']}/submit", json=payload
+        )
+
+        assert response.json()["earned_points"] == 8
+
+    async def test_submit_quiz_not_found(
+        self,
+        auth_client: AsyncClient,
+    ):
+        """Test submitting to a missing quiz."""
+        response = await auth_client.post(
+            "/api/v1/quizzes/99999/submit", json={"answers": []}
+        )
+
+        assert response.status_code == 404
+
+    async def test_submit_attempt_limit(
+        self,
+        auth_client: AsyncClient,
+        quiz: dict,
+    ):
+        """Test submissions beyond max_attempts are rejected."""
+        url = f"/api/v1/quizzes/{quiz['id']}/submit"
+        for _ in range(2):
+            assert (
+                await auth_client.post(url, json={"answers": []})
+            ).status_code == 200
+
+        response = await auth_client.post(url, json={"answers": []})
+
+        assert response.status_code == 400
+
+    async def test_answer_key_loaded_once(
+        self,
+        auth_client: AsyncClient,
+        quiz: dict,
+        sql_statements,
+    ):
+        """Test a repeat submission grades from the cached key, no key query."""
+        url = f"/api/v1/quizzes/{quiz['id']}/submit"
+        await auth_client.post(url, json={"answers": []})
+
+        with sql_statements() as statements:
+            response = await auth_client.post(url, json=all_correct(quiz))
+
+        assert response.json()["score"] == 100
+        assert not any("FROM QUESTIONS" in s.upper() for s in statements)
+
+    async def test_answer_edit_regrades(
+        self,
+        db_session: AsyncSession,
+        auth_client: AsyncClient,
+        quiz: dict,
+    ):
+        """Test editing an answer bumps the quiz version and drops the cached key."""
+        from src.repositories.quizzes.quiz_repository import AnswerRepository
+
+        url = f"/api/v1/quizzes/{quiz['id']}/submit"
+        await auth_client.post(url, json=all_correct(quiz))
+        fill_blank_answer = quiz["questions"]["fill_blank"][1][0]
+        await AnswerRepository(db_session).update(
+            fill_blank_answer, {"content": "print()"}
+        )
+
+        response = await auth_client.post(url, json=all_correct(quiz))
+
+        assert response.json()["earned_points"] == 6
+
+    async def test_list_attempts(
+        self,
+        auth_client: AsyncClient,
+        quiz: dict,
+    ):
+        """Test attempt history lists the user's attempts, newest first."""
+        url = f"/api/v1/quizzes/{quiz['id']}"
+        await auth_client.post(f"{url}/submit", json={"answers": []})
+        await auth_client.post(f"{url}/submit", json=all_correct(quiz))
+
+        response = await auth_client.get(f"{url}/attempts")
+
+        assert response.status_code == 200
+        assert [a["score"] for a in response.json()] == [100, 0]
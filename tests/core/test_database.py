@@ -0,0 +1,148 @@
+"""
+Tests for engine construction and read-replica routing.
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, String, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from src.core.config import settings
+from src.core.database import RoutingSession, build_engine, primary_reads
+
+RoutingBase = declarative_base()
+
+
+class Item(RoutingBase):
+    __tablename__ = "items"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+
+
+@pytest.fixture
+async def engines():
+    primary = create_async_engine("sqlite+aiosqlite:///:memory:")
+    replica = create_async_engine("sqlite+aiosqlite:///:memory:")
+    for engine in (primary, replica):
+        async with engine.begin() as conn:
+            await conn.run_sync(RoutingBase.metadata.create_all)
+    async with primary.begin() as conn:
+        await conn.execute(insert(Item).values(id=1, name="primary"))
+    async with replica.begin() as conn:
+        await conn.execute(insert(Item).values(id=1, name="replica"))
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+@pytest.mark.unit
+class TestBuildEngine:
+    """Tests for settings-driven engine configuration."""
+
+    def test_postgres_pool_settings(self):
+        """Test pool size and pre-ping come from settings."""
+        engine = build_engine("postgresql+asyncpg://u:p@localhost/db")
+
+        assert engine.pool.size() == settings.DB_POOL_SIZE
+        assert engine.pool._max_overflow == settings.DB_MAX_OVERFLOW
+        assert engine.pool._pre_ping is settings.DB_POOL_PRE_PING
+        assert engine.echo is settings.DB_ECHO
+
+    def test_asyncpg_statement_cache(self):
+        """Test the prepared statement cache size is applied."""
+        engine = build_engine("postgresql+asyncpg://u:p@localhost/db")
+
+        assert engine.url.query["prepared_statement_cache_size"] == str(
+            settings.DB_STATEMENT_CACHE_SIZE
+        )
+
+    def test_sqlite_skips_pool_settings(self):
+        """Test SQLite engines are created without queue-pool arguments."""
+        engine = build_engine("sqlite+aiosqlite:///:memory:")
+
+        assert engine.url.get_backend_name() == "sqlite"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestRoutingSession:
+    """Tests for replica routing."""
+
+    async def test_reads_go_to_replica(self, engines):
+        """Test a plain SELECT is served by the replica."""
+        primary, replica = engines
+        factory = async_sessionmaker(
+            primary,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            replica=replica,
+        )
+
+        async with factory() as session:
+            name = await session.scalar(select(Item.name).where(Item.id == 1))
+
+        assert name == "replica"
+
+    async def test_session_sticks_to_primary_after_write(self, engines):
+        """Test reads after a write see the primary (read-your-writes)."""
+        primary, replica = engines
+        factory = async_sessionmaker(
+            primary,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            replica=replica,
+        )
+
+        async with factory() as session:
+            session.add(Item(id=2, name="new"))
+            await session.flush()
+            names = (await session.scalars(select(Item.name))).all()
+
+        assert sorted(names) == ["new", "primary"]
+
+    async def test_locking_reads_go_to_primary(self, engines):
+        """Test SELECT ... FOR UPDATE is never sent to the replica."""
+        primary, replica = engines
+        factory = async_sessionmaker(
+            primary,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            replica=replica,
+        )
+
+        async with factory() as session:
+            query = select(Item.name).where(Item.id == 1).with_for_update()
+            name = await session.scalar(query)
+
+        assert name == "primary"
+
+    async def test_without_replica_uses_primary(self, engines):
+        """Test routing is a no-op when no replica is configured."""
+        primary, _ = engines
+        factory = async_sessionmaker(
+            primary, class_=AsyncSession, sync_session_class=RoutingSession
+        )
+
+        async with factory() as session:
+            name = await session.scalar(select(Item.name).where(Item.id == 1))
+
+        assert name == "primary"
+
+    async def test_primary_reads_bypass_replica(self, engines):
+        """Test reads inside primary_reads() are served by the primary."""
+        primary, replica = engines
+        factory = async_sessionmaker(
+            primary,
+            class_=AsyncSession,
+            sync_session_class=RoutingSession,
+            replica=replica,
+        )
+
+        async with factory() as session:
+            with primary_reads():
+                inside = await session.scalar(select(Item.name).where(Item.id == 1))
+            after = await session.scalar(select(Item.name).where(Item.id == 1))
+
+        assert inside == "primary"
+        assert after == "replica"
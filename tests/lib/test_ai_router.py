@@ -0,0 +1,350 @@
+"""
+Tests for the AI provider router.
+
+Both providers are real SDK clients talking to local fake servers (respx),
+so failover, timeouts and hedging go through the same HTTP paths as in
+production.
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+import respx
+from anthropic import AsyncAnthropic
+from openai import AsyncOpenAI
+from prometheus_client import REGISTRY
+
+from src.exceptions.ai import AIUnavailableError
+from src.lib.ai.claude import ClaudeClient
+from src.lib.ai.openai_client import OpenAIClient
+from src.lib.ai.router import (
+    COMPLEX,
+    SIMPLE,
+    CircuitBreaker,
+    LLMRouter,
+    Route,
+    classify,
+)
+
+ANTHROPIC_BASE_URL = "https://anthropic.test"
+OPENAI_BASE_URL = "https://openai.test/v1"
+ANTHROPIC_URL = f"{ANTHROPIC_BASE_URL}/v1/messages"
+OPENAI_URL = f"{OPENAI_BASE_URL}/chat/completions"
+QUESTION = [{"role": "user", "content": "Python là gì?"}]
+
+
+def claude_reply(text: str) -> dict:
+    return {
+        "id": "msg_1",
+        "type": "message",
+        "role": "assistant",
+        "model": "claude",
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 1, "output_tokens": 1},
+    }
+
+
+def openai_reply(text: str) -> dict:
+    return {
+        "id": "chat_1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+
+
+def sse(events: list[tuple[str | None, dict | str]]) -> httpx.Response:
+    body = ""
+    for event, data in events:
+        if event:
+            body += f"event: {event}\n"
+        body += f"data: {data if isinstance(data, str) else json.dumps(data)}\n\n"
+    return httpx.Response(
+        200, content=body.encode(), headers={"content-type": "text/event-stream"}
+    )
+
+
+def openai_stream(chunks: list[str]) -> httpx.Response:
+    events = [
+        (
+            None,
+            {
+                "id": "chat_1",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt",
+                "choices": [{"index": 0, "delta": {"content": c}}],
+            },
+        )
+        for c in chunks
+    ]
+    return sse([*events, (None, "[DONE]")])
+
+
+def delayed(seconds: float, response: httpx.Response):
+    async def side_effect(request):
+        await asyncio.sleep(seconds)
+        return response
+
+    return side_effect
+
+
+@pytest.fixture
+def providers():
+    """Fake Anthropic and OpenAI endpoints."""
+    with respx.mock(assert_all_called=False) as mock:
+        yield mock.post(ANTHROPIC_URL), mock.post(OPENAI_URL)
+
+
+@pytest.fixture
+def make_router():
+    """Router over both fake providers; kwargs override its settings."""
+
+    def factory(**kwargs) -> LLMRouter:
+        claude = ClaudeClient(
+            AsyncAnthropic(api_key="test", base_url=ANTHROPIC_BASE_URL, max_retries=0)
+        )
+        openai = OpenAIClient(
+            AsyncOpenAI(api_key="test", base_url=OPENAI_BASE_URL, max_retries=0)
+        )
+        routes = {
+            SIMPLE: [
+                Route("anthropic", claude.with_model("haiku")),
+                Route("openai", openai.with_model("gpt-mini")),
+            ],
+            COMPLEX: [
+                Route("anthropic", claude.with_model("sonnet")),
+                Route("openai", openai.with_model("gpt")),
+            ],
+        }
+        return LLMRouter(routes, **kwargs)
+
+    return factory
+
+
+@pytest.mark.unit
+class TestClassify:
+    """Tests for picking the model tier of a question."""
+
+    @pytest.mark.parametrize(
+        "question",
+        ["Python là gì?", "List comprehension dùng để làm gì?", "What is a tuple?"],
+    )
+    def test_simple(self, question: str):
+        """Test short factual questions go to the cheaper tier."""
+        assert classify([{"role": "user", "content": question}]) == SIMPLE
+
+    @pytest.mark.parametrize(
+        "question",
+        [
+            "Tại sao list lại mutable?",
+            "giai thich giup minh decorator",
+            "Lỗi gì đây:\n```\nfor i in range(3) print(i)\n```",
+            "Mình đang học về đệ quy " * 10,
+        ],
+    )
+    def test_complex(self, question: str):
+        """Test explanations, code and long questions go to the strong tier."""
+        assert classify([{"role": "user", "content": question}]) == COMPLEX
+
+
+@pytest.mark.unit
+class TestCircuitBreaker:
+    """Tests for the per-provider circuit breaker."""
+
+    def test_opens_then_probes(self):
+        """Test the circuit opens after N failures and lets one probe through."""
+        now = [0.0]
+        breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=30, clock=lambda: now[0]
+        )
+
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+        now[0] = 31
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.allow() and not breaker.is_open
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestLLMRouter:
+    """Tests for failover, hedging and model selection."""
+
+    async def test_simple_question_uses_cheap_model(self, providers, make_router):
+        """Test a simple question is sent to the cheaper Claude model."""
+        claude, _ = providers
+        claude.mock(return_value=httpx.Response(200, json=claude_reply("Ngôn ngữ")))
+        tokens = {"provider": "anthropic", "model": "haiku", "direction": "output"}
+        tokens_before = REGISTRY.get_sample_value("llm_tokens_total", tokens) or 0
+
+        reply = await make_router().generate(QUESTION, system="tutor")
+
+        assert reply == "Ngôn ngữ"
+        assert (
+            REGISTRY.get_sample_value("llm_tokens_total", tokens) == tokens_before + 1
+        )
+        body = json.loads(claude.calls.last.request.content)
+        assert body["model"] == "haiku"
+        assert body["system"] == "tutor"
+
+    async def test_fallback_to_openai(self, providers, make_router):
+        """Test a Claude error falls through to OpenAI."""
+        claude, openai = providers
+        claude.mock(return_value=httpx.Response(500, json={"error": {}}))
+        openai.mock(return_value=httpx.Response(200, json=openai_reply("Từ GPT")))
+
+        reply = await make_router().generate(QUESTION, system="tutor")
+
+        assert reply == "Từ GPT"
+        body = json.loads(openai.calls.last.request.content)
+        assert body["model"] == "gpt-mini"
+        assert body["messages"][0] == {"role": "system", "content": "tutor"}
+
+    async def test_open_circuit_skips_provider(self, providers, make_router):
+        """Test a provider with an open circuit is not called at all."""
+        claude, openai = providers
+        claude.mock(return_value=httpx.Response(500, json={"error": {}}))
+        openai.mock(return_value=httpx.Response(200, json=openai_reply("ok")))
+        router = make_router(
+            breakers={"anthropic": CircuitBreaker(failure_threshold=2)}
+        )
+
+        for _ in range(3):
+            assert await router.generate(QUESTION) == "ok"
+
+        assert claude.call_count == 2
+        assert openai.call_count == 3
+
+    async def test_all_providers_down(self, providers, make_router):
+        """Test AIUnavailableError once every provider failed."""
+        claude, openai = providers
+        claude.mock(return_value=httpx.Response(500, json={"error": {}}))
+        openai.mock(return_value=httpx.Response(503, json={"error": {}}))
+
+        with pytest.raises(AIUnavailableError):
+            await make_router().generate(QUESTION)
+
+    async def test_timeout_budget(self, providers, make_router):
+        """Test slow providers are cut off by the per-attempt timeout."""
+        claude, openai = providers
+        claude.mock(side_effect=delayed(5, httpx.Response(200, json=claude_reply(""))))
+        openai.mock(side_effect=delayed(5, httpx.Response(200, json=openai_reply(""))))
+        router = make_router(timeout=0.1, budget=1, hedge=False)
+
+        started = time.monotonic()
+        with pytest.raises(AIUnavailableError):
+            await router.generate(QUESTION)
+
+        assert time.monotonic() - started < 0.5
+
+    async def test_hedged_request_after_p95(self, providers, make_router):
+        """Test a primary slower than its p95 is hedged and the hedge wins."""
+        claude, openai = providers
+        slow = httpx.Response(200, json=claude_reply("chậm"))
+        claude.mock(side_effect=delayed(2, slow))
+        openai.mock(return_value=httpx.Response(200, json=openai_reply("nhanh")))
+        router = make_router(hedge_min_delay=0.05)
+        for _ in range(20):
+            router.routes[SIMPLE][0].latency.add(0.01)
+
+        started = time.monotonic()
+        reply = await router.generate(QUESTION)
+
+        assert reply == "nhanh"
+        assert time.monotonic() - started < 1
+        assert openai.call_count == 1
+        # The slow attempt was cancelled, not counted as a provider failure
+        assert router.breakers["anthropic"].failures == 0
+
+    async def test_no_hedge_without_latency_history(self, providers, make_router):
+        """Test no second request is sent before p95 is known."""
+        claude, openai = providers
+        reply = httpx.Response(200, json=claude_reply("ok"))
+        claude.mock(side_effect=delayed(0.2, reply))
+
+        assert await make_router(hedge_min_delay=0.01).generate(QUESTION) == "ok"
+        assert openai.call_count == 0
+
+    async def test_stream_fails_over_before_first_token(self, providers, make_router):
+        """Test a stream that fails to start is served by the next provider."""
+        claude, openai = providers
+        claude.mock(return_value=httpx.Response(529, json={"error": {}}))
+        openai.mock(return_value=openai_stream(["Py", "thon"]))
+
+        deltas = [delta async for delta in make_router().stream(QUESTION)]
+
+        assert deltas == ["Py", "thon"]
+
+    async def test_stream_from_claude(self, providers, make_router):
+        """Test Claude streaming deltas pass straight through."""
+        claude, _ = providers
+        message = {**claude_reply(""), "content": []}
+        claude.mock(
+            return_value=sse(
+                [
+                    ("message_start", {"type": "message_start", "message": message}),
+                    (
+                        "content_block_start",
+                        {
+                            "type": "content_block_start",
+                            "index": 0,
+                            "content_block": {"type": "text", "text": ""},
+                        },
+                    ),
+                    *[
+                        (
+                            "content_block_delta",
+                            {
+                                "type": "content_block_delta",
+                                "index": 0,
+                                "delta": {"type": "text_delta", "text": text},
+                            },
+                        )
+                        for text in ["Xin ", "chào"]
+                    ],
+                    (
+                        "content_block_stop",
+                        {"type": "content_block_stop", "index": 0},
+                    ),
+                    ("message_stop", {"type": "message_stop"}),
+                ]
+            )
+        )
+
+        deltas = [delta async for delta in make_router().stream(QUESTION)]
+
+        assert deltas == ["Xin ", "chào"]
+
+    async def test_aclose_closes_shared_clients_once(self, mocker):
+        """Test clients derived with with_model() leave closing to the owner."""
+        sdk = AsyncAnthropic(api_key="test", base_url=ANTHROPIC_BASE_URL)
+        close = mocker.patch.object(sdk, "close", mocker.AsyncMock())
+        claude = ClaudeClient(sdk)
+        router = LLMRouter(
+            {
+                SIMPLE: [Route("anthropic", claude.with_model("haiku"))],
+                COMPLEX: [Route("anthropic", claude)],
+            }
+        )
+
+        await router.aclose()
+
+        close.assert_awaited_once()
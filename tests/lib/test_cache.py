@@ -0,0 +1,105 @@
+"""
+Tests for the layered Redis cache helpers.
+"""
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.lib.cache import LayeredCache, TTLCache, decode_payload, encode_payload
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestPayloadEncoding:
+    """Tests for cache payload serialization."""
+
+    def test_small_payload_stored_raw(self):
+        """Test small values skip compression."""
+        payload = encode_payload({"a": 1})
+
+        assert payload.startswith(b"j")
+        assert decode_payload(payload) == {"a": 1}
+
+    def test_large_payload_compressed(self):
+        """Test large values are compressed and round-trip."""
+        value = {"lessons": [{"title": "Bài học số %d" % i} for i in range(100)]}
+
+        payload = encode_payload(value)
+
+        assert payload.startswith(b"z")
+        assert len(payload) < len(str(value))
+        assert decode_payload(payload) == value
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Tests for the in-process L1 cache."""
+
+    def test_entry_expires(self):
+        """Test entries disappear after the TTL."""
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("k", 1)
+        clock.now = 11
+
+        assert cache.get("k") is None
+
+    def test_bounded_size_evicts_lru(self):
+        """Test the least recently used key is evicted."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestLayeredCache:
+    """Tests for the L1 + Redis cache."""
+
+    async def test_set_writes_through_to_redis(self, fake_redis):
+        """Test values land in Redis under the namespaced key."""
+        cache = LayeredCache("course_context", ttl=60)
+
+        await cache.set(1, {"title": "Python"})
+
+        assert await fake_redis.get("course_context:1") is not None
+        assert 0 < await fake_redis.ttl("course_context:1") <= 60
+
+    async def test_get_fills_l1_from_redis(self, fake_redis):
+        """Test a Redis hit populates the in-process layer."""
+        await fake_redis.set("course_context:1", encode_payload({"title": "Python"}))
+        cache = LayeredCache("course_context", ttl=60)
+
+        assert await cache.get(1) == {"title": "Python"}
+        await fake_redis.flushall()
+        assert await cache.get(1) == {"title": "Python"}
+
+    async def test_invalidate_clears_both_layers(self, fake_redis):
+        """Test invalidation removes the L1 and Redis copies."""
+        cache = LayeredCache("course_context", ttl=60)
+        await cache.set(1, {"title": "Python"})
+
+        await cache.invalidate(1)
+
+        assert await cache.get(1) is None
+        assert await fake_redis.exists("course_context:1") == 0
+
+    async def test_redis_down_is_a_miss(self, mocker):
+        """Test Redis errors degrade to cache misses."""
+        client = mocker.AsyncMock()
+        client.get.side_effect = RedisConnectionError("down")
+        cache = LayeredCache("course_context", ttl=60, client=client)
+
+        assert await cache.get(1) is None
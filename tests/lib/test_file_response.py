@@ -0,0 +1,76 @@
+"""
+Tests for Range parsing and the zero-copy path of RangeFileResponse.
+"""
+
+import pytest
+from starlette.datastructures import Headers
+
+from src.lib.file_response import (
+    ZEROCOPY_EXTENSION,
+    RangeFileResponse,
+    etag_matches,
+    parse_range,
+)
+
+
+@pytest.mark.unit
+class TestParseRange:
+    """Tests for parse_range."""
+
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=900-", (900, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=500-5000", (500, 999)),
+            ("bytes=0-1,5-9", None),
+            ("items=0-1", None),
+        ],
+    )
+    def test_parse(self, header: str, expected):
+        """Test satisfiable and ignored ranges."""
+        assert parse_range(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=9-3", "bytes=-0"])
+    def test_unsatisfiable(self, header: str):
+        """Test ranges that can't be served raise."""
+        with pytest.raises(ValueError):
+            parse_range(header, 1000)
+
+    def test_etag_matches_list_and_weak(self):
+        """Test If-None-Match lists and weak validators."""
+        assert etag_matches('"a", W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestRangeFileResponse:
+    """Tests for the ASGI send path."""
+
+    async def test_zerocopy_send_when_server_supports_it(self, tmp_path):
+        """Test the server gets the open file and range instead of bytes."""
+        path = tmp_path / "file.bin"
+        path.write_bytes(b"0123456789")
+        response = RangeFileResponse(
+            path, 10, '"x"', request_headers=Headers({"range": "bytes=2-5"})
+        )
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "extensions": {ZEROCOPY_EXTENSION: {}},
+        }
+        await response(scope, None, send)
+
+        assert sent[0]["status"] == 206
+        assert sent[1]["type"] == ZEROCOPY_EXTENSION
+        assert sent[1]["offset"] == 2
+        assert sent[1]["count"] == 4
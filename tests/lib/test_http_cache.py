@@ -0,0 +1,110 @@
+"""
+Tests for ETags, conditional GET and the versioned response cache.
+"""
+
+import pytest
+from fastapi import Request
+from pydantic import BaseModel
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core import database
+from src.lib.cache import TTLCache
+from src.lib.http_cache import ResponseCache, etag_matches
+from src.lib.responses import JSONAdapter
+
+
+class Item(BaseModel):
+    id: int
+
+
+item_json = JSONAdapter(Item)
+
+
+def make_request(query: bytes = b"", if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/items",
+            "query_string": query,
+            "headers": headers,
+        }
+    )
+
+
+@pytest.mark.unit
+class TestEtagMatches:
+    """Tests for If-None-Match comparison."""
+
+    @pytest.mark.parametrize("header", ['"abc"', 'W/"abc"', '"x", "abc"', "*"])
+    def test_matches(self, header: str):
+        """Test strong, weak, listed and wildcard tags match."""
+        assert etag_matches(header, '"abc"')
+
+    @pytest.mark.parametrize("header", [None, "", '"abd"'])
+    def test_no_match(self, header: str | None):
+        """Test missing or different tags do not match."""
+        assert not etag_matches(header, '"abc"')
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestResponseCache:
+    """Tests for ResponseCache.respond."""
+
+    async def test_versions_invalidate_entries(self, fake_redis):
+        """Test a cached body is reused until its scope version is bumped."""
+        cache = ResponseCache("test", l1=TTLCache())
+        loads = []
+
+        async def load():
+            loads.append(1)
+            return {"id": len(loads)}
+
+        first = await cache.respond(make_request(), ["items"], item_json, load)
+        again = await cache.respond(make_request(), ["items"], item_json, load)
+        other = await cache.respond(make_request(b"page=2"), ["items"], item_json, load)
+        await cache.invalidate("items")
+        fresh = await cache.respond(make_request(), ["items"], item_json, load)
+
+        assert first.body == again.body == b'{"id":1}'
+        assert other.body == b'{"id":2}'
+        assert fresh.body == b'{"id":3}'
+        assert fresh.headers["ETag"] != first.headers["ETag"]
+
+    async def test_cached_bodies_load_from_primary(self, fake_redis, mocker):
+        """Test a body that will be cached is not read from a lagging replica."""
+        client = mocker.AsyncMock()
+        client.mget.side_effect = RedisConnectionError("down")
+        cached = ResponseCache("test", l1=TTLCache())
+        uncached = ResponseCache("test", l1=TTLCache(), client=client)
+        seen = []
+
+        async def load():
+            seen.append(database._primary_reads.get())
+            return {"id": 1}
+
+        await cached.respond(make_request(), ["items"], item_json, load)
+        await uncached.respond(make_request(), ["items"], item_json, load)
+
+        assert seen == [True, False]
+
+    async def test_redis_down_still_answers_304(self, mocker):
+        """Test ETags work without Redis, the body is just recomputed."""
+        client = mocker.AsyncMock()
+        client.mget.side_effect = RedisConnectionError("down")
+        cache = ResponseCache("test", l1=TTLCache(), client=client)
+
+        async def load():
+            return {"id": 1}
+
+        first = await cache.respond(make_request(), ["items"], item_json, load)
+        response = await cache.respond(
+            make_request(if_none_match=first.headers["ETag"]),
+            ["items"],
+            item_json,
+            load,
+        )
+
+        assert response.status_code == 304
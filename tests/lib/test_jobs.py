@@ -0,0 +1,194 @@
+"""
+Tests for the job queue, on both backends.
+
+The Redis backend runs on fakeredis (with Lua support) via the autouse
+`fake_redis` fixture; a fake clock drives retry backoff.
+"""
+
+import asyncio
+
+import pytest
+
+from src.lib.jobs import JobQueue, MemoryBackend, RedisBackend, Worker
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(params=["memory", "redis"])
+def clock_and_queue(request, fake_redis):
+    clock = FakeClock()
+    if request.param == "memory":
+        backend = MemoryBackend(clock=clock)
+    else:
+        backend = RedisBackend(prefix="test-jobs", clock=clock)
+    return clock, JobQueue(backend)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestJobQueue:
+    """Tests for enqueueing, retries and idempotency."""
+
+    async def test_enqueue_and_run(self, clock_and_queue):
+        """Test a queued job runs with its arguments."""
+        _, queue = clock_and_queue
+        calls = []
+
+        @queue.task("add", queue="math")
+        async def add(a, b, scale=1):
+            calls.append((a + b) * scale)
+
+        await queue.enqueue("add", 1, 2, scale=10)
+        processed = await Worker(queue, {"math": 1}).run_until_empty()
+
+        assert processed == 1
+        assert calls == [30]
+
+    async def test_unknown_task_rejected(self, clock_and_queue):
+        """Test enqueueing an unregistered task fails fast."""
+        _, queue = clock_and_queue
+
+        with pytest.raises(ValueError):
+            await queue.enqueue("missing")
+
+    async def test_retry_with_backoff_then_dead_letter(self, clock_and_queue):
+        """Test a failing job waits out its backoff, then is buried."""
+        clock, queue = clock_and_queue
+        attempts = []
+
+        @queue.task("flaky", max_retries=2, backoff=10.0)
+        async def flaky():
+            attempts.append(clock.now)
+            raise RuntimeError("boom")
+
+        await queue.enqueue("flaky", idempotency_key="flaky:1")
+        worker = Worker(queue, {"default": 1})
+
+        assert await worker.run_until_empty() == 1
+        # Not due yet: backoff is 5-10s for the first retry
+        clock.now += 4
+        assert await worker.run_until_empty() == 0
+        clock.now += 6
+        assert await worker.run_until_empty() == 1
+        clock.now += 20
+        assert await worker.run_until_empty() == 1
+        clock.now += 1000
+        assert await worker.run_until_empty() == 0
+
+        assert len(attempts) == 3
+        # Dead-lettered jobs release their key
+        assert await queue.enqueue("flaky", idempotency_key="flaky:1") is not None
+
+    async def test_idempotency_key(self, clock_and_queue):
+        """Test one queued/running job per key; the key frees when it finishes."""
+        _, queue = clock_and_queue
+        calls = []
+
+        @queue.task("once")
+        async def once(n):
+            calls.append(n)
+
+        first = await queue.enqueue("once", 1, idempotency_key="k")
+        second = await queue.enqueue("once", 2, idempotency_key="k")
+        await Worker(queue, {"default": 1}).run_until_empty()
+        third = await queue.enqueue("once", 3, idempotency_key="k")
+
+        assert first is not None and second is None and third is not None
+        assert calls == [1]
+
+    async def test_backend_error_fails_only_the_job(self, clock_and_queue):
+        """Test a failed re-queue is logged and frees the job's key."""
+        _, queue = clock_and_queue
+
+        @queue.task("flaky")
+        async def flaky():
+            raise RuntimeError("boom")
+
+        async def broken_push(job, delay=0.0):
+            raise ConnectionError("backend down")
+
+        await queue.enqueue("flaky", idempotency_key="flaky:1")
+        job = await queue.backend.pop("default", 0)
+        queue.backend.push = broken_push
+
+        assert await Worker(queue, {"default": 1}).process(job) is False
+        del queue.backend.push
+        assert await queue.enqueue("flaky", idempotency_key="flaky:1") is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestWorker:
+    """Tests for the long-running worker loop."""
+
+    async def test_concurrency_limit_per_queue(self):
+        """Test a queue never runs more jobs at once than its limit."""
+        queue = JobQueue(MemoryBackend())
+        running = 0
+        peak = 0
+        done = asyncio.Event()
+        finished = []
+
+        @queue.task("slow", queue="ai")
+        async def slow(n):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            finished.append(n)
+            if len(finished) == 6:
+                done.set()
+
+        for n in range(6):
+            await queue.enqueue("slow", n)
+        worker = Worker(queue, {"ai": 2}, poll_timeout=0.05)
+        run = asyncio.create_task(worker.run())
+        await asyncio.wait_for(done.wait(), 2)
+        worker.stop()
+        await asyncio.wait_for(run, 2)
+
+        assert peak == 2
+        assert sorted(finished) == list(range(6))
+
+    async def test_running_job_key_is_leased(self):
+        """Test a worker dying mid-job frees the key after one lease."""
+        clock = FakeClock()
+        queue = JobQueue(MemoryBackend(clock=clock), lease_ttl=60)
+        started = asyncio.Event()
+
+        @queue.task("hang")
+        async def hang():
+            started.set()
+            await asyncio.Event().wait()
+
+        await queue.enqueue("hang", idempotency_key="hang:1")
+        job = await queue.backend.pop("default", 0)
+        run = asyncio.create_task(Worker(queue, {"default": 1}).process(job))
+        await asyncio.wait_for(started.wait(), 2)
+        # The worker dies: nothing releases the key
+        run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
+
+        clock.now += 59
+        assert await queue.enqueue("hang", idempotency_key="hang:1") is None
+        clock.now += 2
+        assert await queue.enqueue("hang", idempotency_key="hang:1") is not None
+
+    async def test_queue_email(self, mock_email_service, run_jobs):
+        """Test queued emails are sent by the worker, not the caller."""
+        from src.lib.email import queue_email
+
+        await queue_email("student@example.com", "Chào mừng", "Xin chào!")
+        mock_email_service.assert_not_called()
+
+        assert await run_jobs() == 1
+        mock_email_service.assert_awaited_once_with(
+            "student@example.com", "Chào mừng", "Xin chào!"
+        )
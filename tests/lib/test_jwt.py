@@ -0,0 +1,63 @@
+"""
+Tests for access token verification and its in-process cache.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from src.lib import jwt
+from src.lib.jwt import (
+    create_access_token,
+    revoke_access_token,
+    verified_token_cache,
+    verify_access_token,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestVerifyAccessToken:
+    """Tests for cached token verification."""
+
+    async def test_repeat_verification_skips_decode(self, mocker):
+        """Test a verified token is not decoded again."""
+        decode = mocker.spy(jwt, "decode_access_token")
+        token = create_access_token({"sub": "1"})
+
+        first = await verify_access_token(token)
+        second = await verify_access_token(token)
+
+        assert first == second
+        assert first["sub"] == "1"
+        assert decode.call_count == 1
+
+    async def test_cache_entry_expires_with_token(self, mocker):
+        """Test a claim entry never outlives the token's exp."""
+        decode = mocker.spy(jwt, "decode_access_token")
+        token = create_access_token({"sub": "1"}, timedelta(seconds=5))
+        await verify_access_token(token)
+
+        now = verified_token_cache.clock()
+        mocker.patch.object(verified_token_cache, "clock", lambda: now + 6)
+        await verify_access_token(token)
+
+        assert decode.call_count == 2
+
+    async def test_invalid_token(self):
+        """Test a bad signature is rejected and not cached."""
+        token = create_access_token({"sub": "1"}) + "x"
+
+        assert await verify_access_token(token) is None
+        assert verified_token_cache.get(jwt.token_digest(token)) is None
+
+    async def test_revoked_token_rejected_by_other_workers(self):
+        """Test revocation reaches workers that have the claims cached elsewhere."""
+        token = create_access_token({"sub": "1"})
+        await verify_access_token(token)
+
+        await revoke_access_token(token)
+        assert await verify_access_token(token) is None
+
+        verified_token_cache.clear()  # another worker: nothing cached locally
+        assert await verify_access_token(token) is None
@@ -0,0 +1,92 @@
+"""
+Tests for the conversation message archive and the partition helpers.
+"""
+
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.lib.message_archive import MessageArchive
+from src.lib.partitions import (
+    add_months,
+    create_monthly_partitions,
+    month_start,
+    partition_name,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestMessageArchive:
+    """Tests for zstd JSONL archive files."""
+
+    async def test_round_trip(self, tmp_path):
+        """Test rows come back with their ids and timestamps."""
+        archive = MessageArchive(tmp_path, level=3)
+        rows = [
+            {
+                "id": i,
+                "role": "user",
+                "content": "Đệ quy là gì? " * 50,
+                "tokens_used": 12,
+                "created_at": datetime(2026, 1, 2, 3, 4, i, tzinfo=UTC),
+                "conversation_id": 7,
+            }
+            for i in range(3)
+        ]
+
+        size = await archive.write(1234, rows)
+
+        path = archive.path_for(1234)
+        assert path == tmp_path / "1" / "1234.jsonl.zst"
+        assert path.stat().st_size == size < len("".join(r["content"] for r in rows))
+        restored = await archive.read(1234)
+        assert restored == [
+            {k: v for k, v in row.items() if k != "conversation_id"} for row in rows
+        ]
+        assert list(path.parent.iterdir()) == [path]
+
+    async def test_delete_and_missing(self, tmp_path):
+        """Test a deleted archive reads as missing."""
+        archive = MessageArchive(tmp_path)
+        await archive.write(5, [])
+
+        assert await archive.read(5) == []
+        await archive.delete(5)
+        await archive.delete(5)
+        with pytest.raises(FileNotFoundError):
+            await archive.read(5)
+
+
+def test_month_arithmetic():
+    assert month_start(date(2026, 10, 18)) == date(2026, 10, 1)
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name("messages", date(2026, 3, 1)) == "messages_p202603"
+
+
+def test_partition_takes_over_rows_from_default():
+    """Test rows already in the DEFAULT partition move to the new month."""
+    connection = MagicMock()
+    connection.dialect.name = "postgresql"
+    connection.scalars.return_value = []
+    connection.scalar.return_value = True
+
+    created = create_monthly_partitions(
+        connection, "messages", date(2026, 3, 1), date(2026, 3, 1)
+    )
+
+    statements = [str(call.args[0]) for call in connection.execute.call_args_list]
+    assert created == ["messages_p202603"]
+    expected = [
+        "LOCK TABLE messages",
+        "ALTER TABLE messages DETACH PARTITION messages_default",
+        "CREATE TABLE messages_p202603 PARTITION OF messages",
+        "WITH moved AS (DELETE FROM messages_default",
+        "ALTER TABLE messages ATTACH PARTITION messages_default DEFAULT",
+    ]
+    assert len(statements) == len(expected)
+    assert all(
+        sql.startswith(start) for sql, start in zip(statements, expected, strict=True)
+    )
@@ -0,0 +1,85 @@
+"""
+Tests for keyset pagination helpers.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.exceptions.pagination import InvalidCursorError
+from src.lib.pagination import (
+    count_rows,
+    cursor_id,
+    decode_cursor,
+    encode_cursor,
+    split_page,
+)
+from src.models.course import Course
+
+
+@pytest.mark.unit
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        """Test a cursor decodes to the values it was built from."""
+        assert decode_cursor(encode_cursor({"id": 42})) == {"id": 42}
+
+    def test_cursor_id_first_page(self):
+        """Test no cursor means start from the beginning."""
+        assert cursor_id(None) is None
+
+    @pytest.mark.parametrize(
+        "cursor",
+        ["%%%", encode_cursor({"id": "1"}), encode_cursor({"id": True}), "WzFd"],
+    )
+    def test_cursor_id_rejects_bad_cursors(self, cursor):
+        """Test malformed or tampered cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            cursor_id(cursor)
+
+
+@pytest.mark.unit
+class TestSplitPage:
+    """Tests for trimming a limit + 1 fetch."""
+
+    def test_full_page_has_next_cursor(self):
+        """Test an extra row yields a cursor pointing at the last kept row."""
+        rows = [SimpleNamespace(id=i) for i in range(1, 5)]
+
+        items, next_cursor = split_page(rows, 3)
+
+        assert [r.id for r in items] == [1, 2, 3]
+        assert cursor_id(next_cursor) == 3
+
+    def test_last_page_has_no_cursor(self):
+        """Test a short fetch ends the listing."""
+        rows = [SimpleNamespace(id=1)]
+
+        assert split_page(rows, 3) == (rows, None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestCountRows:
+    """Tests for the planner-estimate count."""
+
+    async def test_estimate_inlines_values_with_colons(self):
+        """Test a filter value like ":x" is sent literally, not as a parameter."""
+        result = MagicMock()
+        result.scalar.return_value = [{"Plan": {"Plan Rows": 7}}]
+        connection = AsyncMock()
+        connection.exec_driver_sql.return_value = result
+        db = MagicMock()
+        db.get_bind.return_value.dialect = postgresql.dialect()
+        db.connection = AsyncMock(return_value=connection)
+        query = select(Course).where(Course.category == "c++:x :level")
+
+        assert await count_rows(db, query, estimate=True) == 7
+
+        sql = connection.exec_driver_sql.call_args.args[0]
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT")
+        assert "'c++:x :level'" in sql
@@ -0,0 +1,74 @@
+"""
+Tests for the off-loop password hasher.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from src.lib import password
+from src.lib.password import PasswordHasher
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestPasswordHasher:
+    """Tests for the bounded bcrypt pool."""
+
+    async def test_hash_runs_off_event_loop(self, mocker):
+        """Test bcrypt never runs on the event loop thread."""
+        threads = []
+        mocker.patch(
+            "src.lib.password.hash_password",
+            lambda value: threads.append(threading.current_thread()) or "hashed",
+        )
+
+        assert await password.hash_password_async("secret") == "hashed"
+        assert threads[0] is not threading.main_thread()
+
+    async def test_queue_depth_counts_waiting_calls(self):
+        """Test calls beyond the worker count are reported as queued."""
+        hasher = PasswordHasher(max_workers=1)
+        release = threading.Event()
+        tasks = [asyncio.create_task(hasher.run(release.wait, 5)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        assert hasher.snapshot()["queue_depth"] == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+        snapshot = hasher.snapshot()
+        hasher.shutdown()
+        assert snapshot["queue_depth"] == 0
+        assert snapshot["max_queue_depth"] == 2
+        assert snapshot["completed"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestVerifyAndRehash:
+    """Tests for hash upgrades on verify."""
+
+    async def test_current_hash_is_kept(self):
+        """Test a hash made with the current rounds is not replaced."""
+        hashed = password.hash_password("Test@123456")
+
+        assert await password.verify_and_rehash("Test@123456", hashed) == (True, None)
+
+    async def test_outdated_rounds_are_rehashed(self):
+        """Test a hash made with other rounds comes back upgraded."""
+        old = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("Test@123456")
+
+        valid, new_hash = await password.verify_and_rehash("Test@123456", old)
+
+        assert valid
+        assert not password.needs_rehash(new_hash)
+        assert password.verify_password("Test@123456", new_hash)
+
+    async def test_wrong_password_is_not_rehashed(self):
+        """Test a failed check never produces a new hash."""
+        old = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("Test@123456")
+
+        assert await password.verify_and_rehash("wrong", old) == (False, None)
@@ -0,0 +1,38 @@
+"""
+Tests for the N+1 query guard.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.query_guard import TooManyQueriesError, query_budget
+from src.models.course import Course
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestQueryGuard:
+    """Tests for per-block query budgets."""
+
+    async def test_repeated_select_fails(self, db_session: AsyncSession):
+        """Test the same SELECT in a loop trips the repeat limit."""
+        with pytest.raises(TooManyQueriesError, match="N\\+1"):
+            with query_budget(max_repeats=3):
+                for id in range(5):
+                    await db_session.execute(select(Course).where(Course.id == id))
+
+    async def test_query_limit(self, db_session: AsyncSession):
+        """Test distinct statements still count towards the total."""
+        with query_budget(max_queries=2, max_repeats=10) as budget:
+            await db_session.execute(select(Course.id))
+            await db_session.execute(select(Course.title))
+            with pytest.raises(TooManyQueriesError):
+                await db_session.execute(select(Course.level))
+
+        assert budget.queries == 3
+
+    async def test_outside_budget_not_counted(self, db_session: AsyncSession):
+        """Test statements outside a budget are left alone."""
+        for id in range(10):
+            await db_session.execute(select(Course).where(Course.id == id))
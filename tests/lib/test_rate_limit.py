@@ -0,0 +1,149 @@
+"""
+Tests for the sliding-window rate limiter and its local fallback.
+
+Redis runs on fakeredis (with Lua support) via the autouse `fake_redis`
+fixture; a fake clock drives the windows.
+"""
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.lib.rate_limit import RateLimit, RateLimiter
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_limiter(clock: FakeClock, *limits: RateLimit) -> RateLimiter:
+    return RateLimiter(
+        "test", limits or (RateLimit(2, 60), RateLimit(3, 3600)), clock=clock
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestRateLimiter:
+    """Tests for the Redis sliding-window limiter."""
+
+    async def test_allows_up_to_limit(self):
+        """Test hits within the limit pass and count down `remaining`."""
+        limiter = make_limiter(FakeClock())
+
+        first = await limiter.hit(1)
+        second = await limiter.hit(1)
+        third = await limiter.hit(1)
+
+        assert (first.allowed, first.remaining) == (True, 1)
+        assert (second.allowed, second.remaining) == (True, 0)
+        assert third.allowed is False
+        assert third.retry_after == 60
+
+    async def test_window_slides(self):
+        """Test a slot frees exactly when the oldest hit leaves the window."""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+        await limiter.hit(1)
+        clock.now += 30
+        await limiter.hit(1)
+
+        clock.now += 20
+        denied = await limiter.hit(1)
+        clock.now += 10
+        allowed = await limiter.hit(1)
+
+        assert denied.allowed is False
+        assert denied.retry_after == 10
+        assert allowed.allowed is True
+
+    async def test_longest_window_enforced(self):
+        """Test the hourly limit still applies after the short window clears."""
+        clock = FakeClock()
+        limiter = make_limiter(clock)
+        for _ in range(3):
+            assert (await limiter.hit(1)).allowed
+            clock.now += 61
+
+        result = await limiter.hit(1)
+
+        assert result.allowed is False
+        assert result.retry_after == pytest.approx(3600 - 3 * 61)
+        assert result.retry_after_header == str(3600 - 3 * 61)
+
+    async def test_denied_hits_not_recorded(self):
+        """Test rejected requests don't extend the wait."""
+        clock = FakeClock()
+        limiter = make_limiter(clock, RateLimit(1, 60))
+        await limiter.hit(1)
+
+        for _ in range(5):
+            clock.now += 10
+            await limiter.hit(1)
+        clock.now += 10
+
+        assert (await limiter.hit(1)).allowed is True
+
+    async def test_keys_are_independent(self):
+        """Test one user's hits don't count against another's."""
+        limiter = make_limiter(FakeClock(), RateLimit(1, 60))
+
+        assert (await limiter.hit(1)).allowed is True
+        assert (await limiter.hit(2)).allowed is True
+        assert (await limiter.hit(1)).allowed is False
+
+    async def test_single_round_trip(self, fake_redis, mocker):
+        """Test a check is one EVALSHA once the script is cached."""
+        limiter = make_limiter(FakeClock())
+        await limiter.hit(1)
+        evalsha = mocker.spy(fake_redis, "evalsha")
+        eval_ = mocker.spy(fake_redis, "eval")
+
+        await limiter.hit(1)
+
+        assert evalsha.call_count == 1
+        assert eval_.call_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestRateLimiterFallback:
+    """Tests for the local token bucket used when Redis is down."""
+
+    @pytest.fixture(autouse=True)
+    def redis_down(self, fake_redis, mocker):
+        mocker.patch.object(fake_redis, "evalsha", side_effect=ConnectionError())
+
+    async def test_bucket_limits_burst(self):
+        """Test the bucket allows `limit` hits, then asks to wait."""
+        limiter = make_limiter(FakeClock(), RateLimit(2, 60))
+
+        results = [await limiter.hit(1) for _ in range(3)]
+
+        assert [r.allowed for r in results] == [True, True, False]
+        assert results[2].retry_after == pytest.approx(30)
+
+    async def test_bucket_refills(self):
+        """Test tokens come back at limit/window per second."""
+        clock = FakeClock()
+        limiter = make_limiter(clock, RateLimit(2, 60))
+        await limiter.hit(1)
+        await limiter.hit(1)
+
+        clock.now += 30
+
+        assert (await limiter.hit(1)).allowed is True
+        assert (await limiter.hit(1)).allowed is False
+
+    async def test_all_windows_checked(self):
+        """Test the tightest bucket decides."""
+        limiter = make_limiter(FakeClock(), RateLimit(5, 60), RateLimit(1, 3600))
+
+        assert (await limiter.hit(1)).allowed is True
+        result = await limiter.hit(1)
+
+        assert result.allowed is False
+        assert result.retry_after == pytest.approx(3600)
@@ -0,0 +1,80 @@
+"""
+Tests for chunking and the incremental BM25 index.
+"""
+
+import pytest
+
+from src.lib.retrieval import BM25Index, IndexedChunk, chunk_text, term_counts
+
+
+def build_index(texts: dict[int, str]) -> BM25Index:
+    index = BM25Index()
+    for chunk_id, text in texts.items():
+        add(index, chunk_id, text)
+    return index
+
+
+def add(index: BM25Index, chunk_id: int, text: str) -> None:
+    terms, length = term_counts(text)
+    index.add(IndexedChunk(chunk_id, text, length), terms)
+
+
+@pytest.mark.unit
+class TestChunkText:
+    """Tests for chunk_text."""
+
+    def test_windows_overlap(self):
+        """Test consecutive chunks share `overlap` words and cover the text."""
+        words = [f"w{i}" for i in range(25)]
+
+        chunks = chunk_text(" ".join(words), size=10, overlap=3)
+
+        assert chunks[0].split() == words[:10]
+        assert chunks[1].split()[:3] == words[7:10]
+        assert chunks[-1].split()[-1] == "w24"
+        assert len(chunks) == 4
+
+    def test_short_and_empty_text(self):
+        """Test short text is one chunk and blank text none."""
+        assert chunk_text("một hai ba", size=10, overlap=3) == ["một hai ba"]
+        assert chunk_text("   \n ") == []
+
+
+@pytest.mark.unit
+class TestBM25Index:
+    """Tests for BM25Index."""
+
+    def test_ranks_matching_chunk_first(self):
+        """Test the chunk sharing the rare query terms wins."""
+        index = build_index(
+            {
+                1: "Biến trong Python lưu giá trị",
+                2: "Vòng lặp for trong Python duyệt danh sách",
+                3: "Hàm def trả về giá trị",
+            }
+        )
+
+        results = index.search("vòng lặp FOR", k=2)
+
+        assert [chunk.id for _, chunk in results] == [2]
+
+    def test_incremental_update_matches_rebuild(self):
+        """Test add/remove leaves the same scores as building from scratch."""
+        texts = {
+            1: "python list append",
+            2: "python dict keys values",
+            3: "list comprehension python",
+        }
+        index = build_index({**texts, 4: "dict comprehension"})
+        index.remove(4)
+        add(index, 5, "python list slicing")
+
+        rebuilt = build_index({**texts, 5: "python list slicing"})
+
+        assert index.search("python list", 5) == rebuilt.search("python list", 5)
+        assert "comprehension" in index.postings
+        assert 4 not in index.postings["comprehension"]
+
+    def test_empty_index(self):
+        """Test searching an empty index."""
+        assert BM25Index().search("python", 3) == []
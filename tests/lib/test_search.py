@@ -0,0 +1,37 @@
+"""
+Tests for the full-text search helpers.
+"""
+
+import pytest
+
+from src.lib.search import (
+    SNIPPET_CHARS,
+    highlight,
+    parse_terms,
+    to_fts5_query,
+    to_tsquery,
+)
+
+
+@pytest.mark.unit
+class TestSearchHelpers:
+    """Tests for query parsing and highlighting."""
+
+    def test_parse_terms_folds_and_drops_syntax(self):
+        """Test terms are accent-folded and query operators are stripped."""
+        terms = parse_terms('Đệ QUY" OR -python:*')
+
+        assert terms == ["de", "quy", "or", "python"]
+        assert to_tsquery(terms) == "de & quy & or & python:*"
+        assert to_fts5_query(terms) == '"de" "quy" "or" "python"*'
+
+    def test_highlight_snippet_keeps_window_around_match(self):
+        """Test a long description is cut around the first match, on word edges."""
+        text = "mở đầu " * 40 + "chương về đệ quy " + "kết thúc " * 40
+
+        snippet = highlight(text, ["de", "quy"], snippet=True)
+
+        assert snippet.startswith("…") and snippet.endswith("…")
+        assert "<mark>đệ</mark> <mark>quy</mark>" in snippet
+        assert len(snippet) < SNIPPET_CHARS + 60
+        assert snippet[1:].split()[0] in {"mở", "đầu"}
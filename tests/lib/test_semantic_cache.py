@@ -0,0 +1,220 @@
+"""
+Tests for SemanticAnswerCache.
+
+Pure in-process unit tests; time is driven by a fake clock.
+"""
+
+import pytest
+
+from src.lib.ai.semantic_cache import (
+    HashingEmbedder,
+    SemanticAnswerCache,
+    word_overlap,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> SemanticAnswerCache:
+    return SemanticAnswerCache(
+        threshold=0.6, ttl_seconds=60, max_entries_per_course=2, clock=clock
+    )
+
+
+@pytest.mark.unit
+class TestHashingEmbedder:
+    """Tests for the hashing embedder."""
+
+    def test_embedding_is_unit_length(self):
+        """Test embeddings are L2-normalized."""
+        vector = HashingEmbedder(dim=64).embed("Python là gì?")
+
+        assert vector.shape == (64,)
+        assert abs(float((vector**2).sum()) - 1.0) < 1e-5
+
+    def test_accents_are_folded(self):
+        """Test missing diacritics do not change the embedding."""
+        embedder = HashingEmbedder()
+
+        with_accents = embedder.embed("Vòng lặp for là gì")
+        without_accents = embedder.embed("vong lap for la gi")
+
+        assert float(with_accents @ without_accents) > 0.99
+
+
+@pytest.mark.unit
+class TestWordOverlap:
+    """Tests for the content-word match rule."""
+
+    def overlap(self, cached: str, asked: str) -> float:
+        embedder = HashingEmbedder()
+        return word_overlap(embedder.words(cached), embedder.words(asked))
+
+    def test_filler_words_are_ignored(self):
+        """Test question framing does not count against a match."""
+        assert self.overlap("Python là gì?", "Cho mình hỏi Python là gì vậy?") == 1.0
+
+    def test_typo_counts_as_same_word(self):
+        """Test a misspelled content word still matches."""
+        assert self.overlap("Cài Python thế nào?", "Cài Pyhton thế nào?") == 1.0
+
+    def test_swapped_word_scores_zero(self):
+        """Test replacing a content word is never a match."""
+        assert (
+            self.overlap("Cách thêm phần tử vào list?", "Cách xóa phần tử khỏi list?")
+            == 0.0
+        )
+
+    def test_added_word_lowers_overlap(self):
+        """Test a one-sided extra word is a partial match."""
+        assert self.overlap("Cách đọc file CSV?", "Cách đọc file CSV lớn?") == 0.75
+
+
+@pytest.mark.unit
+class TestSemanticAnswerCache:
+    """Tests for similarity lookup, TTL and LRU eviction."""
+
+    def test_similar_question_hits(self, cache: SemanticAnswerCache):
+        """Test a reworded question returns the cached answer."""
+        cache.set(1, "Python là gì?", "Python là một ngôn ngữ lập trình.")
+
+        assert cache.get(1, "python la gi") == "Python là một ngôn ngữ lập trình."
+        assert cache.stats.hits == 1
+
+    @pytest.mark.parametrize(
+        ("cached", "asked"),
+        [
+            ("Python là gì?", "Cho mình hỏi Python là gì?"),
+            ("Làm sao để cài Python trên Windows?", "Cách cài Python trên Windows?"),
+            ("Cách thêm phần tử vào list?", "Làm sao thêm phần tử vào list?"),
+            ("How do I reverse a list in Python?", "How can I reverse a Python list?"),
+        ],
+    )
+    def test_reworded_question_hits(
+        self, cache: SemanticAnswerCache, cached: str, asked: str
+    ):
+        """Test rewordings with the same content words hit."""
+        cache.set(1, cached, "answer")
+
+        assert cache.get(1, asked) == "answer"
+
+    def test_swapped_verb_misses(self, cache: SemanticAnswerCache):
+        """Test a question asking for a different operation misses."""
+        cache.set(1, "Cách thêm phần tử vào list?", "items.append(x)")
+
+        assert cache.get(1, "Cách xóa phần tử khỏi list?") is None
+
+    def test_explicit_zero_threshold_is_used(self, cache: SemanticAnswerCache):
+        """Test threshold=0.0 overrides the default instead of being ignored."""
+        cache.set(1, "Làm sao để cài Python trên Windows?", "answer")
+
+        assert cache.get(1, "Cài Python trên Windows như thế nào?") is None
+        assert (
+            cache.get(1, "Cài Python trên Windows như thế nào?", threshold=0.0)
+            == "answer"
+        )
+
+    def test_different_question_misses(self, cache: SemanticAnswerCache):
+        """Test an unrelated question is a miss."""
+        cache.set(1, "Python là gì?", "answer")
+
+        assert cache.get(1, "Làm sao để cài đặt Docker trên Windows?") is None
+        assert cache.stats.misses == 1
+
+    def test_other_language_misses(self, cache: SemanticAnswerCache):
+        """Test a question about another language is not served the answer."""
+        cache.set(1, "Cách viết vòng lặp for trong Python?", "for x in items:")
+
+        assert cache.get(1, "Cách viết vòng lặp for trong Java?") is None
+
+    def test_swapped_word_in_long_question_misses(self, cache: SemanticAnswerCache):
+        """Test one swapped word misses even when the similarity is high."""
+        cache.set(
+            1,
+            "Làm sao để đọc một file CSV lớn theo từng dòng trong Python mà không "
+            "tốn nhiều bộ nhớ?",
+            "answer",
+        )
+
+        assert (
+            cache.get(
+                1,
+                "Làm sao để đọc một file CSV lớn theo từng dòng trong Java mà không "
+                "tốn nhiều bộ nhớ?",
+            )
+            is None
+        )
+
+    def test_fallback_accepts_extra_words_only(self, cache: SemanticAnswerCache):
+        """Test the loose lookup allows added words but not swapped ones."""
+        cache.set(1, "Python là gì?", "python")
+        cache.set(2, "Cách thêm phần tử vào list?", "items.append(x)")
+
+        assert cache.get(1, "Python 3 là gì?") is None
+        assert cache.get(1, "Python 3 là gì?", threshold=0.5, min_overlap=0.5) == (
+            "python"
+        )
+        assert (
+            cache.get(2, "Cách thêm phần tử vào tuple?", threshold=0.5, min_overlap=0.5)
+            is None
+        )
+
+    def test_invalidate_course(self, cache: SemanticAnswerCache):
+        """Test invalidation drops only that course's answers."""
+        cache.set(1, "Python là gì?", "answer")
+        cache.set(2, "Python là gì?", "answer")
+
+        cache.invalidate_course(1)
+
+        assert cache.get(1, "Python là gì?") is None
+        assert cache.get(2, "Python là gì?") == "answer"
+
+    def test_cache_is_per_course(self, cache: SemanticAnswerCache):
+        """Test answers are not shared across courses."""
+        cache.set(1, "Python là gì?", "answer")
+
+        assert cache.get(2, "Python là gì?") is None
+
+    def test_entries_expire(self, cache: SemanticAnswerCache, clock: FakeClock):
+        """Test entries are ignored after their TTL."""
+        cache.set(1, "Python là gì?", "answer")
+        clock.now += 61
+
+        assert cache.get(1, "Python là gì?") is None
+
+    def test_lru_eviction(self, cache: SemanticAnswerCache, clock: FakeClock):
+        """Test the least recently used entry is evicted at capacity."""
+        cache.set(1, "Python là gì?", "python")
+        clock.now += 1
+        cache.set(1, "Docker là gì?", "docker")
+        clock.now += 1
+        cache.get(1, "Python là gì?")
+        clock.now += 1
+        cache.set(1, "Kubernetes hoạt động thế nào?", "k8s")
+
+        assert cache.get(1, "Python là gì?") == "python"
+        assert cache.get(1, "Docker là gì?") is None
+        assert cache.stats.evictions == 1
+
+    def test_snapshot_reports_hit_rate(self, cache: SemanticAnswerCache):
+        """Test counters are exposed with a hit rate."""
+        cache.set(1, "Python là gì?", "answer")
+        cache.get(1, "Python là gì?")
+        cache.get(1, "Docker là gì?")
+
+        snapshot = cache.snapshot()
+
+        assert snapshot["hit_rate"] == 0.5
+        assert snapshot["entries"] == 1
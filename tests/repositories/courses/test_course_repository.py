@@ -4,12 +4,45 @@ Tests for CourseRepository.
 Unit tests for data access layer using in-memory SQLite.
 """
 import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.lib.ai.semantic_cache import semantic_cache
+from src.lib.query_guard import query_budget
+from src.models.quiz import Answer
 from src.repositories.courses.course_repository import CourseRepository
 from tests.factories import CourseFactory
 
 
+@pytest_asyncio.fixture(scope="function")
+async def course_tree(db_session: AsyncSession, test_course: dict) -> dict:
+    """Course with 3 lessons, each with a quiz of 2 questions x 2 answers."""
+    from src.models.lesson import Lesson
+    from src.models.quiz import Question, Quiz
+
+    for i in range(3):
+        lesson = Lesson(course_id=test_course["id"], title=f"Lesson {i}", order=i)
+        lesson.quizzes = [
+            Quiz(
+                title=f"Quiz {i}",
+                questions=[
+                    Question(
+                        content=f"Q{j}",
+                        order=j,
+                        answers=[Answer(content="A", order=k) for k in range(2)],
+                    )
+                    for j in range(2)
+                ],
+            )
+        ]
+        db_session.add(lesson)
+    await db_session.commit()
+    # Later loads must come from the database, not the identity map
+    db_session.expunge_all()
+    return test_course
+
+
 @pytest.mark.asyncio
 @pytest.mark.unit
 class TestCourseRepository:
@@ -99,6 +132,19 @@ class TestCourseRepository:
 
         assert updated.title == "Updated Title"
 
+    async def test_update_invalidates_cached_answers(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+    ):
+        """Test editing a course drops its cached tutor answers."""
+        repo = CourseRepository(db_session)
+        semantic_cache.set(test_course["id"], "Python là gì?", "answer")
+
+        await repo.update(test_course["id"], {"description": "Rewritten"})
+
+        assert semantic_cache.get(test_course["id"], "Python là gì?") is None
+
     async def test_delete_course(
         self,
         db_session: AsyncSession,
@@ -148,3 +194,51 @@ class TestCourseRepository:
         count = await repo.count()
 
         assert count >= 1
+
+    # ============== LOADING PROFILES ==============
+
+    async def test_get_by_id_with_profile(
+        self,
+        db_session: AsyncSession,
+        course_tree: dict,
+    ):
+        """Test a profile loads the whole tree with one query per level."""
+        repo = CourseRepository(db_session)
+
+        with query_budget() as budget:
+            course = await repo.get_by_id(course_tree["id"], profile="content")
+
+        # Reading the tree afterwards needs no (async-unsafe) lazy load
+        answers = [
+            answer
+            for lesson in course.lessons
+            for quiz in lesson.quizzes
+            for question in quiz.questions
+            for answer in question.answers
+        ]
+        assert len(answers) == 12
+        assert budget.queries == 6
+
+    async def test_get_by_id_unknown_profile(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+    ):
+        """Test an unknown profile name fails loudly."""
+        repo = CourseRepository(db_session)
+
+        with pytest.raises(ValueError):
+            await repo.get_by_id(test_course["id"], profile="everything")
+
+    async def test_delete_cascades_without_n_plus_one(
+        self,
+        db_session: AsyncSession,
+        course_tree: dict,
+    ):
+        """Test deleting a course loads its tree per level, not per row."""
+        repo = CourseRepository(db_session)
+
+        with query_budget(max_repeats=1):
+            assert await repo.delete(course_tree["id"]) is True
+
+        assert await db_session.scalar(select(func.count()).select_from(Answer)) == 0
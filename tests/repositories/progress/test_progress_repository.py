@@ -0,0 +1,66 @@
+"""
+Tests for ProgressRepository counters and their rebuild.
+"""
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.course import Course
+from src.models.progress import Enrollment
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.lessons.lesson_import_repository import LessonImportRepository
+from src.repositories.lessons.lesson_repository import LessonRepository
+from src.repositories.progress.progress_repository import ProgressRepository
+from src.schemas.lesson import LessonImport
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestProgressRepository:
+    """Tests for the denormalized progress counters."""
+
+    async def test_lesson_import_counts_lessons(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+    ):
+        """Test bulk-imported lessons are added to lesson_count."""
+        repo = LessonImportRepository(db_session)
+        await repo.insert_batch(
+            test_course["id"],
+            [LessonImport(title=f"Bài {i}", order=i) for i in range(3)],
+        )
+        await repo.commit(test_course["id"])
+
+        course = await CourseRepository(db_session).get_by_id(test_course["id"])
+        await db_session.refresh(course)
+        assert course.lesson_count == 3
+
+    async def test_rebuild_repairs_drift(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+        test_user: dict,
+    ):
+        """Test rebuild recomputes both counters from the source tables."""
+        lessons = LessonRepository(db_session)
+        first = await lessons.create(
+            {"course_id": test_course["id"], "title": "Bài 1", "order": 1}
+        )
+        await lessons.create(
+            {"course_id": test_course["id"], "title": "Bài 2", "order": 2}
+        )
+        repo = ProgressRepository(db_session)
+        await repo.enroll(test_user["id"], test_course["id"])
+        await repo.mark_completed(test_user["id"], first)
+        await db_session.execute(update(Course).values(lesson_count=99))
+        await db_session.execute(update(Enrollment).values(completed_lessons=7))
+        await db_session.commit()
+
+        rebuilt = await repo.rebuild(test_course["id"])
+
+        assert rebuilt == 1
+        ((enrollment, _, lesson_count),) = await repo.get_summaries(test_user["id"])
+        await db_session.refresh(enrollment)
+        assert (enrollment.completed_lessons, lesson_count) == (1, 2)
@@ -126,3 +126,27 @@ class TestAuthService:
         # Act & Assert
         with pytest.raises(InvalidCredentialsError):
             await service.login(faker.email(), "SomePassword")
+
+    async def test_login_upgrades_outdated_hash(
+        self,
+        db_session,
+        user_data: dict,
+    ):
+        """Test login re-hashes a password stored with other bcrypt rounds."""
+        from passlib.context import CryptContext
+
+        from src.lib.password import needs_rehash
+        from src.repositories.auth.auth_repository import AuthRepository
+
+        repo = AuthRepository(db_session)
+        old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash(
+            user_data["password"]
+        )
+        user = await repo.create({**user_data, "password": old_hash})
+
+        service = AuthService(db_session, repo)
+        await service.login(user_data["email"], user_data["password"])
+
+        stored = (await repo.get_by_id(user.id)).password
+        assert stored != old_hash
+        assert not needs_rehash(stored)
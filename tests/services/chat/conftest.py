@@ -0,0 +1,88 @@
+"""
+Pytest fixtures for chat service tests.
+"""
+
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest_asyncio.fixture(scope="function")
+async def conversation(db_session: AsyncSession, course_data: dict, user_data: dict):
+    """Conversation on a course owned by a freshly created user."""
+    from src.repositories.auth.auth_repository import AuthRepository
+    from src.repositories.chat.conversation_repository import ConversationRepository
+    from src.repositories.courses.course_repository import CourseRepository
+
+    user = await AuthRepository(db_session).create(
+        {**user_data, "password": "not-a-real-hash"}
+    )
+    course = await CourseRepository(db_session).create(
+        {**course_data, "creator_id": user.id}
+    )
+    return await ConversationRepository(db_session).create(
+        {"user_id": user.id, "course_id": course.id, "title": "Python basics"}
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def add_messages(db_session: AsyncSession, conversation):
+    """Append alternating user/assistant messages to `conversation`."""
+    from src.lib.ai.tokens import count_tokens
+    from src.repositories.chat.message_repository import MessageRepository
+
+    repository = MessageRepository(db_session)
+
+    async def add(count: int, content: str = "Câu hỏi về Python"):
+        messages = []
+        for i in range(count):
+            text = f"{content} #{i}"
+            messages.append(
+                await repository.create(
+                    {
+                        "conversation_id": conversation.id,
+                        "role": "user" if i % 2 == 0 else "assistant",
+                        "content": text,
+                        "tokens_used": count_tokens(text),
+                    }
+                )
+            )
+        return messages
+
+    return add
+
+
+@pytest_asyncio.fixture(scope="function")
+async def archive_root(tmp_path, monkeypatch):
+    """Point the conversation archive at a temp directory."""
+    from src.lib.message_archive import message_archive
+
+    monkeypatch.setattr(message_archive, "root", tmp_path)
+    return tmp_path
+
+
+@pytest_asyncio.fixture(scope="function")
+async def age_conversation(db_session: AsyncSession, conversation):
+    """Backdate `conversation` and its messages to `days` ago."""
+    from datetime import UTC, datetime, timedelta
+
+    from sqlalchemy import update
+
+    from src.models.chat import Conversation, Message
+
+    async def age(days: int):
+        created_at = datetime.now(UTC) - timedelta(days=days)
+        await db_session.execute(
+            update(Conversation)
+            .where(Conversation.id == conversation.id)
+            .values(created_at=created_at)
+        )
+        await db_session.execute(
+            update(Message)
+            .where(Message.conversation_id == conversation.id)
+            .values(created_at=created_at)
+            .execution_options(synchronize_session=False)
+        )
+        await db_session.commit()
+        await db_session.refresh(conversation)
+
+    return age
@@ -0,0 +1,157 @@
+"""
+Tests for ConversationArchiveService and the retention job.
+
+Archives go to a temp directory; the job runs on the shared test session
+factory.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.jobs.archive_conversations import archive_conversations
+from src.lib.message_archive import message_archive
+from src.repositories.chat.conversation_repository import ConversationRepository
+from src.repositories.chat.message_repository import MessageRepository
+from src.services.chat.archive_service import ConversationArchiveService
+from src.services.chat.chat_service import ChatService
+from tests.conftest import TestSessionLocal
+
+
+def days_ago(days: int) -> datetime:
+    return datetime.now(UTC) - timedelta(days=days)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestConversationArchiveService:
+    """Tests for archiving and rehydrating conversations."""
+
+    async def test_archive_moves_messages_to_file(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+        age_conversation,
+        archive_root,
+    ):
+        """Test a cold conversation's messages leave the table for the archive."""
+        messages = await add_messages(6)
+        await age_conversation(200)
+        service = ConversationArchiveService(db_session)
+
+        assert await service.archive_conversation(conversation.id, days_ago(180)) == 6
+
+        await db_session.refresh(conversation)
+        assert conversation.archived_at is not None
+        assert (
+            await MessageRepository(db_session).get_by_conversation(conversation.id)
+            == []
+        )
+        rows = await message_archive.read(conversation.id)
+        assert [row["id"] for row in rows] == [m.id for m in messages]
+        assert rows[0]["content"] == messages[0].content
+        assert message_archive.path_for(conversation.id).is_relative_to(archive_root)
+
+    async def test_archive_skips_active_conversation(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+        age_conversation,
+        archive_root,
+    ):
+        """Test a message since the cutoff keeps the conversation hot."""
+        await add_messages(4)
+        await age_conversation(200)
+        await add_messages(1)
+        service = ConversationArchiveService(db_session)
+
+        assert (
+            await service.archive_conversation(conversation.id, days_ago(180)) is None
+        )
+
+        await db_session.refresh(conversation)
+        assert conversation.archived_at is None
+        assert not message_archive.path_for(conversation.id).exists()
+
+    async def test_rehydrate_restores_messages(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+        age_conversation,
+        archive_root,
+    ):
+        """Test rehydration brings back ids, content and token counts."""
+        messages = await add_messages(6)
+        await age_conversation(200)
+        service = ConversationArchiveService(db_session)
+        await service.archive_conversation(conversation.id, days_ago(180))
+        await db_session.refresh(conversation)
+
+        assert await service.rehydrate(conversation) == 6
+        assert await service.rehydrate(conversation) == 0
+
+        assert conversation.archived_at is None
+        restored = await MessageRepository(db_session).get_by_conversation(
+            conversation.id
+        )
+        assert [(m.id, m.content, m.tokens_used) for m in restored] == [
+            (m.id, m.content, m.tokens_used) for m in messages
+        ]
+        assert not message_archive.path_for(conversation.id).exists()
+
+    async def test_listing_messages_rehydrates(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+        age_conversation,
+        archive_root,
+    ):
+        """Test opening an archived conversation lists its messages as before."""
+        messages = await add_messages(4)
+        await age_conversation(200)
+        await ConversationArchiveService(db_session).archive_conversation(
+            conversation.id, days_ago(180)
+        )
+        await db_session.refresh(conversation)
+        service = ChatService(db_session, AsyncMock())
+
+        items, _ = await service.list_messages(conversation.id, conversation.user_id)
+
+        assert [m.id for m in items] == [m.id for m in messages]
+
+    async def test_job_archives_only_cold_conversations(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+        age_conversation,
+        archive_root,
+    ):
+        """Test the retention job archives idle conversations only."""
+        await add_messages(3)
+        await age_conversation(200)
+        fresh = await ConversationRepository(db_session).create(
+            {"user_id": conversation.user_id, "course_id": conversation.course_id}
+        )
+
+        report = await archive_conversations(
+            after_days=180, session_factory=TestSessionLocal
+        )
+
+        assert (report.conversations, report.messages) == (1, 3)
+        await db_session.refresh(conversation)
+        await db_session.refresh(fresh)
+        assert conversation.archived_at is not None
+        assert fresh.archived_at is None
+
+        # Nothing left to do on the next run
+        report = await archive_conversations(
+            after_days=180, session_factory=TestSessionLocal
+        )
+        assert report.conversations == 0
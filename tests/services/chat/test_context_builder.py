@@ -0,0 +1,140 @@
+"""
+Tests for ChatContextBuilder.
+
+Checks the prompt stays within the token budget and flags when the history
+should be folded into the rolling summary.
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.ai.tokens import count_tokens, message_tokens
+from src.repositories.chat.message_repository import MessageRepository
+from src.services.chat.context_builder import RECENT_MESSAGES_LIMIT, ChatContextBuilder
+from src.services.courses.course_context_service import CourseContextService
+from src.services.documents.retrieval_service import CourseRetriever
+
+
+def make_builder(db: AsyncSession, token_budget: int = 3000) -> ChatContextBuilder:
+    return ChatContextBuilder(
+        MessageRepository(db),
+        CourseContextService(db),
+        CourseRetriever(db),
+        token_budget=token_budget,
+    )
+
+
+def prompt_tokens(prompt) -> int:
+    return count_tokens(prompt.system) + sum(
+        message_tokens(count_tokens(m["content"])) for m in prompt.messages
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestChatContextBuilder:
+    """Tests for token-budgeted prompt assembly."""
+
+    async def test_short_history_is_sent_whole(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+    ):
+        """Test a short conversation goes out unchanged, no summary needed."""
+        await add_messages(4)
+
+        prompt = await make_builder(db_session).build(conversation, "Tiếp theo?")
+
+        assert len(prompt.messages) == 5
+        assert prompt.messages[-1] == {"role": "user", "content": "Tiếp theo?"}
+        assert prompt.needs_summary is False
+
+    async def test_history_trimmed_to_budget(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+    ):
+        """Test older messages are dropped once the budget is spent."""
+        await add_messages(8, content="x" * 400)
+        builder = make_builder(db_session)
+        system_tokens = count_tokens((await builder.build(conversation, "?")).system)
+        builder.token_budget = system_tokens + 3 * message_tokens(101) + 10
+
+        prompt = await builder.build(conversation, "?")
+
+        assert prompt_tokens(prompt) <= builder.token_budget
+        assert prompt.needs_summary is True
+        assert prompt.messages[0]["role"] == "user"
+        assert len(prompt.messages) < 9
+
+    async def test_long_history_needs_summary(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+    ):
+        """Test over RECENT_MESSAGES_LIMIT unsummarized messages asks for a summary."""
+        await add_messages(RECENT_MESSAGES_LIMIT + 2)
+
+        prompt = await make_builder(db_session).build(conversation, "?")
+
+        assert prompt.needs_summary is True
+        assert len(prompt.messages) <= RECENT_MESSAGES_LIMIT + 1
+        assert prompt.messages[0]["role"] == "user"
+
+    async def test_summary_replaces_folded_history(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+    ):
+        """Test summarized messages are dropped; the summary joins the system prompt."""
+        messages = await add_messages(6)
+        conversation.summary = "Học viên đang học vòng lặp for."
+        conversation.summary_until_id = messages[3].id
+
+        prompt = await make_builder(db_session).build(conversation, "?")
+
+        assert "Học viên đang học vòng lặp for." in prompt.system
+        assert [m["content"] for m in prompt.messages[:-1]] == [
+            messages[4].content,
+            messages[5].content,
+        ]
+
+    async def test_relevant_chunks_in_system_prompt(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        document_ingester,
+    ):
+        """Test the chunks matching the question are added, within their budget."""
+        from src.repositories.lessons.lesson_repository import LessonRepository
+
+        repository = LessonRepository(db_session)
+        for order, content in enumerate(
+            [
+                "Vòng lặp while lặp đến khi điều kiện sai.",
+                "Dictionary lưu cặp key-value.",
+            ]
+        ):
+            await repository.create(
+                {
+                    "course_id": conversation.course_id,
+                    "title": f"Bài {order}",
+                    "content": content,
+                    "order": order,
+                }
+            )
+        await document_ingester.ingest_lessons(conversation.course_id)
+        builder = make_builder(db_session)
+
+        prompt = await builder.build(conversation, "Vòng lặp while là gì?")
+
+        assert "Vòng lặp while lặp đến khi điều kiện sai." in prompt.system
+        assert "Dictionary" not in prompt.system
+
+        builder.retrieval_budget = 0
+        prompt = await builder.build(conversation, "Vòng lặp while là gì?")
+        assert "Vòng lặp while lặp" not in prompt.system
@@ -0,0 +1,115 @@
+"""
+Tests for the write-behind message buffer.
+
+Flushes go to the shared test database through the test session factory.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.write_behind import WriteBehindBuffer
+from src.models.chat import Message
+from src.repositories.chat.message_repository import MessageRepository
+from tests.conftest import TestSessionLocal
+
+
+def make_buffer(max_rows: int = 100) -> WriteBehindBuffer[Message]:
+    return WriteBehindBuffer(
+        Message,
+        "conversation_id",
+        max_rows=max_rows,
+        flush_interval=3600,
+        session_factory=TestSessionLocal,
+    )
+
+
+def make_message(id: int, conversation_id: int) -> Message:
+    return Message(
+        id=id,
+        conversation_id=conversation_id,
+        role="user",
+        content=f"Câu hỏi {id}",
+        tokens_used=3,
+        created_at=datetime.now(UTC),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestWriteBehindBuffer:
+    """Tests for batched message inserts."""
+
+    async def test_flush_writes_one_batch(self, db_session: AsyncSession, conversation):
+        """Test queued rows are pending until one flush writes them all."""
+        buffer = make_buffer()
+        for id in (1, 2, 3):
+            await buffer.add(make_message(id, conversation.id))
+
+        assert [m.id for m in buffer.pending(conversation.id)] == [1, 2, 3]
+        assert await MessageRepository(db_session).count() == 0
+
+        assert await buffer.flush() == 3
+        assert buffer.pending(conversation.id) == []
+        assert len(buffer) == 0
+        assert await MessageRepository(db_session).count() == 3
+
+    async def test_full_buffer_flushes_on_add(
+        self, db_session: AsyncSession, conversation
+    ):
+        """Test the buffer never holds more than max_rows."""
+        buffer = make_buffer(max_rows=2)
+        for id in (1, 2, 3):
+            await buffer.add(make_message(id, conversation.id))
+
+        assert len(buffer) == 1
+        assert await MessageRepository(db_session).count() == 2
+
+    async def test_bad_rows_are_dropped(self, db_session: AsyncSession, conversation):
+        """Test a duplicate id only costs its own row."""
+        buffer = make_buffer()
+        await buffer.add(make_message(1, conversation.id))
+        await buffer.flush()
+        await buffer.add(make_message(1, conversation.id))
+        await buffer.add(make_message(2, conversation.id))
+
+        assert await buffer.flush() == 1
+        assert len(buffer) == 0
+        assert await MessageRepository(db_session).count() == 2
+
+    async def test_failed_flush_keeps_rows(
+        self, db_session: AsyncSession, conversation, mocker
+    ):
+        """Test rows survive a database outage and are written afterwards."""
+        buffer = make_buffer()
+        await buffer.add(make_message(1, conversation.id))
+        mocker.patch.object(
+            buffer, "_insert", side_effect=OperationalError("INSERT", {}, None)
+        )
+
+        with pytest.raises(OperationalError):
+            await buffer.flush()
+
+        assert [m.id for m in buffer.pending(conversation.id)] == [1]
+        mocker.stopall()
+        assert await buffer.flush() == 1
+
+    async def test_reads_merge_pending(
+        self, db_session: AsyncSession, conversation, add_messages, mocker
+    ):
+        """Test repository reads include unflushed messages in id order."""
+        stored = await add_messages(3)
+        buffer = make_buffer()
+        mocker.patch("src.repositories.chat.message_repository.message_buffer", buffer)
+        repository = MessageRepository(db_session)
+        new_id = await repository.next_id()
+        await buffer.add(make_message(new_id, conversation.id))
+
+        messages = await repository.get_by_conversation(conversation.id)
+        recent = await repository.get_recent(conversation.id, limit=2)
+
+        assert new_id == stored[-1].id + 1
+        assert [m.id for m in messages] == [*(m.id for m in stored), new_id]
+        assert [m.id for m in recent] == [stored[-1].id, new_id]
@@ -0,0 +1,106 @@
+"""
+Tests for ConversationSummaryService.
+
+The service opens its own sessions, so it runs on the shared test session
+factory and a mocked AI client.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.chat.conversation_repository import ConversationRepository
+from src.services.chat.summary_service import ConversationSummaryService
+from tests.conftest import TestSessionLocal
+
+
+def make_summarizer(reply: str = "Tóm tắt mới") -> ConversationSummaryService:
+    ai_client = AsyncMock()
+    ai_client.generate.return_value = reply
+    return ConversationSummaryService(
+        ai_client=ai_client, session_factory=TestSessionLocal, keep_messages=4
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestConversationSummaryService:
+    """Tests for the rolling conversation summary."""
+
+    async def test_summarize_folds_older_messages(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+    ):
+        """Test all but the newest keep_messages are folded into the summary."""
+        messages = await add_messages(10)
+        summarizer = make_summarizer()
+
+        assert await summarizer.summarize(conversation.id) is True
+
+        await db_session.refresh(conversation)
+        assert conversation.summary == "Tóm tắt mới"
+        assert conversation.summary_until_id == messages[5].id
+        request = summarizer.ai_client.generate.call_args.args[0]
+        assert messages[5].content in request[0]["content"]
+        assert messages[6].content not in request[0]["content"]
+
+    async def test_summarize_builds_on_previous_summary(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+    ):
+        """Test a second run only sends messages after summary_until_id."""
+        messages = await add_messages(10)
+        await ConversationRepository(db_session).update(
+            conversation.id,
+            {"summary": "Tóm tắt cũ", "summary_until_id": messages[3].id},
+        )
+        summarizer = make_summarizer()
+
+        assert await summarizer.summarize(conversation.id) is True
+
+        request = summarizer.ai_client.generate.call_args.args[0][0]["content"]
+        assert "Tóm tắt cũ" in request
+        assert messages[3].content not in request
+        assert messages[4].content in request
+
+    async def test_summarize_nothing_to_fold(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+    ):
+        """Test no AI call when only the kept messages are unsummarized."""
+        await add_messages(4)
+        summarizer = make_summarizer()
+
+        assert await summarizer.summarize(conversation.id) is False
+        summarizer.ai_client.generate.assert_not_awaited()
+
+    async def test_schedule_dedupes_pending_runs(
+        self,
+        db_session: AsyncSession,
+        conversation,
+        add_messages,
+        mocker,
+        run_jobs,
+    ):
+        """Test scheduling twice before the run finishes queues one job."""
+        await add_messages(10)
+        summarizer = make_summarizer()
+        mocker.patch(
+            "src.services.chat.summary_service.conversation_summarizer", summarizer
+        )
+
+        await summarizer.schedule(conversation.id)
+        await summarizer.schedule(conversation.id)
+        assert await run_jobs() == 1
+        summarizer.ai_client.generate.assert_awaited_once()
+
+        # Finished runs release the key
+        await summarizer.schedule(conversation.id)
+        assert await run_jobs() == 1
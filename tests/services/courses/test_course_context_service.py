@@ -0,0 +1,109 @@
+"""
+Tests for CourseContextService.
+
+Checks caching of the course context and invalidation from repository writes.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.lib.cache import course_context_cache
+from src.repositories.auth.auth_repository import AuthRepository
+from src.repositories.courses.course_repository import CourseRepository
+from src.repositories.lessons.lesson_repository import LessonRepository
+from src.services.courses.course_context_service import CourseContextService
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_course(db_session: AsyncSession, course_data: dict, user_data: dict):
+    """Course owned by a freshly created user."""
+    user = await AuthRepository(db_session).create(
+        {**user_data, "password": "not-a-real-hash"}
+    )
+    course = await CourseRepository(db_session).create(
+        {**course_data, "creator_id": user.id}
+    )
+    return {"id": course.id, "title": course.title}
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_lesson(db_session: AsyncSession, lesson_data: dict, test_course: dict):
+    """Lesson of `test_course`."""
+    lesson = await LessonRepository(db_session).create(
+        {**lesson_data, "course_id": test_course["id"]}
+    )
+    return {"id": lesson.id, "title": lesson.title, "course_id": lesson.course_id}
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestCourseContextService:
+    """Tests for the cached course context."""
+
+    async def test_get_builds_context(
+        self,
+        db_session: AsyncSession,
+        test_lesson: dict,
+    ):
+        """Test context contains the course and its lesson outline."""
+        service = CourseContextService(db_session)
+
+        context = await service.get(test_lesson["course_id"])
+
+        assert context["course"]["id"] == test_lesson["course_id"]
+        assert context["lessons"][0]["title"] == test_lesson["title"]
+
+    async def test_get_missing_course(self, db_session: AsyncSession):
+        """Test a missing course returns None and is not cached."""
+        service = CourseContextService(db_session)
+
+        assert await service.get(99999) is None
+        assert await course_context_cache.get(99999) is None
+
+    async def test_get_served_from_cache(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+        mocker,
+    ):
+        """Test the second read does not hit the database."""
+        service = CourseContextService(db_session)
+        await service.get(test_course["id"])
+        spy = mocker.spy(service.course_repository, "get_by_id")
+
+        await service.get(test_course["id"])
+
+        spy.assert_not_called()
+
+    async def test_course_update_invalidates(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+    ):
+        """Test CourseRepository.update drops the cached context."""
+        service = CourseContextService(db_session)
+        await service.get(test_course["id"])
+
+        await CourseRepository(db_session).update(
+            test_course["id"], {"title": "Updated Title"}
+        )
+
+        context = await service.get(test_course["id"])
+        assert context["course"]["title"] == "Updated Title"
+
+    async def test_lesson_create_invalidates(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+    ):
+        """Test LessonRepository.create drops the cached context."""
+        service = CourseContextService(db_session)
+        await service.get(test_course["id"])
+
+        await LessonRepository(db_session).create(
+            {"course_id": test_course["id"], "title": "New lesson", "order": 1}
+        )
+
+        context = await service.get(test_course["id"])
+        assert [lesson["title"] for lesson in context["lessons"]] == ["New lesson"]
@@ -0,0 +1,157 @@
+"""
+Tests for lesson/document ingestion and CourseRetriever.
+
+Ingestion opens its own sessions, so it runs on the shared test session
+factory (the autouse `document_ingester` fixture).
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.document import DocumentChunk
+from src.repositories.lessons.lesson_repository import LessonRepository
+from src.services.documents.retrieval_service import CourseRetriever
+from src.services.lessons.lesson_service import LessonService
+
+LESSONS = [
+    ("Biến", "Biến trong Python dùng để lưu giá trị. " * 30),
+    ("Vòng lặp", "Vòng lặp for duyệt qua từng phần tử của danh sách. " * 30),
+    ("Hàm", "Hàm được khai báo bằng từ khóa def và có thể trả về giá trị. " * 30),
+]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def lessons(db_session: AsyncSession, test_course: dict):
+    repository = LessonRepository(db_session)
+    return [
+        await repository.create(
+            {
+                "course_id": test_course["id"],
+                "title": title,
+                "content": content,
+                "order": i,
+            }
+        )
+        for i, (title, content) in enumerate(LESSONS, start=1)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestCourseRetriever:
+    """Tests for chunk ingestion and top-k retrieval."""
+
+    async def test_ingest_lessons_once(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+        lessons,
+        document_ingester,
+    ):
+        """Test lessons are chunked with overlap and not re-chunked."""
+        written = await document_ingester.ingest_lessons(test_course["id"])
+
+        chunks = (await db_session.scalars(select(DocumentChunk))).all()
+        assert written == len(chunks) > len(lessons)
+        assert {chunk.lesson_id for chunk in chunks} == {
+            lesson.id for lesson in lessons
+        }
+        assert await document_ingester.ingest_lessons(test_course["id"]) == 0
+
+    async def test_search_returns_relevant_lesson(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+        lessons,
+        document_ingester,
+    ):
+        """Test the top chunk comes from the lesson about the question."""
+        await document_ingester.ingest_lessons(test_course["id"])
+
+        results = await CourseRetriever(db_session).search(
+            test_course["id"], "vòng lặp for hoạt động thế nào?", k=2
+        )
+
+        assert results
+        assert results[0].meta["lesson_id"] == lessons[1].id
+
+    async def test_index_refreshes_by_difference(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+        lessons,
+        document_ingester,
+        sql_statements,
+    ):
+        """Test a warm index only loads new chunks and drops deleted ones."""
+        await document_ingester.ingest_lessons(test_course["id"])
+        retriever = CourseRetriever(db_session)
+        index = await retriever.get_index(test_course["id"])
+        before = set(index.chunks)
+
+        with sql_statements() as statements:
+            await retriever.get_index(test_course["id"])
+        assert len(statements) == 1
+
+        lesson = await LessonRepository(db_session).create(
+            {
+                "course_id": test_course["id"],
+                "title": "Class",
+                "content": "Lớp class định nghĩa đối tượng",
+                "order": 4,
+            }
+        )
+        await document_ingester.ingest_lessons(test_course["id"])
+        await LessonRepository(db_session).delete(lessons[0].id)
+
+        refreshed = await retriever.get_index(test_course["id"])
+
+        assert refreshed is index
+        added = set(index.chunks) - before
+        assert [index.chunks[i].meta["lesson_id"] for i in added] == [lesson.id]
+        assert all(
+            chunk.meta["lesson_id"] != lessons[0].id for chunk in index.chunks.values()
+        )
+        results = await retriever.search(test_course["id"], "class đối tượng", k=1)
+        assert results[0].meta["lesson_id"] == lesson.id
+
+    async def test_edited_lesson_is_reindexed(
+        self,
+        db_session: AsyncSession,
+        test_user: dict,
+        test_course: dict,
+        lessons,
+        document_ingester,
+        run_jobs,
+    ):
+        """Test editing a lesson replaces its chunks with the new content."""
+        await document_ingester.ingest_lessons(test_course["id"])
+        retriever = CourseRetriever(db_session)
+        await retriever.get_index(test_course["id"])
+
+        await LessonService(db_session, ingester=document_ingester).update_lesson(
+            lessons[0].id,
+            test_user["id"],
+            {"content": "Chuỗi string lưu văn bản, cắt bằng slicing. " * 30},
+        )
+        assert await run_jobs() == 1
+
+        index = await retriever.get_index(test_course["id"])
+        contents = [
+            chunk.content
+            for chunk in index.chunks.values()
+            if chunk.meta["lesson_id"] == lessons[0].id
+        ]
+        assert contents and not any("Biến trong Python" in c for c in contents)
+        results = await retriever.search(test_course["id"], "chuỗi slicing", k=1)
+        assert results[0].meta["lesson_id"] == lessons[0].id
+
+    async def test_course_without_chunks(
+        self,
+        db_session: AsyncSession,
+        test_course: dict,
+    ):
+        """Test a course with nothing ingested retrieves nothing."""
+        assert await CourseRetriever(db_session).search(test_course["id"], "x") == []
@@ -0,0 +1,110 @@
+"""
+Tests for the compiled-key quiz grader.
+
+Rows mimic `QuizRepository.get_answer_key`, so no database is needed.
+"""
+
+from collections import namedtuple
+
+import pytest
+
+from src.schemas.quiz import AnswerSubmission
+from src.services.quizzes.quiz_grader import (
+    MAX_CHOICES,
+    compile_quiz,
+    grade_submissions,
+    normalize_text,
+)
+
+KeyRow = namedtuple("KeyRow", "question_id type points answer_id content is_correct")
+
+ROWS = [
+    KeyRow(1, "single_choice", 2, 10, "A", True),
+    KeyRow(1, "single_choice", 2, 11, "B", False),
+    KeyRow(2, "multiple_choice", 3, 20, "A", True),
+    KeyRow(2, "multiple_choice", 3, 21, "B", False),
+    KeyRow(2, "multiple_choice", 3, 22, "C", True),
+    KeyRow(3, "fill_blank", 5, 30, "Hà  Nội", True),
+    KeyRow(3, "fill_blank", 5, 31, "Ha Noi", True),
+]
+
+
+def submission(*answers: dict) -> list[AnswerSubmission]:
+    return [AnswerSubmission(**answer) for answer in answers]
+
+
+@pytest.mark.unit
+class TestQuizGrader:
+    """Tests for compile_quiz / grade_submissions."""
+
+    def test_compile_builds_masks(self):
+        """Test choice keys become bitmasks and text keys normalized sets."""
+        compiled = compile_quiz(1, 1, ROWS)
+
+        assert list(compiled.question_ids) == [1, 2, 3]
+        assert list(compiled.correct_masks) == [0b01, 0b101, 0]
+        assert compiled.accepted_text[2] == {"hà nội", "ha noi"}
+        assert compiled.total_points == 10
+
+    def test_grade_batch(self):
+        """Test a batch is graded in one pass, one result per submission."""
+        compiled = compile_quiz(1, 1, ROWS)
+
+        results = grade_submissions(
+            compiled,
+            [
+                submission(
+                    {"question_id": 1, "answer_ids": [10]},
+                    {"question_id": 2, "answer_ids": [22, 20]},
+                    {"question_id": 3, "text_answer": "HÀ NỘI"},
+                ),
+                submission({"question_id": 1, "answer_ids": [10, 11]}),
+                submission(
+                    {"question_id": 2, "answer_ids": [20, 22, 21]},
+                    {"question_id": 3, "text_answer": "ha noi"},
+                ),
+                [],
+            ],
+        )
+
+        assert [r.earned_points for r in results] == [10, 0, 5, 0]
+        assert [r.score for r in results] == [100, 0, 50, 0]
+        assert list(results[2].correct) == [False, False, True]
+
+    def test_unknown_question_ignored(self):
+        """Test answers to questions outside the quiz don't affect the score."""
+        compiled = compile_quiz(1, 1, ROWS)
+
+        (result,) = grade_submissions(
+            compiled,
+            [
+                submission(
+                    {"question_id": 99, "answer_ids": [10]},
+                    {"question_id": 1, "answer_ids": [10]},
+                )
+            ],
+        )
+
+        assert result.earned_points == 2
+
+    def test_question_without_correct_answer_never_earned(self):
+        """Test an empty selection doesn't match an empty key."""
+        compiled = compile_quiz(1, 1, [KeyRow(1, "single_choice", 1, 10, "A", False)])
+
+        (result,) = grade_submissions(compiled, [[]])
+
+        assert result.earned_points == 0
+
+    def test_too_many_choices_rejected(self):
+        """Test a question with more answers than mask bits fails to compile."""
+        rows = [
+            KeyRow(1, "multiple_choice", 1, i, str(i), False)
+            for i in range(MAX_CHOICES + 1)
+        ]
+
+        with pytest.raises(ValueError):
+            compile_quiz(1, 1, rows)
+
+    def test_normalize_text(self):
+        """Test normalization folds case, width and whitespace, keeps accents."""
+        assert normalize_text("  Ｐｒｉｎｔ\tHà ") == "print hà"
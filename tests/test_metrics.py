@@ -0,0 +1,66 @@
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient):
+    await client.get("/api/health")
+
+    response = await client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_requests_total{method="GET",route="/api/health",status="200"}' in (
+        response.text
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_latency_and_sql_per_route_template(
+    client: AsyncClient, test_course: dict
+):
+    route = "/api/v1/courses/{course_id}"
+    requests_before = sample(
+        "http_request_duration_seconds_count", method="GET", route=route
+    )
+    queries_before = sample("http_request_db_queries_sum", route=route)
+
+    response = await client.get(f"/api/v1/courses/{test_course['id']}")
+
+    assert response.status_code == 200
+    assert (
+        sample("http_request_duration_seconds_count", method="GET", route=route)
+        == requests_before + 1
+    )
+    assert sample("http_request_db_queries_sum", route=route) > queries_before
+
+
+@pytest.mark.asyncio
+async def test_unmatched_paths_share_a_label(client: AsyncClient):
+    before = sample(
+        "http_requests_total", method="GET", route="unmatched", status="404"
+    )
+
+    await client.get("/no/such/path/123")
+
+    assert (
+        sample("http_requests_total", method="GET", route="unmatched", status="404")
+        == before + 1
+    )
+
+
+def test_named_cache_hits_and_misses():
+    from src.lib.cache import TTLCache
+
+    cache = TTLCache(name="test_cache")
+    cache.get("a")
+    cache.set("a", 1)
+    cache.get("a")
+
+    assert sample("cache_requests_total", cache="test_cache", result="miss") == 1
+    assert sample("cache_requests_total", cache="test_cache", result="hit") == 1
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.database import warm_up_engine
+from src.lib.ai.claude import ClaudeClient
+from src.lib.ai.router import COMPLEX, SIMPLE, LLMRouter, Route
+
+# Cumulative `import src.main` time. Generous for slow CI machines; the
+# list of modules that must not be imported is the precise check
+IMPORT_BUDGET_SECONDS = 2.5
+LAZY_MODULES = {"anthropic", "openai", "pypdf"}
+
+
+def import_profile() -> dict[str, int]:
+    """Cumulative import time (µs) per module of a fresh `import src.main`"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(__file__)),
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        profile[module.strip()] = int(cumulative)
+    return profile
+
+
+def test_app_import_budget():
+    profile = import_profile()
+
+    assert LAZY_MODULES.isdisjoint(profile)
+    assert profile["src.main"] < IMPORT_BUDGET_SECONDS * 1_000_000
+
+
+@pytest.mark.asyncio
+async def test_provider_client_built_on_first_use():
+    claude = ClaudeClient.from_settings(model="sonnet")
+    router = LLMRouter(
+        {
+            SIMPLE: [Route("anthropic", claude.with_model("haiku"))],
+            COMPLEX: [Route("anthropic", claude)],
+        }
+    )
+
+    assert not claude._client.loaded
+    await router.preload()
+    assert claude._client.loaded
+    assert router.routes[SIMPLE][0].client.client is claude.client
+    await router.aclose()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_fills_pool(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/warm.db",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+    )
+
+    await warm_up_engine(engine, 3)
+
+    assert engine.pool.checkedin() == 3
+    await engine.dispose()